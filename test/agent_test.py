@@ -203,6 +203,27 @@ class AgentTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             Agent(**obj)
 
+    def test_ToQueryParam(self):
+        agent = Agent(name="test", mbox="mailto:test@test.com")
+        param = agent.to_query_param("1.0.0")
+        self.assertEqual(param, agent.to_json("1.0.0"))
+        self.assertIs(agent.to_query_param("1.0.0"), param)
+
+        # equal agents share the memoized encoding
+        self.assertIs(Agent(name="test", mbox="mailto:test@test.com").to_query_param("1.0.0"), param)
+
+        agent.mbox = "mailto:other@test.com"
+        self.assertEqual(agent.to_query_param("1.0.0"), agent.to_json("1.0.0"))
+        self.assertIn("other@test.com", agent.to_query_param("1.0.0"))
+
+    def test_ToQueryParamAccount(self):
+        agent = Agent(account={"name": "test", "home_page": "http://example.com"})
+        self.assertIn('"test"', agent.to_query_param())
+
+        agent.account.name = "changed"
+        self.assertEqual(agent.to_query_param(), agent.to_json())
+        self.assertIn('"changed"', agent.to_query_param())
+
     def accountVerificationHelper(self, account):
         self.assertIsInstance(account, AgentAccount)
         self.assertEqual(len(vars(account)), 2)
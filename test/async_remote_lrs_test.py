@@ -0,0 +1,418 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import asyncio
+import unittest
+import uuid
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import (
+    AsyncRemoteLRS,
+    AsyncConnectionPool,
+    LRSResponse,
+    LRSBatchResponse,
+    About,
+    Agent,
+    Verb,
+    Activity,
+    Statement,
+    StatementList,
+    StatementsResult,
+    LazyStatement,
+    StateDocument,
+    Attachment,
+    AttachmentPayload,
+    RetryPolicy,
+    RateLimiter,
+    MetricsCollector,
+    DocumentCache,
+)
+from test.test_utils import LocalHTTPServer, FakeLRSHandler
+
+
+class AsyncRemoteLRSTest(unittest.TestCase):
+    def setUp(self):
+        FakeLRSHandler.reset()
+        self.server = LocalHTTPServer(FakeLRSHandler).__enter__()
+        self.lrs = AsyncRemoteLRS(endpoint=self.server.endpoint)
+
+        self.agent = Agent(mbox="mailto:tincanpython@tincanapi.com")
+        self.verb = Verb(id="http://adlnet.gov/expapi/verbs/experienced")
+        self.activity = Activity(id="http://tincanapi.com/TinCanPython/Test/Unit/0")
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def _run(self, coro):
+        async def run():
+            try:
+                return await coro
+            finally:
+                self.lrs.connection_pool.clear()
+
+        return asyncio.run(run())
+
+    def _statement(self, **kwargs):
+        return Statement(actor=self.agent, verb=self.verb, object=self.activity, **kwargs)
+
+    def test_instantiation(self):
+        lrs = AsyncRemoteLRS()
+        self.assertIsInstance(lrs.connection_pool, AsyncConnectionPool)
+        with self.assertRaises(TypeError):
+            AsyncRemoteLRS(connection_pool=object())
+
+    def test_about(self):
+        response = self._run(self.lrs.about())
+
+        self.assertIsInstance(response, LRSResponse)
+        self.assertTrue(response.success)
+        self.assertIsInstance(response.content, About)
+
+    def test_save_statement(self):
+        statement = self._statement()
+        response = self._run(self.lrs.save_statement(statement))
+
+        self.assertTrue(response.success)
+        self.assertIsNotNone(response.content.id)
+        self.assertEqual(FakeLRSHandler.requests[0][0], "POST")
+
+    def test_save_statement_with_id(self):
+        statement = self._statement(id=str(uuid.uuid4()))
+        response = self._run(self.lrs.save_statement(statement))
+
+        self.assertTrue(response.success)
+        self.assertEqual(FakeLRSHandler.requests[0][0], "PUT")
+        self.assertEqual(FakeLRSHandler.requests[0][2]["statementId"], str(statement.id))
+
+    def test_save_statements_and_query(self):
+        async def run():
+            saved = await self.lrs.save_statements([self._statement() for _ in range(15)])
+            first = await self.lrs.query_statements({"ascending": True})
+            second = await self.lrs.more_statements(first.content)
+            return saved, first, second
+
+        saved, first, second = self._run(run())
+
+        self.assertTrue(saved.success)
+        self.assertTrue(all(s.id is not None for s in saved.content))
+        self.assertIsInstance(first.content, StatementsResult)
+        self.assertEqual(len(first.content.statements), 10)
+        self.assertEqual(len(second.content.statements), 5)
+        self.assertEqual(
+            [s.id for s in first.content.statements + second.content.statements],
+            [s.id for s in saved.content],
+        )
+        self.assertEqual(FakeLRSHandler.connections, 1)
+
+    def test_save_statements_json(self):
+        statements = StatementList([self._statement() for _ in range(3)])
+        response = self._run(self.lrs.save_statements_json(statements.to_json()))
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.content, [s["id"] for s in FakeLRSHandler.statements])
+
+    def test_save_statements_batched(self):
+        statements = [self._statement() for _ in range(25)]
+        response = self._run(self.lrs.save_statements(statements, batch_size=10, max_workers=3))
+
+        self.assertIsInstance(response, LRSBatchResponse)
+        self.assertTrue(response.success)
+        self.assertEqual(len(response.responses), 3)
+        self.assertEqual(
+            sorted(str(s.id) for s in statements),
+            sorted(s["id"] for s in FakeLRSHandler.statements),
+        )
+
+    def test_save_statements_batched_max_workers(self):
+        counts = {"pulled": 0, "sent": 0, "active": 0, "max_active": 0, "max_ahead": 0}
+
+        class CountingLRS(AsyncRemoteLRS):
+            def _statement_batches(self, *args):
+                for batch in super()._statement_batches(*args):
+                    counts["pulled"] += 1
+                    counts["max_ahead"] = max(counts["max_ahead"], counts["pulled"] - counts["sent"])
+                    yield batch
+
+            async def _send_request(self, request, attachments=False):
+                counts["active"] += 1
+                counts["max_active"] = max(counts["max_active"], counts["active"])
+                try:
+                    return await super()._send_request(request, attachments)
+                finally:
+                    counts["active"] -= 1
+                    counts["sent"] += 1
+
+        self.lrs = CountingLRS(endpoint=self.server.endpoint)
+        statements = [self._statement() for _ in range(20)]
+        response = self._run(self.lrs.save_statements(statements, batch_size=2, max_workers=3))
+
+        self.assertTrue(response.success)
+        self.assertEqual(len(response.responses), 10)
+        self.assertEqual(
+            [[s.id for s in r.content] for r in response.responses],
+            [[s.id for s in statements[i:i + 2]] for i in range(0, 20, 2)],
+        )
+        self.assertEqual(counts["max_active"], 3)
+        self.assertLessEqual(counts["max_ahead"], 3)
+
+    def test_iter_statements(self):
+        statements = [self._statement() for _ in range(25)]
+
+        async def run(prefetch):
+            await self.lrs.save_statements(statements)
+            return [s async for s in self.lrs.iter_statements({"ascending": True}, prefetch=prefetch)]
+
+        for prefetch in (False, True):
+            FakeLRSHandler.reset()
+            iterated = self._run(run(prefetch))
+            self.assertEqual([s.id for s in iterated], [s.id for s in statements])
+
+    def test_export_statements(self):
+        statements = [self._statement() for _ in range(25)]
+
+        async def run():
+            await self.lrs.save_statements(statements)
+            return [
+                s async for s in self.lrs.export_statements(
+                    {}, "2013-12-31T23:59:59Z", "2014-01-01T00:00:24Z", windows=5, max_workers=2
+                )
+            ]
+
+        exported = self._run(run())
+        self.assertEqual([s.id for s in exported], [s.id for s in statements])
+
+    def test_retrieve_statement(self):
+        async def run():
+            saved = await self.lrs.save_statement(self._statement())
+            return await self.lrs.retrieve_statement(saved.content.id)
+
+        response = self._run(run())
+        self.assertTrue(response.success)
+        self.assertIsInstance(response.content, Statement)
+
+    def test_lazy(self):
+        self.lrs.lazy = True
+
+        async def run():
+            saved = await self.lrs.save_statements([self._statement() for _ in range(3)])
+            retrieved = await self.lrs.retrieve_statement(saved.content[0].id)
+            queried = await self.lrs.query_statements({"ascending": True})
+            return saved, retrieved, queried
+
+        saved, retrieved, queried = self._run(run())
+        self.assertIsInstance(retrieved.content, LazyStatement)
+        self.assertEqual(retrieved.content.verb, self.verb)
+        self.assertTrue(all(isinstance(s, LazyStatement) for s in queried.content.statements))
+        self.assertEqual([s.id for s in queried.content.statements], [s.id for s in saved.content])
+
+    def test_response_format(self):
+        self.lrs.response_format = "dict"
+
+        async def run():
+            saved = await self.lrs.save_statements([self._statement() for _ in range(15)])
+            first = await self.lrs.query_statements({"ascending": True})
+            second = await self.lrs.more_statements(first.content, response_format="bytes")
+            retrieved = await self.lrs.retrieve_statement(saved.content[0].id)
+            iterated = [s async for s in self.lrs.iter_statements({"ascending": True})]
+            return saved, first, second, retrieved, iterated
+
+        saved, first, second, retrieved, iterated = self._run(run())
+        self.assertEqual([s["id"] for s in first.content["statements"]], [str(s.id) for s in saved.content[:10]])
+        self.assertIsInstance(second.content, bytes)
+        self.assertEqual(len(StatementsResult.from_json(second.content.decode("utf-8")).statements), 5)
+        self.assertEqual(retrieved.content["id"], str(saved.content[0].id))
+        self.assertEqual([s.id for s in iterated], [s.id for s in saved.content])
+
+    def test_projection(self):
+        statements = [self._statement() for _ in range(15)]
+
+        async def run():
+            await self.lrs.save_statements(statements)
+            return [s async for s in self.lrs.iter_statements({"ascending": True}, projection=["id", "verb.id"])]
+
+        iterated = self._run(run())
+        self.assertEqual([s.id for s in iterated], [s.id for s in statements])
+        self.assertEqual(iterated[0].verb, self.verb)
+        self.assertIsNone(iterated[0].actor)
+
+    def test_attachments_round_trip(self):
+        payload = AttachmentPayload(bytes(range(256)) * 100, content_type="image/png")
+        statement = self._statement(attachments=[Attachment(
+            usage_type="http://id.tincanapi.com/attachment/supporting_media",
+            display={"en-US": "payload"},
+            content_type="image/png",
+            length=payload.length,
+            sha2=payload.sha2,
+        )])
+
+        async def run():
+            saved = await self.lrs.save_statements([statement], attachments=[payload])
+            self.assertTrue(saved.success)
+            return await self.lrs.retrieve_statement(statement.id, attachments=True)
+
+        response = self._run(run())
+        self.assertTrue(response.success)
+        self.assertEqual(response.content.id, statement.id)
+        self.assertEqual(response.attachments[payload.sha2].read(), payload.read())
+
+    def test_compression(self):
+        FakeLRSHandler.content_encoding = "gzip"
+        self.lrs.compress_requests = 0
+        statement = self._statement()
+
+        async def run():
+            await self.lrs.save_statements([statement])
+            return await self.lrs.query_statements({})
+
+        response = self._run(run())
+        self.assertEqual(FakeLRSHandler.requests[0][3]["Content-Encoding"], "gzip")
+        self.assertEqual(response.response.getheader("Content-Encoding"), "gzip")
+        self.assertEqual([s.id for s in response.content.statements], [statement.id])
+
+    def test_retry_policy(self):
+        self.lrs.retry_policy = RetryPolicy(max_attempts=3, backoff=0.001)
+        FakeLRSHandler.failures = [(503, {}), (429, {"Retry-After": "0"})]
+
+        response = self._run(self.lrs.about())
+        self.assertTrue(response.success)
+        self.assertEqual(len(FakeLRSHandler.requests), 3)
+
+    def test_rate_limiter(self):
+        self.lrs.rate_limiter = RateLimiter(max_in_flight=1)
+
+        async def run():
+            return await asyncio.gather(*[self.lrs.about() for _ in range(5)])
+
+        self.assertTrue(all(r.success for r in self._run(run())))
+        self.assertEqual(self.lrs.rate_limiter.stats()["acquired"], 5)
+        # one request at a time only ever needs one connection
+        self.assertEqual(FakeLRSHandler.connections, 1)
+
+    def test_metrics(self):
+        metrics = MetricsCollector()
+        self.lrs.hooks = [metrics]
+        self.lrs.retry_policy = RetryPolicy(backoff=0.001)
+        FakeLRSHandler.failures = [(503, {})]
+
+        response = self._run(self.lrs.about())
+        self.assertTrue(response.success)
+        # the retry goes over the kept-alive connection
+        self.assertNotIn("connect", response.timings)
+        for phase in ("send", "wait", "read", "decode", "total"):
+            self.assertGreaterEqual(response.timings[phase], 0)
+
+        self.assertEqual(metrics.request_count("about"), 2)
+        text = metrics.prometheus()
+        self.assertIn('tincan_request_duration_seconds_count{endpoint="about",method="GET",status="503"} 1', text)
+        self.assertIn('tincan_request_duration_seconds_count{endpoint="about",method="GET",status="200"} 1', text)
+        self.assertIn('tincan_request_phase_seconds_count{endpoint="about",method="GET",phase="decode"} 1', text)
+
+    def test_state(self):
+        doc = StateDocument(
+            id="test",
+            content='{"bookmark": 1}',
+            content_type="application/json",
+            activity=self.activity,
+            agent=self.agent,
+        )
+
+        async def run():
+            saved = await self.lrs.save_state(doc)
+            retrieved = await self.lrs.retrieve_state(self.activity, self.agent, "test")
+            deleted = await self.lrs.delete_state(doc)
+            missing = await self.lrs.retrieve_state(self.activity, self.agent, "test")
+            return saved, retrieved, deleted, missing
+
+        saved, retrieved, deleted, missing = self._run(run())
+
+        self.assertTrue(saved.success)
+        self.assertEqual(retrieved.content.content, bytearray(b'{"bookmark": 1}'))
+        self.assertTrue(deleted.success)
+        self.assertTrue(missing.success)
+        self.assertEqual(missing.response.status, 404)
+
+    def test_document_cache(self):
+        self.lrs.document_cache = DocumentCache()
+        doc = StateDocument(
+            id="test",
+            content='{"bookmark": 1}',
+            content_type="application/json",
+            activity=self.activity,
+            agent=self.agent,
+        )
+
+        async def run():
+            await self.lrs.save_state(doc)
+            first = await self.lrs.retrieve_state(self.activity, self.agent, "test")
+            second = await self.lrs.retrieve_state(self.activity, self.agent, "test")
+            await self.lrs.delete_state(doc)
+            return first, second
+
+        first, second = self._run(run())
+        self.assertEqual(first.response.status, 200)
+        self.assertEqual(second.response.status, 304)
+        self.assertTrue(second.success)
+        self.assertEqual(second.content.content, bytearray(b'{"bookmark": 1}'))
+        self.assertEqual(len(self.lrs.document_cache), 0)
+
+    def test_bulk_states(self):
+        states = [
+            StateDocument(id=f"state{i}", content=str(i), activity=self.activity, agent=self.agent)
+            for i in range(6)
+        ]
+
+        async def run():
+            saved = await self.lrs.save_states(states, max_workers=3)
+            retrieved = await self.lrs.retrieve_states(states + [(self.activity, self.agent, "missing")])
+            deleted = await self.lrs.delete_states(states)
+            return saved, retrieved, deleted
+
+        saved, retrieved, deleted = self._run(run())
+        self.assertTrue(saved.success)
+        self.assertEqual([d.content for d in retrieved.content[:6]], [bytearray(str(i), "utf-8") for i in range(6)])
+        self.assertIsNone(retrieved.content[6])
+        self.assertTrue(deleted.success)
+        self.assertEqual(FakeLRSHandler.documents, {})
+
+    def test_concurrent_requests(self):
+        async def run():
+            return await asyncio.gather(*[self.lrs.about() for _ in range(20)])
+
+        responses = self._run(run())
+        self.assertTrue(all(r.success for r in responses))
+        self.assertLessEqual(self.lrs.connection_pool.idle_count(), 10)
+
+    def test_stale_connection_retry(self):
+        async def run():
+            first = await self.lrs.about()
+            # drop the idle connection behind the pool's back
+            for connections in self.lrs.connection_pool._idle.values():
+                for conn in connections:
+                    conn._writer.transport.abort()
+            await asyncio.sleep(0)
+            second = await self.lrs.about()
+            return first, second
+
+        first, second = self._run(run())
+        self.assertTrue(first.success)
+        self.assertTrue(second.success)
+        self.assertEqual(FakeLRSHandler.connections, 2)
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(AsyncRemoteLRSTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,66 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Measures how much gzip shrinks a batch of statements, and what compressing
+and decompressing it costs. Not part of the test suite, run it with:
+
+    python -m test.benchmarks.compression_benchmark [--statements 1000]
+"""
+
+import argparse
+import timeit
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan.compression import compress, decode
+from test.test_utils import statements_result_json
+
+
+def benchmark(statements=1000, number=10):
+    """Compresses and decompresses the JSON of a page of statements
+
+    :return: The sizes in bytes, and the seconds per compression and decompression
+    :rtype: dict
+    """
+    data = statements_result_json(statements).encode("utf-8")
+    compressed = compress(data)
+
+    return {
+        "size": len(data),
+        "compressed size": len(compressed),
+        "compress": timeit.timeit(lambda: compress(data), number=number) / number,
+        "decompress": timeit.timeit(lambda: decode(compressed, "gzip"), number=number) / number,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--statements", type=int, default=1000, help="statements in the batch")
+    parser.add_argument("--number", type=int, default=10, help="runs timed")
+    args = parser.parse_args()
+
+    result = benchmark(args.statements, args.number)
+    print(f"{args.statements} statements")
+    print(f"size:            {result['size']:10d} bytes")
+    print(f"compressed size: {result['compressed size']:10d} bytes "
+          f"({result['size'] / result['compressed size']:.1f}x smaller)")
+    print(f"compress:        {result['compress'] * 1000:10.2f} ms")
+    print(f"decompress:      {result['decompress'] * 1000:10.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Times the ISO 8601 conversions against aniso8601, on distinct values and
+on values repeating as they do in statement streams. Not part of the test
+suite, run it with:
+
+    python -m test.benchmarks.iso8601_benchmark [--values 10000]
+"""
+
+import argparse
+import datetime
+import timeit
+
+import aniso8601
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan.conversions.iso8601 import make_datetime, make_timedelta, jsonify_timedelta
+
+
+def _timestamps(count, distinct):
+    start = datetime.datetime(2014, 1, 1, tzinfo=datetime.timezone.utc)
+    return [
+        (start + datetime.timedelta(milliseconds=1001 * (i % distinct))).isoformat(timespec='milliseconds')
+        .replace('+00:00', 'Z')
+        for i in range(count)
+    ]
+
+
+def _durations(count, distinct):
+    return [f"PT{i % distinct // 60}M{i % distinct % 60}.5S" for i in range(count)]
+
+
+def benchmark(values=10000, distinct=None, number=3, repeat=5):
+    """Times the conversion of values timestamps and durations, with
+    distinct different values of each, returning the best time per value
+    keyed by operation
+
+    :rtype: dict
+    """
+    distinct = distinct or values
+    timestamps = _timestamps(values, distinct)
+    durations = _durations(values, distinct)
+    timedeltas = [make_timedelta(d) + datetime.timedelta(microseconds=i % distinct) for i, d in enumerate(durations)]
+
+    def best(fn, items):
+        timer = timeit.Timer(lambda: [fn(v) for v in items])
+        return min(timer.repeat(repeat=repeat, number=number)) / number / len(items)
+
+    return {
+        "aniso8601.parse_datetime": best(aniso8601.parse_datetime, timestamps),
+        "make_datetime": best(make_datetime, timestamps),
+        "aniso8601.parse_duration": best(aniso8601.parse_duration, durations),
+        "make_timedelta": best(make_timedelta, durations),
+        "jsonify_timedelta": best(jsonify_timedelta, timedeltas),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--values", type=int, default=10000, help="values converted per timing")
+    parser.add_argument("--distinct", type=int, default=100, help="distinct values in the repeating run")
+    parser.add_argument("--number", type=int, default=3, help="conversions of all values per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timings")
+    args = parser.parse_args()
+
+    for title, distinct in (("distinct", None), (f"{args.distinct} repeating", args.distinct)):
+        print(f"{args.values} {title} values")
+        for name, seconds in benchmark(args.values, distinct, args.number, args.repeat).items():
+            print(f"  {name + ':':26} {seconds * 1e6:8.2f} us/value")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Compares the installed JSON codecs on a page of statements, decoded with
+trusted decoding and encoded back. Not part of the test suite, run it with:
+
+    python -m test.benchmarks.json_codec_benchmark [--statements 500]
+"""
+
+import argparse
+import timeit
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import StatementsResult
+from tincan.json_codec import available_codecs
+from test.test_utils import statements_result_json
+
+
+def benchmark(statements=500, number=5, repeat=5):
+    """Times :meth:`tincan.StatementsResult.from_json` and
+    :meth:`tincan.StatementList.to_json` with each installed codec, returning
+    the best times per page keyed by codec name
+
+    :rtype: dict
+    """
+    json_data = statements_result_json(statements)
+    statement_list = StatementsResult.from_json(json_data).statements
+
+    def best(fn):
+        return min(timeit.Timer(fn).repeat(repeat=repeat, number=number)) / number
+
+    return {
+        name: (
+            best(lambda: StatementsResult.from_json(json_data, trusted=True, codec=name)),
+            best(lambda: statement_list.to_json(codec=name)),
+        )
+        for name in available_codecs()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--statements", type=int, default=500, help="statements per page")
+    parser.add_argument("--number", type=int, default=5, help="pages per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timings")
+    args = parser.parse_args()
+
+    print(f"{args.statements} statements per page")
+    for name, (from_json, to_json) in benchmark(args.statements, args.number, args.repeat).items():
+        print(f"{name + ':':10} from_json {from_json * 1000:8.2f} ms/page, to_json {to_json * 1000:8.2f} ms/page")
+
+
+if __name__ == '__main__':
+    main()
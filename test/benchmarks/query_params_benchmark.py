@@ -0,0 +1,79 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Measures building the query string of a state request, serializing the agent
+and URL encoding every parameter each time versus with the memoized agent
+parameter and encoding. Not part of the test suite, run it with:
+
+    python -m test.benchmarks.query_params_benchmark [--number 100000]
+"""
+
+import argparse
+import timeit
+from urllib.parse import urlencode
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import Agent, AgentAccount, RemoteLRS, Version
+
+
+def benchmark(number=100000):
+    """Builds the query string of the same state request number times
+
+    :return: Seconds per query string, each way
+    :rtype: dict
+    """
+    agent = Agent(
+        name="Learner",
+        account=AgentAccount(name="learner-123", home_page="http://lms.example.com"),
+    )
+
+    def params(agent_param):
+        return {
+            "activityId": "http://example.com/course/module/1",
+            "agent": agent_param,
+            "stateId": "bookmark",
+            "registration": "016699c6-d600-48a7-96ab-86187498f16f",
+        }
+
+    def uncached():
+        p = params(agent.to_json(Version.latest))
+        return urlencode({k: str(v).encode("utf-8") for k, v in p.items()})
+
+    def cached():
+        return RemoteLRS._encode_query(params(agent.to_query_param(Version.latest)))
+
+    assert uncached() == cached()
+
+    return {
+        "uncached": timeit.timeit(uncached, number=number) / number,
+        "cached": timeit.timeit(cached, number=number) / number,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=100000, help="query strings built")
+    args = parser.parse_args()
+
+    result = benchmark(args.number)
+    print(f"uncached: {result['uncached'] * 1e6:8.2f} us")
+    print(f"cached:   {result['cached'] * 1e6:8.2f} us ({result['uncached'] / result['cached']:.1f}x faster)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Times the serialization of a list of statements, as sent to an LRS by
+save_statements. Not part of the test suite, run it with:
+
+    python -m test.benchmarks.statement_list_benchmark [--statements 500]
+"""
+
+import argparse
+import timeit
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import StatementsResult
+from test.test_utils import statements_result_json
+
+
+def benchmark(statements=500, number=5, repeat=5):
+    """Times :meth:`tincan.StatementList.to_json`, returning the best time
+    per list
+
+    :rtype: float
+    """
+    statement_list = StatementsResult.from_json(statements_result_json(statements)).statements
+
+    timer = timeit.Timer(statement_list.to_json)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--statements", type=int, default=500, help="statements per list")
+    parser.add_argument("--number", type=int, default=5, help="lists serialized per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timings")
+    args = parser.parse_args()
+
+    to_json = benchmark(args.statements, args.number, args.repeat)
+    print(f"{args.statements} statements per list")
+    print(f"to_json: {to_json * 1000:8.2f} ms/list")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Measures the memory held by decoded statements, next to the parsed JSON
+they were decoded from, with and without sharing their verbs and activities. Not part of the test suite, run it with:
+
+    python -m test.benchmarks.statement_memory_benchmark [--statements 10000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import StatementsResult, interning
+from test.test_utils import statements_result_json
+
+
+def footprint(build):
+    """Returns the number of bytes still allocated by what build returns
+
+    :param build: Function building the objects to measure
+    :type build: callable
+    :rtype: int
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+
+def benchmark(statements=10000):
+    """Measures the memory per statement of the parsed JSON of a page and of
+    its validated and trusted decoding, with and without interning
+
+    :rtype: dict
+    """
+    json_data = statements_result_json(statements)
+
+    sizes = {
+        "parsed JSON": footprint(lambda: json.loads(json_data)),
+        "validated": footprint(lambda: StatementsResult.from_json(json_data)),
+    }
+    if "trusted" in StatementsResult.from_json.__code__.co_varnames:
+        sizes["trusted"] = footprint(lambda: StatementsResult.from_json(json_data, trusted=True))
+
+    def decode_interned(**kwargs):
+        with interning():
+            return StatementsResult.from_json(json_data, **kwargs)
+
+    sizes["interned"] = footprint(decode_interned)
+    if "trusted" in sizes:
+        sizes["interned trusted"] = footprint(lambda: decode_interned(trusted=True))
+
+    return {k: v / statements for k, v in sizes.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--statements", type=int, default=10000, help="statements decoded")
+    args = parser.parse_args()
+
+    print(f"{args.statements} statements")
+    for name, size in benchmark(args.statements).items():
+        print(f"{name + ':':18} {size:8.0f} bytes/statement")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Compares the latency seen by a producer saving statements one at a time
+straight to a slow LRS and through a StatementQueue. Not part of the test
+suite, run it with:
+
+    python -m test.benchmarks.statement_queue_benchmark [--statements 200] [--delay 0.05]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import RemoteLRS, StatementQueue, Agent, Verb, Activity, Statement
+from test.test_utils import LocalHTTPServer, FakeLRSHandler
+
+
+class SlowLRSHandler(FakeLRSHandler):
+    """Takes `delay` seconds to answer each statements POST or PUT"""
+    delay = 0.05
+
+    def do_POST(self):
+        time.sleep(self.delay)
+        super(SlowLRSHandler, self).do_POST()
+
+    def do_PUT(self):
+        time.sleep(self.delay)
+        super(SlowLRSHandler, self).do_PUT()
+
+
+def _statements(count):
+    return [
+        Statement(
+            actor=Agent(mbox="mailto:tincanpython@tincanapi.com"),
+            verb=Verb(id="http://adlnet.gov/expapi/verbs/experienced"),
+            object=Activity(id=f"http://tincanapi.com/TinCanPython/Benchmark/{i}"),
+        )
+        for i in range(count)
+    ]
+
+
+def benchmark(statements=200, delay=0.05):
+    """Saves statements one by one directly and through a queue
+
+    :return: The mean seconds per save seen by the producer, and the seconds
+    until the queue was flushed
+    :rtype: dict
+    """
+    SlowLRSHandler.reset()
+    SlowLRSHandler.delay = delay
+    results = {}
+    with LocalHTTPServer(SlowLRSHandler) as server:
+        lrs = RemoteLRS(endpoint=server.endpoint)
+
+        start = time.perf_counter()
+        for statement in _statements(statements):
+            lrs.save_statement(statement)
+        results["direct"] = (time.perf_counter() - start) / statements
+
+        with tempfile.TemporaryDirectory() as directory:
+            queue = StatementQueue(lrs, os.path.join(directory, "statements.db"))
+            start = time.perf_counter()
+            for statement in _statements(statements):
+                queue.put(statement)
+            results["queued"] = (time.perf_counter() - start) / statements
+            queue.close()
+            results["queue flushed after"] = time.perf_counter() - start
+
+        lrs.connection_pool.clear()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--statements", type=int, default=200, help="statements saved")
+    parser.add_argument("--delay", type=float, default=0.05, help="seconds the LRS takes per request")
+    args = parser.parse_args()
+
+    results = benchmark(args.statements, args.delay)
+    print(f"{args.statements} statements, LRS answering in {args.delay * 1000:.0f} ms")
+    print(f"direct:              {results['direct'] * 1000:8.3f} ms/statement")
+    print(f"queued:              {results['queued'] * 1000:8.3f} ms/statement")
+    print(f"queue flushed after: {results['queue flushed after'] * 1000:8.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
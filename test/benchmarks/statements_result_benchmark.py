@@ -0,0 +1,63 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Compares the validated and trusted decoding of a page of statements, as
+returned by an LRS. Not part of the test suite, run it with:
+
+    python -m test.benchmarks.statements_result_benchmark [--statements 500]
+"""
+
+import argparse
+import timeit
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import StatementsResult
+from test.test_utils import statements_result_json
+
+
+def benchmark(statements=500, number=5, repeat=5):
+    """Times :meth:`tincan.StatementsResult.from_json` with and without
+    trusted decoding, returning the best time per page of each
+
+    :rtype: tuple(float, float)
+    """
+    json_data = statements_result_json(statements)
+
+    def best(trusted):
+        timer = timeit.Timer(lambda: StatementsResult.from_json(json_data, trusted=trusted))
+        return min(timer.repeat(repeat=repeat, number=number)) / number
+
+    return best(False), best(True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--statements", type=int, default=500, help="statements per page")
+    parser.add_argument("--number", type=int, default=5, help="pages decoded per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timings")
+    args = parser.parse_args()
+
+    validated, trusted = benchmark(args.statements, args.number, args.repeat)
+    print(f"{args.statements} statements per page")
+    print(f"validated: {validated * 1000:8.2f} ms/page")
+    print(f"trusted:   {trusted * 1000:8.2f} ms/page")
+    print(f"speedup:   {validated / trusted:8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Compares the peak memory and time of decoding a page of statements at once
+and of streaming it through StatementsResultParser. Not part of the test
+suite, run it with:
+
+    python -m test.benchmarks.statements_stream_benchmark [--statements 2000]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import StatementsResult, StatementsResultParser
+from test.test_utils import statements_result_json
+
+
+def _whole(data):
+    for _ in StatementsResult.from_json(data).statements:
+        pass
+
+
+def _streamed(data, chunk_size):
+    parser = StatementsResultParser()
+    for i in range(0, len(data), chunk_size):
+        for _ in parser.feed(data[i:i + chunk_size]):
+            pass
+    for _ in parser.close():
+        pass
+
+
+def measure(fn):
+    """Returns the peak memory allocated while running fn, and the duration
+    of another run without memory tracing
+
+    :rtype: tuple(int, float)
+    """
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    start = time.perf_counter()
+    fn()
+    return peak, time.perf_counter() - start
+
+
+def benchmark(statements=2000, chunk_size=64 * 1024):
+    """Measures decoding a page of statements at once and streamed in
+    chunk_size parts, not counting the body itself
+
+    :rtype: dict
+    """
+    data = statements_result_json(statements).encode("utf-8")
+    return {
+        "whole": measure(lambda: _whole(data)),
+        "streamed": measure(lambda: _streamed(data, chunk_size)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--statements", type=int, default=2000, help="statements per page")
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024, help="bytes per streamed part")
+    args = parser.parse_args()
+
+    print(f"{args.statements} statements per page")
+    for name, (peak, elapsed) in benchmark(args.statements, args.chunk_size).items():
+        print(f"{name + ':':10} peak {peak / 1024:10.0f} KiB, {elapsed * 1000:8.2f} ms/page")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Measures decoding a page of statements and building statements from dicts
+under each validation level, in statements per second. Not part of the test
+suite, run it with:
+
+    python -m test.benchmarks.validation_levels_benchmark [--statements 200] [--number 20]
+"""
+
+import argparse
+import json
+import timeit
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import Statement, StatementsResult, validating
+from tincan.validation import LEVELS, STRICT
+from test.test_utils import statements_result_json
+
+
+def benchmark(statements=200, number=20):
+    """Decodes the same page of statements, and builds its statements from
+    dicts, number times under each validation level. Under the "strict"
+    level, the statements built are also checked with validate, as decoded
+    ones are.
+
+    :return: Statements per second for each level, decoded ("from_json")
+    and built ("construct")
+    :rtype: dict
+    """
+    data = json.loads(statements_result_json(statements))
+    # only activities may have a context platform, or the page is not strict
+    for statement in data["statements"]:
+        if statement["object"].get("objectType") != "Activity":
+            del statement["context"]["platform"]
+    json_data = json.dumps(data)
+    dicts = data["statements"]
+
+    expected = StatementsResult.from_json(json_data)
+    result = {}
+    for level in LEVELS:
+        with validating(level):
+            assert StatementsResult.from_json(json_data) == expected
+            from_json = timeit.timeit(lambda: StatementsResult.from_json(json_data), number=number)
+            if level == STRICT:
+                construct = timeit.timeit(lambda: [Statement(d).validate() for d in dicts], number=number)
+            else:
+                construct = timeit.timeit(lambda: [Statement(d) for d in dicts], number=number)
+        result[level] = {
+            "from_json": statements * number / from_json,
+            "construct": statements * number / construct,
+        }
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--statements", type=int, default=200, help="statements in the page")
+    parser.add_argument("--number", type=int, default=20, help="times each page is decoded")
+    args = parser.parse_args()
+
+    result = benchmark(args.statements, args.number)
+    for level, rates in result.items():
+        print(f"{level:9s} from_json: {rates['from_json']:10.0f} statements/s   "
+              f"construct: {rates['construct']:10.0f} statements/s")
+
+
+if __name__ == '__main__':
+    main()
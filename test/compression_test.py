@@ -0,0 +1,76 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import gzip
+import io
+import unittest
+import zlib
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan.compression import DecodingReader, compress, compressible, decode
+from test.test_utils import statements_result_json
+
+
+class CompressionTest(unittest.TestCase):
+    data = statements_result_json(200).encode("utf-8")
+
+    def _encodings(self):
+        raw = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        return [
+            ("gzip", gzip.compress(self.data)),
+            ("x-gzip", gzip.compress(self.data)),
+            ("deflate", zlib.compress(self.data)),
+            ("deflate", raw.compress(self.data) + raw.flush()),
+        ]
+
+    def test_compress(self):
+        compressed = compress(self.data.decode("utf-8"))
+        self.assertEqual(gzip.decompress(compressed), self.data)
+        self.assertLess(len(compressed) * 10, len(self.data))
+
+    def test_compressible(self):
+        self.assertTrue(compressible("application/json"))
+        self.assertTrue(compressible("application/ld+json; charset=utf-8"))
+        self.assertTrue(compressible("text/plain"))
+        self.assertFalse(compressible("image/png"))
+        self.assertFalse(compressible("multipart/mixed; boundary=abc"))
+        self.assertFalse(compressible(None))
+
+    def test_decode(self):
+        for encoding, compressed in self._encodings():
+            self.assertEqual(decode(compressed, encoding), self.data)
+        self.assertEqual(decode(self.data, None), self.data)
+
+    def test_reader(self):
+        for encoding, compressed in self._encodings():
+            for size in (1, 1000, 1024 * 1024):
+                reader = DecodingReader(io.BytesIO(compressed).read, encoding)
+                chunks = list(iter(lambda: reader.read(size), b""))
+                self.assertTrue(all(len(chunk) <= size for chunk in chunks))
+                self.assertEqual(b"".join(chunks), self.data)
+
+    def test_reader_empty(self):
+        self.assertEqual(DecodingReader(io.BytesIO(b"").read, "gzip").read(), b"")
+
+    def test_reader_corrupt(self):
+        with self.assertRaises(zlib.error):
+            DecodingReader(io.BytesIO(b"not compressed at all").read, "gzip").read()
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(CompressionTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,284 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import asyncio
+import gzip
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import ConnectionPool, AsyncConnectionPool, RemoteLRS, About
+from test.test_utils import LocalHTTPServer
+
+
+class AboutHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    lock = threading.Lock()
+
+    # close the socket after each response without telling the client,
+    # the way an LRS drops idle keep-alive connections
+    drop_connections = False
+
+    def setup(self):
+        with self.lock:
+            self.__class__.connections += 1
+        super(AboutHandler, self).setup()
+
+    def do_GET(self):
+        body = b'{"version": ["1.0.3"]}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.close_connection = self.drop_connections
+
+    def log_message(self, *args):
+        pass
+
+
+class ChunkedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in (b'{"version": ', b'["1.0.3"]}'):
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args):
+        pass
+
+
+class GzipChunkedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = gzip.compress(b'{"version": ["1.0.3"]}')
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "gzip, chunked")
+        self.end_headers()
+        self.wfile.write(b"%x\r\n%s\r\n0\r\n\r\n" % (len(body), body))
+
+    def log_message(self, *args):
+        pass
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Sends back the body of a chunked request, along with its framing headers"""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = b""
+        while True:
+            size = int(self.rfile.readline().split(b";")[0], 16)
+            if size == 0:
+                self.rfile.readline()
+                break
+            body += self.rfile.read(size)
+            self.rfile.readline()
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Transfer-Encoding", self.headers.get("Transfer-Encoding", ""))
+        self.send_header("X-Content-Length", self.headers.get("Content-Length", ""))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    def setUp(self):
+        AboutHandler.connections = 0
+        AboutHandler.drop_connections = False
+
+    def test_init(self):
+        pool = ConnectionPool()
+        self.assertEqual(pool.max_size, 10)
+        self.assertEqual(pool.idle_count(), 0)
+
+    def test_init_bad_max_size(self):
+        with self.assertRaises(ValueError):
+            ConnectionPool(max_size=0)
+
+    def test_get_put(self):
+        pool = ConnectionPool(max_size=1)
+        conn1, reused = pool.get("http", "localhost", 8080)
+        self.assertFalse(reused)
+        conn2, reused = pool.get("http", "localhost", 8080)
+        self.assertFalse(reused)
+        self.assertIsNot(conn1, conn2)
+
+        pool.put(conn1, "http", "localhost", 8080)
+        pool.put(conn2, "http", "localhost", 8080)
+        self.assertEqual(pool.idle_count(), 1)
+        self.assertEqual(pool.idle_count("http", "localhost", 8080), 1)
+        self.assertEqual(pool.idle_count("https", "localhost", 8080), 0)
+
+        conn, reused = pool.get("http", "localhost", 8080)
+        self.assertTrue(reused)
+        self.assertIs(conn, conn1)
+
+    def test_clear(self):
+        pool = ConnectionPool()
+        conn, _ = pool.get("https", "localhost")
+        pool.put(conn, "https", "localhost")
+        pool.clear()
+        self.assertEqual(pool.idle_count(), 0)
+
+    def test_remote_lrs_default_pool(self):
+        lrs = RemoteLRS()
+        self.assertIsInstance(lrs.connection_pool, ConnectionPool)
+
+        pool = ConnectionPool(max_size=2)
+        lrs = RemoteLRS(connection_pool=pool)
+        self.assertIs(lrs.connection_pool, pool)
+
+    def test_remote_lrs_bad_pool(self):
+        with self.assertRaises(TypeError):
+            RemoteLRS(connection_pool=10)
+
+    def test_keep_alive(self):
+        with LocalHTTPServer(AboutHandler) as server:
+            lrs = RemoteLRS(endpoint=server.endpoint)
+            for _ in range(5):
+                response = lrs.about()
+                self.assertTrue(response.success)
+                self.assertIsInstance(response.content, About)
+            lrs.connection_pool.clear()
+
+        self.assertEqual(AboutHandler.connections, 1)
+
+    def test_stale_connection_retry(self):
+        AboutHandler.drop_connections = True
+        with LocalHTTPServer(AboutHandler) as server:
+            lrs = RemoteLRS(endpoint=server.endpoint)
+            for _ in range(3):
+                response = lrs.about()
+                self.assertTrue(response.success)
+            lrs.connection_pool.clear()
+
+        self.assertEqual(AboutHandler.connections, 3)
+
+    def test_threads(self):
+        results = []
+        with LocalHTTPServer(AboutHandler) as server:
+            lrs = RemoteLRS(endpoint=server.endpoint, connection_pool=ConnectionPool(max_size=4))
+
+            def worker():
+                for _ in range(5):
+                    results.append(lrs.about().success)
+
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertLessEqual(lrs.connection_pool.idle_count(), 4)
+            lrs.connection_pool.clear()
+
+        self.assertEqual(results, [True] * 20)
+        self.assertLessEqual(AboutHandler.connections, 4)
+
+
+class AsyncConnectionPoolTest(unittest.TestCase):
+    def test_init_bad_max_size(self):
+        with self.assertRaises(ValueError):
+            AsyncConnectionPool(max_size=0)
+
+    def test_get_put(self):
+        pool = AsyncConnectionPool(max_size=1)
+        conn1, reused = pool.get("http", "localhost", 8080)
+        self.assertFalse(reused)
+        conn2, _ = pool.get("http", "localhost", 8080)
+
+        pool.put(conn1, "http", "localhost", 8080)
+        pool.put(conn2, "http", "localhost", 8080)
+        self.assertEqual(pool.idle_count(), 1)
+
+        conn, reused = pool.get("http", "localhost", 8080)
+        self.assertTrue(reused)
+        self.assertIs(conn, conn1)
+
+    def test_request(self):
+        async def run(port, handler):
+            pool = AsyncConnectionPool()
+            conn, _ = pool.get("http", "127.0.0.1", port)
+            try:
+                first = await conn.request("GET", "/about")
+                second = await conn.request("GET", "/about")
+            finally:
+                conn.close()
+            return first, second
+
+        for handler in (AboutHandler, ChunkedHandler):
+            with LocalHTTPServer(handler) as server:
+                port = server.server.server_address[1]
+                (response, data), (_, data2) = asyncio.run(run(port, handler))
+
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.getheader("Content-Type"), "application/json")
+            self.assertFalse(response.will_close)
+            self.assertEqual(data, b'{"version": ["1.0.3"]}')
+            self.assertEqual(data2, data)
+
+    def test_request_chunked_transfer_codings(self):
+        async def run(port):
+            conn, _ = AsyncConnectionPool(timeout=5).get("http", "127.0.0.1", port)
+            try:
+                # the second request only gets an answer if the first body was read to its end
+                return await conn.request("GET", "/about"), await conn.request("GET", "/about")
+            finally:
+                conn.close()
+
+        with LocalHTTPServer(GzipChunkedHandler) as server:
+            (response, data), (_, data2) = asyncio.run(run(server.server.server_address[1]))
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(gzip.decompress(data), b'{"version": ["1.0.3"]}')
+        self.assertEqual(data2, data)
+
+    def test_request_iterable_body(self):
+        async def run(port):
+            conn, _ = AsyncConnectionPool(timeout=5).get("http", "127.0.0.1", port)
+            try:
+                first = await conn.request("POST", "/echo", body=iter([b"abc", b"", "d\u00e9f"]))
+                second = await conn.request("POST", "/echo", body=iter([b"ghi"]))
+            finally:
+                conn.close()
+            return first, second
+
+        with LocalHTTPServer(EchoHandler) as server:
+            (response, data), (_, data2) = asyncio.run(run(server.server.server_address[1]))
+
+        self.assertEqual(response.getheader("X-Transfer-Encoding"), "chunked")
+        self.assertEqual(response.getheader("X-Content-Length"), "")
+        self.assertEqual(data, "abcd\u00e9f".encode("utf-8"))
+        self.assertEqual(data2, b"ghi")
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(ConnectionPoolTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
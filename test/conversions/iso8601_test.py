@@ -15,6 +15,7 @@
 import unittest
 from datetime import timedelta, datetime
 
+import aniso8601
 from pytz import utc, timezone
 
 
@@ -29,6 +30,7 @@ if __name__ == '__main__':
 from tincan.conversions.iso8601 import (
     make_timedelta, jsonify_timedelta,
     make_datetime, _make_datetime, jsonify_datetime,
+    make_trusted_datetime, make_trusted_timedelta,
 )
 
 timezone('US/Central')
@@ -410,6 +412,71 @@ class ISO8601Test(unittest.TestCase):
             # naive timestamps raise ValueError
             make_datetime('2014-06-19T16:40:22.293913')
 
+    def test_trusted_iso_to_datetime(self):
+        for value in [
+            '2014-06-19T17:03:17Z',
+            '2014-06-19T17:03:17.361Z',
+            '2014-06-19T17:03:17.361077-05:00',
+            '2014-06-19T17:03:17.3610779+0530',
+            '2014-06-19T17:03:17.1+00:00',
+            '2014-06-19T17:03Z',
+        ]:
+            dt = make_trusted_datetime(value)
+            self.assertEqual(dt, make_datetime(value))
+            self.assertEqual(jsonify_datetime(dt), jsonify_datetime(make_datetime(value)))
+
+        with self.assertRaises(ValueError):
+            make_trusted_datetime('2014-06-19T17:03:17.361077')
+
+        with self.assertRaises(ValueError):
+            make_trusted_datetime('2014-13-19T17:03:17Z')
+
+    def test_trusted_iso_to_timedelta(self):
+        for value in [
+            'PT0S',
+            'PT1M1S',
+            'PT00.225S',
+            'PT12.3456789S',
+            'P1DT2H3M4.5S',
+            'P3D',
+            'PT2H',
+            'PT02.5000M',
+            'P1Y2M',
+        ]:
+            self.assertEqual(make_trusted_timedelta(value), make_timedelta(value))
+
+        for value in ['P', 'PT', 'P1DT', 'PT1.5M2S']:
+            with self.assertRaises(ValueError):
+                make_trusted_timedelta(value)
+
+    def test_canonical_formats_match_aniso8601(self):
+        for value in [
+            '2014-06-19T17:03:17Z',
+            '2014-06-19T17:03:17.361Z',
+            '2014-06-19T17:03:17.361077-05:00',
+            '2014-06-19T17:03:17.3610779+0530',
+            '2014-06-19T17:03:17.999999999+00:00',
+            '2014-06-19T24:00:00Z',
+        ]:
+            dt = make_datetime(value)
+            expected = aniso8601.parse_datetime(value)
+            self.assertEqual(dt, expected)
+            self.assertEqual(dt.utcoffset(), expected.utcoffset())
+            self.assertEqual(jsonify_datetime(dt), jsonify_datetime(expected))
+
+        for value in ['PT0S', 'PT12.3456789S', 'P1DT25H61M4.5S', 'P0D', 'P1W']:
+            self.assertEqual(make_timedelta(value), aniso8601.parse_duration(value))
+
+    def test_parsing_is_cached(self):
+        self.assertIs(make_datetime('2014-06-19T17:03:17.361Z'), make_datetime('2014-06-19T17:03:17.361Z'))
+        self.assertIs(make_timedelta('PT1M30S'), make_timedelta('PT1M30S'))
+        self.assertIs(jsonify_timedelta(timedelta(minutes=1, seconds=30)), jsonify_timedelta(timedelta(seconds=90)))
+
+        with self.assertRaises(ValueError):
+            make_datetime('2014-06-19T17:03:17.361')
+        with self.assertRaises(ValueError):
+            make_datetime('2014-06-19T17:03:17.361')
+
     def test_bad_datetime_to_iso(self):
         with self.assertRaises(AssertionError):
             jsonify_datetime('2014-06-19T17:03:17.361077-05:00')
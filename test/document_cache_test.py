@@ -0,0 +1,106 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import unittest
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import DocumentCache, StateDocument
+
+
+class DocumentCacheTest(unittest.TestCase):
+    @staticmethod
+    def _key(state_id, registration=None):
+        params = {"activityId": "http://example.com/a", "agent": '{"mbox": "mailto:a@example.com"}',
+                  "stateId": state_id}
+        if registration is not None:
+            params["registration"] = registration
+        return DocumentCache.key("activities/state", params)
+
+    @staticmethod
+    def _doc(state_id, etag='"1"'):
+        return StateDocument(id=state_id, content="{}", etag=etag)
+
+    def test_bad_max_size(self):
+        with self.assertRaises(ValueError):
+            DocumentCache(max_size=0)
+
+    def test_key(self):
+        self.assertEqual(
+            DocumentCache.key("agents/profile", {"agent": "{}", "profileId": "p"}),
+            ("agents/profile", None, "{}", None, "p"),
+        )
+        self.assertNotEqual(self._key("s"), self._key("s", registration="r"))
+
+    def test_get_put(self):
+        cache = DocumentCache()
+        self.assertIsNone(cache.get(self._key("s")))
+
+        doc = self._doc("s")
+        cache.put(self._key("s"), doc)
+        cached = cache.get(self._key("s"))
+        self.assertEqual(cached.etag, '"1"')
+
+        # callers get copies, so changing them does not change the cache
+        self.assertIsNot(cached, doc)
+        cached.content.extend(b"changed")
+        doc.content = "changed"
+        self.assertEqual(cache.get(self._key("s")).content, bytearray(b"{}"))
+
+        self.assertEqual(cache.stats(), {"size": 1, "hits": 2, "misses": 1})
+
+    def test_put_without_etag(self):
+        cache = DocumentCache()
+        cache.put(self._key("s"), self._doc("s"))
+        cache.put(self._key("s"), self._doc("s", etag=None))
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        cache = DocumentCache(max_size=2)
+        cache.put(self._key("a"), self._doc("a"))
+        cache.put(self._key("b"), self._doc("b"))
+        cache.get(self._key("a"))
+        cache.put(self._key("c"), self._doc("c"))
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(self._key("b")))
+        self.assertIsNotNone(cache.get(self._key("a")))
+        self.assertIsNotNone(cache.get(self._key("c")))
+
+    def test_discard(self):
+        cache = DocumentCache()
+        for state_id in ("a", "b"):
+            cache.put(self._key(state_id), self._doc(state_id))
+            cache.put(self._key(state_id, registration="r"), self._doc(state_id))
+
+        cache.discard(self._key("a"))
+        self.assertEqual(len(cache), 3)
+
+        cache.discard_matching(("activities/state", "http://example.com/a", None, "r", None))
+        self.assertEqual(len(cache), 1)
+        self.assertIsNotNone(cache.get(self._key("b")))
+
+        cache.discard_matching(self._key(None))
+        self.assertEqual(len(cache), 0)
+
+        cache.put(self._key("a"), self._doc("a"))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(DocumentCacheTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -84,6 +84,17 @@ class GroupTest(unittest.TestCase):
                          json.loads('{"member": [{"name": "test", "objectType": "Agent"}, '
                                     '{"name": "test2", "objectType": "Agent"}], "objectType": "Group"}'))
 
+    def test_ToQueryParam(self):
+        group = Group(mbox="mailto:group@test.com", member=[{"name": "test"}])
+        self.assertEqual(group.to_query_param(), group.to_json())
+
+        group.member[0].name = "changed"
+        self.assertEqual(group.to_query_param(), group.to_json())
+
+        group.addmember(Agent(name="test2"))
+        self.assertEqual(group.to_query_param(), group.to_json())
+        self.assertIn("test2", group.to_query_param())
+
 
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(GroupTest)
@@ -184,6 +184,20 @@ class HTTPRequestTest(unittest.TestCase):
         self.assertTrue("tester" in req.query_params)
         self.assertEqual(req.query_params["tester"], "test")
 
+    def test_idempotent(self):
+        for method in ("GET", "PUT", "DELETE", "head"):
+            self.assertTrue(HTTPRequest(method=method).idempotent)
+        self.assertFalse(HTTPRequest(method="POST").idempotent)
+        self.assertFalse(HTTPRequest().idempotent)
+
+        req = HTTPRequest(method="POST", idempotent=True)
+        self.assertTrue(req.idempotent)
+        req.idempotent = None
+        self.assertFalse(req.idempotent)
+        req.method = "PUT"
+        req.idempotent = 0
+        self.assertFalse(req.idempotent)
+
 
 if __name__ == "__main__":
     suite = unittest.TestLoader().loadTestsFromTestCase(HTTPRequestTest)
@@ -0,0 +1,150 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import http.client
+import io
+import unittest
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import HTTPRequest, LRSResponse, MetricsCollector, RequestHooks
+from tincan.instrumentation import endpoint_name
+
+
+class _Socket(object):
+    def __init__(self, raw):
+        self.raw = raw
+
+    def makefile(self, *args, **kwargs):
+        return io.BytesIO(self.raw)
+
+
+def _response(request, status, timings):
+    response = http.client.HTTPResponse(_Socket(f"HTTP/1.1 {status} X\r\nContent-Length: 0\r\n\r\n".encode()))
+    response.begin()
+    return LRSResponse(success=status < 400, request=request, response=response, data="", timings=timings)
+
+
+class InstrumentationTest(unittest.TestCase):
+    def test_endpoint_name(self):
+        for resource, name in (
+            ("statements", "statements"),
+            ("activities/state", "activities/state"),
+            ("activities/profile", "activities/profile"),
+            ("agents/profile", "agents/profile"),
+            ("agents", "agents"),
+            ("about", "about"),
+            ("http://lrs.example.com/xapi/statements?more=abc", "statements"),
+            ("http://lrs.example.com/xapi/activities/state/", "activities/state"),
+            ("extensions/thing", "other"),
+        ):
+            self.assertEqual(endpoint_name(HTTPRequest(method="GET", resource=resource)), name)
+
+    def test_hooks_do_nothing(self):
+        hooks = RequestHooks()
+        request = HTTPRequest(method="GET", resource="about")
+        hooks.before_request(request)
+        hooks.after_response(request, _response(request, 200, {}))
+        hooks.after_decode(request, _response(request, 200, {}))
+        hooks.on_error(request, ValueError())
+
+    def test_histograms(self):
+        metrics = MetricsCollector(buckets=(0.1, 1.0))
+        request = HTTPRequest(method="GET", resource="statements")
+        metrics.after_response(request, _response(request, 200, {"wait": 0.05, "read": 0.5, "total": 0.6}))
+        metrics.after_response(request, _response(request, 200, {"wait": 0.2, "read": 2.0, "total": 2.5}))
+        metrics.after_response(request, _response(request, 503, {"wait": 0.01, "read": 0.0, "total": 0.01}))
+
+        lrs_response = _response(request, 200, {"decode": 0.02})
+        metrics.after_decode(request, lrs_response)
+        # responses that were not timed are ignored
+        metrics.after_decode(request, _response(request, 200, None))
+
+        metrics.on_error(HTTPRequest(method="PUT", resource="activities/state"), ConnectionResetError())
+
+        self.assertEqual(metrics.request_count(), 3)
+        self.assertEqual(metrics.request_count("statements"), 3)
+        self.assertEqual(metrics.request_count("about"), 0)
+        self.assertEqual(metrics.error_count(), 1)
+        self.assertEqual(metrics.error_count("activities/state"), 1)
+
+        lines = metrics.prometheus().splitlines()
+        labels = 'endpoint="statements",method="GET",status="200"'
+        self.assertIn("# TYPE tincan_request_duration_seconds histogram", lines)
+        self.assertIn(f'tincan_request_duration_seconds_bucket{{{labels},le="0.1"}} 0', lines)
+        self.assertIn(f'tincan_request_duration_seconds_bucket{{{labels},le="1"}} 1', lines)
+        self.assertIn(f'tincan_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2', lines)
+        self.assertIn(f'tincan_request_duration_seconds_sum{{{labels}}} 3.1', lines)
+        self.assertIn(f'tincan_request_duration_seconds_count{{{labels}}} 2', lines)
+        self.assertIn(
+            'tincan_request_duration_seconds_count{endpoint="statements",method="GET",status="503"} 1', lines
+        )
+
+        labels = 'endpoint="statements",method="GET",phase="read"'
+        self.assertIn(f'tincan_request_phase_seconds_bucket{{{labels},le="1"}} 2', lines)
+        self.assertIn(f'tincan_request_phase_seconds_count{{{labels}}} 3', lines)
+        self.assertIn(
+            'tincan_request_phase_seconds_count{endpoint="statements",method="GET",phase="decode"} 1', lines
+        )
+        self.assertIn(
+            'tincan_request_errors_total{endpoint="activities/state",method="PUT",error="ConnectionResetError"} 1',
+            lines
+        )
+
+        metrics.reset()
+        self.assertEqual(metrics.request_count(), 0)
+        self.assertNotIn("_count{", metrics.prometheus())
+
+    def test_statsd(self):
+        metrics = MetricsCollector(namespace="lrs")
+        request = HTTPRequest(method="GET", resource="activities/state")
+        metrics.after_response(request, _response(request, 200, {"wait": 0.0125, "total": 0.02}))
+        metrics.on_error(request, TimeoutError())
+
+        self.assertEqual(metrics.statsd(), [
+            "lrs.activities_state.GET.wait:12.500|ms",
+            "lrs.activities_state.GET.total:20.000|ms",
+            "lrs.activities_state.GET.error.TimeoutError:1|c",
+        ])
+        # the samples are handed out once
+        self.assertEqual(metrics.statsd(), [])
+
+        # but stay in the histograms
+        self.assertEqual(metrics.request_count(), 1)
+
+    def test_statsd_max_samples(self):
+        metrics = MetricsCollector(max_samples=2)
+        request = HTTPRequest(method="GET", resource="about")
+        for total in (1.0, 2.0, 3.0):
+            metrics.after_response(request, _response(request, 200, {"total": total}))
+
+        self.assertEqual(metrics.statsd(), ["tincan.about.GET.total:2000.000|ms", "tincan.about.GET.total:3000.000|ms"])
+
+    def test_label_escaping(self):
+        metrics = MetricsCollector()
+        request = HTTPRequest(method="GET", resource="about")
+
+        class Quoted(Exception):
+            pass
+
+        Quoted.__name__ = 'Quo"ted'
+        metrics.on_error(request, Quoted())
+        self.assertIn('error="Quo\\"ted"', metrics.prometheus())
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(InstrumentationTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
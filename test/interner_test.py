@@ -0,0 +1,153 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import copy
+import gc
+import json
+import pickle
+import unittest
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import Activity, Interner, LanguageMap, Statement, StatementsResult, Verb, interning
+from test.test_utils import statements_result_json
+
+
+class InternerTest(unittest.TestCase):
+    def setUp(self):
+        self.json_data = statements_result_json(8)
+
+    def test_bad_max_size(self):
+        with self.assertRaises(ValueError):
+            Interner(max_size=0)
+
+    def test_inactive(self):
+        result = StatementsResult.from_json(self.json_data)
+        self.assertIsNot(result.statements[0].verb, result.statements[1].verb)
+        result.statements[0].verb.display["fr-FR"] = "vécu"
+
+    def _check_shared(self, trusted):
+        with interning() as interner:
+            result = StatementsResult.from_json(self.json_data, trusted=trusted)
+
+        statements = result.statements
+        self.assertIs(statements[0].verb, statements[1].verb)
+        self.assertIs(statements[0].verb.display, statements[1].verb.display)
+        self.assertIs(statements[0].context.context_activities.parent[0],
+                      statements[1].context.context_activities.parent[0])
+        # activities with different content are not shared
+        self.assertIsNot(statements[0].object, statements[4].object)
+        self.assertEqual(statements[0].object.id, "http://example.com/activities/0")
+
+        stats = interner.stats()
+        self.assertEqual(stats["hits"] + stats["misses"], 8 * 3 + 2 * 3)
+        self.assertGreater(stats["hits"], 16)
+
+        # the result is the same as without interning
+        self.assertEqual(result.to_json(), StatementsResult.from_json(self.json_data).to_json())
+
+    def test_shared(self):
+        self._check_shared(trusted=False)
+
+    def test_shared_trusted(self):
+        self._check_shared(trusted=True)
+
+    def test_validated_not_shared_with_trusted(self):
+        with interning() as interner:
+            trusted = Statement.from_json(json.dumps(json.loads(self.json_data)["statements"][0]), trusted=True)
+            validated = Statement.from_json(json.dumps(json.loads(self.json_data)["statements"][0]))
+        self.assertIsNot(trusted.verb, validated.verb)
+        self.assertEqual(trusted.verb, validated.verb)
+        self.assertEqual(interner.stats()["hits"], 0)
+
+    def test_read_only(self):
+        with interning():
+            verb = Statement.from_json(json.dumps(json.loads(self.json_data)["statements"][0])).verb
+            activity = Statement.from_json(json.dumps(json.loads(self.json_data)["statements"][0])).object
+
+        self.assertIsInstance(verb, Verb)
+        self.assertIsInstance(verb.display, LanguageMap)
+        self.assertEqual(type(verb).__name__, "Verb")
+        with self.assertRaises(AttributeError):
+            verb.id = "http://example.com/verb"
+        with self.assertRaises(AttributeError):
+            del verb.display
+        with self.assertRaises(TypeError):
+            verb.display["fr-FR"] = "vécu"
+        with self.assertRaises(TypeError):
+            verb.display.update({"fr-FR": "vécu"})
+        with self.assertRaises(TypeError):
+            activity.definition.name.clear()
+        with self.assertRaises(TypeError):
+            activity.definition.extensions["http://example.com/ext"]["index"] = "1"
+
+        self.assertEqual(verb, Verb(id="http://adlnet.gov/expapi/verbs/experienced", display={"en-US": "experienced"}))
+        self.assertEqual(Verb(id="http://adlnet.gov/expapi/verbs/experienced", display={"en-US": "experienced"}), verb)
+
+    def test_copy(self):
+        with interning():
+            statement = Statement.from_json(json.dumps(json.loads(self.json_data)["statements"][0]))
+
+        for copied in (copy.copy(statement.object), copy.deepcopy(statement.object),
+                       pickle.loads(pickle.dumps(statement.object))):
+            self.assertIs(type(copied), Activity)
+            self.assertEqual(copied, statement.object)
+            copied.definition.name["fr-FR"] = "Activité 0"
+            copied.definition.extensions["http://example.com/ext"]["index"] = "1"
+            self.assertNotIn("fr-FR", statement.object.definition.name)
+
+        # copying a statement gives it its own verb and activity
+        copied = copy.deepcopy(statement)
+        copied.verb.display["fr-FR"] = "vécu"
+        self.assertNotIn("fr-FR", statement.verb.display)
+
+    def test_weak_references(self):
+        interner = Interner()
+        with interning(interner):
+            result = StatementsResult.from_json(self.json_data)
+        self.assertGreater(len(interner), 0)
+
+        del result
+        gc.collect()
+        self.assertEqual(len(interner), 0)
+
+    def test_max_size(self):
+        interner = Interner(max_size=1)
+        with interning(interner):
+            result = StatementsResult.from_json(self.json_data)
+
+        self.assertEqual(len(interner), 1)
+        statements = result.statements
+        self.assertIs(statements[0].verb, statements[1].verb)
+        self.assertIsNot(statements[0].context.context_activities.parent[0],
+                         statements[1].context.context_activities.parent[0])
+        statements[0].context.context_activities.parent[0].id = "http://example.com/changed"
+
+    def test_reused(self):
+        interner = Interner()
+        with interning(interner):
+            first = StatementsResult.from_json(self.json_data)
+        with interning(interner):
+            second = StatementsResult.from_json(self.json_data)
+
+        self.assertIs(first.statements[0].verb, second.statements[0].verb)
+        interner.clear()
+        self.assertEqual(len(interner), 0)
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(InternerTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,109 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import datetime
+import json
+import unittest
+import uuid
+
+from pytz import utc
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import JSONCodec, StatementsResult
+from tincan.conversions.iso8601 import jsonify_timedelta
+from tincan.json_codec import available_codecs, get_codec, get_default_codec, set_default_codec
+from test.test_utils import statements_result_json
+
+
+class JSONCodecTest(unittest.TestCase):
+    def tearDown(self):
+        set_default_codec(None)
+
+    def test_get_codec(self):
+        self.assertIs(get_codec(), get_default_codec())
+        self.assertIs(get_codec("json"), get_codec("json"))
+        self.assertEqual(get_codec("json").name, "json")
+        codec = JSONCodec()
+        self.assertIs(get_codec(codec), codec)
+        self.assertIn(get_codec("auto").name, available_codecs())
+        self.assertEqual(available_codecs()[-1], "json")
+
+    def test_get_codec_unknown(self):
+        with self.assertRaises(ValueError):
+            get_codec("yaml")
+
+    def test_set_default_codec(self):
+        codec = JSONCodec()
+        set_default_codec(codec)
+        self.assertIs(get_default_codec(), codec)
+        set_default_codec(None)
+        self.assertIs(get_default_codec(), get_codec("json"))
+
+    def test_stdlib_matches_json(self):
+        data = json.loads(statements_result_json(3))
+        self.assertEqual(get_codec("json").dumps(data), json.dumps(data))
+
+    def test_native_types(self):
+        data = {
+            "id": uuid.UUID("016699c6-d600-48a7-96ab-86187498f16f"),
+            "timestamp": datetime.datetime(2014, 6, 1, 12, 30, 5, 250000, tzinfo=utc),
+            "duration": datetime.timedelta(minutes=1, seconds=30),
+        }
+        expected = {
+            "id": "016699c6-d600-48a7-96ab-86187498f16f",
+            "timestamp": "2014-06-01T12:30:05.250000+00:00",
+            "duration": jsonify_timedelta(datetime.timedelta(minutes=1, seconds=30)),
+        }
+        for name in available_codecs():
+            codec = get_codec(name)
+            self.assertEqual(codec.loads(codec.dumps(data)), expected, name)
+
+        with self.assertRaises(TypeError):
+            get_codec("json").dumps({"value": object()})
+
+    def test_codecs_round_trip(self):
+        json_data = statements_result_json(5)
+        expected = StatementsResult.from_json(json_data)
+        for name in available_codecs():
+            result = StatementsResult.from_json(json_data, codec=name)
+            self.assertEqual(result, expected, name)
+            self.assertEqual(json.loads(result.to_json(codec=name)), json.loads(expected.to_json()), name)
+
+    def test_default_codec_is_used(self):
+        calls = []
+
+        class RecordingCodec(JSONCodec):
+            def loads(self, json_data):
+                calls.append(json_data)
+                return super(RecordingCodec, self).loads(json_data)
+
+        set_default_codec(RecordingCodec())
+        StatementsResult.from_json(statements_result_json(1))
+        self.assertEqual(len(calls), 1)
+
+    @unittest.skipUnless("orjson" in available_codecs(), "orjson is not installed")
+    def test_orjson(self):
+        codec = get_codec("orjson")
+        self.assertEqual(codec.dumps({"a": [1, "b"]}), '{"a":[1,"b"]}')
+        self.assertEqual(codec.loads(b'{"a": [1, "b"]}'), {"a": [1, "b"]})
+        with self.assertRaises(ValueError):
+            codec.loads("{")
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(JSONCodecTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,147 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import copy
+import json
+import pickle
+import unittest
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import (
+    Context,
+    LazyStatement,
+    LazyStatementsResult,
+    Result,
+    Statement,
+    StatementsResult,
+    Verb,
+    Version,
+)
+from test.test_utils import statements_result_json
+
+
+class LazyStatementTest(unittest.TestCase):
+    def setUp(self):
+        self.data = json.loads(statements_result_json(4))["statements"]
+
+    def test_decoded_on_read(self):
+        statement = LazyStatement(self.data[0])
+        self.assertEqual(set(statement._raw), {
+            "id", "actor", "verb", "object", "result", "context", "timestamp", "stored", "authority", "version",
+        })
+
+        self.assertIsInstance(statement.verb, Verb)
+        self.assertEqual(statement.verb.id, "http://adlnet.gov/expapi/verbs/experienced")
+        self.assertEqual(str(statement.id), "00000000-0000-4000-8000-000000000001")
+        self.assertNotIn("verb", statement._raw)
+        self.assertIn("context", statement._raw)
+
+        self.assertIsInstance(statement.context, Context)
+        self.assertIsInstance(statement.result, Result)
+        self.assertEqual(statement.version, "1.0.0")
+        self.assertIsNone(statement.attachments)
+
+    def test_same_as_statement(self):
+        for data in self.data:
+            lazy = LazyStatement(data)
+            statement = Statement(data)
+            self.assertEqual(lazy, statement)
+            self.assertEqual(statement, lazy)
+            self.assertEqual(LazyStatement(data), lazy)
+            self.assertEqual(Statement.from_json(LazyStatement(data).to_json()), statement)
+
+    def test_as_version(self):
+        statement = LazyStatement(self.data[0])
+        statement.verb.display["fr-FR"] = "vécu"
+        statement.result = None
+
+        serialized = statement.as_version(Version.latest)
+        # parts never read are the parsed JSON, untouched
+        self.assertIs(serialized["context"], self.data[0]["context"])
+        self.assertEqual(serialized["verb"]["display"], {"en-US": "experienced", "fr-FR": "vécu"})
+        self.assertNotIn("result", serialized)
+        self.assertEqual(list(serialized), [k for k in Statement(self.data[0]).as_version() if k != "result"])
+        self.assertEqual(LazyStatement(self.data[0]).as_version()["version"], "1.0.0")
+
+    def test_set_and_delete(self):
+        statement = LazyStatement(self.data[0])
+        statement.context = {"platform": "other"}
+        self.assertEqual(statement.context.platform, "other")
+        del statement.result
+        self.assertNotIn("result", statement._raw)
+        self.assertFalse(hasattr(statement, "result"))
+
+    def test_validated_on_read(self):
+        self.data[0]["timestamp"] = "not a timestamp"
+        statement = LazyStatement(self.data[0])
+        self.assertEqual(statement.verb.id, "http://adlnet.gov/expapi/verbs/experienced")
+        with self.assertRaises(ValueError):
+            statement.timestamp
+        # the property stays undecoded
+        with self.assertRaises(ValueError):
+            statement.timestamp
+
+    def test_unknown_property(self):
+        with self.assertRaises(AttributeError):
+            LazyStatement({"verb": {"id": "http://example.com/verb"}, "unknown": 1})
+
+    def test_objects(self):
+        verb = Verb(id="http://example.com/verb")
+        statement = LazyStatement(verb=verb, actor={"mbox": "mailto:a@example.com"})
+        self.assertIs(statement.verb, verb)
+        self.assertEqual(set(statement._raw), {"actor"})
+
+        copied = LazyStatement(LazyStatement(self.data[1]))
+        self.assertEqual(copied, Statement(self.data[1]))
+        self.assertEqual(copied._raw, {})
+
+    def test_copy(self):
+        statement = LazyStatement(self.data[0])
+        for copied in (copy.copy(statement), copy.deepcopy(statement), pickle.loads(pickle.dumps(statement))):
+            self.assertIsInstance(copied, LazyStatement)
+            self.assertEqual(copied, Statement(self.data[0]))
+            self.assertIsNot(copied._raw, statement._raw)
+
+    def test_decode_in_place(self):
+        statement = LazyStatement(self.data[0])
+        raw = statement._raw
+        statement.verb
+        del statement.context
+        self.assertIs(statement._raw, raw)
+        self.assertNotIn("verb", raw)
+        self.assertNotIn("context", raw)
+
+    def test_from_json(self):
+        json_data = statements_result_json(4)
+        for trusted in (False, True):
+            result = LazyStatementsResult.from_json(json_data, trusted=trusted)
+            self.assertTrue(all(isinstance(s, LazyStatement) for s in result.statements))
+            self.assertEqual(StatementsResult.from_json(json_data), result)
+            self.assertEqual(StatementsResult.from_json(result.to_json()), StatementsResult.from_json(json_data))
+
+        statement = LazyStatement.from_json(json.dumps(self.data[2]), trusted=True)
+        self.assertIsInstance(statement, LazyStatement)
+
+        result = LazyStatementsResult()
+        result.statements = [Statement(self.data[0]), self.data[1]]
+        self.assertIs(type(result.statements[0]), Statement)
+        self.assertIsInstance(result.statements[1], LazyStatement)
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(LazyStatementTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
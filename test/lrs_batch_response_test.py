@@ -0,0 +1,54 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import unittest
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import LRSBatchResponse, LRSResponse
+
+
+class LRSBatchResponseTest(unittest.TestCase):
+    def test_init_empty(self):
+        resp = LRSBatchResponse()
+        self.assertEqual(resp.responses, [])
+        self.assertTrue(resp.success)
+        self.assertIsNone(resp.content)
+
+    def test_init_kwarg_exception(self):
+        with self.assertRaises(AttributeError):
+            LRSBatchResponse(bad_test="test")
+
+    def test_success(self):
+        resp = LRSBatchResponse(responses=[LRSResponse(success=True), LRSResponse(success=True)])
+        self.assertTrue(resp.success)
+        self.assertEqual(resp.failed_responses, [])
+
+    def test_failure(self):
+        failed = LRSResponse(success=False)
+        resp = LRSBatchResponse(responses=[LRSResponse(success=True), failed], content=[1, 2])
+        self.assertFalse(resp.success)
+        self.assertEqual(resp.failed_responses, [failed])
+        self.assertEqual(resp.content, [1, 2])
+
+    def test_responses_from_dicts(self):
+        resp = LRSBatchResponse(responses=[{"success": True}])
+        self.assertIsInstance(resp.responses[0], LRSResponse)
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(LRSBatchResponseTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
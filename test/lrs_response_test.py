@@ -141,6 +141,21 @@ class LRSResponseTest(unittest.TestCase):
         self.assertIsInstance(resp.data, str)
         self.assertEqual(resp.data, u"δοκιμή περιεχομένου")
 
+    def test_raw_data(self):
+        body = b'{"id": "\xce\xb4"}'
+        resp = LRSResponse(data=body)
+        self.assertIs(resp.raw_data, body)
+        self.assertIsNone(resp._data)
+        self.assertEqual(resp.data, u'{"id": "δ"}')
+        # once decoded, the body is only held as text
+        self.assertIsNone(resp._raw_data)
+        self.assertEqual(resp.raw_data, body)
+
+        resp.data = u"δ"
+        self.assertEqual(resp.raw_data, b"\xce\xb4")
+        resp.data = None
+        self.assertIsNone(resp.raw_data)
+
     def test_setters_none(self):
         resp = LRSResponse()
 
@@ -0,0 +1,120 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import hashlib
+import io
+import mmap
+import tempfile
+import unittest
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import AttachmentPayload
+from tincan import multipart
+from tincan.multipart import MultipartBody, multipart_boundary, read_statements_body
+
+
+class MultipartTest(unittest.TestCase):
+    content = bytes(range(256)) * 1000 + b"\r\n--not-a-boundary\r\n"
+
+    def test_payload_bytes(self):
+        payload = AttachmentPayload(self.content, content_type="application/octet-stream")
+        self.assertEqual(payload.sha2, hashlib.sha256(self.content).hexdigest())
+        self.assertEqual(payload.length, len(self.content))
+        self.assertEqual(payload.read(), self.content)
+
+    def test_payload_file(self):
+        f = io.BytesIO(b"prefix" + self.content)
+        f.seek(6)
+        payload = AttachmentPayload(f)
+        self.assertEqual(payload.sha2, hashlib.sha256(self.content).hexdigest())
+        self.assertEqual(payload.length, len(self.content))
+        self.assertEqual(payload.read(), self.content)
+        self.assertEqual(b"".join(payload.chunks(1000)), self.content)
+
+    def test_payload_mmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(self.content)
+            f.flush()
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                payload = AttachmentPayload(mapped)
+                self.assertEqual(payload.sha2, hashlib.sha256(self.content).hexdigest())
+                self.assertEqual(payload.read(), self.content)
+            finally:
+                del payload
+                mapped.close()
+
+    def test_payload_given_hash_not_computed(self):
+        payload = AttachmentPayload(io.BytesIO(self.content), sha2="abc", length=10)
+        self.assertEqual(payload.sha2, "abc")
+        self.assertEqual(payload.read(), self.content[:10])
+
+    def test_payload_bad_source(self):
+        with self.assertRaises(TypeError):
+            AttachmentPayload("text")
+
+    def test_multipart_boundary(self):
+        self.assertEqual(multipart_boundary('multipart/mixed; boundary="abc"'), "abc")
+        self.assertEqual(multipart_boundary("multipart/mixed; boundary=abc"), "abc")
+        self.assertIsNone(multipart_boundary("application/json"))
+        self.assertIsNone(multipart_boundary(None))
+
+    def test_body_round_trip(self):
+        payloads = [AttachmentPayload(self.content), AttachmentPayload(b"second", content_type="text/plain")]
+        body = MultipartBody('{"id": "é"}', [(payloads[0], "image/png"), (payloads[1], "text/plain")])
+        data = b"".join(bytes(chunk) for chunk in body)
+        self.assertEqual(len(data), len(body))
+        self.assertEqual(b"".join(bytes(chunk) for chunk in body), data)
+
+        for chunk_size in (1, 7, 100, 64 * 1024):
+            json_data, attachments = read_statements_body(body.content_type, io.BytesIO(data).read, chunk_size)
+            self.assertEqual(json_data.decode("utf-8"), '{"id": "é"}')
+            self.assertEqual(sorted(attachments), sorted(p.sha2 for p in payloads))
+            self.assertEqual(attachments[payloads[0].sha2].read(), self.content)
+            self.assertEqual(attachments[payloads[0].sha2].content_type, "image/png")
+            self.assertEqual(attachments[payloads[1].sha2].read(), b"second")
+
+    def test_read_not_multipart(self):
+        self.assertEqual(read_statements_body("application/json", io.BytesIO(b"[]").read), (b"[]", None))
+
+    def test_read_hash_mismatch(self):
+        body = MultipartBody("{}", [(AttachmentPayload(b"content", sha2="0" * 64), "text/plain")])
+        data = b"".join(bytes(chunk) for chunk in body)
+        with self.assertRaises(ValueError):
+            read_statements_body(body.content_type, io.BytesIO(data).read)
+
+    def test_read_truncated(self):
+        body = MultipartBody("{}", [(AttachmentPayload(self.content), "text/plain")])
+        data = b"".join(bytes(chunk) for chunk in body)
+        with self.assertRaises(ValueError):
+            read_statements_body(body.content_type, io.BytesIO(data[:-100]).read)
+
+    def test_read_spools_to_file(self):
+        content = b"x" * (multipart.SPOOL_SIZE + 1)
+        body = MultipartBody("{}", [(AttachmentPayload(content), "text/plain")])
+        data = b"".join(bytes(chunk) for chunk in body)
+        _, attachments = read_statements_body(body.content_type, io.BytesIO(data).read)
+
+        payload = attachments[hashlib.sha256(content).hexdigest()]
+        self.assertTrue(payload._file._rolled)
+        self.assertEqual(payload.length, len(content))
+        self.assertEqual(payload.read(), content)
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(MultipartTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,93 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import json
+import unittest
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import Agent, LazyStatementsResult, Projection, StatementRef, StatementsResult, SubStatement
+from test.test_utils import statements_result_json
+
+
+class ProjectionTest(unittest.TestCase):
+    def setUp(self):
+        self.json_data = statements_result_json(4, more="/xapi/statements?more=abc")
+        self.data = json.loads(self.json_data)["statements"]
+
+    def test_bad_paths(self):
+        for paths in (["verb..id"], [""], ["actor."], [1]):
+            with self.assertRaises(ValueError):
+                Projection(paths)
+
+    def test_of(self):
+        projection = Projection(["verb.id"])
+        self.assertIs(Projection.of(projection), projection)
+        self.assertIsNone(Projection.of(None))
+        self.assertEqual(Projection.of("verb.id").paths, ("verb.id",))
+
+    def test_apply(self):
+        projection = Projection([
+            "actor.mbox", "verb.id", "object.id", "result.score.scaled", "timestamp",
+            "context.context_activities.grouping.id",
+        ])
+        self.assertEqual(projection.apply(self.data[0]), {
+            "actor": {"mbox": "mailto:agent0@example.com", "objectType": "Agent"},
+            "verb": {"id": "http://adlnet.gov/expapi/verbs/experienced"},
+            "object": {"id": "http://example.com/activities/0", "objectType": "Activity"},
+            "result": {"score": {"scaled": 0.5}},
+            "timestamp": "2014-06-23T15:25:00.123-05:00",
+            "context": {"contextActivities": {"grouping": [{"id": "http://example.com/activities/course"}]}},
+        })
+        # the parsed JSON is left as is
+        self.assertIn("display", self.data[0]["verb"])
+
+    def test_whole_objects(self):
+        projection = Projection(["verb.id", "verb", "result.score", "result.score.raw"])
+        projected = projection.apply(self.data[0])
+        self.assertIs(projected["verb"], self.data[0]["verb"])
+        self.assertIs(projected["result"]["score"], self.data[0]["result"]["score"])
+        self.assertEqual(projection.apply({"result": {"success": True}}), {"result": {}})
+        self.assertEqual(projection.apply({"verb": "not an object"}), {"verb": "not an object"})
+
+    def test_from_json(self):
+        paths = ["id", "verb.id", "object.id", "object.mbox", "object.object.id", "timestamp"]
+        expected = StatementsResult.from_json(self.json_data)
+        for cls in (StatementsResult, LazyStatementsResult):
+            for trusted in (False, True):
+                result = cls.from_json(self.json_data, trusted=trusted, projection=paths)
+                self.assertEqual(result.more, expected.more)
+                statements = result.statements
+                self.assertEqual([s.id for s in statements], [s.id for s in expected.statements])
+                self.assertEqual([s.timestamp for s in statements], [s.timestamp for s in expected.statements])
+                self.assertEqual(statements[0].verb.id, "http://adlnet.gov/expapi/verbs/experienced")
+                self.assertIsNone(statements[0].verb.display)
+                self.assertIsNone(statements[0].actor)
+                self.assertIsNone(statements[0].result)
+                self.assertIsNone(statements[0].context)
+                self.assertIsNone(statements[0].object.definition)
+                self.assertIsInstance(statements[1].object, Agent)
+                self.assertIsInstance(statements[2].object, StatementRef)
+                self.assertIsInstance(statements[3].object, SubStatement)
+                self.assertEqual(statements[3].object.object.id, "http://example.com/activities/sub/3")
+
+    def test_repr(self):
+        self.assertEqual(repr(Projection(["verb.id"])), "<Projection paths=['verb.id']>")
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(ProjectionTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,162 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import RateLimiter
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+        with self.assertRaises(ValueError):
+            RateLimiter(max_in_flight=0)
+
+    def test_defaults(self):
+        self.assertEqual(RateLimiter(rate=20).burst, 20)
+        self.assertEqual(RateLimiter(rate=0.5).burst, 1)
+        self.assertEqual(RateLimiter(max_in_flight=2).burst, 1)
+
+    def test_unlimited(self):
+        limiter = RateLimiter()
+        start = time.monotonic()
+        for _ in range(100):
+            with limiter:
+                pass
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(limiter.stats()["acquired"], 100)
+
+    def test_rate(self):
+        limiter = RateLimiter(rate=50, burst=5)
+        start = time.monotonic()
+        for _ in range(5):
+            with limiter:
+                pass
+        self.assertLess(time.monotonic() - start, 0.05)
+
+        for _ in range(10):
+            with limiter:
+                pass
+        self.assertGreaterEqual(time.monotonic() - start, 0.18)
+
+        stats = limiter.stats()
+        self.assertEqual(stats["acquired"], 15)
+        self.assertEqual(stats["waiting"], 0)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertGreater(stats["total_wait"], 0.15)
+        self.assertGreater(stats["max_wait"], 0.01)
+
+    def test_max_in_flight(self):
+        limiter = RateLimiter(max_in_flight=2)
+        lock = threading.Lock()
+        current = []
+        peak = []
+        depth = []
+
+        def work(_):
+            with limiter:
+                with lock:
+                    current.append(1)
+                    peak.append(len(current))
+                depth.append(limiter.stats()["waiting"])
+                time.sleep(0.01)
+                with lock:
+                    current.pop()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(work, range(24)))
+
+        self.assertEqual(max(peak), 2)
+        self.assertGreater(max(depth), 0)
+        self.assertEqual(limiter.stats()["in_flight"], 0)
+        self.assertEqual(limiter.stats()["waiting"], 0)
+
+    def test_async(self):
+        limiter = RateLimiter(rate=100, burst=1, max_in_flight=2)
+        current = []
+        peak = []
+
+        async def work():
+            async with limiter:
+                current.append(1)
+                peak.append(len(current))
+                await asyncio.sleep(0.01)
+                current.pop()
+
+        async def run():
+            await asyncio.gather(*[work() for _ in range(10)])
+
+        start = time.monotonic()
+        asyncio.run(run())
+        self.assertGreaterEqual(time.monotonic() - start, 0.08)
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(limiter.stats()["acquired"], 10)
+        self.assertEqual(limiter.stats()["in_flight"], 0)
+
+    def test_async_cancelled(self):
+        limiter = RateLimiter(max_in_flight=1)
+
+        async def run():
+            await limiter.acquire_async()
+            waiting = asyncio.ensure_future(limiter.acquire_async())
+            await asyncio.sleep(0.01)
+            waiting.cancel()
+            limiter.release()
+            # the slot the cancelled call would have had is still available
+            await asyncio.wait_for(limiter.acquire_async(), 1)
+            limiter.release()
+
+        asyncio.run(run())
+        self.assertEqual(limiter.stats()["in_flight"], 0)
+        self.assertEqual(limiter.stats()["waiting"], 0)
+
+    def test_async_fifo(self):
+        limiter = RateLimiter(max_in_flight=1)
+        order = []
+
+        async def work(name):
+            await limiter.acquire_async()
+            order.append(name)
+            await asyncio.sleep(0)
+            limiter.release()
+
+        async def run():
+            await limiter.acquire_async()
+            tasks = [asyncio.ensure_future(work(name)) for name in "abc"]
+            await asyncio.sleep(0.01)
+
+            # "a" is woken up, but another call takes the slot before it runs
+            limiter.release()
+            await limiter.acquire_async()
+            await asyncio.sleep(0.01)
+
+            limiter.release()
+            await asyncio.wait_for(asyncio.gather(*tasks), 1)
+
+        asyncio.run(run())
+        self.assertEqual(order, ["a", "b", "c"])
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(RateLimiterTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
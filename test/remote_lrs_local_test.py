@@ -0,0 +1,810 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Tests of :class:`tincan.RemoteLRS` against an in-process fake LRS, for
+the parts that do not need a real LRS (see remote_lrs_test.py for those).
+"""
+
+import datetime
+import hashlib
+import json
+import unittest
+import uuid
+from urllib.parse import urlencode
+
+from pytz import utc
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import (
+    RemoteLRS,
+    LRSResponse,
+    LRSBatchResponse,
+    LRSResponseError,
+    Agent,
+    Verb,
+    Activity,
+    Statement,
+    StatementList,
+    StatementsResult,
+    LazyStatement,
+    LazyStatementsResult,
+    Attachment,
+    AttachmentPayload,
+    RetryPolicy,
+    RateLimiter,
+    RequestHooks,
+    MetricsCollector,
+    DocumentCache,
+    StateDocument,
+    AgentProfileDocument,
+)
+from tincan.json_codec import JSONCodec
+from test.test_utils import LocalHTTPServer, FakeLRSHandler
+
+
+class RemoteLRSLocalTest(unittest.TestCase):
+    def setUp(self):
+        FakeLRSHandler.reset()
+        self.server = LocalHTTPServer(FakeLRSHandler).__enter__()
+        self.lrs = RemoteLRS(endpoint=self.server.endpoint)
+
+        self.agent = Agent(mbox="mailto:tincanpython@tincanapi.com")
+        self.verb = Verb(id="http://adlnet.gov/expapi/verbs/experienced")
+        self.activity = Activity(id="http://tincanapi.com/TinCanPython/Test/Unit/0")
+
+    def tearDown(self):
+        self.lrs.connection_pool.clear()
+        self.server.__exit__(None, None, None)
+
+    def _statements(self, count):
+        return StatementList([
+            Statement(actor=self.agent, verb=self.verb, object=self.activity)
+            for _ in range(count)
+        ])
+
+    def _posted_batches(self):
+        return [json.loads(r[4]) for r in FakeLRSHandler.requests if r[0] == "POST"]
+
+    def test_save_statements_unbatched(self):
+        response = self.lrs.save_statements(self._statements(5))
+
+        self.assertIsInstance(response, LRSResponse)
+        self.assertTrue(response.success)
+        self.assertEqual(len(self._posted_batches()), 1)
+
+    def test_save_statements_json(self):
+        statements = self._statements(3)
+        statements[0].id = uuid.uuid4()
+        response = self.lrs.save_statements_json(statements.to_json())
+
+        self.assertTrue(response.success)
+        self.assertEqual(len(response.content), 3)
+        self.assertEqual(response.content[0], str(statements[0].id))
+        self.assertEqual(response.content, [s["id"] for s in FakeLRSHandler.statements])
+        self.assertEqual(FakeLRSHandler.requests[-1][3]["Content-Type"], "application/json")
+
+    def test_save_statements_batch_size(self):
+        statements = self._statements(25)
+        response = self.lrs.save_statements(statements, batch_size=10)
+
+        self.assertIsInstance(response, LRSBatchResponse)
+        self.assertTrue(response.success)
+        self.assertEqual(len(response.responses), 3)
+        self.assertEqual([len(b) for b in self._posted_batches()], [10, 10, 5])
+        self.assertIs(response.content, statements)
+        self.assertEqual(
+            [str(s.id) for s in statements],
+            [s["id"] for s in FakeLRSHandler.statements],
+        )
+        self.assertEqual(len(response.responses[2].content), 5)
+
+    def test_save_statements_max_batch_bytes(self):
+        statements = self._statements(10)
+        size = len(statements[0].to_json(self.lrs.version).encode("utf-8"))
+
+        response = self.lrs.save_statements(statements, max_batch_bytes=3 * size + 8)
+
+        self.assertTrue(response.success)
+        self.assertEqual([len(b) for b in self._posted_batches()], [3, 3, 3, 1])
+        for r in FakeLRSHandler.requests:
+            self.assertLessEqual(len(r[4]), 3 * size + 8)
+
+    def test_save_statements_oversized_statement(self):
+        response = self.lrs.save_statements(self._statements(3), max_batch_bytes=10)
+
+        self.assertTrue(response.success)
+        self.assertEqual([len(b) for b in self._posted_batches()], [1, 1, 1])
+
+    def test_save_statements_concurrent(self):
+        statements = self._statements(50)
+        response = self.lrs.save_statements(statements, batch_size=5, max_workers=4)
+
+        self.assertTrue(response.success)
+        self.assertEqual(len(response.responses), 10)
+        self.assertTrue(all(s.id is not None for s in statements))
+        self.assertEqual(
+            sorted(str(s.id) for s in statements),
+            sorted(s["id"] for s in FakeLRSHandler.statements),
+        )
+        for r, batch in zip(response.responses, [statements[i:i + 5] for i in range(0, 50, 5)]):
+            self.assertEqual(list(r.content), list(batch))
+
+    def test_save_statements_failed_batch(self):
+        statements = self._statements(4)
+        self.lrs.endpoint = self.server.endpoint + "missing/"
+
+        response = self.lrs.save_statements(statements, batch_size=2)
+
+        self.assertFalse(response.success)
+        self.assertEqual(len(response.failed_responses), 2)
+        self.assertEqual(response.responses[0].response.status, 404)
+
+    def test_save_statements_bad_batch_size(self):
+        with self.assertRaises(ValueError):
+            self.lrs.save_statements(self._statements(1), batch_size=0)
+
+    def test_iter_statements(self):
+        statements = self._statements(25)
+        self.lrs.save_statements(statements)
+
+        for prefetch in (False, True):
+            iterated = self.lrs.iter_statements({"ascending": True}, prefetch=prefetch)
+            self.assertNotIsInstance(iterated, list)
+            self.assertEqual([s.id for s in iterated], [s.id for s in statements])
+
+    def test_iter_statements_pages(self):
+        self.lrs.save_statements(self._statements(25))
+        FakeLRSHandler.requests = []
+
+        iterated = self.lrs.iter_statements({"limit": 10})
+        self.assertIsInstance(next(iterated), Statement)
+        self.assertEqual(len(FakeLRSHandler.requests), 1)
+
+        self.assertEqual(len(list(iterated)), 24)
+        self.assertEqual(len(FakeLRSHandler.requests), 3)
+
+    def test_iter_statements_prefetch_early_exit(self):
+        self.lrs.save_statements(self._statements(25))
+
+        iterated = self.lrs.iter_statements({}, prefetch=True)
+        self.assertIsInstance(next(iterated), Statement)
+        iterated.close()
+
+    def test_iter_statements_empty(self):
+        self.assertEqual(list(self.lrs.iter_statements({})), [])
+
+    def test_iter_statements_failure(self):
+        self.lrs.endpoint = self.server.endpoint + "missing/"
+        for prefetch, stream in ((False, False), (True, False), (False, True)):
+            with self.assertRaises(LRSResponseError) as cm:
+                list(self.lrs.iter_statements({}, prefetch=prefetch, stream=stream))
+            self.assertEqual(cm.exception.lrs_response.response.status, 404)
+
+    def test_iter_statements_stream(self):
+        self.lrs.save_statements(self._statements(25))
+        expected = list(self.lrs.iter_statements({"ascending": True}))
+
+        for trusted in (False, True):
+            self.lrs.trusted = trusted
+            FakeLRSHandler.requests = []
+            iterated = self.lrs.iter_statements({"ascending": True, "limit": 10}, stream=True)
+            self.assertEqual(list(iterated), expected)
+            self.assertEqual(len(FakeLRSHandler.requests), 3)
+        self.assertEqual(self.lrs.connection_pool.idle_count(), 1)
+
+    def test_iter_statements_stream_early_exit(self):
+        self.lrs.save_statements(self._statements(25))
+
+        iterated = self.lrs.iter_statements({}, stream=True)
+        self.assertIsInstance(next(iterated), Statement)
+        iterated.close()
+        self.assertEqual(self.lrs.connection_pool.idle_count(), 0)
+
+        self.assertEqual(len(list(self.lrs.iter_statements({}, stream=True))), 25)
+
+    def test_iter_statements_stream_prefetch(self):
+        with self.assertRaises(ValueError):
+            list(self.lrs.iter_statements({}, prefetch=True, stream=True))
+
+
+    def _attached_statement(self, payload):
+        return Statement(
+            actor=self.agent,
+            verb=self.verb,
+            object=self.activity,
+            attachments=[Attachment(
+                usage_type="http://id.tincanapi.com/attachment/supporting_media",
+                display={"en-US": "payload"},
+                content_type="application/octet-stream",
+                length=payload.length,
+                sha2=payload.sha2,
+            )],
+        )
+
+    def test_attachments_round_trip(self):
+        content = bytes(range(256)) * 1000
+        payload = AttachmentPayload(content, content_type="image/png")
+        statement = self._attached_statement(payload)
+
+        response = self.lrs.save_statement(statement, attachments=[payload])
+        self.assertTrue(response.success)
+        request = FakeLRSHandler.requests[-1]
+        self.assertTrue(request[3]["Content-Type"].startswith("multipart/mixed; boundary="))
+        self.assertEqual(FakeLRSHandler.attachments[payload.sha2], ("image/png", content))
+
+        response = self.lrs.retrieve_statement(statement.id, attachments=True)
+        self.assertTrue(response.success)
+        self.assertEqual(response.content.id, statement.id)
+        self.assertEqual(response.attachments[payload.sha2].read(), content)
+        self.assertEqual(response.attachments[payload.sha2].content_type, "image/png")
+
+        response = self.lrs.query_statements({"attachments": True})
+        self.assertEqual(len(response.content.statements), 1)
+        self.assertEqual(response.attachments[payload.sha2].read(), content)
+        self.assertEqual(FakeLRSHandler.requests[-1][2]["attachments"], "true")
+
+        response = self.lrs.query_statements({})
+        self.assertIsNone(response.attachments)
+
+        streamed = list(self.lrs.iter_statements({"attachments": True}, stream=True))
+        self.assertEqual([s.id for s in streamed], [statement.id])
+
+    def test_save_statements_attachments(self):
+        payloads = [AttachmentPayload(b"first"), AttachmentPayload(b"second")]
+        statements = StatementList([self._attached_statement(p) for p in payloads])
+
+        for batch_size in (None, 1):
+            FakeLRSHandler.reset()
+            response = self.lrs.save_statements(statements, batch_size=batch_size, attachments=payloads)
+            self.assertTrue(response.success)
+            self.assertEqual(
+                {k: v[1] for k, v in FakeLRSHandler.attachments.items()},
+                {p.sha2: p.read() for p in payloads},
+            )
+            self.assertEqual(FakeLRSHandler.attachments[payloads[0].sha2][0], "application/octet-stream")
+
+        # each batch only carries the payloads of its own statements
+        bodies = [r[4] for r in FakeLRSHandler.requests]
+        self.assertEqual(len(bodies), 2)
+        self.assertTrue(b"\r\n\r\nfirst\r\n" in bodies[0] and b"second" not in bodies[0])
+        self.assertTrue(b"\r\n\r\nsecond\r\n" in bodies[1] and b"first" not in bodies[1])
+
+    def test_save_statement_attachment_uppercase_sha2(self):
+        content = b"content"
+        payload = AttachmentPayload(content, sha2=hashlib.sha256(content).hexdigest().upper(), length=len(content))
+        statement = self._attached_statement(AttachmentPayload(content))
+
+        response = self.lrs.save_statement(statement, attachments=[payload])
+        self.assertTrue(response.success)
+        self.assertEqual(FakeLRSHandler.attachments[payload.sha2], ("application/octet-stream", content))
+
+    def test_save_statements_duplicate_attachment(self):
+        payload = AttachmentPayload(b"content")
+        statements = [self._attached_statement(payload), self._attached_statement(payload)]
+
+        response = self.lrs.save_statements(statements, attachments=[payload, AttachmentPayload(b"content")])
+        self.assertTrue(response.success)
+        self.assertEqual(FakeLRSHandler.requests[-1][4].count(b"\r\n\r\ncontent\r\n"), 1)
+
+    def test_save_statement_unreferenced_attachment(self):
+        statement = self._attached_statement(AttachmentPayload(b"content"))
+        with self.assertRaises(ValueError):
+            self.lrs.save_statement(statement, attachments=[AttachmentPayload(b"other")])
+        with self.assertRaises(ValueError):
+            self.lrs.save_statements([statement], batch_size=1, attachments=[AttachmentPayload(b"other")])
+        self.assertEqual(FakeLRSHandler.requests, [])
+
+    def test_compress_requests(self):
+        self.lrs.compress_requests = 1000
+        self.lrs.save_statements(self._statements(1))
+        self.lrs.save_statements(self._statements(20))
+
+        small, large = FakeLRSHandler.requests
+        self.assertNotIn("Content-Encoding", small[3])
+        self.assertEqual(large[3]["Content-Encoding"], "gzip")
+        self.assertLess(int(large[3]["Content-Length"]), len(large[4]) // 10)
+        self.assertEqual(len(json.loads(large[4])), 20)
+
+        # attachment payloads are not compressed
+        payload = AttachmentPayload(b"x" * 2000)
+        self.lrs.save_statement(self._attached_statement(payload), attachments=[payload])
+        self.assertNotIn("Content-Encoding", FakeLRSHandler.requests[-1][3])
+
+        with self.assertRaises(ValueError):
+            self.lrs.compress_requests = -1
+
+    def test_compressed_responses(self):
+        statements = self._statements(25)
+        self.lrs.save_statements(statements)
+        payload = AttachmentPayload(b"content")
+        attached = self._attached_statement(payload)
+        self.lrs.save_statement(attached, attachments=[payload])
+        ids = [s.id for s in statements] + [attached.id]
+
+        for encoding in ("gzip", "deflate"):
+            FakeLRSHandler.content_encoding = encoding
+            self.assertEqual([s.id for s in self.lrs.iter_statements({"ascending": True})], ids)
+            self.assertEqual([s.id for s in self.lrs.iter_statements({"ascending": True}, stream=True)], ids)
+
+            response = self.lrs.retrieve_statement(attached.id, attachments=True)
+            self.assertEqual(response.response.getheader("Content-Encoding"), encoding)
+            self.assertEqual(response.attachments[payload.sha2].read(), b"content")
+
+            response = self.lrs.retrieve_statement("missing")
+            self.assertEqual(response.data, "Not Found")
+        self.assertEqual(self.lrs.connection_pool.idle_count(), 1)
+
+    def test_compress_responses_off(self):
+        FakeLRSHandler.content_encoding = "gzip"
+        self.lrs.compress_responses = False
+        self.lrs.save_statements(self._statements(1))
+
+        response = self.lrs.query_statements({})
+        self.assertIsNone(response.response.getheader("Content-Encoding"))
+        self.assertEqual(len(response.content.statements), 1)
+
+    def test_retry_policy(self):
+        self.lrs.retry_policy = RetryPolicy(max_attempts=3, backoff=0.001)
+        self.lrs.save_statements(self._statements(2))
+
+        FakeLRSHandler.requests = []
+        FakeLRSHandler.failures = [(503, {}), (500, {})]
+        response = self.lrs.query_statements({})
+        self.assertTrue(response.success)
+        self.assertEqual(len(response.content.statements), 2)
+        self.assertEqual(len(FakeLRSHandler.requests), 3)
+
+        FakeLRSHandler.requests = []
+        FakeLRSHandler.failures = [(503, {})] * 3
+        response = self.lrs.query_statements({})
+        self.assertEqual(response.response.status, 503)
+        self.assertEqual(len(FakeLRSHandler.requests), 3)
+
+        FakeLRSHandler.failures = [(503, {}), (502, {})]
+        self.assertEqual(len(list(self.lrs.iter_statements({}, stream=True))), 2)
+
+        with self.assertRaises(TypeError):
+            self.lrs.retry_policy = 3
+
+    def test_retry_policy_idempotency(self):
+        self.lrs.retry_policy = RetryPolicy(max_attempts=3, backoff=0.001)
+
+        # the LRS may have stored statements without ids, they are not sent again
+        FakeLRSHandler.failures = [(500, {})]
+        response = self.lrs.save_statements(self._statements(2))
+        self.assertFalse(response.success)
+        self.assertEqual(len(FakeLRSHandler.requests), 1)
+
+        FakeLRSHandler.requests = []
+        FakeLRSHandler.failures = [(429, {"Retry-After": "0"})]
+        self.assertTrue(self.lrs.save_statements(self._statements(2)).success)
+        self.assertEqual(len(FakeLRSHandler.requests), 2)
+
+        statements = self._statements(2)
+        for s in statements:
+            s.id = uuid.uuid4()
+        FakeLRSHandler.requests = []
+        FakeLRSHandler.failures = [(500, {})]
+        self.assertTrue(self.lrs.save_statements(statements).success)
+        self.assertEqual(len(FakeLRSHandler.requests), 2)
+
+        FakeLRSHandler.requests = []
+        FakeLRSHandler.failures = [(502, {})]
+        self.assertTrue(self.lrs.save_statement(statements[0]).success)
+        self.assertEqual(FakeLRSHandler.requests[-1][0], "PUT")
+        self.assertEqual(len(FakeLRSHandler.requests), 2)
+
+    def test_retry_policy_connection_refused(self):
+        attempts = []
+
+        class CountingPolicy(RetryPolicy):
+            def retry_delay(self, request, attempt, response=None, error=None):
+                attempts.append(error)
+                return super(CountingPolicy, self).retry_delay(request, attempt, response, error)
+
+        self.lrs.endpoint = "http://127.0.0.1:9/xapi/"
+        self.lrs.retry_policy = CountingPolicy(max_attempts=3, backoff=0.001)
+        with self.assertRaises(ConnectionRefusedError):
+            self.lrs.save_statements(self._statements(1))
+        self.assertEqual(len(attempts), 3)
+        self.assertIsInstance(attempts[0], ConnectionRefusedError)
+
+    def test_rate_limiter(self):
+        limiter = RateLimiter(rate=1000, max_in_flight=2)
+        self.lrs.rate_limiter = limiter
+
+        response = self.lrs.save_statements(self._statements(20), batch_size=2, max_workers=4)
+        self.assertTrue(response.success)
+        self.assertEqual(limiter.stats()["acquired"], 10)
+
+        self.lrs.retry_policy = RetryPolicy(backoff=0.001)
+        FakeLRSHandler.failures = [(503, {})]
+        self.assertEqual(len(list(self.lrs.iter_statements({}, stream=True))), 20)
+        self.assertEqual(limiter.stats()["acquired"], 13)
+        self.assertEqual(limiter.stats()["in_flight"], 0)
+
+        iterated = self.lrs.iter_statements({"limit": 5}, stream=True)
+        next(iterated)
+        self.assertEqual(limiter.stats()["in_flight"], 1)
+        iterated.close()
+        self.assertEqual(limiter.stats()["in_flight"], 0)
+
+        with self.assertRaises(TypeError):
+            self.lrs.rate_limiter = 10
+
+    def test_hooks(self):
+        events = []
+
+        class RecordingHooks(RequestHooks):
+            def before_request(self, request):
+                events.append(("before_request", request.method))
+
+            def after_response(self, request, lrs_response):
+                events.append(("after_response", lrs_response.response.status))
+
+            def after_decode(self, request, lrs_response):
+                events.append(("after_decode", request.method))
+
+            def on_error(self, request, error):
+                events.append(("on_error", type(error)))
+
+        metrics = MetricsCollector()
+        self.lrs.hooks = [RecordingHooks(), metrics]
+        self.lrs.retry_policy = RetryPolicy(backoff=0.001)
+
+        self.lrs.save_statements(self._statements(2))
+        FakeLRSHandler.failures = [(503, {})]
+        response = self.lrs.query_statements({})
+        self.assertEqual(events, [
+            ("before_request", "POST"),
+            ("after_response", 200),
+            ("before_request", "GET"),
+            ("after_response", 503),
+            ("before_request", "GET"),
+            ("after_response", 200),
+            ("after_decode", "GET"),
+        ])
+
+        for phase in ("send", "wait", "read", "decode", "total"):
+            self.assertGreaterEqual(response.timings[phase], 0)
+        self.assertNotIn("queue", response.timings)
+        self.assertEqual(metrics.request_count("statements"), 3)
+
+        events[:] = []
+        self.assertEqual(len(list(self.lrs.iter_statements({}, stream=True))), 2)
+        self.assertEqual(events, [("before_request", "GET"), ("after_response", 200)])
+
+        events[:] = []
+        self.lrs.endpoint = "http://127.0.0.1:9/xapi/"
+        with self.assertRaises(ConnectionRefusedError):
+            self.lrs.about()
+        self.assertEqual(events[-1], ("on_error", ConnectionRefusedError))
+        self.assertEqual(metrics.error_count("about"), 3)
+        self.assertIn('tincan_request_errors_total{endpoint="about",method="GET",'
+                      'error="ConnectionRefusedError"} 3', metrics.prometheus())
+
+        with self.assertRaises(TypeError):
+            self.lrs.hooks = [metrics, 1]
+        self.lrs.hooks = None
+        self.assertEqual(self.lrs.hooks, [])
+
+    def test_timings_rate_limiter(self):
+        self.lrs.rate_limiter = RateLimiter(rate=1000)
+        response = self.lrs.about()
+        self.assertGreaterEqual(response.timings["queue"], 0)
+        self.assertGreaterEqual(response.timings["connect"], 0)
+        self.assertGreaterEqual(response.timings["total"], response.timings["wait"])
+
+        # a kept-alive connection does not connect again
+        self.assertNotIn("connect", self.lrs.about().timings)
+
+    def test_document_cache(self):
+        cache = DocumentCache()
+        self.lrs.document_cache = cache
+        state = StateDocument(
+            id="bookmark", content='{"page": 1}', content_type="application/json",
+            activity=self.activity, agent=self.agent,
+        )
+        self.assertTrue(self.lrs.save_state(state).success)
+
+        first = self.lrs.retrieve_state(self.activity, self.agent, "bookmark")
+        self.assertEqual(first.response.status, 200)
+        self.assertIsNotNone(first.content.etag)
+        self.assertEqual(first.content.content_type, "application/json")
+        self.assertIsNotNone(first.content.timestamp)
+
+        FakeLRSHandler.requests = []
+        second = self.lrs.retrieve_state(self.activity, self.agent, "bookmark")
+        self.assertTrue(second.success)
+        self.assertEqual(second.response.status, 304)
+        self.assertEqual(second.content.content, bytearray(b'{"page": 1}'))
+        self.assertEqual(second.content.etag, first.content.etag)
+        self.assertEqual(FakeLRSHandler.requests[0][3]["If-None-Match"], first.content.etag)
+
+        # saving through the same RemoteLRS drops the cached copy
+        state.content = '{"page": 2}'
+        state.etag = first.content.etag
+        self.assertTrue(self.lrs.save_state(state).success)
+        self.assertEqual(len(cache), 0)
+        third = self.lrs.retrieve_state(self.activity, self.agent, "bookmark")
+        self.assertEqual(third.response.status, 200)
+        self.assertEqual(third.content.content, bytearray(b'{"page": 2}'))
+
+        # a document changed by someone else is downloaded again
+        FakeLRSHandler.documents[next(iter(FakeLRSHandler.documents))]["etag"] = '"other"'
+        fourth = self.lrs.retrieve_state(self.activity, self.agent, "bookmark")
+        self.assertEqual(fourth.response.status, 200)
+        self.assertEqual(fourth.content.etag, '"other"')
+
+        self.lrs.clear_state(self.activity, self.agent)
+        self.assertEqual(len(cache), 0)
+
+        self.lrs.retrieve_state(self.activity, self.agent, "bookmark")
+        self.lrs.delete_state(state)
+        self.assertEqual(len(cache), 0)
+        missing = self.lrs.retrieve_state(self.activity, self.agent, "bookmark")
+        self.assertEqual(missing.response.status, 404)
+        self.assertEqual(len(cache), 0)
+
+        profile = AgentProfileDocument(id="prefs", content="x", agent=self.agent)
+        self.lrs.save_agent_profile(profile)
+        self.lrs.retrieve_agent_profile(self.agent, "prefs")
+        self.assertEqual(self.lrs.retrieve_agent_profile(self.agent, "prefs").response.status, 304)
+        self.lrs.delete_agent_profile(profile)
+        self.assertEqual(len(cache), 0)
+
+        with self.assertRaises(TypeError):
+            self.lrs.document_cache = {}
+
+    def test_bulk_states(self):
+        states = [
+            StateDocument(
+                id="bookmark", content=f'{{"page": {i}}}', content_type="application/json",
+                activity=self.activity, agent=self.agent, registration=str(uuid.uuid4()),
+            )
+            for i in range(12)
+        ]
+        saved = self.lrs.save_states(states, max_workers=4)
+        self.assertTrue(saved.success)
+        self.assertEqual(len(saved.responses), 12)
+        self.assertIs(saved.content[0], states[0])
+        self.assertEqual({r[2].get("registration") for r in FakeLRSHandler.requests},
+                         {s.registration for s in states})
+
+        keys = states[:6] + [(self.activity, self.agent, "bookmark", states[6].registration),
+                             (self.activity, self.agent, "missing")]
+        retrieved = self.lrs.retrieve_states(keys, max_workers=4)
+        self.assertTrue(retrieved.success)
+        self.assertEqual(len(retrieved.content), 8)
+        for i, doc in enumerate(retrieved.content[:7]):
+            self.assertEqual(doc.content, bytearray(f'{{"page": {i}}}', "utf-8"))
+            self.assertEqual(doc.registration, states[i].registration)
+            self.assertIsNotNone(doc.etag)
+        self.assertIsNone(retrieved.content[7])
+
+        # each document is only saved over the version it was retrieved as
+        current = retrieved.content[:2]
+        current[1].etag = '"stale"'
+        for doc in current:
+            doc.content = '{"page": 100}'
+        saved = self.lrs.save_states(current)
+        self.assertFalse(saved.success)
+        self.assertEqual([r.response.status for r in saved.responses], [204, 412])
+
+        deleted = self.lrs.delete_states(states, max_workers=4)
+        self.assertTrue(deleted.success)
+        self.assertEqual(FakeLRSHandler.documents, {})
+
+        # a key that can not be sent fails on its own
+        retrieved = self.lrs.retrieve_states([(self.activity,), states[0]])
+        self.assertFalse(retrieved.success)
+        self.assertIsInstance(retrieved.responses[0].content, TypeError)
+        self.assertEqual(retrieved.responses[1].response.status, 404)
+        self.assertEqual(retrieved.content, [None, None])
+
+    def test_encode_query(self):
+        params = {
+            "agent": self.agent.to_query_param(self.lrs.version),
+            "stateId": "a b&c=d/\u00e9",
+            "limit": 10,
+            "ascending": "true",
+        }
+        self.assertEqual(RemoteLRS._encode_query(params), urlencode(params))
+        self.assertEqual(RemoteLRS._encode_query({}), "")
+
+    def test_query_statements_boolean_params(self):
+        self.lrs.query_statements({
+            "ascending": True,
+            "related_activities": False,
+            "related_agents": True,
+            "attachments": False,
+            "limit": 5,
+        })
+
+        # booleans go on the wire the way xAPI writes them
+        params = FakeLRSHandler.requests[0][2]
+        self.assertEqual(params["ascending"], "true")
+        self.assertEqual(params["related_activities"], "false")
+        self.assertEqual(params["related_agents"], "true")
+        self.assertEqual(params["attachments"], "false")
+        self.assertEqual(params["limit"], "5")
+
+    def test_query_statements_trusted(self):
+        self.lrs.save_statements(self._statements(5))
+        validated = self.lrs.query_statements({"ascending": True})
+
+        self.lrs.trusted = True
+        trusted = self.lrs.query_statements({"ascending": True})
+
+        self.assertTrue(trusted.success)
+        self.assertEqual(trusted.content, validated.content)
+        self.assertEqual(
+            self.lrs.retrieve_statement(trusted.content.statements[0].id).content,
+            trusted.content.statements[0],
+        )
+
+    def test_lazy(self):
+        self.lrs.save_statements(self._statements(5))
+        validated = self.lrs.query_statements({"ascending": True})
+        streamed = list(self.lrs.iter_statements({"ascending": True}, stream=True))
+
+        self.lrs.lazy = True
+        for trusted in (False, True):
+            self.lrs.trusted = trusted
+            lazy = self.lrs.query_statements({"ascending": True})
+            self.assertIsInstance(lazy.content, LazyStatementsResult)
+            self.assertIsInstance(lazy.content.statements[0], LazyStatement)
+            self.assertEqual(lazy.content, validated.content)
+
+            retrieved = self.lrs.retrieve_statement(validated.content.statements[0].id).content
+            self.assertIsInstance(retrieved, LazyStatement)
+            self.assertEqual(retrieved, validated.content.statements[0])
+
+            iterated = list(self.lrs.iter_statements({"ascending": True}, stream=True))
+            self.assertIsInstance(iterated[0], LazyStatement)
+            self.assertEqual(iterated, streamed)
+
+    def test_response_format(self):
+        statements = self._statements(15)
+        self.lrs.save_statements(statements)
+        objects = self.lrs.query_statements({"ascending": True})
+
+        self.lrs.response_format = "dict"
+        first = self.lrs.query_statements({"ascending": True})
+        self.assertIsInstance(first.content, dict)
+        self.assertEqual([s["id"] for s in first.content["statements"]], [str(s.id) for s in statements[:10]])
+        self.assertEqual(StatementsResult(first.content), objects.content)
+
+        second = self.lrs.more_statements(first.content)
+        self.assertEqual(len(second.content["statements"]), 5)
+
+        retrieved = self.lrs.retrieve_statement(statements[0].id, response_format="bytes")
+        self.assertIsInstance(retrieved.content, bytes)
+        self.assertIs(retrieved.content, retrieved.raw_data)
+        self.assertEqual(Statement.from_json(retrieved.content.decode("utf-8")), objects.content.statements[0])
+        self.assertEqual(self.lrs.more_statements(objects.content, response_format="bytes").content,
+                         second.data.encode("utf-8"))
+
+        self.assertIsInstance(self.lrs.retrieve_statement(statements[0].id, response_format="objects").content,
+                              Statement)
+        # iterating hands out objects whatever the format
+        self.assertEqual([s.id for s in self.lrs.iter_statements({"ascending": True})], [s.id for s in statements])
+
+        with self.assertRaises(ValueError):
+            self.lrs.response_format = "xml"
+        with self.assertRaises(ValueError):
+            self.lrs.query_statements({}, response_format="xml")
+        self.assertEqual(RemoteLRS(response_format="bytes").response_format, "bytes")
+
+    def test_projection(self):
+        self.lrs.save_statements(self._statements(15))
+        expected = list(self.lrs.iter_statements({"ascending": True}))
+        paths = ["id", "verb.id"]
+
+        for kwargs in ({}, {"prefetch": True}, {"stream": True}):
+            iterated = list(self.lrs.iter_statements({"ascending": True, "limit": 10}, projection=paths, **kwargs))
+            self.assertEqual([s.id for s in iterated], [s.id for s in expected])
+            self.assertEqual(iterated[0].verb.id, self.verb.id)
+            self.assertIsNone(iterated[0].actor)
+            self.assertIsNone(iterated[0].object)
+
+        exported = list(self.lrs.export_statements(
+            {}, "2013-12-31T23:59:59Z", "2014-01-01T00:00:15Z", windows=3, projection=paths
+        ))
+        self.assertEqual([s.id for s in exported], [s.id for s in expected])
+        self.assertIsNone(exported[0].actor)
+
+        result = self.lrs.query_statements({"ascending": True}, response_format="dict", projection=paths).content
+        self.assertEqual(result["statements"][0], {"id": str(expected[0].id), "verb": {"id": self.verb.id}})
+        self.assertIn("more", result)
+        result = self.lrs.more_statements(result, projection=paths).content
+        self.assertEqual(len(result.statements), 5)
+        self.assertIsNone(result.statements[0].actor)
+
+    def test_codec(self):
+        calls = []
+
+        class RecordingCodec(JSONCodec):
+            def dumps(self, obj):
+                calls.append("dumps")
+                return super(RecordingCodec, self).dumps(obj)
+
+            def loads(self, json_data):
+                calls.append("loads")
+                return super(RecordingCodec, self).loads(json_data)
+
+        self.lrs.codec = RecordingCodec()
+        statements = self._statements(2)
+        self.lrs.save_statements(statements)
+        self.assertEqual(calls, ["dumps", "loads"])
+
+        result = self.lrs.query_statements({"ascending": True})
+        self.assertEqual([s.id for s in result.content.statements], [s.id for s in statements])
+        self.assertEqual(calls[-1], "loads")
+
+        self.lrs.codec = "json"
+        self.assertIs(type(self.lrs.codec), JSONCodec)
+        self.lrs.codec = None
+        self.assertIsNone(self.lrs.codec)
+        with self.assertRaises(ValueError):
+            self.lrs.codec = "not a codec"
+
+    def test_export_statements(self):
+        statements = self._statements(25)
+        self.lrs.save_statements(statements)
+        FakeLRSHandler.requests = []
+
+        exported = self.lrs.export_statements({}, "2013-12-31T23:59:59Z", "2014-01-01T00:00:24Z", windows=5)
+
+        self.assertNotIsInstance(exported, list)
+        self.assertEqual([s.id for s in exported], [s.id for s in statements])
+        windows = sorted((r[2]["since"], r[2]["until"]) for r in FakeLRSHandler.requests)
+        self.assertEqual(len(windows), 5)
+        for (_, until), (since, _) in zip(windows, windows[1:]):
+            self.assertEqual(until, since)
+
+    def test_export_statements_more_pages(self):
+        statements = self._statements(25)
+        self.lrs.save_statements(statements)
+
+        since = datetime.datetime(2014, 1, 1, tzinfo=utc) - datetime.timedelta(seconds=1)
+        for max_workers in (1, 2):
+            exported = self.lrs.export_statements(
+                {"verb": self.verb},
+                since,
+                since + datetime.timedelta(minutes=1),
+                windows=2,
+                max_workers=max_workers,
+            )
+            self.assertEqual([s.id for s in exported], [s.id for s in statements])
+
+    def test_export_statements_failure(self):
+        self.lrs.endpoint = self.server.endpoint + "missing/"
+        with self.assertRaises(LRSResponseError):
+            list(self.lrs.export_statements({}, "2014-01-01T00:00:00Z", "2014-01-02T00:00:00Z"))
+
+    def test_export_statements_bad_range(self):
+        with self.assertRaises(ValueError):
+            list(self.lrs.export_statements({}, "2014-01-02T00:00:00Z", "2014-01-01T00:00:00Z"))
+        with self.assertRaises(ValueError):
+            list(self.lrs.export_statements({}, "2014-01-01T00:00:00Z", "2014-01-02T00:00:00Z", windows=0))
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(RemoteLRSLocalTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,94 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import datetime
+import email.utils
+import http.client
+import unittest
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import HTTPRequest, RetryPolicy
+
+
+class FakeResponse(object):
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers or {}
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(max_attempts=4, backoff=1.0, max_backoff=3.0)
+        self.get = HTTPRequest(method="GET", resource="statements")
+        self.post = HTTPRequest(method="POST", resource="statements")
+
+    def test_bad_max_attempts(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    def test_backoff_with_jitter(self):
+        response = FakeResponse(503)
+        for attempt, cap in ((1, 1.0), (2, 2.0), (3, 3.0)):
+            delays = [self.policy.retry_delay(self.get, attempt, response=response) for _ in range(200)]
+            self.assertTrue(all(0 <= d <= cap for d in delays))
+            self.assertGreater(max(delays) - min(delays), cap / 4)
+        self.assertIsNone(self.policy.retry_delay(self.get, 4, response=response))
+
+    def test_statuses(self):
+        for status in (408, 500, 502, 504):
+            self.assertIsNotNone(self.policy.retry_delay(self.get, 1, response=FakeResponse(status)))
+            self.assertIsNone(self.policy.retry_delay(self.post, 1, response=FakeResponse(status)))
+        for status in (429, 503):
+            self.assertIsNotNone(self.policy.retry_delay(self.post, 1, response=FakeResponse(status)))
+        for status in (200, 204, 400, 404, 409):
+            self.assertIsNone(self.policy.retry_delay(self.get, 1, response=FakeResponse(status)))
+
+    def test_errors(self):
+        self.assertIsNotNone(self.policy.retry_delay(self.post, 1, error=ConnectionRefusedError()))
+        for error in (ConnectionResetError(), TimeoutError(), http.client.RemoteDisconnected()):
+            self.assertIsNotNone(self.policy.retry_delay(self.get, 1, error=error))
+            self.assertIsNone(self.policy.retry_delay(self.post, 1, error=error))
+        self.assertIsNone(self.policy.retry_delay(self.get, 1, error=ValueError()))
+
+        self.post.idempotent = True
+        self.assertIsNotNone(self.policy.retry_delay(self.post, 1, error=ConnectionResetError()))
+
+    def test_retry_after_seconds(self):
+        delay = self.policy.retry_delay(self.post, 1, response=FakeResponse(429, {"Retry-After": "5"}))
+        self.assertTrue(5 <= delay <= 6)
+
+        self.assertIsNone(self.policy.retry_delay(self.post, 1, response=FakeResponse(429, {"Retry-After": "3600"})))
+
+    def test_retry_after_date(self):
+        date = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=30)
+        response = FakeResponse(503, {"Retry-After": email.utils.format_datetime(date, usegmt=True)})
+        self.assertTrue(28 <= RetryPolicy.retry_after(response) <= 30)
+
+        past = datetime.datetime(2014, 1, 1, tzinfo=datetime.timezone.utc)
+        response = FakeResponse(503, {"Retry-After": email.utils.format_datetime(past, usegmt=True)})
+        self.assertEqual(RetryPolicy.retry_after(response), 0)
+
+        self.assertIsNone(RetryPolicy.retry_after(FakeResponse(503, {"Retry-After": "soon"})))
+        self.assertIsNone(RetryPolicy.retry_after(FakeResponse(503)))
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(RetryPolicyTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
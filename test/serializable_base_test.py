@@ -0,0 +1,124 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import copy
+import datetime
+import json
+import pickle
+import unittest
+import uuid
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import (
+    SerializableBase,
+    StatementsResult,
+    Statement,
+    Activity,
+    ActivityDefinition,
+    Extensions,
+    LanguageMap,
+    Version,
+)
+from tincan.conversions.iso8601 import jsonify_datetime, jsonify_timedelta
+from test.test_utils import statements_result_json
+
+
+def reference_as_version(obj, version=Version.latest):
+    """The straightforward serialization that as_version must keep matching"""
+    if isinstance(obj, list):
+        return [reference_as_version(v, version) if isinstance(v, SerializableBase) else v for v in obj]
+
+    result = {}
+    for k, v in obj.items() if isinstance(obj, dict) else vars(obj).items():
+        k = obj._props_corrected.get(k, k)
+        if isinstance(v, SerializableBase):
+            result[k] = reference_as_version(v, version)
+        elif isinstance(v, list):
+            result[k] = [reference_as_version(val, version) if isinstance(val, SerializableBase) else val
+                         for val in v]
+        elif isinstance(v, uuid.UUID):
+            result[k] = str(v)
+        elif isinstance(v, datetime.timedelta):
+            result[k] = jsonify_timedelta(v)
+        elif isinstance(v, datetime.datetime):
+            result[k] = jsonify_datetime(v)
+        else:
+            result[k] = v
+    return SerializableBase._filter_none(result)
+
+
+class SerializableBaseTest(unittest.TestCase):
+    def assertSameJSON(self, obj):
+        for version in Version.supported:
+            self.assertEqual(obj.to_json(version), json.dumps(reference_as_version(obj, version)))
+
+    def test_as_version_statements(self):
+        statements = StatementsResult.from_json(statements_result_json(24)).statements
+        self.assertSameJSON(statements)
+        for statement in statements:
+            self.assertSameJSON(statement)
+
+    def test_as_version_empty(self):
+        self.assertSameJSON(Statement())
+        self.assertEqual(Statement().to_json(), '{"version": "1.0.3"}')
+
+    def test_as_version_dicts(self):
+        extensions = Extensions({"_private": 1, "none": None, "nested": {"a": [1, 2]}})
+        self.assertSameJSON(extensions)
+        self.assertEqual(extensions.as_version(), {"private": 1, "nested": {"a": [1, 2]}})
+        self.assertSameJSON(LanguageMap({"en-US": "test"}))
+
+    def test_as_version_camel_case(self):
+        activity = Activity(
+            id="http://example.com/activity",
+            definition=ActivityDefinition(
+                more_info="http://example.com/more",
+                interaction_type="choice",
+                correct_responses_pattern=["a", "b"],
+            ),
+        )
+        self.assertSameJSON(activity)
+        self.assertEqual(
+            activity.as_version()["definition"],
+            {
+                "moreInfo": "http://example.com/more",
+                "interactionType": "choice",
+                "correctResponsesPattern": ["a", "b"],
+            },
+        )
+
+    def test_as_version_after_update(self):
+        statement = StatementsResult.from_json(statements_result_json(1)).statements[0]
+        before = statement.to_json()
+        statement.result.duration = 90
+        statement.timestamp = None
+        self.assertSameJSON(statement)
+        self.assertNotEqual(statement.to_json(), before)
+
+    def test_slots(self):
+        statement = StatementsResult.from_json(statements_result_json(1)).statements[0]
+        with self.assertRaises(AttributeError):
+            object.__setattr__(statement, '_not_a_slot', 1)
+        self.assertEqual(sorted(vars(statement)), sorted('_' + k for k in Statement._props))
+        self.assertEqual(copy.deepcopy(statement), statement)
+        self.assertEqual(pickle.loads(pickle.dumps(statement)), statement)
+        self.assertEqual(pickle.loads(pickle.dumps(statement)).to_json(), statement.to_json())
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(SerializableBaseTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,178 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import (
+    RemoteLRS,
+    StatementQueue,
+    Agent,
+    Verb,
+    Activity,
+    Statement,
+)
+from test.test_utils import LocalHTTPServer, FakeLRSHandler
+
+
+class StatementQueueTest(unittest.TestCase):
+    def setUp(self):
+        FakeLRSHandler.reset()
+        self.server = LocalHTTPServer(FakeLRSHandler).__enter__()
+        self.lrs = RemoteLRS(endpoint=self.server.endpoint)
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "statements.db")
+
+    def tearDown(self):
+        self.lrs.connection_pool.clear()
+        self.server.__exit__(None, None, None)
+        shutil.rmtree(self.dir)
+
+    def _statement(self, verb="experienced"):
+        return Statement(
+            actor=Agent(mbox="mailto:tincanpython@tincanapi.com"),
+            verb=Verb(id="http://adlnet.gov/expapi/verbs/" + verb),
+            object=Activity(id="http://tincanapi.com/TinCanPython/Test/Unit/0"),
+        )
+
+    def _queue(self, **kwargs):
+        kwargs.setdefault("retry_delay", 0.01)
+        kwargs.setdefault("max_retry_delay", 0.05)
+        queue = StatementQueue(self.lrs, self.path, **kwargs)
+        self.addCleanup(queue.stop)
+        return queue
+
+    def _stored_ids(self):
+        return [s["id"] for s in FakeLRSHandler.statements]
+
+    def test_put_and_flush(self):
+        queue = self._queue(batch_size=10)
+        statements = [self._statement() for _ in range(25)]
+
+        ids = queue.put_many(statements[:20]) + [queue.put(s) for s in statements[20:]]
+        self.assertEqual(ids, [str(s.id) for s in statements])
+        self.assertTrue(queue.flush(timeout=5))
+
+        self.assertEqual(self._stored_ids(), ids)
+        self.assertEqual(queue.pending_count(), 0)
+        self.assertEqual(queue.acknowledged_count(), 25)
+        self.assertTrue(all(len(r[4]) for r in FakeLRSHandler.requests))
+        self.assertLessEqual(max(len(r[4].split(b'"actor"')) - 1 for r in FakeLRSHandler.requests), 10)
+
+        self.assertEqual(queue.purge(), 25)
+        self.assertEqual(queue.acknowledged_count(), 0)
+        self.assertTrue(queue.close())
+
+    def test_retry_after_failure(self):
+        FakeLRSHandler.fail_status = 503
+        queue = self._queue()
+        statement_id = queue.put(self._statement())
+
+        self.assertFalse(queue.flush(timeout=0.2))
+        self.assertGreater(len(FakeLRSHandler.requests), 1)
+        self.assertTrue(queue.last_error.startswith("503"))
+
+        FakeLRSHandler.fail_status = None
+        self.assertTrue(queue.flush(timeout=5))
+        self.assertEqual(self._stored_ids(), [statement_id])
+
+    def test_lrs_unreachable(self):
+        self.lrs.endpoint = "http://127.0.0.1:9/xapi/"
+        queue = self._queue()
+        started = time.monotonic()
+        queue.put(self._statement())
+        self.assertLess(time.monotonic() - started, 1)
+
+        self.assertFalse(queue.flush(timeout=0.1))
+        self.assertIsInstance(queue.last_error, Exception)
+        self.assertEqual(queue.pending_count(), 1)
+
+    def test_exit_lrs_unreachable(self):
+        self.lrs.endpoint = "http://127.0.0.1:9/xapi/"
+        started = time.monotonic()
+        with self._queue() as queue:
+            statement_id = queue.put(self._statement())
+        self.assertLess(time.monotonic() - started, 1)
+
+        # the statement is sent by the next queue on the journal
+        self.lrs.endpoint = self.server.endpoint
+        queue = self._queue()
+        self.assertTrue(queue.flush(timeout=5))
+        self.assertEqual(self._stored_ids(), [statement_id])
+
+    def test_flush_thread_died(self):
+        error = RuntimeError("broken journal")
+
+        class BrokenQueue(StatementQueue):
+            def _send(self, rows):
+                raise error
+
+        excepthook = threading.excepthook
+        threading.excepthook = lambda args: None
+        self.addCleanup(setattr, threading, "excepthook", excepthook)
+
+        queue = BrokenQueue(self.lrs, self.path)
+        self.addCleanup(queue.stop)
+        queue.put(self._statement())
+
+        started = time.monotonic()
+        self.assertFalse(queue.flush())
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertIs(queue.last_error, error)
+        self.assertEqual(queue.pending_count(), 1)
+
+    def test_persists_across_queues(self):
+        queue = self._queue(start=False)
+        ids = queue.put_many([self._statement() for _ in range(3)])
+        queue.close()
+        self.assertEqual(FakeLRSHandler.requests, [])
+
+        queue = self._queue()
+        self.assertEqual(queue.pending_count(), 3)
+        self.assertTrue(queue.close(timeout=5))
+        self.assertEqual(self._stored_ids(), ids)
+
+    def test_rejected_statements(self):
+        FakeLRSHandler.reject = lambda s: s["verb"]["id"].endswith("invalid")
+        queue = self._queue()
+        statements = [self._statement(), self._statement("invalid"), self._statement()]
+        queue.put_many(statements)
+
+        self.assertTrue(queue.flush(timeout=5))
+        self.assertEqual(self._stored_ids(), [str(statements[0].id), str(statements[2].id)])
+
+        rejected = queue.rejected()
+        self.assertEqual(len(rejected), 1)
+        self.assertEqual(rejected[0][0].id, statements[1].id)
+        self.assertTrue(rejected[0][1].startswith("400"))
+
+        self.assertEqual(queue.purge(rejected=True), 3)
+        self.assertEqual(queue.rejected(), [])
+
+    def test_bad_batch_size(self):
+        with self.assertRaises(ValueError):
+            StatementQueue(self.lrs, self.path, batch_size=0)
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(StatementQueueTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -34,6 +34,7 @@ from tincan import (
     SubStatement,
     Activity,
     StatementRef,
+    ActivityList,
 )
 
 
@@ -463,6 +464,34 @@ class StatementTest(unittest.TestCase):
                          '"context": {"registration": "016699c6-d600-48a7-96ab-86187498f16f"}, '
                                     '"id": "016699c6-d600-48a7-96ab-86187498f16f"}'))
 
+    def test_FromJSONTrusted(self):
+        json_str = '{"id":"016699c6-d600-48a7-96ab-86187498f16f", ' \
+                   '"actor": {"name":"test", "mbox":"test@example.com"}, ' \
+                   '"verb": {"id":"test", "display": {"en-US": "test"}}, ' \
+                   '"object": {"objectType":"SubStatement", "actor": {"name":"test"}, "verb": {"id":"test"}, ' \
+                   '"object": {"id":"test"}}, ' \
+                   '"authority":{ "name":"test"}, ' \
+                   '"context": {"registration":"016699c6-d600-48a7-96ab-86187498f16f", ' \
+                   '"instructor": {"member": [{"name":"test"}]}, "contextActivities": {"parent": {"id":"test"}}}, ' \
+                   '"result": {"score": {"raw": 1}, "duration": "PT1.5S", "success": true}, ' \
+                   '"timestamp": "2014-06-23T15:25:00-05:00", "stored": "2014-06-23T15:25:00.123Z", ' \
+                   '"attachments":[{"usageType":"test"}]}'
+        statement = Statement.from_json(json_str, trusted=True)
+        self.assertEqual(statement, Statement.from_json(json_str))
+        self.assertEqual(statement.to_json(), Statement.from_json(json_str).to_json())
+        self.assertEqual(statement.actor.mbox, "mailto:test@example.com")
+        self.assertIsInstance(statement.object, SubStatement)
+        self.assertIsInstance(statement.context.instructor, Group)
+        self.assertIsInstance(statement.context.context_activities.parent, ActivityList)
+
+    def test_FromJSONTrustedInvalidProperty(self):
+        json_str = '{"actor": {"name":"test"}, "bogus": 1}'
+        with self.assertRaises(AttributeError) as validated:
+            Statement.from_json(json_str)
+        with self.assertRaises(AttributeError) as trusted:
+            Statement.from_json(json_str, trusted=True)
+        self.assertEqual(str(trusted.exception), str(validated.exception))
+
     def test_ExceptionInvalidUUID(self):
         with self.assertRaises(ValueError):
             Statement(id='badtest')
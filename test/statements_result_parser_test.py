@@ -0,0 +1,142 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import json
+import unittest
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import LazyStatement, StatementsResult, StatementsResultParser, Statement, validating
+from test.test_utils import statements_result_json
+
+
+class StatementsResultParserTest(unittest.TestCase):
+    def parse(self, data, chunk_size, trusted=False):
+        parser = StatementsResultParser(trusted=trusted)
+        statements = []
+        for i in range(0, len(data), chunk_size):
+            statements.extend(parser.feed(data[i:i + chunk_size]))
+        statements.extend(parser.close())
+        return statements, parser.more
+
+    def test_chunks(self):
+        json_data = statements_result_json(12, more="/xapi/statements?more=abc")
+        expected = StatementsResult.from_json(json_data)
+        data = json_data.encode("utf-8")
+
+        for chunk_size in (1, 2, 7, 100, 4096, len(data)):
+            for trusted in (False, True):
+                statements, more = self.parse(data, chunk_size, trusted)
+                self.assertEqual(statements, list(expected.statements))
+                self.assertEqual(more, expected.more)
+
+    def test_lazy(self):
+        json_data = statements_result_json(4)
+        parser = StatementsResultParser(lazy=True)
+        statements = parser.feed(json_data.encode("utf-8")) + parser.close()
+
+        self.assertTrue(all(isinstance(s, LazyStatement) for s in statements))
+        self.assertEqual(statements, list(StatementsResult.from_json(json_data).statements))
+
+    def test_projection(self):
+        json_data = statements_result_json(4)
+        parser = StatementsResultParser(projection=["id", "verb.id"])
+        statements = parser.feed(json_data.encode("utf-8")) + parser.close()
+
+        expected = StatementsResult.from_json(json_data).statements
+        self.assertEqual([s.id for s in statements], [s.id for s in expected])
+        self.assertEqual(statements[0].verb.id, expected[0].verb.id)
+        self.assertIsNone(statements[0].actor)
+
+    def test_strict(self):
+        # the second statement has a context platform but no activity object
+        data = statements_result_json(2).encode("utf-8")
+        with validating("strict"):
+            parser = StatementsResultParser()
+            with self.assertRaises(ValueError):
+                parser.feed(data)
+            statements = StatementsResultParser(projection=["id", "context"]).feed(data)
+        self.assertEqual(len(statements), 2)
+
+    def test_statements_as_they_complete(self):
+        statements = json.loads(statements_result_json(2))["statements"]
+        first, second = (json.dumps(s).encode("utf-8") for s in statements)
+        parser = StatementsResultParser()
+
+        self.assertEqual(parser.feed(b'{"statements": ['), [])
+        self.assertEqual(parser.feed(first[:-1]), [])
+        completed = parser.feed(first[-1:] + b', ')
+        self.assertEqual(completed, [Statement(statements[0])])
+        self.assertEqual(parser.feed(second + b']}') + parser.close(), [Statement(statements[1])])
+
+    def test_large_statement(self):
+        statement = json.loads(statements_result_json(1))["statements"][0]
+        statement["result"] = {
+            "response": 'a "quoted" {[}] \\ response ' * 40000,
+            "extensions": {
+                f"http://example.com/ext/{i}": {"values": [i, {"nested": "}]"}]} for i in range(20000)
+            },
+        }
+        data = json.dumps({"statements": [statement, statement], "more": None}).encode("utf-8")
+        self.assertGreater(len(data), 4 * 2 ** 20)
+
+        class CountingDecoder(json.JSONDecoder):
+            calls = 0
+
+            def raw_decode(self, s, idx=0):
+                CountingDecoder.calls += 1
+                return super().raw_decode(s, idx)
+
+        parser = StatementsResultParser(trusted=True)
+        parser._scanner = CountingDecoder()
+        statements = []
+        for i in range(0, len(data), 65536):
+            statements.extend(parser.feed(data[i:i + 65536]))
+        statements.extend(parser.close())
+
+        self.assertEqual(statements, [Statement(statement)] * 2)
+        # each statement is decoded once, plus the keys and "more"
+        self.assertLessEqual(CountingDecoder.calls, 6)
+
+    def test_multibyte_characters(self):
+        data = '{"more": "/more?q=é中", "statements": []}'.encode("utf-8")
+        self.assertEqual(self.parse(data, 1), ([], "/more?q=é中"))
+
+    def test_empty(self):
+        self.assertEqual(self.parse(b'{}', 1), ([], None))
+        self.assertEqual(self.parse(b' { "statements" : [ ] , "more" : null } ', 1), ([], None))
+        self.assertEqual(self.parse(b'{"statements": null, "more": ""}', 3), ([], ""))
+
+    def test_invalid(self):
+        for data in [
+            b'',
+            b'[]',
+            b'{"statements": [',
+            b'{"statements": [{}] x',
+            b'{"statements": [{}],}',
+            b'{"more": "/more"',
+            b'{"more": "/more"} {',
+        ]:
+            with self.assertRaises(ValueError, msg=data):
+                self.parse(data, 2)
+
+        with self.assertRaises(TypeError):
+            self.parse(b'{"statements": 5}', 2)
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(StatementsResultParserTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
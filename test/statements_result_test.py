@@ -20,7 +20,7 @@ if __name__ == '__main__':
 
     setup_tincan_path()
 from tincan import StatementsResult, Statement
-from test.test_utils import TinCanBaseTestCase
+from test.test_utils import TinCanBaseTestCase, statements_result_json
 
 
 class StatementsResultTest(TinCanBaseTestCase):
@@ -43,6 +43,25 @@ class StatementsResultTest(TinCanBaseTestCase):
         sr = StatementsResult(data)
         self.assertSerializeDeserialize(sr)
 
+    def test_from_json_trusted(self):
+        json_str = statements_result_json(24, more='/statements?more=1234')
+
+        trusted = StatementsResult.from_json(json_str, trusted=True)
+        validated = StatementsResult.from_json(json_str)
+
+        self.assertEqual(trusted, validated)
+        self.assertEqual(trusted.to_json(), validated.to_json())
+        for t, v in zip(trusted.statements, validated.statements):
+            self.assertEqual(vars(t), vars(v))
+            self.assertEqual(list(vars(t)), list(vars(v)))
+            self.assertIs(type(t.object), type(v.object))
+            self.assertIs(type(t.actor), type(v.actor))
+
+    def test_from_json_trusted_empty(self):
+        trusted = StatementsResult.from_json('{"statements": []}', trusted=True)
+        self.assertEqual(trusted, StatementsResult.from_json('{"statements": []}'))
+        self.assertIsNone(trusted.more)
+
     def test_read_write(self):
         sr = StatementsResult()
         self.assertEqual(len(sr.statements), 0, 'Empty StatementsResult inited as non-empty!')
@@ -12,13 +12,25 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import datetime
+import email.parser
+import email.policy
+import email.utils
+import hashlib
+import json
+import threading
 import unittest
+import uuid
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qsl, urlencode
 
 if __name__ == '__main__':
     from test.main import setup_tincan_path
 
     setup_tincan_path()
 from tincan import Version
+from tincan.conversions.iso8601 import make_datetime
 
 
 class TinCanBaseTestCase(unittest.TestCase):
@@ -48,3 +60,346 @@ class TinCanBaseTestCase(unittest.TestCase):
                 clone_dict = clone.__dict__
 
             self.assertEqual(orig_dict, clone_dict)
+
+
+class LocalHTTPServer(object):
+    """Serves requests with the given handler class on a free local port from
+    a background thread, so that :class:`tincan.RemoteLRS` can be exercised
+    without a real LRS. Use as a context manager.
+
+    :param handler_class: Request handler for the server
+    :type handler_class: :class:`http.server.BaseHTTPRequestHandler`
+    """
+
+    def __init__(self, handler_class):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), handler_class)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def endpoint(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}/"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+
+class FakeLRSHandler(BaseHTTPRequestHandler):
+    """A small in-memory LRS for :class:`LocalHTTPServer`. It keeps
+    statements and documents in class attributes, call :meth:`reset`
+    before each test.
+
+    Statement queries are paged `page_size` statements at a time, in
+    stored order, following `more` links. Attachment payloads sent in
+    multipart/mixed requests are kept by sha2, and returned along with the
+    statements that refer to them when asked to. Documents are sent with
+    their ETag, and a 304 when it matches the If-None-Match header.
+
+    Gzip compressed request bodies are decompressed, and responses are
+    compressed with `content_encoding` ("gzip" or "deflate") when it is set
+    and the client accepts it.
+
+    Saving statements fails with `fail_status` when it is set, and with a
+    400 for a batch holding a statement `reject` returns true for. The next
+    requests, whatever they are, fail with the (status, headers) tuples
+    queued in `failures`.
+    """
+    protocol_version = "HTTP/1.1"
+    page_size = 10
+
+    lock = threading.Lock()
+    connections = 0
+    requests = []
+    statements = []
+    documents = {}
+    attachments = {}
+    content_encoding = None
+    fail_status = None
+    reject = None
+    failures = []
+
+    @classmethod
+    def reset(cls):
+        cls.connections = 0
+        cls.requests = []
+        cls.statements = []
+        cls.documents = {}
+        cls.attachments = {}
+        cls.content_encoding = None
+        cls.fail_status = None
+        cls.reject = None
+        cls.failures = []
+
+    def setup(self):
+        with self.lock:
+            FakeLRSHandler.connections += 1
+        super(FakeLRSHandler, self).setup()
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b"", content_type="application/json", headers=None):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        headers = dict(headers or {})
+        encoding = self.content_encoding
+        if body and encoding is not None and encoding in self.headers.get("Accept-Encoding", ""):
+            compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS if encoding == "gzip" else zlib.MAX_WBITS)
+            body = compressor.compress(body) + compressor.flush()
+            headers["Content-Encoding"] = encoding
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        return body
+
+    def _record(self, body=b""):
+        parsed = urlparse(self.path)
+        params = dict(parse_qsl(parsed.query))
+        with self.lock:
+            FakeLRSHandler.requests.append((self.command, parsed.path, params, dict(self.headers), body))
+        return parsed.path.rstrip("/").split("/", 1)[-1], params
+
+    def _fail(self):
+        with self.lock:
+            if not self.failures:
+                return False
+            status, headers = FakeLRSHandler.failures.pop(0)
+        self._send(status, "Failed", "text/plain", headers)
+        return True
+
+    def _document_key(self, resource, params):
+        return (resource,) + tuple(sorted(params.items()))
+
+    def do_GET(self):
+        resource, params = self._record()
+        if self._fail():
+            return
+        if resource == "about":
+            self._send(200, json.dumps({"version": ["1.0.3"]}))
+        elif resource == "statements":
+            self._get_statements(params)
+        elif resource in ("activities/state", "activities/profile", "agents/profile"):
+            doc = self.documents.get(self._document_key(resource, params))
+            if doc is None:
+                self._send(404, "Not Found", "text/plain")
+            elif self.headers.get("If-None-Match") == doc["etag"]:
+                self._send(304, b"", doc["content_type"], {"ETag": doc["etag"]})
+            else:
+                headers = {"ETag": doc["etag"], "Last-Modified": doc["updated"]}
+                self._send(200, doc["content"], doc["content_type"], headers)
+        else:
+            self._send(404, "Not Found", "text/plain")
+
+    def _get_statements(self, params):
+        with self.lock:
+            statements = list(self.statements)
+
+        if "statementId" in params:
+            for s in statements:
+                if s["id"] == params["statementId"]:
+                    self._send_statements(s, [s], params)
+                    return
+            self._send(404, "Not Found", "text/plain")
+            return
+
+        if "since" in params:
+            since = make_datetime(params["since"])
+            statements = [s for s in statements if make_datetime(s["stored"]) > since]
+        if "until" in params:
+            until = make_datetime(params["until"])
+            statements = [s for s in statements if make_datetime(s["stored"]) <= until]
+        if params.get("ascending") not in ("True", "true"):
+            statements.reverse()
+
+        start = int(params.pop("start", 0))
+        limit = int(params.get("limit") or self.page_size)
+        page = statements[start:start + limit]
+
+        more = ""
+        if start + limit < len(statements):
+            params["start"] = str(start + limit)
+            more = "/statements?" + urlencode(params)
+
+        self._send_statements({"statements": page, "more": more}, page, params)
+
+    def _send_statements(self, result, statements, params):
+        if params.get("attachments") not in ("True", "true"):
+            self._send(200, json.dumps(result))
+            return
+
+        boundary = uuid.uuid4().hex
+        body = b"--%s\r\nContent-Type: application/json\r\n\r\n%s" % (
+            boundary.encode(), json.dumps(result).encode("utf-8"),
+        )
+        sent = set()
+        for s in statements:
+            for attachment in s.get("attachments", ()):
+                sha2 = attachment["sha2"]
+                if sha2 in sent or sha2 not in self.attachments:
+                    continue
+                sent.add(sha2)
+                content_type, content = self.attachments[sha2]
+                body += (
+                    b"\r\n--%s\r\nContent-Type: %s\r\nContent-Transfer-Encoding: binary\r\n"
+                    b"X-Experience-API-Hash: %s\r\n\r\n%s"
+                ) % (boundary.encode(), content_type.encode(), sha2.encode(), content)
+        body += b"\r\n--%s--\r\n" % boundary.encode()
+
+        self._send(200, body, "multipart/mixed; boundary=" + boundary)
+
+    def _read_statements(self, body):
+        """Decodes the statements of a POST or PUT, keeping the attachment
+        payloads of a multipart/mixed body"""
+        content_type = self.headers.get("Content-Type", "")
+        if not content_type.startswith("multipart/mixed"):
+            return json.loads(body.decode("utf-8"))
+
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+        )
+        parts = list(message.iter_parts())
+        for part in parts[1:]:
+            content = part.get_payload(decode=True)
+            sha2 = part["X-Experience-API-Hash"]
+            if hashlib.sha256(content).hexdigest() != sha2.lower():
+                raise ValueError("Attachment does not match its hash")
+            with self.lock:
+                FakeLRSHandler.attachments[sha2] = (part.get_content_type(), content)
+
+        return json.loads(parts[0].get_payload(decode=True).decode("utf-8"))
+
+    def do_POST(self):
+        body = self._read_body()
+        resource, params = self._record(body)
+        if self._fail():
+            return
+        if resource != "statements":
+            self._send(404, "Not Found", "text/plain")
+            return
+
+        statements = self._read_statements(body)
+        if isinstance(statements, dict):
+            statements = [statements]
+        if self.fail_status is not None:
+            self._send(self.fail_status, "Failed", "text/plain")
+            return
+        if self.reject is not None and any(FakeLRSHandler.reject(s) for s in statements):
+            self._send(400, "Rejected", "text/plain")
+            return
+
+        ids = [self._store(s) for s in statements]
+        self._send(200, json.dumps(ids))
+
+    def do_PUT(self):
+        body = self._read_body()
+        resource, params = self._record(body)
+        if self._fail():
+            return
+        if resource == "statements":
+            statement = self._read_statements(body)
+            statement["id"] = params["statementId"]
+            self._store(statement)
+            self._send(204)
+        elif resource in ("activities/state", "activities/profile", "agents/profile"):
+            key = self._document_key(resource, params)
+            with self.lock:
+                current = self.documents.get(key)
+                if_match = self.headers.get("If-Match")
+                if if_match is not None and (current is None or current["etag"] != if_match):
+                    self._send(412, "Precondition Failed", "text/plain")
+                    return
+                FakeLRSHandler.documents[key] = {
+                    "content": body,
+                    "content_type": self.headers.get("Content-Type"),
+                    "etag": '"%s"' % hashlib.sha1(body).hexdigest(),
+                    "updated": email.utils.formatdate(usegmt=True),
+                }
+            self._send(204)
+        else:
+            self._send(404, "Not Found", "text/plain")
+
+    def do_DELETE(self):
+        resource, params = self._record()
+        if self._fail():
+            return
+        key = self._document_key(resource, params)
+        with self.lock:
+            FakeLRSHandler.documents.pop(key, None)
+        self._send(204)
+
+    def _store(self, statement):
+        with self.lock:
+            statement.setdefault("id", str(uuid.uuid4()))
+            stored = make_datetime("2014-01-01T00:00:00Z") + datetime.timedelta(seconds=len(FakeLRSHandler.statements))
+            statement["stored"] = stored.isoformat()
+            FakeLRSHandler.statements.append(statement)
+        return statement["id"]
+
+
+def statements_result_json(count, more=None):
+    """Builds the JSON of a page of `count` statements, as returned by an
+    LRS, cycling through the different kinds of actors, objects, contexts and
+    results so that every part of a statement gets decoded"""
+    objects = [
+        {"objectType": "Activity", "id": "http://example.com/activities/%d",
+         "definition": {"name": {"en-US": "Activity %d"}, "description": {"en-US": "An activity"},
+                        "type": "http://adlnet.gov/expapi/activities/lesson",
+                        "moreInfo": "http://example.com/more",
+                        "extensions": {"http://example.com/ext": {"index": "%d"}}}},
+        {"objectType": "Agent", "mbox": "mailto:object%d@example.com"},
+        {"objectType": "StatementRef", "id": "016699c6-d600-48a7-96ab-86187498f16f"},
+        {"objectType": "SubStatement", "actor": {"mbox": "mailto:sub@example.com"},
+         "verb": {"id": "http://adlnet.gov/expapi/verbs/attempted"},
+         "object": {"id": "http://example.com/activities/sub/%d"}},
+    ]
+    actors = [
+        {"objectType": "Agent", "name": "Agent %d", "mbox": "mailto:agent%d@example.com"},
+        {"objectType": "Agent", "account": {"homePage": "http://example.com", "name": "account%d"}},
+        {"objectType": "Group", "name": "Group %d", "member": [
+            {"mbox": "mailto:member1@example.com"}, {"mbox_sha1sum": "ebd31e95054c018b10727ccffd2ef2ec3a016ee9"},
+        ]},
+    ]
+
+    statements = []
+    for i in range(count):
+        statement = {
+            "id": str(uuid.UUID(int=i + 1, version=4)),
+            "actor": actors[i % len(actors)],
+            "verb": {"id": "http://adlnet.gov/expapi/verbs/experienced", "display": {"en-US": "experienced"}},
+            "object": objects[i % len(objects)],
+            "result": {"score": {"scaled": 0.5, "raw": 50, "min": 0, "max": 100},
+                       "success": True, "completion": False, "duration": "PT1M%d.5S" % (i % 60),
+                       "response": "response %d"},
+            "context": {"registration": "016699c6-d600-48a7-96ab-86187498f16f",
+                        "instructor": {"name": "Instructor", "mbox": "mailto:instructor@example.com"},
+                        "contextActivities": {"parent": {"id": "http://example.com/activities/parent"},
+                                              "grouping": [{"id": "http://example.com/activities/course"}]},
+                        "platform": "TinCanPython", "language": "en-US",
+                        "extensions": {"http://example.com/context": i}},
+            "timestamp": "2014-06-23T15:25:%02d.123-05:00" % (i % 60),
+            "stored": "2014-06-23T20:25:%02d.456Z" % (i % 60),
+            "authority": {"objectType": "Agent", "account": {"homePage": "http://example.com", "name": "lrs"}},
+            "version": "1.0.0",
+        }
+        statements.append(json.loads(json.dumps(statement).replace("%d", str(i))))
+
+    result = {"statements": statements}
+    if more is not None:
+        result["more"] = more
+    return json.dumps(result)
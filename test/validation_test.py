@@ -0,0 +1,271 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import json
+import threading
+import unittest
+
+if __name__ == '__main__':
+    from test.main import setup_tincan_path
+
+    setup_tincan_path()
+from tincan import (
+    Activity,
+    Agent,
+    Attachment,
+    Context,
+    Group,
+    LanguageMap,
+    LazyStatement,
+    LazyStatementsResult,
+    Score,
+    Statement,
+    StatementRef,
+    StatementsResult,
+    Verb,
+    get_validation_level,
+    set_validation_level,
+    validating,
+)
+from test.test_utils import statements_result_json
+
+
+class ValidationTest(unittest.TestCase):
+    def setUp(self):
+        self.statement_data = {
+            "actor": {"mbox": "mailto:learner@example.com"},
+            "verb": {"id": "http://adlnet.gov/expapi/verbs/experienced", "display": {"en-US": "experienced"}},
+            "object": {"id": "http://example.com/activities/1"},
+            "result": {"score": {"scaled": 0.5, "raw": 50, "min": 0, "max": 100}},
+            "context": {"platform": "TinCanPython"},
+        }
+
+    def tearDown(self):
+        set_validation_level("standard")
+
+    def test_default(self):
+        self.assertEqual(get_validation_level(), "standard")
+
+    def test_validating(self):
+        with validating("strict"):
+            self.assertEqual(get_validation_level(), "strict")
+            with validating("trusted"):
+                self.assertEqual(get_validation_level(), "trusted")
+            self.assertEqual(get_validation_level(), "strict")
+        self.assertEqual(get_validation_level(), "standard")
+
+    def test_set_validation_level(self):
+        set_validation_level("strict")
+        self.assertEqual(get_validation_level(), "strict")
+        with validating("trusted"):
+            self.assertEqual(get_validation_level(), "trusted")
+        self.assertEqual(get_validation_level(), "strict")
+
+    def test_set_validation_level_other_thread(self):
+        set_validation_level("trusted")
+        levels = []
+        thread = threading.Thread(target=lambda: levels.append(get_validation_level()))
+        thread.start()
+        thread.join()
+        self.assertEqual(levels, ["trusted"])
+
+    def test_bad_level(self):
+        with self.assertRaises(ValueError):
+            set_validation_level("lenient")
+        with self.assertRaises(ValueError):
+            with validating(None):
+                pass
+        self.assertEqual(get_validation_level(), "standard")
+
+    def test_standard_allows_partial(self):
+        Agent(name="Learner")
+        Group()
+        Score(scaled=2.0)
+        Verb()
+        Statement(verb={"id": "http://adlnet.gov/expapi/verbs/experienced"})
+        LanguageMap({"not a tag!": "value"})
+
+    def test_strict_constructors_unchecked(self):
+        with validating("strict"):
+            statement = Statement()
+            agent = Agent()
+            Activity()
+            Group()
+            statement.actor = agent
+            agent.mbox = "mailto:learner@example.com"
+            statement.verb = Verb(id="http://adlnet.gov/expapi/verbs/experienced")
+            statement.object = Activity(id="http://example.com/activities/1")
+        statement.validate()
+
+    def test_strict_from_json(self):
+        with validating("strict"):
+            statement = Statement.from_json(json.dumps(self.statement_data))
+        self.assertEqual(statement, Statement(self.statement_data))
+
+        self.statement_data["result"]["score"]["scaled"] = 5
+        with validating("strict"):
+            with self.assertRaises(ValueError):
+                Statement.from_json(json.dumps(self.statement_data))
+        Statement.from_json(json.dumps(self.statement_data))
+
+    def test_validate_agent_identifiers(self):
+        Agent(mbox="mailto:learner@example.com").validate()
+        Agent(account={"home_page": "http://example.com", "name": "learner"}).validate()
+        with self.assertRaises(ValueError):
+            Agent(name="Learner").validate()
+        with self.assertRaises(ValueError):
+            Agent(mbox="mailto:learner@example.com", openid="http://example.com/learner").validate()
+        with self.assertRaisesRegex(ValueError, "'mbox'.*mbox_sha1sum"):
+            Agent(mbox="mailto:learner@example.com",
+                  mbox_sha1sum="ebd31e95054c018b10727ccffd2ef2ec3a016ee9").validate()
+        with self.assertRaises(ValueError):
+            Agent(mbox="learner").validate()
+        with self.assertRaises(ValueError):
+            Agent(mbox="mailto:learner@").validate()
+        with self.assertRaises(ValueError):
+            Agent(mbox_sha1sum="not a hash").validate()
+        with self.assertRaises(ValueError):
+            Agent(account={"name": "learner"}).validate()
+
+    def test_strict_mbox_scheme(self):
+        self.assertEqual(Agent.from_json('{"mbox": "learner@example.com"}').mbox, "mailto:learner@example.com")
+        with validating("strict"):
+            with self.assertRaises(ValueError):
+                Agent.from_json('{"mbox": "learner@example.com"}')
+            Agent.from_json('{"mbox": "mailto:learner@example.com"}')
+
+    def test_validate_group(self):
+        Group(member=[{"mbox": "mailto:learner@example.com"}]).validate()
+        Group(mbox="mailto:team@example.com").validate()
+        with self.assertRaises(ValueError):
+            Group().validate()
+        with self.assertRaises(ValueError):
+            Group(member=[{"name": "Learner"}]).validate()
+        with self.assertRaises(ValueError):
+            Group(mbox="mailto:team@example.com", openid="http://example.com/team").validate()
+
+    def test_validate_score(self):
+        Score(scaled=-1.0, raw=0, min=0, max=0).validate()
+        with self.assertRaises(ValueError):
+            Score(scaled=1.5).validate()
+        with self.assertRaises(ValueError):
+            Score(min=10, max=0).validate()
+        with self.assertRaises(ValueError):
+            Score(raw=101, min=0, max=100).validate()
+        with self.assertRaises(ValueError):
+            Score(raw=-1, min=0).validate()
+
+    def test_validate_required(self):
+        with self.assertRaises(ValueError):
+            Verb(display={"en-US": "experienced"}).validate()
+        with self.assertRaises(ValueError):
+            Activity().validate()
+        with self.assertRaises(ValueError):
+            StatementRef().validate()
+        with self.assertRaises(ValueError):
+            Attachment(usage_type="http://example.com/usage").validate()
+        with self.assertRaises(ValueError):
+            Statement(actor=self.statement_data["actor"], verb=self.statement_data["verb"]).validate()
+
+    def test_validate_nested(self):
+        Statement(self.statement_data).validate()
+        self.statement_data["result"]["score"]["scaled"] = 5
+        with self.assertRaises(ValueError):
+            Statement(self.statement_data).validate()
+
+    def test_validate_language_tag(self):
+        LanguageMap({"en-US": "value", "zh-Hant-TW": "value"}).validate()
+        with self.assertRaises(ValueError):
+            LanguageMap({"not a tag!": "value"}).validate()
+        self.statement_data["verb"]["display"] = {"not a tag!": "value"}
+        with self.assertRaises(ValueError):
+            Statement(self.statement_data).validate()
+
+    def test_validate_context_platform(self):
+        self.statement_data["object"] = {"objectType": "Agent", "mbox": "mailto:other@example.com"}
+        with self.assertRaises(ValueError):
+            Statement(self.statement_data).validate()
+        del self.statement_data["context"]
+        Statement(self.statement_data).validate()
+
+    def test_validate_version(self):
+        self.statement_data["version"] = "1.0.3"
+        Statement(self.statement_data).validate()
+        self.statement_data["version"] = "0.95"
+        with self.assertRaises(ValueError):
+            Statement(self.statement_data).validate()
+
+    def test_strict_lazy(self):
+        self.statement_data["result"]["score"]["scaled"] = 5
+        with validating("strict"):
+            statement = LazyStatement(self.statement_data)
+            decoded = LazyStatement.from_json(json.dumps(self.statement_data))
+        self.assertIn("result", decoded._raw)
+        self.assertEqual(statement.verb.id, "http://adlnet.gov/expapi/verbs/experienced")
+        with self.assertRaises(ValueError):
+            statement.validate()
+
+        json_data = statements_result_json(8)
+        with validating("strict"):
+            result = LazyStatementsResult.from_json(json_data)
+        self.assertTrue(all(s._raw for s in result.statements))
+        self.assertEqual(result, StatementsResult.from_json(json_data))
+
+    def test_trusted_equal(self):
+        with validating("trusted"):
+            statement = Statement(self.statement_data)
+            context = Context({"platform": "TinCanPython", "language": "en-US"})
+        self.assertIsInstance(statement.actor, Agent)
+        self.assertIsInstance(statement.verb.display, LanguageMap)
+        self.assertEqual(statement, Statement(self.statement_data))
+        self.assertEqual(context, Context({"platform": "TinCanPython", "language": "en-US"}))
+
+    def test_trusted_keywords(self):
+        with validating("trusted"):
+            verb = Verb(id="http://adlnet.gov/expapi/verbs/experienced", display={"en-US": "experienced"})
+        self.assertIsInstance(verb.display, LanguageMap)
+        self.assertEqual(verb, Verb(self.statement_data["verb"]))
+
+    def test_trusted_skips_checks(self):
+        with validating("trusted"):
+            score = Score({"scaled": 5})
+        self.assertEqual(score.scaled, 5)
+        # setting a property still converts and checks it
+        with self.assertRaises(TypeError):
+            score.scaled = "five"
+
+    def test_from_json(self):
+        json_data = statements_result_json(8)
+        expected = StatementsResult.from_json(json_data)
+        with validating("trusted"):
+            trusted = StatementsResult.from_json(json_data)
+        self.assertEqual(trusted, expected)
+        self.assertEqual(trusted.to_json(), expected.to_json())
+
+        with validating("strict"):
+            # the statements with a platform but no activity object do not conform
+            with self.assertRaises(ValueError):
+                StatementsResult.from_json(json_data)
+            # and the strict level is not lowered by trusted=True
+            with self.assertRaises(ValueError):
+                StatementsResult.from_json(json_data, trusted=True)
+            # projected statements are incomplete, so they are not checked
+            StatementsResult.from_json(json_data, projection=["id", "context"])
+            statement = json.loads(json_data)["statements"][0]
+            self.assertEqual(Statement.from_json(json.dumps(statement)), expected.statements[0])
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(ValidationTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -26,32 +26,49 @@ from tincan.agent import Agent
 from tincan.agent_account import AgentAccount
 from tincan.agent_list import AgentList
 from tincan.attachment import Attachment
+from tincan.async_remote_lrs import AsyncRemoteLRS
 from tincan.attachment_list import AttachmentList
 from tincan.base import Base
+from tincan.connection_pool import ConnectionPool, AsyncConnectionPool
 from tincan.context import Context
 from tincan.context_activities import ContextActivities
 from tincan.documents.activity_profile_document import ActivityProfileDocument
 from tincan.documents.agent_profile_document import AgentProfileDocument
 from tincan.documents.document import Document
 from tincan.documents.state_document import StateDocument
+from tincan.document_cache import DocumentCache
 from tincan.extensions import Extensions
 from tincan.group import Group
 from tincan.http_request import HTTPRequest
+from tincan.instrumentation import RequestHooks, MetricsCollector
 from tincan.interaction_component import InteractionComponent
+from tincan.interner import Interner, interning
 from tincan.interaction_component_list import InteractionComponentList
+from tincan.json_codec import JSONCodec
 from tincan.language_map import LanguageMap
-from tincan.lrs_response import LRSResponse
+from tincan.lazy_statement import LazyStatement
+from tincan.lazy_statement_list import LazyStatementList
+from tincan.lazy_statements_result import LazyStatementsResult
+from tincan.lrs_batch_response import LRSBatchResponse
+from tincan.lrs_response import LRSResponse, LRSResponseError
+from tincan.multipart import AttachmentPayload
+from tincan.projection import Projection
 from tincan.remote_lrs import RemoteLRS
+from tincan.rate_limiter import RateLimiter
 from tincan.result import Result
+from tincan.retry_policy import RetryPolicy
 from tincan.score import Score
 from tincan.serializable_base import SerializableBase
 from tincan.statement import Statement
 from tincan.statement_base import StatementBase
 from tincan.statement_list import StatementList
+from tincan.statement_queue import StatementQueue
 from tincan.statement_ref import StatementRef
 from tincan.statement_targetable import StatementTargetable
 from tincan.statements_result import StatementsResult
+from tincan.statements_result_parser import StatementsResultParser
 from tincan.substatement import SubStatement
 from tincan.typed_list import TypedList
 from tincan.verb import Verb
+from tincan.validation import get_validation_level, set_validation_level, validating
 from tincan.version import Version
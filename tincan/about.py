@@ -26,6 +26,8 @@ class About(SerializableBase):
     :type extensions: :class:`tincan.Extensions`
     """
 
+    __slots__ = ('_version', '_extensions')
+
     _props_req = [
         'version',
     ]
@@ -25,6 +25,8 @@ from tincan.activity_definition import ActivityDefinition
 
 
 class Activity(SerializableBase, StatementTargetable):
+    __slots__ = ('_id', '_object_type', '_definition')
+
     _props_req = [
         'id',
         'object_type'
@@ -43,6 +45,16 @@ class Activity(SerializableBase, StatementTargetable):
 
         super(Activity, self).__init__(*args, **kwargs)
 
+    def _check_conformance(self):
+        self._check_required('id')
+
+    @classmethod
+    def _trusted_converters(cls):
+        return {
+            'id': str,
+            'definition': ActivityDefinition._from_trusted,
+        }
+
     @property
     def id(self):
         """Id for Activity
@@ -26,6 +26,21 @@ from tincan.interaction_component_list import InteractionComponentList
 
 
 class ActivityDefinition(SerializableBase):
+    __slots__ = (
+        '_name',
+        '_description',
+        '_type',
+        '_more_info',
+        '_interaction_type',
+        '_correct_responses_pattern',
+        '_choices',
+        '_scale',
+        '_source',
+        '_target',
+        '_steps',
+        '_extensions',
+    )
+
     _props = [
         'name',
         'description',
@@ -70,6 +85,16 @@ class ActivityDefinition(SerializableBase):
 
         super(ActivityDefinition, self).__init__(*args, **kwargs)
 
+    @classmethod
+    def _trusted_converters(cls):
+        return {
+            'name': LanguageMap._from_trusted,
+            'description': LanguageMap._from_trusted,
+            'type': str,
+            'more_info': str,
+            'extensions': Extensions._from_trusted,
+        }
+
     @property
     def name(self):
         """Name for Activity Definition
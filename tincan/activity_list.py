@@ -14,6 +14,7 @@
 
 from tincan.activity import Activity
 from tincan.typed_list import TypedList
+from tincan.interner import interned
 
 """
 .. module:: activity_list
@@ -23,4 +24,29 @@ from tincan.typed_list import TypedList
 
 
 class ActivityList(TypedList):
+    __slots__ = ()
+
     _cls = Activity
+
+    @classmethod
+    def _from_trusted(cls, data):
+        """Builds the list from data parsed from a trusted source, sharing
+        the activities with the active :class:`tincan.Interner`, if any
+
+        :param data: The parsed JSON of the list
+        :type data: list
+        """
+        result = cls.__new__(cls)
+        list.extend(result, [interned(Activity._from_trusted, v) for v in data])
+        return result
+
+    def _make_cls(self, value):
+        """Converts value to an Activity, shared with the active
+        :class:`tincan.Interner`, if any
+
+        :param value: the thing to make an Activity from
+        :rtype: :class:`tincan.Activity`
+        """
+        if isinstance(value, Activity):
+            return value
+        return interned(Activity, value)
@@ -11,8 +11,13 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
+import re
+
 from tincan.serializable_base import SerializableBase
 from tincan.agent_account import AgentAccount
+from tincan.json_codec import get_codec
+from tincan.validation import STRICT, get_validation_level
+from tincan.version import Version
 
 """
 
@@ -21,8 +26,17 @@ from tincan.agent_account import AgentAccount
 
 """
 
+# Memoized agent query parameters, see Agent.to_query_param
+_query_params = {}
+_QUERY_PARAMS_MAX = 4096
+
+_SHA1_REGEX = re.compile(r'^[0-9a-fA-F]{40}$')
+_MBOX_REGEX = re.compile(r'^mailto:[^@\s]+@[^@\s]+$')
+
 
 class Agent(SerializableBase):
+    __slots__ = ("_object_type", "_name", "_mbox", "_mbox_sha1sum", "_openid", "_account")
+
     _props_req = [
         "object_type"
     ]
@@ -47,6 +61,58 @@ class Agent(SerializableBase):
 
         super(Agent, self).__init__(*args, **kwargs)
 
+    def _check_conformance(self):
+        self._check_identifier()
+        if not self._identifiers():
+            raise ValueError(
+                f"A 'tincan.{self.__class__.__name__}' object must have one of the properties "
+                f"mbox, mbox_sha1sum, openid and account"
+            )
+
+    def _identifiers(self):
+        """The inverse functional identifiers the agent is set with
+
+        :rtype: list of unicode
+        """
+        return [p for p in ('mbox', 'mbox_sha1sum', 'openid', 'account') if getattr(self, p) is not None]
+
+    def _check_identifier(self):
+        """Checks that the agent has at most one identifier, and its form,
+        see :meth:`_check_conformance`
+
+        :raises: ValueError
+        """
+        identifiers = self._identifiers()
+        if len(identifiers) > 1:
+            raise ValueError(
+                f"Property '{identifiers[0]}' in a 'tincan.{self.__class__.__name__}' object can not be set "
+                f"along with {', '.join(identifiers[1:])}, an agent has a single identifier"
+            )
+        if self.mbox is not None and not _MBOX_REGEX.match(self.mbox):
+            raise ValueError(
+                f"Property 'mbox' in a 'tincan.{self.__class__.__name__}' object must be a mailto IRI, "
+                f"such as mailto:learner@example.com"
+            )
+        if self.mbox_sha1sum is not None and not _SHA1_REGEX.match(self.mbox_sha1sum):
+            raise ValueError(
+                f"Property 'mbox_sha1sum' in a 'tincan.{self.__class__.__name__}' object must be a "
+                f"hex-encoded SHA-1 hash"
+            )
+
+    @classmethod
+    def _trusted_converters(cls):
+        return {
+            'name': str,
+            'mbox': cls._trusted_mbox,
+            'mbox_sha1sum': str,
+            'openid': str,
+            'account': AgentAccount._from_trusted,
+        }
+
+    @staticmethod
+    def _trusted_mbox(value):
+        return value if value.startswith("mailto:") else "mailto:" + value
+
     @property
     def object_type(self):
         """Object Type for Agent. Will always be 'Agent'
@@ -105,6 +171,11 @@ class Agent(SerializableBase):
             elif not isinstance(value, str):
                 value = str(value)
         if not value.startswith("mailto:"):
+            if get_validation_level() == STRICT:
+                raise ValueError(
+                    f"Property 'mbox' in a 'tincan.{self.__class__.__name__}' object must be a mailto IRI, "
+                    f"such as mailto:learner@example.com"
+                )
             value = "mailto:" + value
         self._mbox = value
 
@@ -180,3 +251,40 @@ class Agent(SerializableBase):
     @account.deleter
     def account(self):
         del self._account
+
+    def to_query_param(self, version=Version.latest, codec=None):
+        """Returns the JSON sent as the agent parameter of LRS requests, the
+        same as :meth:`to_json`, but memoized by the values of the agent, so
+        that an agent passed to many calls is only serialized once. Changing
+        the agent, or its account, changes the values it is looked up by.
+
+        :param version: The version to which the agent must be serialized to
+        :type version: str | unicode
+        :param codec: The JSON codec to encode with, see :func:`tincan.json_codec.get_codec`
+        :type codec: :class:`tincan.json_codec.JSONCodec` | unicode | None
+        :rtype: unicode
+        """
+        codec = get_codec(codec)
+        identity = self._query_identity()
+        if identity is None:
+            return self.to_json(version, codec=codec)
+
+        key = (identity, version, codec)
+        value = _query_params.get(key)
+        if value is None:
+            value = self.to_json(version, codec=codec)
+            if len(_query_params) >= _QUERY_PARAMS_MAX:
+                _query_params.clear()
+            _query_params[key] = value
+        return value
+
+    def _query_identity(self):
+        """The values :meth:`to_json` serializes, or None if they can not
+        key :meth:`to_query_param`
+
+        :rtype: tuple | None
+        """
+        account = self._account
+        if account is not None:
+            account = (account.home_page, account.name)
+        return self.__class__, self._name, self._mbox, self._mbox_sha1sum, self._openid, account
@@ -23,6 +23,8 @@ from tincan.serializable_base import SerializableBase
 
 
 class AgentAccount(SerializableBase):
+    __slots__ = ("_name", "_home_page")
+
     _props = [
         "name",
         "home_page"
@@ -34,6 +36,16 @@ class AgentAccount(SerializableBase):
 
         super(AgentAccount, self).__init__(*args, **kwargs)
 
+    def _check_conformance(self):
+        self._check_required('home_page', 'name')
+
+    @classmethod
+    def _trusted_converters(cls):
+        return {
+            'name': str,
+            'home_page': str,
+        }
+
     @property
     def name(self):
         """Name for Account
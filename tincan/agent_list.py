@@ -23,4 +23,6 @@ from tincan.typed_list import TypedList
 
 
 class AgentList(TypedList):
+    __slots__ = ()
+
     _cls = Agent
@@ -0,0 +1,741 @@
+# Copyright 2014 Rustici Software
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import asyncio
+import io
+import time
+from collections import deque
+
+from tincan.remote_lrs import RemoteLRS
+from tincan.lrs_response import LRSResponse, LRSResponseError
+from tincan.lrs_batch_response import LRSBatchResponse
+from tincan.statement_list import StatementList
+from tincan.projection import Projection
+from tincan.compression import content_encoding, decode
+from tincan.multipart import read_statements_body
+from tincan.connection_pool import AsyncConnectionPool
+
+"""
+.. module:: async_remote_lrs
+   :synopsis: The AsyncRemoteLRS class implements non-blocking LRS communication
+   on top of asyncio.
+"""
+
+
+class AsyncRemoteLRS(RemoteLRS):
+    """The asyncio counterpart of :class:`tincan.RemoteLRS`. It is constructed
+    the same way and has the same methods, but every LRS call is a coroutine
+    that resolves to a :class:`tincan.LRSResponse`::
+
+        lrs = AsyncRemoteLRS(endpoint=..., username=..., password=...)
+        lrs_response = await lrs.save_statement(statement)
+
+    Connections are kept alive in a :class:`tincan.connection_pool.AsyncConnectionPool`,
+    which must only be used from a single event loop.
+    """
+
+    async def _send_request(self, request, attachments=False):
+        """Establishes connection and returns http response based off of request.
+
+        :param request: HTTPRequest object
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        :param attachments: Whether a multipart/mixed response holds statements
+        and their attachments, see :meth:`tincan.RemoteLRS._send_request`
+        :type attachments: bool
+        :returns: LRS Response object
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        limiter = self._rate_limiter
+        attempt = 1
+        while True:
+            timings = {}
+            start = time.perf_counter()
+            self._call_hooks("before_request", request)
+            try:
+                if limiter is not None:
+                    timings["queue"] = await limiter.acquire_async()
+                try:
+                    lrs_response = await self._send_attempt(request, attachments, timings)
+                finally:
+                    if limiter is not None:
+                        limiter.release()
+            except Exception as e:
+                self._call_hooks("on_error", request, e)
+                delay = self._retry_delay(request, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                timings["total"] = time.perf_counter() - start
+                self._call_hooks("after_response", request, lrs_response)
+                delay = self._retry_delay(request, attempt, response=lrs_response.response)
+                if delay is None:
+                    return lrs_response
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _send_attempt(self, request, attachments, timings):
+        """Sends request once, see :meth:`_send_request`
+
+        :param timings: Dictionary the timings of the attempt are recorded
+        into, see :attr:`tincan.lrs_response.LRSResponse.timings`
+        :type timings: dict
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        parsed, path, headers, body = self._prepare_request(request)
+
+        pool = self.connection_pool
+        host = (parsed.scheme, parsed.hostname, parsed.port)
+
+        web_req, reused = pool.get(*host)
+        try:
+            response, data = await self._perform_request(web_req, request, path, headers, body, timings)
+        except pool.stale_errors:
+            pool.discard(web_req)
+            if not reused:
+                raise
+
+            # the server closed the kept-alive socket while it sat idle in
+            # the pool, so try once more on a fresh connection
+            web_req = pool.new_connection(*host)
+            try:
+                response, data = await self._perform_request(web_req, request, path, headers, body, timings)
+            except BaseException:
+                pool.discard(web_req)
+                raise
+        except BaseException:
+            pool.discard(web_req)
+            raise
+
+        if response.will_close:
+            pool.discard(web_req)
+        else:
+            pool.put(web_req, *host)
+
+        start = time.perf_counter()
+        data = decode(data, content_encoding(response))
+
+        payloads = None
+        if attachments:
+            # the body has already been read, but its attachments still end
+            # up spooled rather than held twice in memory
+            data, payloads = read_statements_body(response.getheader("Content-Type"), io.BytesIO(data).read)
+        # decompressing and splitting the body count as reading it
+        timings["read"] = timings.get("read", 0.0) + time.perf_counter() - start
+
+        lrs_response = self._make_response(request, response, data)
+        lrs_response.attachments = payloads
+        lrs_response.timings = timings
+        return lrs_response
+
+    @staticmethod
+    async def _perform_request(web_req, request, path, headers, body, timings=None):
+        """Sends request over the given connection and reads the whole response
+
+        :param web_req: Connection to send the request over
+        :type web_req: :class:`tincan.connection_pool.AsyncConnection`
+        :param request: HTTPRequest object
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        :param path: Request path, including the query string
+        :type path: unicode
+        :param headers: Request headers
+        :type headers: dict
+        :param body: Request body
+        :type body: str | bytes | iterable
+        :param timings: Dictionary the timings of the request are recorded
+        into, see :attr:`tincan.lrs_response.LRSResponse.timings`
+        :type timings: dict
+        :return: The response and its body
+        :rtype: tuple(:class:`http.client.HTTPResponse`, bytes)
+        """
+        return await web_req.request(
+            method=request.method,
+            url=path,
+            body=body,
+            headers=headers,
+            timings=timings,
+        )
+
+    async def about(self):
+        """Gets about response from LRS
+
+        :return: LRS Response object with the returned LRS about object as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        lrs_response = await self._send_request(self._about_request())
+        return self._about_response(lrs_response)
+
+    async def save_statement(self, statement, attachments=None):
+        """Save statement to LRS and update statement id if necessary
+
+        :param statement: Statement object to be saved
+        :type statement: :class:`tincan.statement.Statement`
+        :param attachments: Payloads of the attachments of the statement,
+        see :meth:`tincan.RemoteLRS.save_statement`
+        :type attachments: list of :class:`tincan.multipart.AttachmentPayload`
+        :return: LRS Response object with the saved statement as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        statement, request = self._save_statement_request(statement, attachments)
+        lrs_response = await self._send_request(request)
+        return self._save_statement_response(lrs_response, statement)
+
+    async def save_statements(self, statements, batch_size=None, max_batch_bytes=None, max_workers=1,
+                              attachments=None):
+        """Save statements to LRS and update their statement id's
+
+        :param statements: A list of statement objects to be saved
+        :type statements: :class:`StatementList`
+        :param batch_size: Maximum number of statements per request,
+        see :meth:`tincan.RemoteLRS.save_statements`
+        :type batch_size: int
+        :param max_batch_bytes: Maximum size of the serialized statements per request
+        :type max_batch_bytes: int
+        :param max_workers: Number of batches sent concurrently
+        :type max_workers: int
+        :param attachments: Payloads of the attachments of the statements
+        :type attachments: list of :class:`tincan.multipart.AttachmentPayload`
+        :return: LRS Response object with the saved list of statements as content,
+        or when batching, LRS Batch Response object with one LRS Response per batch
+        :rtype: :class:`tincan.lrs_response.LRSResponse` | :class:`tincan.lrs_batch_response.LRSBatchResponse`
+        """
+        if not isinstance(statements, StatementList):
+            statements = StatementList(statements)
+
+        if batch_size is not None or max_batch_bytes is not None:
+            return await self._save_statement_batches(
+                statements, batch_size, max_batch_bytes, max_workers, attachments
+            )
+
+        request = self._save_statements_request(
+            statements,
+            statements.to_json(codec=self._codec),
+            self._attachment_parts(statements, attachments),
+        )
+        lrs_response = await self._send_request(request)
+        return self._save_statements_response(lrs_response, statements)
+
+    async def save_statements_json(self, json_data, idempotent=False):
+        """Save statements already serialized to JSON, see :meth:`tincan.RemoteLRS.save_statements_json`
+
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        lrs_response = await self._send_request(self._statements_json_request(json_data, idempotent))
+        return self._ids_response(lrs_response)
+
+    async def _save_statement_batches(self, statements, batch_size, max_batch_bytes, max_workers, attachments=None):
+        """Saves statements in batches, see :meth:`tincan.RemoteLRS._save_statement_batches`
+
+        :return: LRS Batch Response object with the list of statements as content
+        :rtype: :class:`tincan.lrs_batch_response.LRSBatchResponse`
+        """
+        self._check_statement_batches(statements, batch_size, max_batch_bytes, attachments)
+
+        async def send_batch(batch):
+            batch_statements, parts = batch
+            request = None
+            try:
+                request = self._statement_batch_request(batch_statements, parts, attachments)
+                lrs_response = await self._send_request(request)
+            except Exception as e:
+                return LRSResponse(success=False, request=request, content=e)
+
+            return self._save_statements_response(lrs_response, batch_statements)
+
+        responses = await self._map_concurrently(
+            send_batch,
+            self._statement_batches(statements, batch_size, max_batch_bytes),
+            max_workers,
+        )
+
+        return LRSBatchResponse(responses=responses, content=statements)
+
+    @staticmethod
+    async def _map_concurrently(fn, items, max_workers):
+        """Awaits fn on each of items, up to `max_workers` at a time, the way
+        :meth:`tincan.RemoteLRS._map_concurrently` runs its worker pool. Each
+        worker pulls the next item only once it is done with its last one, so
+        items are produced lazily and no more than `max_workers` are in flight.
+
+        :param fn: Coroutine function called on each item
+        :type fn: callable
+        :param items: Items to await fn on, produced as the workers need them
+        :type items: iterable
+        :param max_workers: Number of items in flight at once
+        :type max_workers: int
+        :return: The results, in the order of items
+        :rtype: list
+        """
+        items = enumerate(items)
+        results = {}
+
+        async def work():
+            for index, item in items:
+                results[index] = await fn(item)
+
+        await asyncio.gather(*[work() for _ in range(max(max_workers or 1, 1))])
+
+        return [results[index] for index in range(len(results))]
+
+    async def retrieve_statement(self, statement_id, attachments=False, response_format=None):
+        """Retrieve a statement from the server from its id
+
+        :param statement_id: The UUID of the desired statement
+        :type statement_id: str | unicode
+        :param attachments: Whether to retrieve the payloads of the statement's
+        attachments too, into the attachments of the LRS Response
+        :type attachments: bool
+        :param response_format: How to hand out the statement, one of
+        :data:`tincan.remote_lrs.RESPONSE_FORMATS`. Defaults to :attr:`response_format`.
+        :type response_format: unicode | None
+        :return: LRS Response object with the retrieved statement as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        request = self._retrieve_statement_request("statementId", statement_id, attachments)
+        lrs_response = await self._send_request(request, attachments=True)
+        return self._statements_response(lrs_response, self._statement_class, response_format)
+
+    async def retrieve_voided_statement(self, statement_id, attachments=False, response_format=None):
+        """Retrieve a voided statement from the server from its id
+
+        :param statement_id: The UUID of the desired voided statement
+        :type statement_id: str | unicode
+        :param attachments: Whether to retrieve the payloads of the statement's
+        attachments too, into the attachments of the LRS Response
+        :type attachments: bool
+        :param response_format: How to hand out the statement, one of
+        :data:`tincan.remote_lrs.RESPONSE_FORMATS`. Defaults to :attr:`response_format`.
+        :type response_format: unicode | None
+        :return: LRS Response object with the retrieved voided statement as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        request = self._retrieve_statement_request("voidedStatementId", statement_id, attachments)
+        lrs_response = await self._send_request(request, attachments=True)
+        return self._statements_response(lrs_response, self._statement_class, response_format)
+
+    async def query_statements(self, query, response_format=None, projection=None):
+        """Query the LRS for statements with specified parameters
+
+        :param query: Dictionary of query parameters and their values,
+        see :meth:`tincan.RemoteLRS.query_statements`
+        :type query: dict
+        :param response_format: How to hand out the statements, one of
+        :data:`tincan.remote_lrs.RESPONSE_FORMATS`. Defaults to :attr:`response_format`.
+        :type response_format: unicode | None
+        :param projection: The fields of the statements to decode, the others being
+        dropped, see :class:`tincan.projection.Projection`. None (the default) decodes every field.
+        :type projection: :class:`tincan.projection.Projection` | iterable of unicode | None
+        :return: LRS Response object with the returned StatementsResult object as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        lrs_response = await self._send_request(self._query_statements_request(query), attachments=True)
+        return self._statements_response(
+            lrs_response, self._statements_result_class, response_format, Projection.of(projection)
+        )
+
+    async def iter_statements(self, query, prefetch=False, projection=None):
+        """Query the LRS for statements and lazily iterate over them, following
+        the "more" links of each page of results until the last one::
+
+            async for statement in lrs.iter_statements(query):
+                ...
+
+        :param query: Dictionary of query parameters and their values,
+        see :meth:`tincan.RemoteLRS.query_statements`
+        :type query: dict
+        :param prefetch: Whether to download the next page in a separate task
+        while the current one is being iterated over
+        :type prefetch: bool
+        :param projection: The fields of the statements to decode, the others being
+        dropped, see :class:`tincan.projection.Projection`. None (the default) decodes every field.
+        :type projection: :class:`tincan.projection.Projection` | iterable of unicode | None
+        :return: Asynchronous generator of the queried statements
+        :rtype: async generator of :class:`tincan.statement.Statement`
+        :raises: :class:`tincan.lrs_response.LRSResponseError` if a page can not be retrieved
+        """
+        projection = Projection.of(projection)
+        pending = self.query_statements(query, response_format="objects", projection=projection)
+        if prefetch:
+            pending = asyncio.ensure_future(pending)
+
+        try:
+            while pending is not None:
+                lrs_response = await pending
+                pending = None
+                if not lrs_response.success:
+                    raise LRSResponseError(lrs_response)
+
+                result = lrs_response.content
+                lrs_response = None
+                if result.more:
+                    pending = self.more_statements(result.more, response_format="objects", projection=projection)
+                    if prefetch:
+                        pending = asyncio.ensure_future(pending)
+
+                for statement in result.statements:
+                    yield statement
+        finally:
+            if pending is not None:
+                if prefetch:
+                    pending.cancel()
+                else:
+                    pending.close()
+
+    async def export_statements(self, query, since, until, windows=4, max_workers=None, projection=None):
+        """Export the statements stored in a time range by splitting it into
+        `windows` consecutive windows and fetching them concurrently, see
+        :meth:`tincan.RemoteLRS.export_statements`::
+
+            async for statement in lrs.export_statements(query, since, until):
+                ...
+
+        :param query: Dictionary of query parameters and their values
+        :type query: dict
+        :param since: Export the statements stored after this time (exclusive)
+        :type since: :class:`datetime.datetime` | str | unicode
+        :param until: Export the statements stored at or before this time (inclusive)
+        :type until: :class:`datetime.datetime` | str | unicode
+        :param windows: Number of time windows to split the range into
+        :type windows: int
+        :param max_workers: Number of windows fetched at the same time,
+        defaults to `windows`
+        :type max_workers: int
+        :param projection: The fields of the statements to decode, the others being
+        dropped, see :class:`tincan.projection.Projection`. None (the default) decodes every field.
+        :type projection: :class:`tincan.projection.Projection` | iterable of unicode | None
+        :return: Asynchronous generator of the exported statements
+        :rtype: async generator of :class:`tincan.statement.Statement`
+        :raises: :class:`tincan.lrs_response.LRSResponseError` if a page can not be retrieved
+        """
+        queries = self._export_window_queries(query, since, until, windows)
+        if max_workers is None or max_workers < 1:
+            max_workers = len(queries)
+
+        pending = deque()
+        try:
+            for window_query in queries:
+                pending.append(asyncio.ensure_future(self._fetch_window(window_query, projection)))
+                if len(pending) >= max_workers:
+                    for statement in await pending.popleft():
+                        yield statement
+            while pending:
+                for statement in await pending.popleft():
+                    yield statement
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _fetch_window(self, query, projection=None):
+        return [statement async for statement in self.iter_statements(query, projection=projection)]
+
+    async def more_statements(self, more_url, response_format=None, projection=None):
+        """Query the LRS for more statements
+
+        :param more_url: URL from a StatementsResult object used to retrieve more statements,
+        or the StatementsResult itself
+        :type more_url: str | unicode | :class:`tincan.statements_result.StatementsResult` | dict
+        :param response_format: How to hand out the statements, one of
+        :data:`tincan.remote_lrs.RESPONSE_FORMATS`. Defaults to :attr:`response_format`.
+        :type response_format: unicode | None
+        :param projection: The fields of the statements to decode, the others being
+        dropped, see :class:`tincan.projection.Projection`. None (the default) decodes every field.
+        :type projection: :class:`tincan.projection.Projection` | iterable of unicode | None
+        :return: LRS Response object with the returned StatementsResult object as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        lrs_response = await self._send_request(self._more_statements_request(more_url), attachments=True)
+        return self._statements_response(
+            lrs_response, self._statements_result_class, response_format, Projection.of(projection)
+        )
+
+    async def retrieve_state_ids(self, activity, agent, registration=None, since=None):
+        """Retrieve state id's from the LRS with the provided parameters
+
+        :param activity: Activity object of desired states
+        :type activity: :class:`tincan.activity.Activity`
+        :param agent: Agent object of desired states
+        :type agent: :class:`tincan.agent.Agent`
+        :param registration: Registration UUID of desired states
+        :type registration: str | unicode
+        :param since: Retrieve state id's since this time
+        :type since: str | unicode
+        :return: LRS Response object with the retrieved state id's as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        lrs_response = await self._send_request(self._state_ids_request(activity, agent, registration, since))
+        return self._ids_response(lrs_response)
+
+    async def retrieve_state(self, activity, agent, state_id, registration=None):
+        """Retrieve state from LRS with the provided parameters
+
+        :param activity: Activity object of desired state
+        :type activity: :class:`tincan.activity.Activity`
+        :param agent: Agent object of desired state
+        :type agent: :class:`tincan.agent.Agent`
+        :param state_id: UUID of desired state
+        :type state_id: str | unicode
+        :param registration: registration UUID of desired state
+        :type registration: str | unicode
+        :return: LRS Response object with retrieved state document as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        request, doc = self._retrieve_state_request(activity, agent, state_id, registration)
+        key, cached = self._cached_document(request)
+        lrs_response = await self._send_request(request)
+        return self._retrieve_document_response(lrs_response, doc, key, cached)
+
+    async def save_state(self, state):
+        """Save a state doc to the LRS
+
+        :param state: State document to be saved
+        :type state: :class:`tincan.documents.state_document.StateDocument`
+        :return: LRS Response object with saved state as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        request = self._save_state_request(state)
+        lrs_response = await self._send_request(request)
+        return self._save_document_response(lrs_response, request, state)
+
+    async def _delete_state(self, activity, agent, state_id=None, registration=None, etag=None):
+        """Private method to delete a specified state from the LRS
+
+        :param activity: Activity object of state to be deleted
+        :type activity: :class:`tincan.activity.Activity`
+        :param agent: Agent object of state to be deleted
+        :type agent: :class:`tincan.agent.Agent`
+        :param state_id: UUID of state to be deleted
+        :type state_id: str | unicode
+        :param registration: registration UUID of state to be deleted
+        :type registration: str | unicode
+        :param etag: etag of state to be deleted
+        :type etag: str | unicode
+        :return: LRS Response object with deleted state as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        request = self._delete_state_request(activity, agent, state_id, registration, etag)
+        lrs_response = await self._send_request(request)
+        self._forget_documents(request)
+
+        return lrs_response
+
+    async def delete_state(self, state):
+        """Delete a specified state from the LRS
+
+        :param state: State document to be deleted
+        :type state: :class:`tincan.documents.state_document.StateDocument`
+        :return: LRS Response object
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        return await self._delete_state(
+            activity=state.activity,
+            agent=state.agent,
+            state_id=state.id,
+            registration=state.registration,
+            etag=state.etag
+        )
+
+    async def clear_state(self, activity, agent, registration=None):
+        """Clear state(s) with specified activity and agent
+
+        :param activity: Activity object of state(s) to be deleted
+        :type activity: :class:`tincan.activity.Activity`
+        :param agent: Agent object of state(s) to be deleted
+        :type agent: :class:`tincan.agent.Agent`
+        :param registration: registration UUID of state(s) to be deleted
+        :type registration: str | unicode
+        :return: LRS Response object
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        return await self._delete_state(
+            activity=activity,
+            agent=agent,
+            registration=registration
+        )
+
+    async def retrieve_states(self, keys, max_workers=4):
+        """Retrieves many state documents, see :meth:`tincan.RemoteLRS.retrieve_states`
+
+        :return: LRS Batch Response object with the LRS Response of each key,
+        in order, and the list of retrieved documents as content
+        :rtype: :class:`tincan.lrs_batch_response.LRSBatchResponse`
+        """
+        responses = await self._map_states(
+            lambda key: self.retrieve_state(*self._state_key(key)), keys, max_workers
+        )
+        return LRSBatchResponse(responses=responses, content=[self._found_state(r) for r in responses])
+
+    async def save_states(self, states, max_workers=4):
+        """Saves many state documents, see :meth:`tincan.RemoteLRS.save_states`
+
+        :return: LRS Batch Response object with the LRS Response of each
+        document, in order, and the list of documents as content
+        :rtype: :class:`tincan.lrs_batch_response.LRSBatchResponse`
+        """
+        states = list(states)
+        responses = await self._map_states(self.save_state, states, max_workers)
+        return LRSBatchResponse(responses=responses, content=states)
+
+    async def delete_states(self, states, max_workers=4):
+        """Deletes many state documents, see :meth:`tincan.RemoteLRS.delete_states`
+
+        :return: LRS Batch Response object with the LRS Response of each document, in order
+        :rtype: :class:`tincan.lrs_batch_response.LRSBatchResponse`
+        """
+        return LRSBatchResponse(responses=await self._map_states(self.delete_state, states, max_workers))
+
+    async def _map_states(self, call, items, max_workers):
+        """Awaits an LRS method on each of items, up to max_workers at a time,
+        see :meth:`tincan.RemoteLRS._map_states`
+
+        :param call: LRS coroutine function taking an item and returning an LRS Response
+        :type call: callable
+        :rtype: list of :class:`tincan.lrs_response.LRSResponse`
+        """
+        async def call_item(item):
+            try:
+                return await call(item)
+            except Exception as e:
+                return LRSResponse(success=False, content=e)
+
+        return await self._map_concurrently(call_item, items, max_workers)
+
+    async def retrieve_activity_profile_ids(self, activity, since=None):
+        """Retrieve activity profile id(s) with the specified parameters
+
+        :param activity: Activity object of desired activity profiles
+        :type activity: :class:`tincan.activity.Activity`
+        :param since: Retrieve activity profile id's since this time
+        :type since: str | unicode
+        :return: LRS Response object with list of retrieved activity profile id's as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        lrs_response = await self._send_request(self._activity_profile_ids_request(activity, since))
+        return self._ids_response(lrs_response)
+
+    async def retrieve_activity_profile(self, activity, profile_id):
+        """Retrieve activity profile with the specified parameters
+
+        :param activity: Activity object of the desired activity profile
+        :type activity: :class:`tincan.activity.Activity`
+        :param profile_id: UUID of the desired profile
+        :type profile_id: str | unicode
+        :return: LRS Response object with an activity profile doc as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        request, doc = self._retrieve_activity_profile_request(activity, profile_id)
+        key, cached = self._cached_document(request)
+        lrs_response = await self._send_request(request)
+        return self._retrieve_document_response(lrs_response, doc, key, cached)
+
+    async def save_activity_profile(self, profile):
+        """Save an activity profile doc to the LRS
+
+        :param profile: Activity profile doc to be saved
+        :type profile: :class:`tincan.documents.activity_profile_document.ActivityProfileDocument`
+        :return: LRS Response object with the saved activity profile doc as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        request = self._save_activity_profile_request(profile)
+        lrs_response = await self._send_request(request)
+        return self._save_document_response(lrs_response, request, profile)
+
+    async def delete_activity_profile(self, profile):
+        """Delete activity profile doc from LRS
+
+        :param profile: Activity profile document to be deleted
+        :type profile: :class:`tincan.documents.activity_profile_document.ActivityProfileDocument`
+        :return: LRS Response object
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        request = self._delete_activity_profile_request(profile)
+        lrs_response = await self._send_request(request)
+        self._forget_documents(request)
+
+        return lrs_response
+
+    async def retrieve_agent_profile_ids(self, agent, since=None):
+        """Retrieve agent profile id(s) with the specified parameters
+
+        :param agent: Agent object of desired agent profiles
+        :type agent: :class:`tincan.agent.Agent`
+        :param since: Retrieve agent profile id's since this time
+        :type since: str | unicode
+        :return: LRS Response object with list of retrieved agent profile id's as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        lrs_response = await self._send_request(self._agent_profile_ids_request(agent, since))
+        return self._ids_response(lrs_response)
+
+    async def retrieve_agent_profile(self, agent, profile_id):
+        """Retrieve agent profile with the specified parameters
+
+        :param agent: Agent object of the desired agent profile
+        :type agent: :class:`tincan.agent.Agent`
+        :param profile_id: UUID of the desired agent profile
+        :type profile_id: str | unicode
+        :return: LRS Response object with an agent profile doc as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        request, doc = self._retrieve_agent_profile_request(agent, profile_id)
+        key, cached = self._cached_document(request)
+        lrs_response = await self._send_request(request)
+        return self._retrieve_document_response(lrs_response, doc, key, cached)
+
+    async def save_agent_profile(self, profile):
+        """Save an agent profile doc to the LRS
+
+        :param profile: Agent profile doc to be saved
+        :type profile: :class:`tincan.documents.agent_profile_document.AgentProfileDocument`
+        :return: LRS Response object with the saved agent profile doc as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        request = self._save_agent_profile_request(profile)
+        lrs_response = await self._send_request(request)
+        return self._save_document_response(lrs_response, request, profile)
+
+    async def delete_agent_profile(self, profile):
+        """Delete agent profile doc from LRS
+
+        :param profile: Agent profile document to be deleted
+        :type profile: :class:`tincan.documents.agent_profile_document.AgentProfileDocument`
+        :return: LRS Response object
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        request = self._delete_agent_profile_request(profile)
+        lrs_response = await self._send_request(request)
+        self._forget_documents(request)
+
+        return lrs_response
+
+    @property
+    def connection_pool(self):
+        """Pool of keep-alive connections used for remote LRS communication
+
+        :setter: Must be a :class:`tincan.connection_pool.AsyncConnectionPool`.
+        Setting to None creates a new pool with the default size.
+        :setter type: :class:`tincan.connection_pool.AsyncConnectionPool`
+        :rtype: :class:`tincan.connection_pool.AsyncConnectionPool`
+        """
+        return self._connection_pool
+
+    @connection_pool.setter
+    def connection_pool(self, value):
+        if value is None:
+            value = AsyncConnectionPool()
+        elif not isinstance(value, AsyncConnectionPool):
+            raise TypeError(
+                f"Property 'connection_pool' in 'tincan.{self.__class__.__name__}' must be set with a "
+                f"tincan.AsyncConnectionPool object"
+            )
+        self._connection_pool = value
@@ -23,6 +23,16 @@ from tincan.language_map import LanguageMap
 
 
 class Attachment(SerializableBase):
+    __slots__ = (
+        "_usage_type",
+        "_display",
+        "_content_type",
+        "_length",
+        "_sha2",
+        "_description",
+        "_fileurl",
+    )
+
     _props_req = [
         "usage_type",
         "display",
@@ -49,6 +59,9 @@ class Attachment(SerializableBase):
 
         super(Attachment, self).__init__(*args, **kwargs)
 
+    def _check_conformance(self):
+        self._check_required('usage_type', 'display', 'content_type', 'length', 'sha2')
+
     @property
     def usage_type(self):
         """Usage type for Attachment
@@ -23,4 +23,6 @@ from tincan.typed_list import TypedList
 
 
 class AttachmentList(TypedList):
+    __slots__ = ()
+
     _cls = Attachment
@@ -22,6 +22,16 @@
 
 
 class Base(object):
+    """Model classes keep their attributes in ``__slots__`` rather than in a
+    per-instance dict, which makes large numbers of them (such as the
+    statements of a query) much more compact. Each class declares the slots
+    of the attributes its constructor sets, and ``vars(obj)`` still returns
+    them as a dict. Subclasses of such a class should declare ``__slots__``
+    too, even if empty.
+
+    """
+    __slots__ = ('__weakref__',)
+
     _props = []
 
     def __init__(self, *args, **kwargs):
@@ -65,5 +75,41 @@ class Base(object):
         else:
             super(Base, self).__setattr__(attr, value)
 
+    @property
+    def __dict__(self):
+        """The attributes stored in the slots of the object, in the order its
+        constructor sets them. Classes that do not declare ``__slots__`` have
+        a regular instance dict instead.
+
+        :rtype: dict
+        """
+        result = {}
+        for name in self._slot_names():
+            try:
+                result[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        return result
+
+    @classmethod
+    def _slot_names(cls):
+        """The names of the slots of cls: the ones of the class itself, then
+        the ones of its bases, unless a class lists its attributes in another
+        order in `_attribute_order`
+
+        :rtype: tuple
+        """
+        names = _slot_names_cache.get(cls)
+        if names is None:
+            names = []
+            for klass in cls.__mro__:
+                slots = klass.__dict__.get('_attribute_order', klass.__dict__.get('__slots__', ()))
+                names.extend(n for n in slots if n != '__weakref__' and n not in names)
+            names = _slot_names_cache[cls] = tuple(names)
+        return names
+
     def __eq__(self, other):
         return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+
+_slot_names_cache = {}
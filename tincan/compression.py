@@ -0,0 +1,144 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import gzip
+import zlib
+
+"""
+.. module:: compression
+   :synopsis: Gzip compression of request bodies and incremental gzip/deflate
+   decoding of response bodies.
+
+"""
+
+# Sent in the Accept-Encoding header when responses may be compressed
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Trades a little ratio for a lot of speed over the default level 9, JSON
+# being so repetitive that it hardly compresses better at higher levels
+COMPRESS_LEVEL = 6
+
+# Compressed bytes read at a time
+CHUNK_SIZE = 64 * 1024
+
+_ENCODINGS = ("gzip", "x-gzip", "deflate")
+
+
+def compressible(content_type):
+    """Tells whether a body of the given type is worth compressing, which
+    media types such as images and videos, usually compressed already, are not
+
+    :param content_type: The value of a Content-Type header
+    :type content_type: unicode
+    :rtype: bool
+    """
+    if not content_type:
+        return False
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith("text/") or media_type.endswith(("json", "xml"))
+
+
+def compress(data):
+    """Compresses a request body with gzip
+
+    :param data: The body
+    :type data: str | unicode | bytes
+    :rtype: bytes
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return gzip.compress(data, compresslevel=COMPRESS_LEVEL)
+
+
+def content_encoding(response):
+    """Returns the encoding of a response body that :class:`DecodingReader`
+    decodes, or None if the body is not compressed
+
+    :param response: The response
+    :type response: :class:`http.client.HTTPResponse`
+    :rtype: unicode
+    """
+    encoding = (response.getheader("Content-Encoding") or "").strip().lower()
+    return encoding if encoding in _ENCODINGS else None
+
+
+class DecodingReader(object):
+    """Decompresses a gzip or deflate body while it is being read
+
+    :param read: Function reading up to n bytes of the compressed body,
+    returning b"" at its end
+    :type read: callable
+    :param encoding: "gzip", "x-gzip" or "deflate"
+    :type encoding: unicode
+    """
+
+    def __init__(self, read, encoding):
+        self._read = read
+        self._encoding = encoding
+        self._decompressor = None
+        self._eof = False
+
+    def read(self, size=-1):
+        """Reads up to size bytes of the decompressed body
+
+        :param size: Most bytes returned, or all the rest of the body when negative
+        :type size: int
+        :return: The bytes read, b"" at the end of the body
+        :rtype: bytes
+        :raises: zlib.error for a corrupt body
+        """
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(CHUNK_SIZE), b""))
+
+        while True:
+            decompressor = self._decompressor
+            if decompressor is not None and decompressor.unconsumed_tail:
+                data = decompressor.decompress(decompressor.unconsumed_tail, size)
+            elif self._eof:
+                return b""
+            else:
+                compressed = self._read(CHUNK_SIZE)
+                if not compressed:
+                    self._eof = True
+                    data = decompressor.flush() if decompressor is not None else b""
+                else:
+                    if decompressor is None:
+                        decompressor = self._decompressor = self._make_decompressor(compressed)
+                    data = decompressor.decompress(compressed, size)
+            if data:
+                return data
+
+    def _make_decompressor(self, head):
+        if self._encoding != "deflate":
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        # "deflate" should be zlib wrapped, but some servers send a raw
+        # deflate stream instead, which has no zlib header
+        if len(head) >= 2 and head[0] & 0x0f == 8 and (head[0] << 8 | head[1]) % 31 == 0:
+            return zlib.decompressobj(zlib.MAX_WBITS)
+        return zlib.decompressobj(-zlib.MAX_WBITS)
+
+
+def decode(data, encoding):
+    """Decompresses a whole gzip or deflate body
+
+    :param data: The compressed body
+    :type data: bytes
+    :param encoding: See :class:`DecodingReader`, None for an uncompressed body
+    :type encoding: unicode
+    :rtype: bytes
+    """
+    if encoding is None:
+        return data
+    chunks = iter((data,))
+    return DecodingReader(lambda size: next(chunks, b""), encoding).read()
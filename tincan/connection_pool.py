@@ -0,0 +1,416 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import asyncio
+import http.client
+import io
+import ssl
+import threading
+import time
+from collections import deque
+
+"""
+.. module:: connection_pool
+   :synopsis: Thread safe and asyncio pools of keep-alive HTTP connections, keyed by host
+
+"""
+
+
+class ConnectionPool(object):
+    """Keeps idle keep-alive connections around so that consecutive requests
+    to the same host can reuse them instead of paying for a new TCP and TLS
+    handshake each time.
+
+    A connection is checked out with :meth:`get` and handed back with
+    :meth:`put` once its response has been read completely. At most
+    `max_size` idle connections are kept per host; when more are in use at
+    the same time, the extra ones are opened on demand and closed when they
+    are released.
+
+    :param max_size: Maximum number of idle connections kept per host
+    :type max_size: int
+    :param timeout: Socket timeout, in seconds, for new connections
+    :type timeout: float
+    """
+
+    # Errors raised when a kept-alive socket has been closed or reset by
+    # the server while it was sitting idle in the pool
+    stale_errors = (
+        http.client.RemoteDisconnected,
+        http.client.BadStatusLine,
+        ConnectionResetError,
+        ConnectionAbortedError,
+        BrokenPipeError,
+    )
+
+    def __init__(self, max_size=10, timeout=None):
+        if max_size is None or int(max_size) < 1:
+            raise ValueError("Property 'max_size' in a 'tincan.ConnectionPool' must be a positive integer")
+
+        self.max_size = int(max_size)
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._idle = {}
+
+    def get(self, scheme, host, port=None):
+        """Checks out a connection to the given host, reusing an idle one if
+        available
+
+        :param scheme: "http" or "https"
+        :type scheme: str
+        :param host: Host name
+        :type host: str
+        :param port: Port, or None for the scheme's default
+        :type port: int
+        :return: The connection and whether it was reused from the pool
+        :rtype: tuple(:class:`http.client.HTTPConnection`, bool)
+        """
+        key = (scheme, host, port)
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+
+        return self.new_connection(scheme, host, port), False
+
+    def put(self, conn, scheme, host, port=None):
+        """Hands a connection back to the pool. The response of the last
+        request made on it must have been read completely.
+
+        :param conn: Connection previously returned by :meth:`get`
+        :type conn: :class:`http.client.HTTPConnection`
+        """
+        key = (scheme, host, port)
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self.max_size:
+                idle.append(conn)
+                return
+
+        conn.close()
+
+    @staticmethod
+    def discard(conn):
+        """Closes a connection that can not be reused
+
+        :param conn: Connection previously returned by :meth:`get`
+        :type conn: :class:`http.client.HTTPConnection`
+        """
+        conn.close()
+
+    def clear(self):
+        """Closes all the idle connections in the pool"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    def idle_count(self, scheme=None, host=None, port=None):
+        """Number of idle connections, either in total or for one host
+
+        :rtype: int
+        """
+        with self._lock:
+            if host is None:
+                return sum(len(c) for c in self._idle.values())
+            return len(self._idle.get((scheme, host, port), ()))
+
+    def new_connection(self, scheme, host, port=None):
+        """Opens a new connection to the given host, bypassing the idle
+        connections. Used to retry a request whose pooled socket went stale.
+
+        :rtype: :class:`http.client.HTTPConnection`
+        """
+        kwargs = {} if self.timeout is None else {"timeout": self.timeout}
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, **kwargs)
+        return http.client.HTTPConnection(host, port, **kwargs)
+
+
+class AsyncConnection(object):
+    """A minimal non-blocking HTTP/1.1 connection built on asyncio streams.
+
+    Responses are returned as regular :class:`http.client.HTTPResponse`
+    objects so that they can be wrapped in a :class:`tincan.LRSResponse`
+    just like the ones of the blocking client.
+
+    :param scheme: "http" or "https"
+    :type scheme: str
+    :param host: Host name
+    :type host: str
+    :param port: Port, or None for the scheme's default
+    :type port: int
+    :param timeout: Timeout, in seconds, for connecting and for each read
+    :type timeout: float
+    """
+
+    def __init__(self, scheme, host, port=None, timeout=None):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+        self._reader = None
+        self._writer = None
+
+    async def connect(self):
+        """Opens the underlying stream. Called by :meth:`request` if needed."""
+        if self.scheme == "https":
+            port = self.port or http.client.HTTPS_PORT
+            ssl_context = ssl.create_default_context()
+        else:
+            port = self.port or http.client.HTTP_PORT
+            ssl_context = None
+
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, port, ssl=ssl_context),
+            self.timeout,
+        )
+
+    def close(self):
+        """Closes the underlying stream"""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
+
+    async def request(self, method, url, body=None, headers=None, timings=None):
+        """Sends a request and reads the whole response
+
+        :param method: HTTP method
+        :type method: str
+        :param url: Request path, including the query string
+        :type url: str
+        :param body: Request body, or an iterable of its chunks, in which case
+        its Content-Length must be among the headers
+        :type body: str | bytes | iterable
+        :param headers: Request headers
+        :type headers: dict
+        :param timings: Dictionary the seconds spent connecting, sending the
+        request, waiting for the response head and reading the body are
+        recorded into, as "connect", "send", "wait" and "read"
+        :type timings: dict
+        :return: The response and its body
+        :rtype: tuple(:class:`http.client.HTTPResponse`, bytes)
+        """
+        if timings is None:
+            timings = {}
+
+        if self._writer is None:
+            start = time.perf_counter()
+            await self.connect()
+            timings["connect"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        host_header = self.host if self.port is None else f"{self.host}:{self.port}"
+        lines = [f"{method} {url} HTTP/1.1", f"Host: {host_header}"]
+        if not any(k.lower() == "accept-encoding" for k in headers or {}):
+            lines.append("Accept-Encoding: identity")
+        for k, v in (headers or {}).items():
+            lines.append(f"{k}: {v}")
+        iterable = body is not None and not isinstance(body, (bytes, bytearray))
+        # as with http.client, an iterable body whose framing the caller has
+        # not set is sent with the chunked transfer coding
+        chunked = iterable and not any(
+            k.lower() in ("content-length", "transfer-encoding") for k in headers or {}
+        )
+        if chunked:
+            lines.append("Transfer-Encoding: chunked")
+        elif not iterable and (body is not None or method in ("POST", "PUT")):
+            lines.append(f"Content-Length: {len(body or b'')}")
+
+        self._writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if iterable:
+            for chunk in body:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8")
+                if not chunk:
+                    # an empty chunk would end a chunked body
+                    continue
+                if chunked:
+                    chunk = b"%x\r\n" % len(chunk) + chunk + b"\r\n"
+                self._writer.write(chunk)
+                await self._writer.drain()
+            if chunked:
+                self._writer.write(b"0\r\n\r\n")
+        elif body:
+            self._writer.write(body)
+        await self._writer.drain()
+        timings["send"] = time.perf_counter() - start
+
+        head, data = await self._read_response(method, timings)
+
+        # only the head goes through HTTPResponse, the body having already
+        # been read and unchunked, so that it is never held twice
+        response = http.client.HTTPResponse(_BufferedSocket(head), method=method)
+        response.begin()
+
+        return response, data
+
+    async def _read_response(self, method, timings):
+        """Reads exactly one response off the stream
+
+        :return: The raw head of the response, and its body with any chunked
+        transfer coding removed
+        :rtype: tuple(bytes, bytes)
+        """
+        start = time.perf_counter()
+        try:
+            head = await self._read(self._reader.readuntil(b"\r\n\r\n"))
+        except asyncio.IncompleteReadError as e:
+            if not e.partial:
+                raise http.client.RemoteDisconnected("Remote end closed connection without response")
+            raise http.client.BadStatusLine(e.partial.decode("latin-1"))
+        timings["wait"] = time.perf_counter() - start
+        start = time.perf_counter()
+
+        status_line, _, header_block = head.partition(b"\r\n")
+        try:
+            status = int(status_line.split()[1])
+        except (IndexError, ValueError):
+            raise http.client.BadStatusLine(status_line.decode("latin-1"))
+
+        headers = {}
+        for line in header_block.split(b"\r\n"):
+            name, sep, value = line.partition(b":")
+            if sep:
+                headers[name.strip().lower()] = value.strip().lower()
+
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            timings["read"] = 0.0
+            return head, b""
+
+        # the transfer codings are listed in the order they were applied,
+        # so a chunked body has "chunked" last
+        codings = [c.strip() for c in headers.get(b"transfer-encoding", b"").split(b",")]
+        if codings[-1] == b"chunked":
+            parts = []
+            while True:
+                size_line = await self._read(self._reader.readuntil(b"\r\n"))
+                size = int(size_line.split(b";")[0], 16)
+                if size == 0:
+                    break
+                parts.append(await self._read(self._reader.readexactly(size)))
+                await self._read(self._reader.readexactly(2))
+            while True:
+                trailer = await self._read(self._reader.readuntil(b"\r\n"))
+                if trailer == b"\r\n":
+                    break
+            body = b"".join(parts)
+        elif b"content-length" in headers:
+            body = await self._read(self._reader.readexactly(int(headers[b"content-length"])))
+        else:
+            body = await self._read(self._reader.read())
+        timings["read"] = time.perf_counter() - start
+
+        return head, body
+
+    async def _read(self, awaitable):
+        return await asyncio.wait_for(awaitable, self.timeout)
+
+
+class _BufferedSocket(object):
+    """Stands in for a socket so that :class:`http.client.HTTPResponse` can
+    parse the head of a response that has already been read into memory"""
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    def makefile(self, *args, **kwargs):
+        return io.BytesIO(self._raw)
+
+
+class AsyncConnectionPool(object):
+    """The asyncio counterpart of :class:`ConnectionPool`, keeping idle
+    :class:`AsyncConnection` objects around for reuse.
+
+    A pool must only be used from the event loop that created its
+    connections.
+
+    :param max_size: Maximum number of idle connections kept per host
+    :type max_size: int
+    :param timeout: Timeout, in seconds, for connecting and for each read
+    :type timeout: float
+    """
+
+    stale_errors = ConnectionPool.stale_errors + (asyncio.IncompleteReadError,)
+
+    def __init__(self, max_size=10, timeout=None):
+        if max_size is None or int(max_size) < 1:
+            raise ValueError("Property 'max_size' in a 'tincan.AsyncConnectionPool' must be a positive integer")
+
+        self.max_size = int(max_size)
+        self.timeout = timeout
+
+        self._idle = {}
+
+    def get(self, scheme, host, port=None):
+        """Checks out a connection to the given host, reusing an idle one if
+        available. New connections are opened lazily by their first request.
+
+        :return: The connection and whether it was reused from the pool
+        :rtype: tuple(:class:`AsyncConnection`, bool)
+        """
+        idle = self._idle.get((scheme, host, port))
+        if idle:
+            return idle.pop(), True
+
+        return self.new_connection(scheme, host, port), False
+
+    def put(self, conn, scheme, host, port=None):
+        """Hands a connection back to the pool once its response has been read
+
+        :param conn: Connection previously returned by :meth:`get`
+        :type conn: :class:`AsyncConnection`
+        """
+        idle = self._idle.setdefault((scheme, host, port), deque())
+        if len(idle) < self.max_size:
+            idle.append(conn)
+        else:
+            conn.close()
+
+    @staticmethod
+    def discard(conn):
+        """Closes a connection that can not be reused"""
+        conn.close()
+
+    def clear(self):
+        """Closes all the idle connections in the pool"""
+        idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    def idle_count(self, scheme=None, host=None, port=None):
+        """Number of idle connections, either in total or for one host
+
+        :rtype: int
+        """
+        if host is None:
+            return sum(len(c) for c in self._idle.values())
+        return len(self._idle.get((scheme, host, port), ()))
+
+    def new_connection(self, scheme, host, port=None):
+        """Creates a new, not yet connected, connection to the given host
+
+        :rtype: :class:`AsyncConnection`
+        """
+        return AsyncConnection(scheme, host, port, timeout=self.timeout)
@@ -32,6 +32,18 @@ from tincan.statement_ref import StatementRef
 
 
 class Context(SerializableBase):
+    __slots__ = (
+        '_registration',
+        '_instructor',
+        '_team',
+        '_context_activities',
+        '_revision',
+        '_platform',
+        '_language',
+        '_statement',
+        '_extensions',
+    )
+
     _LANG_REGEX = re.compile(
         '^(((([A-Za-z]{2,3}(-([A-Za-z]{3}(-[A-Za-z]{3}){0,2}))?)|[A-Za-z]{4}|[A-Za-z]{5,8})(-([A-Za-z]{4}))?(-([A-Za-z]'
         '{2}|[0-9]{3}))?(-([A-Za-z0-9]{5,8}|[0-9][A-Za-z0-9]{3}))*(-([0-9A-WY-Za-wy-z](-[A-Za-z0-9]{2,8})+))*(-(x(-[A-Z'
@@ -64,6 +76,24 @@ class Context(SerializableBase):
 
         super(Context, self).__init__(*args, **kwargs)
 
+    @classmethod
+    def _trusted_converters(cls):
+        return {
+            'registration': uuid.UUID,
+            'instructor': cls._trusted_instructor,
+            'team': Group._from_trusted,
+            'context_activities': ContextActivities._from_trusted,
+            'revision': str,
+            'platform': str,
+            'language': str,
+            'statement': StatementRef._from_trusted,
+            'extensions': Extensions._from_trusted,
+        }
+
+    @staticmethod
+    def _trusted_instructor(value):
+        return Group._from_trusted(value) if 'member' in value else Agent._from_trusted(value)
+
     @property
     def registration(self):
         """Registration for Context
@@ -15,9 +15,12 @@
 from tincan.serializable_base import SerializableBase
 from tincan.activity_list import ActivityList
 from tincan.activity import Activity
+from tincan.interner import interned
 
 
 class ContextActivities(SerializableBase):
+    __slots__ = ('_category', '_parent', '_grouping', '_other')
+
     _props = [
         'category',
         'parent',
@@ -33,6 +36,14 @@ class ContextActivities(SerializableBase):
 
         super(ContextActivities, self).__init__(*args, **kwargs)
 
+    @classmethod
+    def _trusted_converters(cls):
+        return dict.fromkeys(cls._props, cls._trusted_activity_list)
+
+    @staticmethod
+    def _trusted_activity_list(value):
+        return ActivityList._from_trusted(value if isinstance(value, list) else [value])
+
     @property
     def category(self):
         """Category for Context Activities
@@ -123,7 +134,7 @@ class ContextActivities(SerializableBase):
         result = value
         if value is not None and not isinstance(value, ActivityList):
             try:
-                result = ActivityList([Activity(value)])
+                result = ActivityList([interned(Activity, value)])
             except (TypeError, AttributeError):
                 result = ActivityList(value)
         return result
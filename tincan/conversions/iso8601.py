@@ -18,6 +18,8 @@ Functions for converting ``datetime.timedelta`` and
 """
 
 import datetime
+import functools
+import re
 # struct_time does not preserve millisecond accuracy per
 # Tin Can spec, so this is disabled to discourage its use.
 # from time import mktime, struct_time
@@ -42,16 +44,7 @@ def make_timedelta(value):
     """
 
     if isinstance(value, str):
-        try:
-            return aniso8601.parse_duration(value)
-        except Exception as e:
-            msg = (
-                f"Conversion to datetime.timedelta failed. Could not "
-                f"parse the given string as an ISO 8601 duration: "
-                f"{repr(value)}\n\n"
-                f"{repr(e)}"
-            )
-            raise ValueError(msg)
+        return _parse_duration(value)
 
     try:
         if isinstance(value, datetime.timedelta):
@@ -83,6 +76,14 @@ def jsonify_timedelta(value):
     """
 
     assert isinstance(value, datetime.timedelta)
+    return _jsonify_timedelta(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _jsonify_timedelta(value):
+    """Helper function for `jsonify_timedelta()`, caching the strings of
+    the most recently converted durations.
+    """
 
     # split seconds to larger units
     seconds = value.total_seconds()
@@ -185,15 +186,7 @@ def _make_datetime(value):
     """
 
     if isinstance(value, str):
-        try:
-            return aniso8601.parse_datetime(value)
-        except Exception as e:
-            raise ValueError(
-                f"Conversion to datetime.datetime failed. Could not "
-                f"parse the given string as an ISO 8601 timestamp: "
-                f"{repr(value)}\n\n"
-                f"{repr(e)}"
-            )
+        return _parse_datetime(value)
 
     try:
         if isinstance(value, datetime.datetime):
@@ -222,6 +215,149 @@ def _make_datetime(value):
         raise TypeError(msg) if isinstance(e, TypeError) else ValueError(msg)
 
 
+# The extended formats LRSs use for timestamps (2014-06-23T15:25:00.123Z)
+# and durations (PT1M30.5S), parsed without going through aniso8601
+_DATETIME_REGEX = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6})\d*)?(?:(Z)|([+-])(\d{2}):?(\d{2}))$'
+)
+
+_TIMEDELTA_REGEX = re.compile(
+    r'^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)(?:\.(\d{1,6})\d*)?S)?)?$'
+)
+
+_timezones = {}
+
+
+def _make_timezone(sign, hours, minutes):
+    """Returns the fixed offset timezone of a ``+hh:mm`` or ``-hh:mm`` suffix
+
+    :raises: ValueError for offsets aniso8601 rejects
+    """
+    if int(minutes) > 59:
+        raise ValueError("Time zone minutes must be less than 60.")
+    offset = datetime.timedelta(hours=int(hours), minutes=int(minutes))
+    if sign == '-':
+        if not offset:
+            raise ValueError("Negative ISO 8601 time offset must not be 0.")
+        offset = -offset
+    return datetime.timezone(offset)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime(value):
+    """Parses an ISO 8601 timestamp string, caching the most recently
+    parsed ones.
+
+    Timestamps in the format LRSs use are parsed with a single regular
+    expression; anything else is handed to aniso8601.
+
+    :raises: ValueError
+    """
+    match = _DATETIME_REGEX.match(value)
+    if match is not None:
+        year, month, day, hour, minute, second, fraction, zulu, sign, tz_hour, tz_minute = match.groups()
+        try:
+            if zulu:
+                tzinfo = datetime.timezone.utc
+            else:
+                tzinfo = _timezones.get((sign, tz_hour, tz_minute))
+                if tzinfo is None:
+                    tzinfo = _make_timezone(sign, tz_hour, tz_minute)
+                    _timezones[(sign, tz_hour, tz_minute)] = tzinfo
+
+            return datetime.datetime(
+                int(year), int(month), int(day), int(hour), int(minute), int(second),
+                int(fraction.ljust(6, '0')) if fraction else 0,
+                tzinfo,
+            )
+        except ValueError:
+            # out of range fields, such as 24:00:00 or -00:00, which
+            # aniso8601 knows how to handle or reject
+            pass
+
+    try:
+        return aniso8601.parse_datetime(value)
+    except Exception as e:
+        raise ValueError(
+            f"Conversion to datetime.datetime failed. Could not "
+            f"parse the given string as an ISO 8601 timestamp: "
+            f"{repr(value)}\n\n"
+            f"{repr(e)}"
+        )
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_duration(value):
+    """Parses an ISO 8601 duration string, caching the most recently
+    parsed ones.
+
+    Durations made of days, hours, minutes and seconds are parsed with a
+    single regular expression; anything else is handed to aniso8601.
+
+    :raises: ValueError
+    """
+    match = _TIMEDELTA_REGEX.match(value)
+    if match is not None and value not in ('P', 'PT') and not value.endswith('T'):
+        days, hours, minutes, seconds, fraction = match.groups()
+        try:
+            return datetime.timedelta(
+                days=int(days or 0),
+                hours=int(hours or 0),
+                minutes=int(minutes or 0),
+                seconds=int(seconds or 0),
+                microseconds=int(fraction.ljust(6, '0')) if fraction else 0,
+            )
+        except OverflowError:
+            pass
+
+    try:
+        return aniso8601.parse_duration(value)
+    except Exception as e:
+        msg = (
+            f"Conversion to datetime.timedelta failed. Could not "
+            f"parse the given string as an ISO 8601 duration: "
+            f"{repr(value)}\n\n"
+            f"{repr(e)}"
+        )
+        raise ValueError(msg)
+
+
+def make_trusted_datetime(value):
+    """Converts a timestamp coming from a trusted source, such as an LRS,
+    to a :class:`datetime.datetime` equal to the one returned by
+    :func:`make_datetime`, skipping its checks on the type of the value.
+
+    :param value: something to convert
+    :type value: str | unicode
+    :return: the value after conversion
+    :rtype: :class:`datetime.datetime`
+    :raises: ValueError | TypeError
+
+    """
+    if isinstance(value, str):
+        result = _parse_datetime(value)
+        if result.tzinfo is not None:
+            return result
+    return make_datetime(value)
+
+
+def make_trusted_timedelta(value):
+    """Converts a duration coming from a trusted source, such as an LRS,
+    to a :class:`datetime.timedelta` equal to the one returned by
+    :func:`make_timedelta`, skipping its checks on the type of the value.
+
+    :param value: something to convert
+    :type value: str | unicode
+    :return: the value after conversion
+    :rtype: datetime.timedelta
+    :raises: ValueError | TypeError
+
+    """
+    if isinstance(value, str):
+        return _parse_duration(value)
+    return make_timedelta(value)
+
+
 def jsonify_datetime(value):
     assert isinstance(value, datetime.datetime)
     return value.isoformat()
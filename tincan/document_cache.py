@@ -0,0 +1,173 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import copy
+import threading
+from collections import OrderedDict
+
+"""
+.. module:: document_cache
+   :synopsis: Client side cache of state and profile documents, revalidated
+   with the LRS by ETag.
+
+"""
+
+
+class DocumentCache(object):
+    """Keeps the state, activity profile and agent profile documents
+    retrieved from the LRS, along with their ETag, so that retrieving them
+    again only downloads them if they have changed. Set it as the
+    :attr:`tincan.RemoteLRS.document_cache`::
+
+        lrs.document_cache = DocumentCache(max_size=1000)
+
+    The LRS is still asked for every document retrieved, with an
+    If-None-Match header, and the cached copy is handed out when it answers
+    304 Not Modified. Documents are keyed by resource, activity, agent,
+    registration and id. Saving or deleting a document through the same
+    RemoteLRS drops it from the cache. Once `max_size` documents are
+    cached, the least recently used one is dropped to make room.
+
+    It is thread safe, and may be shared by several RemoteLRS objects
+    talking to the same LRS.
+
+    :param max_size: Most documents kept
+    :type max_size: int
+    """
+
+    def __init__(self, max_size=256):
+        if max_size is None or int(max_size) < 1:
+            raise ValueError("Property 'max_size' in a 'tincan.DocumentCache' must be a positive integer")
+
+        self.max_size = int(max_size)
+
+        self._lock = threading.Lock()
+        self._documents = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key(resource, params):
+        """Builds the key of the document a request is for
+
+        :param resource: "activities/state", "activities/profile" or "agents/profile"
+        :type resource: unicode
+        :param params: Query parameters of the request
+        :type params: dict
+        :return: The resource, activity id, agent, registration and document id
+        :rtype: tuple
+        """
+        registration = params.get("registration")
+        return (
+            resource,
+            params.get("activityId"),
+            params.get("agent"),
+            None if registration is None else str(registration),
+            params.get("stateId", params.get("profileId")),
+        )
+
+    def get(self, key):
+        """Returns a copy of a cached document, making it the most recently used
+
+        :param key: See :meth:`key`
+        :type key: tuple
+        :return: The document, or None if it is not cached
+        :rtype: :class:`tincan.documents.document.Document` | None
+        """
+        with self._lock:
+            document = self._documents.get(key)
+            if document is None:
+                self._misses += 1
+                return None
+            self._documents.move_to_end(key)
+            self._hits += 1
+        return _copy(document)
+
+    def put(self, key, document):
+        """Caches a copy of a document, if it has an ETag to revalidate it with
+
+        :param key: See :meth:`key`
+        :type key: tuple
+        :param document: The document
+        :type document: :class:`tincan.documents.document.Document`
+        """
+        if document.etag is None:
+            self.discard(key)
+            return
+
+        document = _copy(document)
+        with self._lock:
+            self._documents[key] = document
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
+
+    def discard(self, key):
+        """Drops a document from the cache, if it is in it
+
+        :param key: See :meth:`key`
+        :type key: tuple
+        """
+        with self._lock:
+            self._documents.pop(key, None)
+
+    def discard_matching(self, key):
+        """Drops the documents a key matches, its None parts matching
+        anything, such as all the states of an activity and agent
+
+        :param key: See :meth:`key`
+        :type key: tuple
+        """
+        with self._lock:
+            matched = [
+                cached for cached in self._documents
+                if all(part is None or part == cached_part for part, cached_part in zip(key, cached))
+            ]
+            for cached in matched:
+                del self._documents[cached]
+
+    def clear(self):
+        """Drops every document"""
+        with self._lock:
+            self._documents.clear()
+
+    def stats(self):
+        """Returns how well the cache is doing
+
+        :return: The documents cached ("size"), and since the cache was
+        created, the lookups that found a document to revalidate ("hits")
+        and those that did not ("misses")
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "size": len(self._documents),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def __len__(self):
+        with self._lock:
+            return len(self._documents)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} max_size={self.max_size} size={len(self)}>"
+
+
+def _copy(document):
+    """Copies a document along with its content, which is mutable"""
+    copied = copy.copy(document)
+    if document.content is not None:
+        copied.content = bytearray(document.content)
+    return copied
@@ -25,5 +25,18 @@ class Extensions(dict, SerializableBase):
     Use this like a regular Python dict.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Extensions, self).__init__(*args, **kwargs)
+
+    @classmethod
+    def _from_trusted(cls, data):
+        """Builds Extensions from data parsed from a trusted source
+
+        :param data: The parsed JSON of the extensions
+        :type data: dict
+        """
+        result = cls.__new__(cls)
+        dict.update(result, data)
+        return result
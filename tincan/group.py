@@ -24,6 +24,12 @@ from tincan.agent_list import AgentList
 
 
 class Group(Agent):
+    __slots__ = ("_member",)
+
+    # The constructor sets object_type before member, so that it comes first
+    # once serialized, like for an Agent
+    _attribute_order = ("_object_type", "_member")
+
     _props = [
         "member"
     ]
@@ -36,6 +42,19 @@ class Group(Agent):
 
         super(Group, self).__init__(*args, **kwargs)
 
+    def _check_conformance(self):
+        self._check_identifier()
+        if not self._identifiers() and not self.member:
+            raise ValueError(f"An anonymous 'tincan.{self.__class__.__name__}' object must have members")
+        if any(isinstance(m, Group) for m in self.member):
+            raise ValueError(f"The members of a 'tincan.{self.__class__.__name__}' object must not be groups")
+
+    @classmethod
+    def _trusted_converters(cls):
+        converters = super(Group, cls)._trusted_converters()
+        converters['member'] = AgentList._from_trusted
+        return converters
+
     def addmember(self, value):
         """Adds a single member to this group's list of members.
         Tries to convert to :class:`tincan.Agent`
@@ -92,3 +111,14 @@ class Group(Agent):
     @object_type.setter
     def object_type(self, _):
         self._object_type = 'Group'
+
+    def _query_identity(self):
+        """The values :meth:`to_json` serializes, members included, see
+        :meth:`tincan.Agent._query_identity`
+
+        :rtype: tuple | None
+        """
+        members = tuple(None if m is None else m._query_identity() for m in self._member)
+        if None in members:
+            return None
+        return super(Group, self)._query_identity() + (members,)
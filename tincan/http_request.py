@@ -12,6 +12,10 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 from tincan.base import Base
+from tincan.multipart import MultipartBody
+
+# Methods that have the same effect when a request is sent more than once
+_IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
 
 
 class HTTPRequest(Base):
@@ -25,10 +29,14 @@ class HTTPRequest(Base):
     :type headers: dict(unicode:unicode)
     :param query_params: Query parameters for the HTTP connection ("registration", "since", "statementId", etc.)
     :type query_params: dict(unicode:unicode)
-    :param content: Content body for the HTTP connection. Valid json string.
-    :type content: unicode
+    :param content: Content body for the HTTP connection. Valid json string, or a
+    multipart body when attachments are sent.
+    :type content: unicode | :class:`tincan.multipart.MultipartBody`
     :param ignore404: True if this request should consider a 404 response successful, False otherwise
     :type ignore404: bool
+    :param idempotent: True if sending this request more than once has the same effect as
+    sending it once, which makes it safe to retry. Defaults to what its method implies.
+    :type idempotent: bool
     """
 
     _props_req = [
@@ -41,6 +49,7 @@ class HTTPRequest(Base):
     _props = [
         'content',
         'ignore404',
+        'idempotent',
     ]
 
     _props.extend(_props_req)
@@ -52,6 +61,7 @@ class HTTPRequest(Base):
         self._query_params = None
         self._content = None
         self._ignore404 = None
+        self._idempotent = None
 
         super(HTTPRequest, self).__init__(*args, **kwargs)
 
@@ -123,17 +133,18 @@ class HTTPRequest(Base):
 
     @property
     def content(self):
-        """Content body for the HTTP connection. Valid json string.
+        """Content body for the HTTP connection. Valid json string, or a
+        multipart body when attachments are sent.
 
-        :setter: Tries to convert to unicode
-        :setter type: str | unicode
-        :rtype: unicode
+        :setter: Tries to convert to unicode, unless given a multipart body
+        :setter type: str | unicode | :class:`tincan.multipart.MultipartBody`
+        :rtype: unicode | :class:`tincan.multipart.MultipartBody`
         """
         return self._content
 
     @content.setter
     def content(self, value):
-        if not isinstance(value, str) and value is not None:
+        if not isinstance(value, (str, MultipartBody)) and value is not None:
             value = value.decode("utf-8")
         self._content = value
 
@@ -158,3 +169,23 @@ class HTTPRequest(Base):
     @ignore404.deleter
     def ignore404(self):
         del self._ignore404
+
+    @property
+    def idempotent(self):
+        """True if sending this request more than once has the same effect as
+        sending it once, which makes it safe to retry, see :class:`tincan.retry_policy.RetryPolicy`.
+        Unless set, it is True for GET, HEAD, OPTIONS, PUT and DELETE requests.
+        A POST of statements that all have an id is idempotent too, since the
+        LRS ignores a statement it already has.
+
+        :setter: Tries to convert to boolean, None reverts to what the method implies
+        :setter type: bool | None
+        :rtype: bool
+        """
+        if self._idempotent is None:
+            return self._method is not None and self._method.upper() in _IDEMPOTENT_METHODS
+        return self._idempotent
+
+    @idempotent.setter
+    def idempotent(self, value):
+        self._idempotent = None if value is None else bool(value)
@@ -0,0 +1,284 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import bisect
+import threading
+from collections import deque
+from urllib.parse import urlparse
+
+"""
+.. module:: instrumentation
+   :synopsis: Hooks called around LRS requests, and a metrics collector built
+   on them exporting per endpoint timing histograms to Prometheus or StatsD.
+
+"""
+
+# Phases timed by RemoteLRS, in the order they happen, see LRSResponse.timings
+PHASES = ("queue", "connect", "send", "wait", "read", "decode", "total")
+
+# LRS resources metrics are grouped by, longest first so that the most
+# specific one matches
+_ENDPOINTS = (
+    "activities/profile",
+    "activities/state",
+    "agents/profile",
+    "statements",
+    "activities",
+    "agents",
+    "about",
+)
+
+# The Prometheus client's default buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def endpoint_name(request):
+    """Returns the LRS resource a request is for, such as "statements" or
+    "activities/state", whether its resource is relative to the endpoint or
+    an absolute "more" URL
+
+    :param request: HTTPRequest object
+    :type request: :class:`tincan.http_request.HTTPRequest`
+    :return: The resource, or "other"
+    :rtype: unicode
+    """
+    path = urlparse(request.resource or "").path.rstrip("/")
+    for name in _ENDPOINTS:
+        if path == name or path.endswith("/" + name):
+            return name
+    return "other"
+
+
+class RequestHooks(object):
+    """Receives the events of the requests sent by a :class:`tincan.RemoteLRS`
+    it is one of the :attr:`tincan.RemoteLRS.hooks` of. Subclasses override
+    the events they need; each is called once per attempt of a retried
+    request, from the thread (or event loop) sending it.
+    """
+
+    def before_request(self, request):
+        """Called before request is sent
+
+        :param request: HTTPRequest object
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        """
+
+    def after_response(self, request, lrs_response):
+        """Called once the response to request has been read. Its
+        :attr:`tincan.LRSResponse.timings` hold all the phases but "decode".
+        For a streamed page of statements, the body is not read yet.
+
+        :param request: HTTPRequest object
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        :param lrs_response: The LRS Response
+        :type lrs_response: :class:`tincan.lrs_response.LRSResponse`
+        """
+
+    def after_decode(self, request, lrs_response):
+        """Called once the content of a response has been decoded from its
+        JSON, with the time it took in the "decode" timing
+
+        :param request: HTTPRequest object
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        :param lrs_response: The LRS Response
+        :type lrs_response: :class:`tincan.lrs_response.LRSResponse`
+        """
+
+    def on_error(self, request, error):
+        """Called when request could not be sent, or its response could not be read
+
+        :param request: HTTPRequest object
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        :param error: The exception raised
+        :type error: Exception
+        """
+
+
+class _Histogram(object):
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+
+class MetricsCollector(RequestHooks):
+    """Aggregates the timings of LRS requests into histograms per endpoint,
+    method and status, and per endpoint, method and phase, in process. Add
+    it to the hooks of one or more RemoteLRS objects, and export what it
+    collected with :meth:`prometheus` or :meth:`statsd`::
+
+        metrics = MetricsCollector()
+        lrs.hooks = [metrics]
+        ...
+        text = metrics.prometheus()
+
+    :param buckets: Upper bounds of the histogram buckets, in seconds
+    :type buckets: list of float
+    :param namespace: Prefix of the metric names
+    :type namespace: unicode
+    :param max_samples: Most samples kept for :meth:`statsd` between two calls,
+    the oldest being dropped first
+    :type max_samples: int
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, namespace="tincan", max_samples=10000):
+        self.buckets = tuple(sorted(buckets))
+        self.namespace = namespace
+
+        self._lock = threading.Lock()
+        self._durations = {}
+        self._phases = {}
+        self._errors = {}
+        self._samples = deque(maxlen=max_samples)
+
+    def after_response(self, request, lrs_response):
+        endpoint = endpoint_name(request)
+        method = request.method
+        status = str(lrs_response.response.status) if lrs_response.response is not None else "none"
+        timings = lrs_response.timings or {}
+
+        with self._lock:
+            if "total" in timings:
+                self._observe(self._durations, (endpoint, method, status), timings["total"])
+            for phase, seconds in timings.items():
+                if phase != "total":
+                    self._observe(self._phases, (endpoint, method, phase), seconds)
+                self._samples.append((endpoint, method, phase, seconds))
+
+    def after_decode(self, request, lrs_response):
+        seconds = (lrs_response.timings or {}).get("decode")
+        if seconds is None:
+            return
+
+        endpoint = endpoint_name(request)
+        with self._lock:
+            self._observe(self._phases, (endpoint, request.method, "decode"), seconds)
+            self._samples.append((endpoint, request.method, "decode", seconds))
+
+    def on_error(self, request, error):
+        key = (endpoint_name(request), request.method, error.__class__.__name__)
+        with self._lock:
+            self._errors[key] = self._errors.get(key, 0) + 1
+            self._samples.append(key + (None,))
+
+    def _observe(self, histograms, key, seconds):
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = _Histogram(self.buckets)
+        index = bisect.bisect_left(self.buckets, seconds)
+        if index < len(self.buckets):
+            histogram.counts[index] += 1
+        histogram.sum += seconds
+        histogram.count += 1
+
+    def request_count(self, endpoint=None):
+        """Number of responses received, in total or for one endpoint
+
+        :param endpoint: See :func:`endpoint_name`
+        :type endpoint: unicode
+        :rtype: int
+        """
+        with self._lock:
+            return sum(
+                h.count for (name, _, _), h in self._durations.items()
+                if endpoint is None or name == endpoint
+            )
+
+    def error_count(self, endpoint=None):
+        """Number of requests that raised an error, in total or for one endpoint
+
+        :rtype: int
+        """
+        with self._lock:
+            return sum(
+                count for (name, _, _), count in self._errors.items()
+                if endpoint is None or name == endpoint
+            )
+
+    def reset(self):
+        """Forgets everything collected so far"""
+        with self._lock:
+            self._durations = {}
+            self._phases = {}
+            self._errors = {}
+            self._samples.clear()
+
+    def prometheus(self):
+        """Renders the metrics in the Prometheus text exposition format
+
+        :rtype: unicode
+        """
+        ns = self.namespace
+        lines = []
+        with self._lock:
+            self._render_histograms(
+                lines, f"{ns}_request_duration_seconds",
+                "Time spent on LRS requests, from connecting to reading the response body",
+                ("endpoint", "method", "status"), self._durations,
+            )
+            self._render_histograms(
+                lines, f"{ns}_request_phase_seconds",
+                "Time spent in each phase of LRS requests",
+                ("endpoint", "method", "phase"), self._phases,
+            )
+            lines.append(f"# HELP {ns}_request_errors_total LRS requests that raised an error")
+            lines.append(f"# TYPE {ns}_request_errors_total counter")
+            for key, count in sorted(self._errors.items()):
+                lines.append(f"{ns}_request_errors_total{{{_labels(('endpoint', 'method', 'error'), key)}}} {count}")
+        return "\n".join(lines) + "\n"
+
+    def _render_histograms(self, lines, name, help_text, label_names, histograms):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for key, histogram in sorted(histograms.items()):
+            labels = _labels(label_names, key)
+            cumulative = 0
+            for bound, count in zip(self.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum!r}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+    def statsd(self):
+        """Renders the samples collected since the previous call as StatsD
+        lines, timers in milliseconds named
+        "<namespace>.<endpoint>.<method>.<phase>" and error counters named
+        "<namespace>.<endpoint>.<method>.error.<exception>", ready to be sent
+        to a StatsD server
+
+        :rtype: list of unicode
+        """
+        with self._lock:
+            samples = list(self._samples)
+            self._samples.clear()
+
+        lines = []
+        for endpoint, method, name, seconds in samples:
+            prefix = f"{self.namespace}.{endpoint.replace('/', '_')}.{method}"
+            if seconds is None:
+                lines.append(f"{prefix}.error.{name}:1|c")
+            else:
+                lines.append(f"{prefix}.{name}:{seconds * 1000:.3f}|ms")
+        return lines
+
+
+def _labels(names, values):
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -24,6 +24,8 @@ from tincan.language_map import LanguageMap
 
 
 class InteractionComponent(SerializableBase):
+    __slots__ = ('_id', '_description')
+
     _props_req = [
         'id',
     ]
@@ -40,6 +42,9 @@ class InteractionComponent(SerializableBase):
 
         super(InteractionComponent, self).__init__(*args, **kwargs)
 
+    def _check_conformance(self):
+        self._check_required('id')
+
     @property
     def id(self):
         """Id for Agent
@@ -0,0 +1,263 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import contextlib
+import contextvars
+import threading
+import weakref
+
+from tincan.base import Base
+
+"""
+.. module:: interner
+   :synopsis: Shares the verbs and activities repeated across the statements
+   being decoded, as read-only objects.
+
+"""
+
+_active = contextvars.ContextVar("tincan_interner", default=None)
+
+
+class Interner(object):
+    """Registry of the verbs and activities decoded while it is active (see
+    :func:`interning`), so that the statements of a query that reference the
+    same verb or activity share one object, along with its display, definition
+    and other language maps, instead of each holding a copy::
+
+        with interning():
+            result = StatementsResult.from_json(json_data)
+
+    Objects are keyed by the class building them, their IRI and their JSON
+    content, so that only identical ones are shared. Shared objects are
+    read-only: setting their properties or changing their language maps,
+    lists and extensions raises an error. ``copy.copy`` and ``copy.deepcopy``
+    return a regular, mutable copy of them.
+
+    The registry only holds weak references, so an object is dropped from it
+    once no statement uses it anymore. Once it holds `max_size` objects, the
+    new ones are decoded as usual, without being shared.
+
+    It is thread safe, and may be kept and reused to share objects across
+    queries.
+
+    :param max_size: Most objects shared at once
+    :type max_size: int
+    """
+
+    def __init__(self, max_size=10000):
+        if max_size is None or int(max_size) < 1:
+            raise ValueError("Property 'max_size' in a 'tincan.Interner' must be a positive integer")
+
+        self.max_size = int(max_size)
+
+        self._lock = threading.Lock()
+        self._objects = weakref.WeakValueDictionary()
+        self._hits = 0
+        self._misses = 0
+
+    def intern(self, build, data):
+        """Returns the shared object built from data, building, freezing and
+        registering it if there is none yet
+
+        :param build: Builds the object from data, such as a class or its
+        ``_from_trusted`` method
+        :type build: callable
+        :param data: The parsed JSON of the object
+        :type data: dict
+        """
+        key = (build, data.get("id"), repr(data))
+        with self._lock:
+            shared = self._objects.get(key)
+            if shared is not None:
+                self._hits += 1
+                return shared
+            self._misses += 1
+
+        value = build(data)
+        with self._lock:
+            shared = self._objects.get(key)
+            if shared is not None:
+                return shared
+            if len(self._objects) >= self.max_size:
+                return value
+            value = freeze(value)
+            self._objects[key] = value
+        return value
+
+    def clear(self):
+        """Drops every object, which stay read-only"""
+        with self._lock:
+            self._objects.clear()
+
+    def stats(self):
+        """Returns how well the registry is doing
+
+        :return: The objects shared ("size"), and since the registry was
+        created, the objects decoded that were already in it ("hits") and
+        those that were not ("misses")
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "size": len(self._objects),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def __len__(self):
+        with self._lock:
+            return len(self._objects)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} max_size={self.max_size} size={len(self)}>"
+
+
+@contextlib.contextmanager
+def interning(interner=None):
+    """Shares the verbs and activities decoded in the block, see
+    :class:`Interner`. The interner is active for the current thread or
+    asyncio task, and the tasks it starts.
+
+    :param interner: The registry to use, a new one by default
+    :type interner: :class:`Interner` | None
+    :return: The registry
+    :rtype: :class:`Interner`
+    """
+    if interner is None:
+        interner = Interner()
+    token = _active.set(interner)
+    try:
+        yield interner
+    finally:
+        _active.reset(token)
+
+
+def interned(build, data):
+    """Builds an object from data, or hands back the shared one if an
+    :class:`Interner` is active
+
+    :param build: Builds the object from data
+    :type build: callable
+    :param data: The parsed JSON of the object
+    :type data: any
+    """
+    interner = _active.get()
+    if interner is None or type(data) is not dict:
+        return build(data)
+    return interner.intern(build, data)
+
+
+def freeze(value):
+    """Makes an object and everything it holds read-only, in place for model
+    objects and language maps, and by copying plain lists and dicts
+
+    :param value: The object
+    :return: The read-only object
+    """
+    value_type = type(value)
+    if value_type in _originals:
+        return value
+
+    if isinstance(value, dict):
+        for k, v in value.items():
+            dict.__setitem__(value, k, freeze(v))
+    elif isinstance(value, list):
+        for i, v in enumerate(value):
+            list.__setitem__(value, i, freeze(v))
+    elif isinstance(value, Base):
+        for name, v in vars(value).items():
+            object.__setattr__(value, name, freeze(v))
+    else:
+        return value
+
+    frozen = _frozen_class(value_type)
+    if value_type is dict or value_type is list:
+        return frozen(value)
+    object.__setattr__(value, '__class__', frozen)
+    return value
+
+
+def thaw(value):
+    """Returns a mutable copy of a read-only object, see :func:`freeze`
+
+    :param value: The object
+    :return: The copy, or value itself if it is not read-only
+    """
+    cls = _originals.get(type(value))
+    if cls is None:
+        return value
+
+    result = cls.__new__(cls)
+    if issubclass(cls, dict):
+        dict.update(result, {k: thaw(v) for k, v in value.items()})
+    elif issubclass(cls, list):
+        list.extend(result, [thaw(v) for v in value])
+    else:
+        for name, v in vars(value).items():
+            object.__setattr__(result, name, thaw(v))
+    return result
+
+
+def _read_only(self, *args, **kwargs):
+    name = _originals[type(self)].__name__
+    raise TypeError(f"'tincan.{name}' objects shared by an Interner are read-only, copy them to make changes")
+
+
+def _read_only_attribute(self, *args):
+    name = _originals[type(self)].__name__
+    raise AttributeError(f"'tincan.{name}' objects shared by an Interner are read-only, copy them to make changes")
+
+
+_DICT_MUTATORS = ('__setitem__', '__delitem__', '__ior__', 'clear', 'pop', 'popitem', 'setdefault', 'update')
+_LIST_MUTATORS = ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append', 'extend', 'insert', 'pop', 'remove',
+                  'clear', 'sort', 'reverse')
+
+_frozen_classes = {}
+_originals = {}
+
+
+def _frozen_class(cls):
+    """Returns the read-only subclass of cls, creating it on first use. It
+    has the same name and no instance attributes of its own, so that
+    existing objects can be switched to it.
+
+    :param cls: The class
+    :type cls: type
+    :rtype: type
+    """
+    frozen = _frozen_classes.get(cls)
+    if frozen is not None:
+        return frozen
+
+    namespace = {
+        '__slots__': (),
+        '__module__': cls.__module__,
+        '__qualname__': cls.__qualname__,
+        '__copy__': thaw,
+        '__deepcopy__': lambda self, memo: thaw(self),
+        '__reduce_ex__': lambda self, protocol: (thaw, (thaw(self),)),
+    }
+    if issubclass(cls, dict):
+        namespace.update((name, _read_only) for name in _DICT_MUTATORS)
+    elif issubclass(cls, list):
+        namespace.update((name, _read_only) for name in _LIST_MUTATORS)
+    else:
+        namespace['__setattr__'] = _read_only_attribute
+        namespace['__delattr__'] = _read_only_attribute
+        namespace['__eq__'] = lambda self, other: isinstance(other, cls) and self.__dict__ == other.__dict__
+
+    frozen = type(cls.__name__, (cls,), namespace)
+    _originals[frozen] = cls
+    _frozen_classes[cls] = frozen
+    return frozen
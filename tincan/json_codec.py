@@ -0,0 +1,215 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import datetime
+import json
+import uuid
+
+from tincan.conversions.iso8601 import jsonify_datetime, jsonify_timedelta
+
+"""
+.. module:: json_codec
+   :synopsis: Pluggable JSON encoding and decoding, backed by the stdlib json
+   module or by orjson, ujson or simdjson when they are installed
+
+"""
+
+
+def _default(value):
+    """Encodes the values the JSON libraries do not handle themselves
+
+    :raises: TypeError
+    """
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime.timedelta):
+        return jsonify_timedelta(value)
+    if isinstance(value, datetime.datetime):
+        return jsonify_datetime(value)
+    raise TypeError(f"Object of type '{value.__class__.__name__}' is not JSON serializable")
+
+
+class JSONCodec(object):
+    """Encodes and decodes JSON with the stdlib json module. This is the
+    default codec, and its output is what :meth:`tincan.SerializableBase.to_json`
+    has always produced.
+
+    Subclasses use a faster library for one or both directions. UUIDs,
+    datetimes and timedeltas found in the encoded data are written the same
+    way :meth:`tincan.SerializableBase.as_version` writes them, natively when
+    the library supports it.
+    """
+
+    name = "json"
+
+    def dumps(self, obj):
+        """Encodes obj as JSON
+
+        :param obj: The data to encode
+        :type obj: dict | list
+        :rtype: unicode
+        """
+        return json.dumps(obj, default=_default)
+
+    def loads(self, json_data):
+        """Decodes a JSON document
+
+        :param json_data: The JSON to decode
+        :type json_data: str | unicode | bytes
+        :raises: ValueError
+        """
+        return json.loads(json_data)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.name!r}>"
+
+
+class OrjsonCodec(JSONCodec):
+    """Encodes and decodes JSON with orjson, which handles UUIDs and
+    datetimes natively. Its output has no spaces after separators.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj):
+        return self._dumps(obj, default=_default).decode('utf-8')
+
+    def loads(self, json_data):
+        return self._loads(json_data)
+
+
+class UjsonCodec(JSONCodec):
+    """Encodes and decodes JSON with ujson. Its output has no spaces after
+    separators.
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+
+        self._dumps = ujson.dumps
+        self._loads = ujson.loads
+
+    def dumps(self, obj):
+        return self._dumps(obj, default=_default, escape_forward_slashes=False)
+
+    def loads(self, json_data):
+        return self._loads(json_data)
+
+
+class SimdjsonCodec(JSONCodec):
+    """Decodes JSON with pysimdjson, and encodes it with the stdlib json
+    module as simdjson itself does
+    """
+
+    name = "simdjson"
+
+    def __init__(self):
+        import simdjson
+
+        self._loads = simdjson.loads
+
+    def loads(self, json_data):
+        return self._loads(json_data)
+
+
+_codec_classes = {
+    codec_class.name: codec_class
+    for codec_class in (JSONCodec, OrjsonCodec, UjsonCodec, SimdjsonCodec)
+}
+
+# Order in which "auto" tries the codecs, fastest first
+_auto_order = ("orjson", "ujson", "simdjson", "json")
+
+_codecs = {"json": JSONCodec()}
+
+_default_codec = _codecs["json"]
+
+
+def available_codecs():
+    """Returns the names of the codecs whose library is installed
+
+    :rtype: list of unicode
+    """
+    names = []
+    for name in _auto_order:
+        try:
+            get_codec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_codec(codec=None):
+    """Returns the codec with the given name, creating it on first use
+
+    :param codec: One of "json", "orjson", "ujson" and "simdjson", "auto" for
+    the fastest installed one, a :class:`JSONCodec` which is returned as is,
+    or None for the default codec (see :func:`set_default_codec`)
+    :type codec: :class:`JSONCodec` | unicode | None
+    :rtype: :class:`JSONCodec`
+    :raises: ValueError for an unknown codec, ImportError when its library is
+    not installed
+    """
+    if codec is None:
+        return _default_codec
+    if isinstance(codec, JSONCodec):
+        return codec
+
+    result = _codecs.get(codec)
+    if result is not None:
+        return result
+
+    if codec == "auto":
+        result = get_codec(available_codecs()[0])
+    elif codec in _codec_classes:
+        result = _codec_classes[codec]()
+    else:
+        raise ValueError(
+            f"Unknown JSON codec {codec!r}, expected one of {', '.join(_codec_classes)} or auto"
+        )
+
+    _codecs[codec] = result
+    return result
+
+
+def get_default_codec():
+    """Returns the codec used when none is given to
+    :meth:`tincan.SerializableBase.to_json`, :meth:`tincan.SerializableBase.from_json`
+    or :class:`tincan.RemoteLRS`
+
+    :rtype: :class:`JSONCodec`
+    """
+    return _default_codec
+
+
+def set_default_codec(codec):
+    """Sets the codec used when none is given to
+    :meth:`tincan.SerializableBase.to_json`, :meth:`tincan.SerializableBase.from_json`
+    or :class:`tincan.RemoteLRS`. Setting it to None restores the stdlib json
+    codec.
+
+    :param codec: See :func:`get_codec`
+    :type codec: :class:`JSONCodec` | unicode | None
+    """
+    global _default_codec
+    _default_codec = get_codec("json" if codec is None else codec)
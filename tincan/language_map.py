@@ -12,7 +12,10 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import re
+
 from tincan.serializable_base import SerializableBase
+from tincan.validation import TRUSTED, get_validation_level
 
 """
 .. module:: languagemap
@@ -21,7 +24,13 @@ from tincan.serializable_base import SerializableBase
 """
 
 
+# The form of RFC 5646 language tags, such as "en" or "zh-Hant-TW"
+_LANGUAGE_TAG_REGEX = re.compile(r'^[A-Za-z]{1,8}(-[A-Za-z0-9]{1,8})*$')
+
+
 class LanguageMap(dict, SerializableBase):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """Initializes a LanguageMap with the given mapping
 
@@ -30,6 +39,10 @@ class LanguageMap(dict, SerializableBase):
         call the base dict constructor
 
         """
+        if get_validation_level() == TRUSTED:
+            super(LanguageMap, self).__init__(*args, **kwargs)
+            return
+
         check_args = dict(*args, **kwargs)
         list(map(lambda k_v: (k_v[0], self._check_basestring(k_v[1])), iter(check_args.items())))
         super(LanguageMap, self).__init__(check_args)
@@ -48,6 +61,18 @@ class LanguageMap(dict, SerializableBase):
         self._check_basestring(value)
         super(LanguageMap, self).__setitem__(prop, value)
 
+    @classmethod
+    def _from_trusted(cls, data):
+        """Builds a LanguageMap from data parsed from a trusted source,
+        without checking its values
+
+        :param data: The parsed JSON of the language map
+        :type data: dict
+        """
+        result = cls.__new__(cls)
+        dict.update(result, data)
+        return result
+
     @staticmethod
     def _check_basestring(value):
         """Ensures that value is an instance of basestring
@@ -58,3 +83,17 @@ class LanguageMap(dict, SerializableBase):
         """
         if not isinstance(value, str):
             raise TypeError("Value must be a stringstring_types")
+
+    def _check_conformance(self):
+        list(map(self._check_language_tag, self))
+
+    @staticmethod
+    def _check_language_tag(key):
+        """Ensures that key is a language tag, see :meth:`tincan.SerializableBase.validate`
+
+        :param key: the key to check
+        :type key: any
+
+        """
+        if not isinstance(key, str) or not _LANGUAGE_TAG_REGEX.match(key):
+            raise ValueError(f"Keys of a 'tincan.LanguageMap' must be language tags, not {key!r}")
@@ -0,0 +1,187 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from tincan.statement import Statement
+from tincan.version import Version
+
+"""
+.. module:: lazy_statement
+   :synopsis: A Statement that decodes its properties the first time they
+   are read.
+
+"""
+
+_JSON_TYPES = (dict, list, str, int, float, bool)
+
+
+class LazyStatement(Statement):
+    """Statement built from parsed JSON that keeps the JSON of each
+    property and only decodes it, through the regular setter, the first time
+    the property is read. Reading a statement's id, actor and verb does not
+    decode its context, result or attachments. When serialized, the
+    properties that were never read are written back from their JSON as is.
+
+    Since properties are validated when they are decoded, invalid JSON only
+    raises an error once the property is read. Objects, rather than JSON,
+    given to the constructor are set right away. For the same reason, the
+    conformance checks of the "strict" validation level are skipped when a
+    LazyStatement is decoded, and only run when :meth:`validate` is called,
+    which decodes every property.
+
+    """
+    __slots__ = ('_raw',)
+
+    _attribute_order = ()
+
+    def __init__(self, *args, **kwargs):
+        object.__setattr__(self, '_raw', {})
+        super(LazyStatement, self).__init__()
+
+        raw = {}
+        for obj in args:
+            if isinstance(obj, dict):
+                raw.update(obj)
+            else:
+                if isinstance(obj, LazyStatement):
+                    obj._decode_all()
+                for k, v in vars(obj).items():
+                    setattr(self, k, v)
+        raw.update(kwargs)
+
+        for k, v in raw.items():
+            k = self._trusted_renames.get(k, k)
+            if k not in self._props or not isinstance(v, _JSON_TYPES):
+                setattr(self, k, v)
+            else:
+                self._raw[k] = v
+
+    @classmethod
+    def _from_trusted(cls, data):
+        """Builds a LazyStatement from data parsed from a trusted source.
+        Since the properties are decoded when they are first read, this is
+        the same as building it from untrusted data.
+
+        :param data: The parsed JSON of the statement
+        :type data: dict
+        """
+        return cls(data)
+
+    def __setattr__(self, attr, value):
+        if attr == '_raw':
+            object.__setattr__(self, attr, value)
+        else:
+            super(LazyStatement, self).__setattr__(attr, value)
+
+    def _decode(self, prop):
+        """Decodes the JSON of a property, if it has not been yet
+
+        :param prop: The property
+        :type prop: str
+        """
+        raw = self._raw
+        if prop in raw:
+            getattr(Statement, prop).fset(self, raw[prop])
+            del raw[prop]
+
+    def _decode_all(self):
+        """Decodes the JSON of every property not read yet"""
+        for prop in list(self._raw):
+            self._decode(prop)
+
+    def _forget(self, prop):
+        """Drops the JSON of a property that is set or deleted
+
+        :param prop: The property
+        :type prop: str
+        """
+        self._raw.pop(prop, None)
+
+    def validate(self):
+        """Decodes every property not read yet, then checks the statement
+        as :meth:`tincan.SerializableBase.validate` does
+
+        :raises: TypeError, ValueError
+        """
+        self._decode_all()
+        super(LazyStatement, self)._validate()
+
+    def _validate(self):
+        # not decoded yet, see validate
+        pass
+
+    def as_version(self, version=Version.latest):
+        """Returns a dict of the statement, as :meth:`tincan.SerializableBase.as_version`
+        does, with the properties not read yet copied from their JSON
+
+        :param version: the relevant version
+        :type version: str | unicode
+        :rtype: dict
+        """
+        decoded = super(LazyStatement, self).as_version(version)
+        raw = self._raw
+        if not raw:
+            return decoded
+
+        result = {}
+        for attr in Statement._slot_names():
+            prop = attr[1:]
+            key = self._serializer_key(attr)
+            if prop in raw:
+                if raw[prop] is not None:
+                    result[key] = raw[prop]
+            elif key in decoded:
+                result[key] = decoded[key]
+        return result
+
+    def __eq__(self, other):
+        self._decode_all()
+        if isinstance(other, LazyStatement):
+            other._decode_all()
+        return isinstance(other, Statement) and vars(self) == vars(other)
+
+    def __reduce_ex__(self, protocol):
+        self._decode_all()
+        # _raw is changed in place, so copies must not share it
+        object.__setattr__(self, '_raw', {})
+        return super(LazyStatement, self).__reduce_ex__(protocol)
+
+
+def _lazy_property(prop):
+    """Wraps a property of Statement so that its JSON is decoded when it is
+    first read, and dropped when it is set or deleted
+
+    :param prop: The property
+    :type prop: str
+    :rtype: property
+    """
+    decoded = getattr(Statement, prop)
+
+    def fget(self):
+        if prop in self._raw:
+            self._decode(prop)
+        return decoded.fget(self)
+
+    def fset(self, value):
+        self._forget(prop)
+        decoded.fset(self, value)
+
+    def fdel(self):
+        self._forget(prop)
+        decoded.fdel(self)
+
+    return property(fget, fset, fdel, decoded.__doc__)
+
+
+for _prop in Statement._props:
+    setattr(LazyStatement, _prop, _lazy_property(_prop))
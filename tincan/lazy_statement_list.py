@@ -0,0 +1,41 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from tincan.lazy_statement import LazyStatement
+from tincan.statement import Statement
+from tincan.statement_list import StatementList
+
+"""
+.. module:: lazy_statement_list
+   :synopsis: A Statement list that decodes the statements it is built from
+   lazily
+
+"""
+
+
+class LazyStatementList(StatementList):
+    __slots__ = ()
+
+    _cls = LazyStatement
+
+    def _make_cls(self, value):
+        """Converts value to a :class:`tincan.LazyStatement`, unless it is
+        already a Statement
+
+        :param value: the thing to make a LazyStatement from
+        :rtype: :class:`tincan.Statement`
+        """
+        if isinstance(value, Statement):
+            return value
+        return LazyStatement(value)
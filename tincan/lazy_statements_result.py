@@ -0,0 +1,31 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from tincan.lazy_statement_list import LazyStatementList
+from tincan.statements_result import StatementsResult
+
+"""
+.. module:: lazy_statements_result
+   :synopsis: Statements result whose statements are decoded lazily, see
+              :class:`tincan.LazyStatement`
+"""
+
+
+class LazyStatementsResult(StatementsResult):
+    __slots__ = ()
+
+    _statement_list = LazyStatementList
+
+    def __eq__(self, other):
+        return isinstance(other, StatementsResult) and vars(self) == vars(other)
@@ -0,0 +1,85 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from tincan.base import Base
+from tincan.lrs_response import LRSResponse
+
+
+class LRSBatchResponse(Base):
+    """Aggregates the LRS Responses of a call that was split into several
+    requests, such as a batched :meth:`tincan.RemoteLRS.save_statements`.
+    Can be created from a dict, another object, or from kwargs
+
+    :param responses: One LRS Response per request, in the order the requests were made
+    :type responses: list of :class:`tincan.LRSResponse`
+    :param content: Parsed content of the whole call
+    """
+
+    _props_req = [
+        'responses',
+    ]
+
+    _props = [
+        'content',
+    ]
+
+    _props.extend(_props_req)
+
+    def __init__(self, *args, **kwargs):
+        self._responses = None
+        self._content = None
+
+        super(LRSBatchResponse, self).__init__(*args, **kwargs)
+
+    @property
+    def success(self):
+        """True if every request of the batch was successful, False otherwise
+
+        :rtype: bool
+        """
+        return all(r.success for r in self._responses)
+
+    @property
+    def failed_responses(self):
+        """The LRS Responses of the requests that were not successful
+
+        :rtype: list of :class:`tincan.LRSResponse`
+        """
+        return [r for r in self._responses if not r.success]
+
+    @property
+    def responses(self):
+        """One LRS Response per request, in the order the requests were made
+
+        :setter: Tries to convert each element to :class:`tincan.LRSResponse`
+        :setter type: list of :class:`tincan.LRSResponse`
+        :rtype: list of :class:`tincan.LRSResponse`
+        """
+        return self._responses
+
+    @responses.setter
+    def responses(self, value):
+        if value is None:
+            value = []
+        self._responses = [r if isinstance(r, LRSResponse) else LRSResponse(r) for r in value]
+
+    @property
+    def content(self):
+        """Parsed content of the whole call
+        """
+        return self._content
+
+    @content.setter
+    def content(self, value):
+        self._content = value
@@ -29,7 +29,13 @@ class LRSResponse(Base):
     :type response: HTTPResponse
     :param data: Body of the HTTPResponse
     :type data: unicode
+    :param raw_data: Body of the HTTPResponse as received, before it is decoded to data
+    :type raw_data: bytes
     :param content: Parsed content received from the LRS
+    :param attachments: Attachment payloads received along with statements, keyed by sha2
+    :type attachments: dict(unicode: :class:`tincan.multipart.AttachmentPayload`)
+    :param timings: Seconds spent in each phase of the request, keyed by phase
+    :type timings: dict(unicode: float)
     """
 
     _props_req = [
@@ -41,6 +47,9 @@ class LRSResponse(Base):
 
     _props = [
         'content',
+        'attachments',
+        'timings',
+        'raw_data',
     ]
 
     _props.extend(_props_req)
@@ -50,7 +59,10 @@ class LRSResponse(Base):
         self._request = None
         self._response = None
         self._data = None
+        self._raw_data = None
         self._content = None
+        self._attachments = None
+        self._timings = None
 
         super(LRSResponse, self).__init__(*args, **kwargs)
 
@@ -106,18 +118,43 @@ class LRSResponse(Base):
 
     @property
     def data(self):
+        if self._data is None and self._raw_data is not None:
+            # the body is only held once, as received until it is first read
+            self._data = self._raw_data.decode('utf-8')
+            self._raw_data = None
         return self._data
 
     @data.setter
     def data(self, value):
         """Setter for the _data attribute. Should be set from response.read()
 
-        :param value: The body of the response object for the LRSResponse
-        :type value: unicode
+        :param value: The body of the response object for the LRSResponse.
+        Bytes are kept as they are until :attr:`data` is read.
+        :type value: unicode | bytes
         """
         if value is not None and isinstance(value, (bytes, bytearray)):
-            value = value.decode('utf-8')
-        self._data = value
+            self._raw_data = bytes(value)
+            self._data = None
+        else:
+            self._raw_data = None
+            self._data = value
+
+    @property
+    def raw_data(self):
+        """The body of the response as received, until :attr:`data` is read,
+        after which it is :attr:`data` encoded in UTF-8 anew on each access
+
+        :setter type: bytes
+        :rtype: bytes
+        """
+        if self._raw_data is None and self._data is not None:
+            return self._data.encode('utf-8')
+        return self._raw_data
+
+    @raw_data.setter
+    def raw_data(self, value):
+        self._raw_data = value
+        self._data = None
 
     @property
     def content(self):
@@ -132,3 +169,54 @@ class LRSResponse(Base):
     @content.deleter
     def content(self):
         del self._content
+
+    @property
+    def attachments(self):
+        """Attachment payloads the LRS sent along with statements in a
+        multipart/mixed response, keyed by their sha2, or None for other
+        responses
+
+        :setter type: dict(unicode: :class:`tincan.multipart.AttachmentPayload`)
+        :rtype: dict(unicode: :class:`tincan.multipart.AttachmentPayload`)
+        """
+        return self._attachments
+
+    @attachments.setter
+    def attachments(self, value):
+        self._attachments = value
+
+    @property
+    def timings(self):
+        """Seconds the request took, in total ("total") and in each of its
+        phases: waiting for the rate limiter ("queue"), opening the
+        connection, TLS handshake included ("connect"), sending the request
+        ("send"), waiting for the response head ("wait"), reading the body
+        ("read") and decoding the content ("decode"). Phases that did not
+        happen, such as connecting over a kept-alive connection, are left
+        out. None for responses that were not received from an LRS.
+
+        :setter type: dict(unicode: float)
+        :rtype: dict(unicode: float)
+        """
+        return self._timings
+
+    @timings.setter
+    def timings(self, value):
+        self._timings = value
+
+
+class LRSResponseError(Exception):
+    """Raised by LRS calls that can not hand back an LRS Response object, such
+    as iterators, when the LRS returns an unsuccessful response
+
+    :param lrs_response: The unsuccessful LRS Response
+    :type lrs_response: :class:`tincan.lrs_response.LRSResponse`
+    """
+
+    def __init__(self, lrs_response, message=None):
+        if message is None:
+            status = lrs_response.response.status if lrs_response.response is not None else None
+            message = f"LRS request failed with status {status}: {lrs_response.data}"
+
+        super(LRSResponseError, self).__init__(message)
+        self.lrs_response = lrs_response
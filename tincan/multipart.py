@@ -0,0 +1,363 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import hashlib
+import tempfile
+import uuid
+from email.message import Message
+
+"""
+.. module:: multipart
+   :synopsis: Attachment payloads and the multipart/mixed bodies that carry
+   them along with statements, streamed in both directions.
+
+"""
+
+# Bytes read or sent at a time
+CHUNK_SIZE = 64 * 1024
+
+# Downloaded attachments larger than this are spooled to a temporary file
+SPOOL_SIZE = 1024 * 1024
+
+
+class AttachmentPayload(object):
+    """The raw content of an attachment, sent or received along with the
+    statement whose :class:`tincan.Attachment` has the same sha2. The content
+    is always read in chunks, so that it never needs to be held in memory at
+    once::
+
+        payload = AttachmentPayload(open("video.mp4", "rb"), content_type="video/mp4")
+        statement.attachments = [Attachment(
+            usage_type="http://id.tincanapi.com/attachment/supporting_media",
+            display={"en-US": "video.mp4"},
+            content_type=payload.content_type,
+            length=payload.length,
+            sha2=payload.sha2,
+        )]
+        lrs.save_statement(statement, attachments=[payload])
+
+    The SHA-256 and the length are computed together, in a single pass over
+    the content, the first time either is needed, unless they are given.
+
+    :param source: The content: bytes, a memory map, or a binary file object,
+    which must be seekable and is read from its current position
+    :type source: bytes | bytearray | memoryview | mmap.mmap | file
+    :param content_type: Content type of the content, defaults to the one of
+    the matching :class:`tincan.Attachment` when sent
+    :type content_type: unicode
+    :param sha2: SHA-256 of the content, as a hex string
+    :type sha2: unicode
+    :param length: Length of the content, in bytes
+    :type length: int
+    """
+
+    def __init__(self, source, content_type=None, sha2=None, length=None):
+        if hasattr(source, "read"):
+            self._view = None
+            self._file = source
+            self._start = source.tell()
+        else:
+            try:
+                self._view = memoryview(source).cast("B")
+            except TypeError:
+                raise TypeError(
+                    f"An AttachmentPayload must be built from bytes, a memory map or a binary file object, "
+                    f"not a '{source.__class__.__name__}' object"
+                )
+            self._file = None
+            self._start = 0
+            if length is None:
+                length = len(self._view)
+
+        self.content_type = content_type
+        self._sha2 = sha2
+        self._length = length
+
+    @property
+    def sha2(self):
+        """SHA-256 of the content, as a hex string
+
+        :rtype: unicode
+        """
+        if self._sha2 is None:
+            self._digest()
+        return self._sha2
+
+    @property
+    def length(self):
+        """Length of the content, in bytes
+
+        :rtype: int
+        """
+        if self._length is None:
+            self._digest()
+        return self._length
+
+    def _digest(self):
+        """Computes the SHA-256 and the length of the content in one pass"""
+        sha2 = hashlib.sha256()
+        length = 0
+        for chunk in self.chunks():
+            sha2.update(chunk)
+            length += len(chunk)
+        self._sha2 = sha2.hexdigest()
+        self._length = length
+
+    def chunks(self, chunk_size=CHUNK_SIZE):
+        """Reads the content from its start, chunk by chunk
+
+        :param chunk_size: Most bytes per chunk
+        :type chunk_size: int
+        :return: Generator of the chunks of the content
+        :rtype: generator of bytes | memoryview
+        """
+        if self._view is not None:
+            for i in range(0, len(self._view), chunk_size):
+                yield self._view[i:i + chunk_size]
+            return
+
+        self._file.seek(self._start)
+        remaining = self._length
+        while remaining is None or remaining > 0:
+            chunk = self._file.read(chunk_size if remaining is None else min(chunk_size, remaining))
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+
+    def read(self):
+        """Reads the whole content into memory
+
+        :rtype: bytes
+        """
+        return b"".join(bytes(chunk) for chunk in self.chunks())
+
+    @classmethod
+    def _spool(cls, chunks, content_type=None, sha2=None):
+        """Builds a payload from downloaded chunks, which are kept in memory
+        up to :data:`SPOOL_SIZE` bytes and in a temporary file above
+
+        :param sha2: The SHA-256 announced for the content, which is checked
+        :type sha2: unicode
+        :raises: ValueError if the content does not match sha2
+        """
+        spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+        digest = hashlib.sha256()
+        length = 0
+        for chunk in chunks:
+            spooled.write(chunk)
+            digest.update(chunk)
+            length += len(chunk)
+
+        if sha2 is not None and digest.hexdigest() != sha2.lower():
+            spooled.close()
+            raise ValueError(
+                f"Attachment content does not match its hash {sha2}, got {digest.hexdigest()}"
+            )
+
+        spooled.seek(0)
+        return cls(spooled, content_type=content_type, sha2=digest.hexdigest(), length=length)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} sha2={self._sha2!r} length={self._length!r}>"
+
+
+class MultipartBody(object):
+    """A multipart/mixed request body: the JSON of one or more statements,
+    followed by one part per attachment payload. Iterating over it yields
+    the body chunk by chunk, from its start each time, so that the request
+    can be sent again.
+
+    :param json_data: The JSON of the statements
+    :type json_data: unicode
+    :param payloads: The attachment payloads and the content type of each
+    :type payloads: list of tuple(:class:`AttachmentPayload`, unicode)
+    """
+
+    def __init__(self, json_data, payloads):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/mixed; boundary={self.boundary}"
+
+        self._parts = [(self._head("Content-Type: application/json"), json_data.encode("utf-8"))]
+        for payload, content_type in payloads:
+            self._parts.append((
+                self._head(
+                    f"Content-Type: {content_type}",
+                    "Content-Transfer-Encoding: binary",
+                    f"X-Experience-API-Hash: {payload.sha2}",
+                ),
+                payload,
+            ))
+        self._end = f"\r\n--{self.boundary}--\r\n".encode("latin-1")
+
+    def _head(self, *headers):
+        return (f"--{self.boundary}\r\n" + "".join(h + "\r\n" for h in headers) + "\r\n").encode("latin-1")
+
+    def __len__(self):
+        length = len(self._end)
+        for i, (head, content) in enumerate(self._parts):
+            length += (2 if i else 0) + len(head)
+            length += content.length if isinstance(content, AttachmentPayload) else len(content)
+        return length
+
+    def __iter__(self):
+        for i, (head, content) in enumerate(self._parts):
+            yield b"\r\n" + head if i else head
+            if isinstance(content, AttachmentPayload):
+                yield from content.chunks()
+            else:
+                yield content
+        yield self._end
+
+
+def multipart_boundary(content_type):
+    """Returns the boundary of a multipart/mixed content type
+
+    :param content_type: The value of a Content-Type header
+    :type content_type: unicode
+    :return: The boundary, or None for other content types
+    :rtype: unicode
+    """
+    if not content_type:
+        return None
+
+    message = Message()
+    message["Content-Type"] = content_type
+    if message.get_content_type() != "multipart/mixed":
+        return None
+    return message.get_param("boundary")
+
+
+def read_multipart(read, boundary, chunk_size=CHUNK_SIZE):
+    """Parses a multipart body while it is being read
+
+    :param read: Function reading up to n bytes of the body, returning b""
+    at its end
+    :type read: callable
+    :param boundary: The boundary of the body
+    :type boundary: unicode
+    :return: Generator of the parts of the body, as (headers, chunks)
+    tuples, headers being a dict with lower case names and chunks a
+    generator of the content of the part, which must be exhausted before
+    the next part is requested
+    :rtype: generator of tuple(dict, generator of bytes)
+    :raises: ValueError for a malformed body
+    """
+    delimiter = b"\r\n--" + boundary.encode("latin-1")
+    # the first delimiter is not preceded by a line break
+    buffer = b"\r\n" + read(chunk_size)
+
+    def fill(size):
+        nonlocal buffer
+        while len(buffer) < size:
+            data = read(chunk_size)
+            if not data:
+                return False
+            buffer += data
+        return True
+
+    # skip the preamble
+    while True:
+        found = buffer.find(delimiter)
+        if found >= 0:
+            buffer = buffer[found + len(delimiter):]
+            break
+        buffer = buffer[1 - len(delimiter):]
+        if not fill(len(delimiter)):
+            raise ValueError("Multipart body has no parts")
+
+    while True:
+        fill(2)
+        if buffer.startswith(b"--"):
+            return
+
+        # the rest of the delimiter line, then the headers
+        while True:
+            end = buffer.find(b"\r\n\r\n")
+            if end >= 0:
+                break
+            if not fill(len(buffer) + 1):
+                raise ValueError("Multipart body ends in the headers of a part")
+        header_lines = buffer[:end].split(b"\r\n")[1:]
+        buffer = buffer[end + 4:]
+
+        headers = {}
+        for line in header_lines:
+            name, sep, value = line.decode("latin-1").partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+
+        done = []
+
+        def chunks():
+            nonlocal buffer
+            while True:
+                found = buffer.find(delimiter)
+                if found >= 0:
+                    if found:
+                        yield buffer[:found]
+                    buffer = buffer[found + len(delimiter):]
+                    done.append(True)
+                    return
+                # keep what may be the start of the delimiter
+                keep = len(delimiter) - 1
+                if len(buffer) > keep:
+                    yield buffer[:-keep]
+                    buffer = buffer[-keep:]
+                if not fill(len(buffer) + 1):
+                    raise ValueError("Multipart body ends in the middle of a part")
+
+        part = chunks()
+        yield headers, part
+        if not done:
+            for _ in part:
+                pass
+
+
+def read_statements_body(content_type, read, chunk_size=CHUNK_SIZE):
+    """Reads the body of a statements response. A multipart/mixed body is
+    split into the JSON of its first part and the attachment payloads of
+    the others, keyed by their SHA-256; any other body is read as is.
+
+    :param content_type: The Content-Type header of the response
+    :type content_type: unicode
+    :param read: Function reading up to n bytes of the body, or all of it
+    when called without argument
+    :type read: callable
+    :return: The JSON, and the attachment payloads (None if the body is not multipart)
+    :rtype: tuple(bytes, dict(unicode: :class:`AttachmentPayload`))
+    :raises: ValueError for a malformed multipart body
+    """
+    boundary = multipart_boundary(content_type)
+    if boundary is None:
+        return read(), None
+
+    parts = read_multipart(read, boundary, chunk_size)
+    try:
+        _, chunks = next(parts)
+    except StopIteration:
+        raise ValueError("Multipart body has no statements part")
+    data = b"".join(chunks)
+
+    attachments = {}
+    for headers, chunks in parts:
+        payload = AttachmentPayload._spool(
+            chunks,
+            content_type=headers.get("content-type"),
+            sha2=headers.get("x-experience-api-hash"),
+        )
+        attachments[payload.sha2] = payload
+
+    return data, attachments
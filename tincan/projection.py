@@ -0,0 +1,126 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from tincan.serializable_base import SerializableBase
+
+"""
+.. module:: projection
+   :synopsis: Keeps only some of the fields of the statements being decoded.
+
+"""
+
+# JSON names of the properties whose attribute names differ, such as
+# "context_activities" for "contextActivities"
+_json_names = {uscore[1:]: camel for uscore, camel in SerializableBase._props_corrected.items()}
+
+
+class Projection(object):
+    """The fields of statements to decode, as dotted paths of their JSON
+    properties, such as ``actor.mbox``, ``verb.id``, ``object.id``,
+    ``result.score.scaled`` or ``timestamp``. Attribute names, such as
+    ``context.context_activities``, may be used as well. A path ending on
+    an object, such as ``verb``, keeps all of it, and paths go through
+    lists, so that ``context.contextActivities.parent.id`` keeps the id of
+    every parent activity.
+
+    Everything else is dropped from the parsed JSON before statements are
+    built from it, except for the ``objectType`` of the objects kept, which
+    tells what they are::
+
+        result = StatementsResult.from_json(json_data, projection=["verb.id", "timestamp"])
+
+    :param paths: The dotted paths of the fields to keep
+    :type paths: iterable of unicode
+    """
+
+    def __init__(self, paths):
+        if isinstance(paths, str):
+            paths = [paths]
+
+        self.paths = tuple(paths)
+        self._tree = {}
+        for path in self.paths:
+            if not isinstance(path, str) or not path or "" in path.split("."):
+                raise ValueError(f"'tincan.Projection' paths must be dotted property names, not {path!r}")
+
+            node = self._tree
+            names = [_json_names.get(name, name) for name in path.split(".")]
+            for name in names[:-1]:
+                child = node.get(name)
+                if child is True:
+                    break
+                node = node.setdefault(name, {})
+            else:
+                node[names[-1]] = True
+
+    @classmethod
+    def of(cls, value):
+        """Returns value as a Projection
+
+        :param value: A Projection, the paths of one, or None
+        :type value: :class:`Projection` | iterable of unicode | None
+        :rtype: :class:`Projection` | None
+        """
+        if value is None or isinstance(value, cls):
+            return value
+        return cls(value)
+
+    def apply(self, data):
+        """Returns the projection of the parsed JSON of a statement
+
+        :param data: The parsed JSON of a statement
+        :type data: dict
+        :return: A new dict with only the fields of the projection, sharing
+        the values kept whole with data
+        :rtype: dict
+        """
+        return _project(data, self._tree)
+
+    def apply_all(self, statements):
+        """Returns the projection of the parsed JSON of statements
+
+        :param statements: The parsed JSON of statements
+        :type statements: list of dict | None
+        :rtype: list of dict | None
+        """
+        if statements is None:
+            return None
+        return [_project(data, self._tree) for data in statements]
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} paths={list(self.paths)!r}>"
+
+
+def _project(data, tree):
+    """Keeps the fields of data that are in tree, recursively
+
+    :param data: Parsed JSON
+    :param tree: Dict of the names of the fields to keep, mapped to True to
+    keep a field whole, or to the tree of its own fields
+    :type tree: dict | bool
+    """
+    if tree is True:
+        return data
+    if isinstance(data, list):
+        return [_project(v, tree) for v in data]
+    if not isinstance(data, dict):
+        return data
+
+    result = {}
+    for name, subtree in tree.items():
+        if name in data:
+            result[name] = _project(data[name], subtree)
+    if "objectType" in data:
+        result["objectType"] = data["objectType"]
+    return result
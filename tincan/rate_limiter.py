@@ -0,0 +1,237 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import asyncio
+import threading
+import time
+from collections import deque
+
+"""
+.. module:: rate_limiter
+   :synopsis: Client side limit on the rate and concurrency of LRS requests.
+
+"""
+
+
+class RateLimiter(object):
+    """Limits requests to `rate` per second, with bursts of up to `burst`,
+    using a token bucket, and to `max_in_flight` at a time. Calls over the
+    budget wait their turn instead of being sent. Set it as the
+    :attr:`tincan.RemoteLRS.rate_limiter` of one RemoteLRS, or of all the
+    ones of a process to share a budget between them::
+
+        limiter = RateLimiter(rate=50, max_in_flight=8)
+        lrs.rate_limiter = limiter
+
+    It is thread safe, and can be used from blocking code (``with limiter:``)
+    and from coroutines (``async with limiter:``) at the same time. Once a
+    call has a slot, tokens are handed out in the order calls reserve them,
+    and :meth:`stats` tells how long calls have had to wait.
+
+    :param rate: Most requests started per second, None for no limit
+    :type rate: float
+    :param burst: Most requests started at once after a quiet period, defaults to
+    one second worth of requests
+    :type burst: int
+    :param max_in_flight: Most requests in progress at a time, None for no limit
+    :type max_in_flight: int
+    """
+
+    def __init__(self, rate=None, burst=None, max_in_flight=None):
+        if rate is not None and rate <= 0:
+            raise ValueError("Property 'rate' in a 'tincan.RateLimiter' must be positive")
+        if max_in_flight is not None and int(max_in_flight) < 1:
+            raise ValueError("Property 'max_in_flight' in a 'tincan.RateLimiter' must be a positive integer")
+
+        if burst is None:
+            burst = 1 if rate is None else rate
+
+        self.rate = rate
+        self.burst = max(1, int(burst))
+        self.max_in_flight = None if max_in_flight is None else int(max_in_flight)
+
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+        self._async_waiters = deque()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+        self._in_flight = 0
+        self._waiting = 0
+        self._acquired = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def acquire(self):
+        """Waits until a request may be sent. Every call must be followed by
+        a call to :meth:`release` once the request is over.
+
+        :return: Seconds waited
+        :rtype: float
+        """
+        start = time.monotonic()
+        with self._lock:
+            self._waiting += 1
+            try:
+                while not self._slot_available():
+                    self._slot_freed.wait()
+                delay = self._reserve()
+            except BaseException:
+                self._waiting -= 1
+                raise
+
+        try:
+            if delay > 0:
+                time.sleep(delay)
+        except BaseException:
+            self._abandon()
+            raise
+        return self._acquired_after(start)
+
+    async def acquire_async(self):
+        """Coroutine flavour of :meth:`acquire`, waiting without blocking the event loop
+
+        :return: Seconds waited
+        :rtype: float
+        """
+        start = time.monotonic()
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._waiting += 1
+        waiter = None
+        try:
+            while True:
+                with self._lock:
+                    if self._slot_available():
+                        delay = self._reserve()
+                        break
+                    if waiter is None:
+                        waiter = loop.create_future()
+                        self._async_waiters.append((loop, waiter))
+                    else:
+                        # woken up but beaten to the slot, so still first in line
+                        waiter = loop.create_future()
+                        self._async_waiters.appendleft((loop, waiter))
+                await waiter
+        except BaseException:
+            with self._lock:
+                self._waiting -= 1
+                # the slot this call may have been woken for goes to the next one
+                self._notify_slot_freed()
+            raise
+
+        try:
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            self._abandon()
+            raise
+        return self._acquired_after(start)
+
+    def release(self):
+        """Tells that a request started after :meth:`acquire` is over"""
+        with self._lock:
+            self._in_flight -= 1
+            self._notify_slot_freed()
+
+    def stats(self):
+        """Returns how busy the limiter is, to help size workers and budgets
+
+        :return: The calls currently waiting ("waiting") and in progress
+        ("in_flight"), and since the limiter was created, the calls let
+        through ("acquired") and the total and longest seconds they waited
+        ("total_wait" and "max_wait")
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "waiting": self._waiting,
+                "in_flight": self._in_flight,
+                "acquired": self._acquired,
+                "total_wait": self._total_wait,
+                "max_wait": self._max_wait,
+            }
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    async def __aenter__(self):
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.release()
+
+    def _notify_slot_freed(self):
+        """Wakes up a blocking and a coroutine waiter, the lock being held.
+        Whichever does not get the slot waits again."""
+        self._slot_freed.notify()
+        while self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            if not waiter.done():
+                loop.call_soon_threadsafe(self._wake, waiter)
+                break
+
+    def _abandon(self):
+        """Gives back the slot of a call interrupted while waiting for its token"""
+        with self._lock:
+            self._waiting -= 1
+            self._in_flight -= 1
+            self._notify_slot_freed()
+
+    @staticmethod
+    def _wake(waiter):
+        if not waiter.done():
+            waiter.set_result(None)
+
+    def _slot_available(self):
+        return self.max_in_flight is None or self._in_flight < self.max_in_flight
+
+    def _reserve(self):
+        """Takes a slot and a token, the lock being held
+
+        :return: Seconds to wait for the token
+        :rtype: float
+        """
+        self._in_flight += 1
+        if self.rate is None:
+            return 0.0
+
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+        # the token may be borrowed from the future, which queues the calls
+        # in the order they got here
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def _acquired_after(self, start):
+        waited = time.monotonic() - start
+        with self._lock:
+            self._waiting -= 1
+            self._acquired += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        return waited
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} rate={self.rate} burst={self.burst} "
+            f"max_in_flight={self.max_in_flight}>"
+        )
@@ -12,23 +12,42 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-import http.client
-import json
 import base64
+import email.utils
+import functools
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 
-from urllib.parse import urlparse, urlencode
+from urllib.parse import urlparse, quote_plus
 
-from tincan.lrs_response import LRSResponse
+from pytz import utc
+
+from tincan.lrs_response import LRSResponse, LRSResponseError
+from tincan.lrs_batch_response import LRSBatchResponse
 from tincan.http_request import HTTPRequest
 from tincan.statement_list import StatementList
 from tincan.agent import Agent
 from tincan.statement import Statement
 from tincan.activity import Activity
 from tincan.statements_result import StatementsResult
+from tincan.lazy_statement import LazyStatement
+from tincan.lazy_statements_result import LazyStatementsResult
+from tincan.statements_result_parser import StatementsResultParser
+from tincan.projection import Projection
 from tincan.about import About
 from tincan.version import Version
+from tincan.json_codec import get_codec
+from tincan.compression import ACCEPT_ENCODING, DecodingReader, compress, compressible, content_encoding
+from tincan.document_cache import DocumentCache
+from tincan.instrumentation import RequestHooks
+from tincan.rate_limiter import RateLimiter
+from tincan.retry_policy import RetryPolicy
+from tincan.multipart import MultipartBody, multipart_boundary, read_multipart, read_statements_body
 from tincan.base import Base
+from tincan.connection_pool import ConnectionPool
+from tincan.conversions.iso8601 import make_datetime
 from tincan.documents import (
     StateDocument,
     ActivityProfileDocument,
@@ -40,15 +59,39 @@ from tincan.documents import (
    :synopsis: The RemoteLRS class implements LRS communication.
 """
 
+# How statements responses are handed out in LRSResponse.content: as
+# Statement and StatementsResult objects, as the dicts and lists of the parsed
+# JSON, or as the JSON itself, in UTF-8
+RESPONSE_FORMATS = ("objects", "dict", "bytes")
+
+# Memoized URL encoding of query parameter names and values
+_quote = functools.lru_cache(maxsize=1024)(quote_plus)
+
 
 class RemoteLRS(Base):
+    # Most bytes read from the socket at a time when streaming statements,
+    # see iter_statements
+    stream_chunk_size = 64 * 1024
+
     _props_req = [
         'version',
         'endpoint',
         'auth',
+        'connection_pool',
     ]
 
-    _props = []
+    _props = [
+        'trusted',
+        'lazy',
+        'response_format',
+        'codec',
+        'compress_requests',
+        'compress_responses',
+        'retry_policy',
+        'rate_limiter',
+        'hooks',
+        'document_cache',
+    ]
 
     _props.extend(_props_req)
 
@@ -65,11 +108,54 @@ class RemoteLRS(Base):
         :type password: str | unicode
         :param auth: Authentication string
         :type auth: str | unicode
+        :param connection_pool: Pool of keep-alive connections used for lrs communication.
+        Several RemoteLRS objects may share one pool.
+        :type connection_pool: :class:`tincan.connection_pool.ConnectionPool`
+        :param trusted: Whether statements returned by the lrs are decoded without validation,
+        see :meth:`tincan.SerializableBase.from_json`
+        :type trusted: bool
+        :param lazy: Whether statements returned by the lrs are decoded property by property,
+        the first time each is read, see :class:`tincan.lazy_statement.LazyStatement`
+        :type lazy: bool
+        :param response_format: How retrieved and queried statements are handed out
+        in the content of the LRS Response, one of :data:`RESPONSE_FORMATS`, see
+        :attr:`response_format`
+        :type response_format: unicode
+        :param codec: JSON codec used to encode requests and decode responses,
+        see :func:`tincan.json_codec.get_codec`. Defaults to the default codec.
+        :type codec: :class:`tincan.json_codec.JSONCodec` | unicode
+        :param compress_requests: Size in bytes from which JSON and text request bodies are
+        sent gzip compressed, None (the default) to never compress them
+        :type compress_requests: int | None
+        :param compress_responses: Whether to ask the lrs for gzip or deflate compressed responses
+        :type compress_responses: bool
+        :param retry_policy: When to send failed requests again, None (the default) to send them once
+        :type retry_policy: :class:`tincan.retry_policy.RetryPolicy`
+        :param rate_limiter: Limit on the rate and concurrency of requests, which several
+        RemoteLRS objects may share. None (the default) for no limit.
+        :type rate_limiter: :class:`tincan.rate_limiter.RateLimiter`
+        :param hooks: Objects told about every request sent, such as a
+        :class:`tincan.instrumentation.MetricsCollector`
+        :type hooks: list of :class:`tincan.instrumentation.RequestHooks`
+        :param document_cache: Cache of the state and profile documents retrieved,
+        revalidated by ETag. None (the default) to download them every time.
+        :type document_cache: :class:`tincan.document_cache.DocumentCache`
         """
 
         self._version = Version.latest
         self._endpoint = None
         self._auth = None
+        self._connection_pool = None
+        self._trusted = False
+        self._lazy = False
+        self._response_format = "objects"
+        self._codec = None
+        self._compress_requests = None
+        self._compress_responses = True
+        self._retry_policy = None
+        self._rate_limiter = None
+        self._hooks = []
+        self._document_cache = None
 
         if "username" in kwargs \
                 and kwargs["username"] is not None \
@@ -88,24 +174,282 @@ class RemoteLRS(Base):
 
         super(RemoteLRS, self).__init__(*args, **kwargs)
 
-    def _send_request(self, request):
+    def _send_request(self, request, attachments=False):
         """Establishes connection and returns http response based off of request.
 
         :param request: HTTPRequest object
         :type request: :class:`tincan.http_request.HTTPRequest`
+        :param attachments: Whether a multipart/mixed response holds statements
+        and their attachments, which are then spooled into the attachments of
+        the LRS Response instead of being read into memory
+        :type attachments: bool
         :returns: LRS Response object
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        limiter = self._rate_limiter
+        attempt = 1
+        while True:
+            timings = {}
+            start = time.perf_counter()
+            self._call_hooks("before_request", request)
+            try:
+                if limiter is not None:
+                    timings["queue"] = limiter.acquire()
+                try:
+                    lrs_response = self._send_attempt(request, attachments, timings)
+                finally:
+                    if limiter is not None:
+                        limiter.release()
+            except Exception as e:
+                self._call_hooks("on_error", request, e)
+                delay = self._retry_delay(request, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                timings["total"] = time.perf_counter() - start
+                self._call_hooks("after_response", request, lrs_response)
+                delay = self._retry_delay(request, attempt, response=lrs_response.response)
+                if delay is None:
+                    return lrs_response
+
+            attempt += 1
+            time.sleep(delay)
+
+    def _call_hooks(self, event, *args):
+        """Calls the given method of every hook, see :class:`tincan.instrumentation.RequestHooks`
+
+        :param event: Name of the method, such as "before_request"
+        :type event: unicode
+        """
+        for hook in self._hooks:
+            getattr(hook, event)(*args)
+
+    def _decode_content(self, lrs_response, decode, *args, raw=False, **kwargs):
+        """Sets the content of an LRS Response to its data decoded by
+        decode, recording the time it took as its "decode" timing
+
+        :param lrs_response: The LRS Response
+        :type lrs_response: :class:`tincan.lrs_response.LRSResponse`
+        :param decode: Function called with the data, then args and kwargs
+        :type decode: callable
+        :param raw: Whether decode is called with the body as received,
+        :attr:`tincan.LRSResponse.raw_data`, which then is never decoded to text
+        :type raw: bool
+        """
+        start = time.perf_counter()
+        data = lrs_response.raw_data if raw else lrs_response.data
+        lrs_response.content = decode(data, *args, **kwargs)
+        if lrs_response.timings is not None:
+            lrs_response.timings["decode"] = time.perf_counter() - start
+            self._call_hooks("after_decode", lrs_response.request, lrs_response)
+
+    def _decode_statements(self, lrs_response, cls, response_format, projection=None):
+        """Sets the content of a statements response, see :meth:`_decode_content`
+
+        :param lrs_response: The LRS Response
+        :type lrs_response: :class:`tincan.lrs_response.LRSResponse`
+        :param cls: The class to decode the statements to as objects
+        :type cls: type
+        :param response_format: One of :data:`RESPONSE_FORMATS`, or None for
+        :attr:`response_format`
+        :type response_format: unicode | None
+        :param projection: The fields of the statements of a page to keep, see
+        :class:`tincan.projection.Projection`
+        :type projection: :class:`tincan.projection.Projection` | None
+        """
+        if response_format is None:
+            response_format = self._response_format
+        else:
+            response_format = self._check_response_format(response_format)
+
+        if response_format == "bytes":
+            # handed out as received, without decoding and encoding it again
+            self._decode_content(lrs_response, lambda raw_data: raw_data, raw=True)
+        elif response_format == "dict":
+            self._decode_content(lrs_response, self._loads_statements, projection)
+        elif projection is not None:
+            self._decode_content(
+                lrs_response, cls.from_json, trusted=self._trusted, codec=self._codec, projection=projection
+            )
+        else:
+            self._decode_content(lrs_response, cls.from_json, trusted=self._trusted, codec=self._codec)
+
+    def _loads_statements(self, json_data, projection=None):
+        """Parses the JSON of a statements response, keeping the fields of the
+        projection of the statements of a page, if any
+
+        :rtype: dict | list
+        """
+        data = get_codec(self._codec).loads(json_data)
+        if projection is not None and isinstance(data, dict) and isinstance(data.get("statements"), list):
+            data["statements"] = projection.apply_all(data["statements"])
+        return data
+
+    @staticmethod
+    def _check_response_format(value):
+        """Checks that value is one of :data:`RESPONSE_FORMATS`
+
+        :rtype: unicode
+        :raises: ValueError
+        """
+        if value not in RESPONSE_FORMATS:
+            raise ValueError(
+                f"Property 'response_format' in a 'tincan.RemoteLRS' must be one of "
+                f"{', '.join(RESPONSE_FORMATS)}, not {value!r}"
+            )
+        return value
+
+    def _retry_delay(self, request, attempt, response=None, error=None):
+        """Asks the retry policy whether to send request again, see
+        :meth:`tincan.retry_policy.RetryPolicy.retry_delay`
+
+        :return: Seconds to wait before the next attempt, or None to not retry
+        :rtype: float | None
+        """
+        if self._retry_policy is None:
+            return None
+        return self._retry_policy.retry_delay(request, attempt, response=response, error=error)
+
+    def _send_attempt(self, request, attachments, timings):
+        """Sends request once, see :meth:`_send_request`
+
+        :param timings: Dictionary the timings of the attempt are recorded
+        into, see :attr:`tincan.lrs_response.LRSResponse.timings`
+        :type timings: dict
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        web_req, host, response, (data, payloads) = self._open_request(
+            request, self._read_statements_body if attachments else self._read_body, timings
+        )
+        self._release_connection(web_req, host, response)
+
+        lrs_response = self._make_response(request, response, data)
+        lrs_response.attachments = payloads
+        lrs_response.timings = timings
+        return lrs_response
+
+    @staticmethod
+    def _read_body(response):
+        """Reads the whole body of a response
+
+        :return: The body, and no attachment payloads
+        :rtype: tuple(bytes, None)
+        """
+        return RemoteLRS._body_reader(response)(), None
+
+    @staticmethod
+    def _read_statements_body(response):
+        """Reads the body of a statements response, see
+        :func:`tincan.multipart.read_statements_body`
+
+        :return: The JSON of the statements, and the attachment payloads keyed
+        by sha2 (None if the response is not multipart)
+        :rtype: tuple(bytes, dict(unicode: :class:`tincan.multipart.AttachmentPayload`))
+        """
+        return read_statements_body(response.getheader("Content-Type"), RemoteLRS._body_reader(response))
+
+    @staticmethod
+    def _body_reader(response):
+        """Returns the function reading the body of a response, decompressing
+        it if it is compressed
+
+        :param response: The response
+        :type response: :class:`http.client.HTTPResponse`
+        :return: Function reading up to n bytes of the body, or all of it when
+        called without argument
+        :rtype: callable
+        """
+        encoding = content_encoding(response)
+        if encoding is None:
+            return response.read
+        return DecodingReader(response.read, encoding).read
+
+    def _open_request(self, request, read=None, timings=None):
+        """Sends request over a pooled connection, retrying once on a fresh
+        connection if the pooled one turns out to be stale
+
+        :param request: HTTPRequest object
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        :param read: Function reading the body off the response, such as
+        :meth:`_read_body`. When it is None the body is left unread, and the
+        caller reads it and then hands the connection to
+        :meth:`_release_connection`, or discards it.
+        :type read: callable
+        :param timings: Dictionary the timings of the request are recorded
+        into, see :attr:`tincan.lrs_response.LRSResponse.timings`
+        :type timings: dict
+        :return: The connection, its pool key, the response and what read returned
+        :rtype: tuple(:class:`http.client.HTTPConnection`, tuple, :class:`http.client.HTTPResponse`, object)
+        """
+        parsed, path, headers, body = self._prepare_request(request)
+
+        pool = self.connection_pool
+        host = (parsed.scheme, parsed.hostname, parsed.port)
+
+        web_req, reused = pool.get(*host)
+        try:
+            response, result = self._perform_request(web_req, request, path, headers, body, read, timings)
+        except pool.stale_errors:
+            pool.discard(web_req)
+            if not reused:
+                raise
+
+            # the server closed the kept-alive socket while it sat idle in
+            # the pool, so try once more on a fresh connection
+            web_req = pool.new_connection(*host)
+            try:
+                response, result = self._perform_request(web_req, request, path, headers, body, read, timings)
+            except Exception:
+                pool.discard(web_req)
+                raise
+        except Exception:
+            pool.discard(web_req)
+            raise
+
+        return web_req, host, response, result
+
+    def _release_connection(self, web_req, host, response):
+        """Hands a connection whose response has been read completely back
+        to the pool, unless the server is closing it
+
+        :param web_req: Connection returned by :meth:`_open_request`
+        :type web_req: :class:`http.client.HTTPConnection`
+        :param host: Pool key returned by :meth:`_open_request`
+        :type host: tuple
+        :param response: The response read over the connection
+        :type response: :class:`http.client.HTTPResponse`
+        """
+        if response.will_close:
+            self.connection_pool.discard(web_req)
+        else:
+            self.connection_pool.put(web_req, *host)
+
+    def _prepare_request(self, request):
+        """Works out the url, path, headers and body to send request with
+
+        :param request: HTTPRequest object
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        :return: The parsed url, the path including the query string, the headers and the body
+        :rtype: tuple(:class:`urllib.parse.ParseResult`, unicode, dict, str | bytes | iterable)
+        """
         headers = {"X-Experience-API-Version": self.version}
 
         if self.auth is not None:
             headers["Authorization"] = self.auth
+        if self._compress_responses:
+            headers["Accept-Encoding"] = ACCEPT_ENCODING
 
         headers.update(request.headers)
 
-        params = request.query_params
-        params = {k: str(params[k]).encode('utf-8') for k in list(params.keys())}
-        params = urlencode(params)
+        body = getattr(request, "content", None)
+        if (self._compress_requests is not None
+                and isinstance(body, (str, bytes))
+                and len(body) >= self._compress_requests
+                and compressible(headers.get("Content-Type"))):
+            body = compress(body)
+            headers["Content-Encoding"] = "gzip"
+
+        params = self._encode_query(request.query_params)
 
         if request.resource.startswith('http'):
             url = request.resource
@@ -115,11 +459,6 @@ class RemoteLRS(Base):
 
         parsed = urlparse(url)
 
-        if parsed.scheme == "https":
-            web_req = http.client.HTTPSConnection(parsed.hostname, parsed.port)
-        else:
-            web_req = http.client.HTTPConnection(parsed.hostname, parsed.port)
-
         path = parsed.path
         if parsed.query or parsed.path:
             path += "?"
@@ -128,24 +467,34 @@ class RemoteLRS(Base):
             if params:
                 path += params
 
-        if hasattr(request, "content") and request.content is not None:
-            web_req.request(
-                method=request.method,
-                url=path,
-                body=request.content,
-                headers=headers,
-            )
-        else:
-            web_req.request(
-                method=request.method,
-                url=path,
-                headers=headers,
-            )
+        return parsed, path, headers, body
 
-        response = web_req.getresponse()
-        data = response.read()
-        web_req.close()
+    @staticmethod
+    def _encode_query(params):
+        """URL encodes query parameters like :func:`urllib.parse.urlencode`,
+        memoizing the encoding of the values, which are often the same from
+        one request to the next, such as the agent of a learner's states
+
+        :param params: Query parameters, whose values are converted to unicode
+        :type params: dict
+        :rtype: unicode
+        """
+        return "&".join(
+            f"{_quote(k)}={_quote(v if isinstance(v, str) else str(v))}" for k, v in params.items()
+        )
+
+    @staticmethod
+    def _make_response(request, response, data):
+        """Wraps a completed http response in an LRS Response object
 
+        :param request: HTTPRequest object that was sent
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        :param response: The response received from the LRS
+        :type response: :class:`http.client.HTTPResponse`
+        :param data: The body of the response
+        :type data: bytes
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
         if (200 <= response.status < 300
             or (response.status == 404
                 and hasattr(request, "ignore404")
@@ -161,31 +510,122 @@ class RemoteLRS(Base):
             data=data,
         )
 
+    @staticmethod
+    def _perform_request(web_req, request, path, headers, body, read=None, timings=None):
+        """Sends request over the given connection and reads the response
+
+        :param web_req: Connection to send the request over
+        :type web_req: :class:`http.client.HTTPConnection`
+        :param request: HTTPRequest object
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        :param path: Request path, including the query string
+        :type path: unicode
+        :param headers: Request headers
+        :type headers: dict
+        :param body: Request body
+        :type body: str | bytes | iterable
+        :param read: Function reading the body off the response, see :meth:`_open_request`
+        :type read: callable
+        :param timings: Dictionary the timings of the request are recorded
+        into, see :attr:`tincan.lrs_response.LRSResponse.timings`
+        :type timings: dict
+        :return: The response and what read returned (None when not read)
+        :rtype: tuple(:class:`http.client.HTTPResponse`, object)
+        """
+        if timings is None:
+            timings = {}
+
+        start = time.perf_counter()
+        if getattr(web_req, "sock", False) is None:
+            # connect explicitly, rather than as part of sending the request,
+            # to time it on its own
+            web_req.connect()
+            now = time.perf_counter()
+            timings["connect"] = now - start
+            start = now
+
+        if body is not None:
+            web_req.request(
+                method=request.method,
+                url=path,
+                body=body,
+                headers=headers,
+            )
+        else:
+            web_req.request(
+                method=request.method,
+                url=path,
+                headers=headers,
+            )
+
+        now = time.perf_counter()
+        timings["send"] = now - start
+        start = now
+
+        response = web_req.getresponse()
+        now = time.perf_counter()
+        timings["wait"] = now - start
+        start = now
+
+        if read is not None:
+            result = read(response)
+            timings["read"] = time.perf_counter() - start
+        else:
+            result = None
+
+        return response, result
+
     def about(self):
         """Gets about response from LRS
 
         :return: LRS Response object with the returned LRS about object as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
-        request = HTTPRequest(
+        lrs_response = self._send_request(self._about_request())
+        return self._about_response(lrs_response)
+
+    @staticmethod
+    def _about_request():
+        """Builds the request sent by :meth:`about`
+
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
+        return HTTPRequest(
             method="GET",
             resource="about"
         )
-        lrs_response = self._send_request(request)
 
+    def _about_response(self, lrs_response):
+        """Decodes the LRS Response to :meth:`about`
+
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
         if lrs_response.success:
-            lrs_response.content = About.from_json(lrs_response.data)
+            self._decode_content(lrs_response, About.from_json, codec=self._codec)
 
         return lrs_response
 
-    def save_statement(self, statement):
+    def save_statement(self, statement, attachments=None):
         """Save statement to LRS and update statement id if necessary
 
         :param statement: Statement object to be saved
         :type statement: :class:`tincan.statement.Statement`
+        :param attachments: Payloads of the attachments of the statement, sent
+        along with it in a multipart/mixed request, see :class:`tincan.multipart.AttachmentPayload`
+        :type attachments: list of :class:`tincan.multipart.AttachmentPayload`
         :return: LRS Response object with the saved statement as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        statement, request = self._save_statement_request(statement, attachments)
+        lrs_response = self._send_request(request)
+        return self._save_statement_response(lrs_response, statement)
+
+    def _save_statement_request(self, statement, attachments=None):
+        """Builds the request sent by :meth:`save_statement`
+
+        :return: The statement, converted to a Statement object if need be, and the request
+        :rtype: tuple(:class:`tincan.statement.Statement`, :class:`tincan.http_request.HTTPRequest`)
+        """
         if not isinstance(statement, Statement):
             statement = Statement(statement)
 
@@ -197,41 +637,97 @@ class RemoteLRS(Base):
             request.method = "PUT"
             request.query_params["statementId"] = statement.id
 
-        request.headers["Content-Type"] = "application/json"
-        request.content = statement.to_json(self.version)
+        self._set_statements_content(
+            request,
+            statement.to_json(self.version, codec=self._codec),
+            self._attachment_parts([statement], attachments),
+        )
 
-        lrs_response = self._send_request(request)
+        return statement, request
 
+    def _save_statement_response(self, lrs_response, statement):
+        """Decodes the LRS Response to :meth:`save_statement`, giving the
+        statement the id the LRS assigned it, if it had none
+
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
         if lrs_response.success:
             if statement.id is None:
-                statement.id = json.loads(lrs_response.data)[0]
+                statement.id = get_codec(self._codec).loads(lrs_response.data)[0]
             lrs_response.content = statement
 
         return lrs_response
 
-    def save_statements(self, statements):
+    def save_statements(self, statements, batch_size=None, max_batch_bytes=None, max_workers=1, attachments=None):
         """Save statements to LRS and update their statement id's
 
+        By default all the statements are sent in a single request. If
+        `batch_size` or `max_batch_bytes` is given, they are split into
+        consecutive batches that are sent as separate requests instead,
+        `max_workers` of them at a time, and an aggregate response is
+        returned.
+
         :param statements: A list of statement objects to be saved
         :type statements: :class:`StatementList`
-        :return: LRS Response object with the saved list of statements as content
-        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        :param batch_size: Maximum number of statements per request
+        :type batch_size: int
+        :param max_batch_bytes: Maximum size of the serialized statements per request.
+        A statement larger than this is sent in a request of its own.
+        :type max_batch_bytes: int
+        :param max_workers: Number of batches sent concurrently
+        :type max_workers: int
+        :param attachments: Payloads of the attachments of the statements, sent
+        along with them in multipart/mixed requests. When batching, each batch
+        carries the payloads its own statements refer to.
+        :type attachments: list of :class:`tincan.multipart.AttachmentPayload`
+        :return: LRS Response object with the saved list of statements as content,
+        or when batching, LRS Batch Response object with one LRS Response per batch
+        :rtype: :class:`tincan.lrs_response.LRSResponse` | :class:`tincan.lrs_batch_response.LRSBatchResponse`
         """
         if not isinstance(statements, StatementList):
             statements = StatementList(statements)
 
+        if batch_size is not None or max_batch_bytes is not None:
+            return self._save_statement_batches(statements, batch_size, max_batch_bytes, max_workers, attachments)
+
+        request = self._save_statements_request(
+            statements,
+            statements.to_json(codec=self._codec),
+            self._attachment_parts(statements, attachments),
+        )
+        lrs_response = self._send_request(request)
+        return self._save_statements_response(lrs_response, statements)
+
+    def _save_statements_request(self, statements, json_data, parts):
+        """Builds the request sent by :meth:`save_statements`, for all the
+        statements or a batch of them
+
+        :param statements: The statements sent
+        :type statements: :class:`StatementList`
+        :param json_data: The JSON of the statements
+        :type json_data: unicode
+        :param parts: The payloads to send along, see :meth:`_attachment_parts`
+        :type parts: list of tuple(:class:`tincan.multipart.AttachmentPayload`, unicode)
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
         request = HTTPRequest(
             method="POST",
             resource="statements"
         )
-        request.headers["Content-Type"] = "application/json"
+        request.idempotent = all(s.id is not None for s in statements)
+        self._set_statements_content(request, json_data, parts)
 
-        request.content = statements.to_json()
+        return request
 
-        lrs_response = self._send_request(request)
+    def _save_statements_response(self, lrs_response, statements):
+        """Decodes the LRS Response to :meth:`save_statements`, for all the
+        statements or a batch of them, giving each statement the id the LRS
+        returned for it
 
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
         if lrs_response.success:
-            id_list = json.loads(lrs_response.data)
+            id_list = get_codec(self._codec).loads(lrs_response.data)
             for s, statement_id in zip(statements, id_list):
                 s.id = statement_id
 
@@ -239,53 +735,318 @@ class RemoteLRS(Base):
 
         return lrs_response
 
-    def retrieve_statement(self, statement_id):
-        """Retrieve a statement from the server from its id
-
-        :param statement_id: The UUID of the desired statement
-        :type statement_id: str | unicode
-        :return: LRS Response object with the retrieved statement as content
+    def save_statements_json(self, json_data, idempotent=False):
+        """Save statements already serialized to JSON, such as the ones kept
+        in a :class:`tincan.statement_queue.StatementQueue` journal, without
+        decoding and encoding them again
+
+        :param json_data: The JSON array of the statements, serialized for
+        the version of the LRS
+        :type json_data: unicode
+        :param idempotent: Whether every statement has an id, so that the
+        request may be retried without storing them twice
+        :type idempotent: bool
+        :return: LRS Response object with the ids of the statements the LRS
+        stored as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        lrs_response = self._send_request(self._statements_json_request(json_data, idempotent))
+        return self._ids_response(lrs_response)
+
+    @staticmethod
+    def _statements_json_request(json_data, idempotent):
+        """Builds the request of :meth:`save_statements_json`
+
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
         request = HTTPRequest(
-            method="GET",
+            method="POST",
             resource="statements"
         )
-        request.query_params["statementId"] = statement_id
+        request.headers["Content-Type"] = "application/json"
+        request.content = json_data
+        request.idempotent = idempotent
+        return request
+
+    def _save_statement_batches(self, statements, batch_size, max_batch_bytes, max_workers, attachments=None):
+        """Saves statements in batches, see :meth:`save_statements`
+
+        Each batch's LRS Response holds the batch's statements as content
+        when it was saved. If a batch could not be sent at all, its LRS
+        Response is unsuccessful and holds the exception as content.
+
+        :return: LRS Batch Response object with the list of statements as content
+        :rtype: :class:`tincan.lrs_batch_response.LRSBatchResponse`
+        """
+        self._check_statement_batches(statements, batch_size, max_batch_bytes, attachments)
+
+        def send_batch(batch):
+            batch_statements, parts = batch
+            request = None
+            try:
+                request = self._statement_batch_request(batch_statements, parts, attachments)
+                lrs_response = self._send_request(request)
+            except Exception as e:
+                return LRSResponse(success=False, request=request, content=e)
+
+            return self._save_statements_response(lrs_response, batch_statements)
+
+        responses = self._map_concurrently(
+            send_batch,
+            self._statement_batches(statements, batch_size, max_batch_bytes),
+            max_workers,
+        )
 
-        lrs_response = self._send_request(request)
+        return LRSBatchResponse(responses=responses, content=statements)
 
-        if lrs_response.success:
-            lrs_response.content = Statement.from_json(lrs_response.data)
+    def _check_statement_batches(self, statements, batch_size, max_batch_bytes, attachments=None):
+        """Checks the arguments of :meth:`_save_statement_batches` before
+        anything is sent, including that every payload belongs to a statement
 
-        return lrs_response
+        :raises: ValueError
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if max_batch_bytes is not None and max_batch_bytes < 1:
+            raise ValueError("max_batch_bytes must be a positive integer")
+
+        self._attachment_parts(statements, attachments)
+
+    def _statement_batch_request(self, batch_statements, parts, attachments=None):
+        """Builds the request sending a batch of statements, see :meth:`_statement_batches`
+
+        :param batch_statements: The statements of the batch
+        :type batch_statements: :class:`StatementList`
+        :param parts: The serialized statements of the batch
+        :type parts: list of unicode
+        :param attachments: The payloads of all the statements, the batch
+        carrying the ones its statements refer to
+        :type attachments: list of :class:`tincan.multipart.AttachmentPayload`
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
+        return self._save_statements_request(
+            batch_statements,
+            "[" + ", ".join(parts) + "]",
+            self._attachment_parts(batch_statements, attachments, strict=False),
+        )
+
+    @staticmethod
+    def _attachment_parts(statements, payloads, strict=True):
+        """Matches attachment payloads with the attachments of statements by
+        their sha2, working out the content type each payload is sent with
+
+        :param statements: The statements being sent
+        :type statements: list of :class:`tincan.statement.Statement`
+        :param payloads: The payloads to send along
+        :type payloads: list of :class:`tincan.multipart.AttachmentPayload`
+        :param strict: Whether a payload that no statement refers to is an error,
+        otherwise it is left out
+        :type strict: bool
+        :return: The payloads to send, once each by sha2, and their content types
+        :rtype: list of tuple(:class:`tincan.multipart.AttachmentPayload`, unicode)
+        :raises: ValueError for a payload no statement refers to
+        """
+        if not payloads:
+            return []
+
+        content_types = {}
+        for statement in statements:
+            for attachment in statement.attachments or ():
+                if attachment.sha2 is not None:
+                    content_types.setdefault(attachment.sha2.lower(), attachment.content_type)
+
+        parts = []
+        sent = set()
+        for payload in payloads:
+            sha2 = payload.sha2.lower()
+            if sha2 in sent:
+                continue
+            if sha2 not in content_types:
+                if strict:
+                    raise ValueError(
+                        f"Attachment payload {payload.sha2} is not the sha2 of any attachment of the statements"
+                    )
+                continue
+            sent.add(sha2)
+            content_type = content_types[sha2]
+            parts.append((payload, payload.content_type or content_type or "application/octet-stream"))
+
+        return parts
+
+    @staticmethod
+    def _set_statements_content(request, json_data, parts):
+        """Sets the content of a request saving statements: their JSON alone,
+        or a multipart/mixed body when there are attachment payloads to send along
+
+        :param request: HTTPRequest object
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        :param json_data: The JSON of the statements
+        :type json_data: unicode
+        :param parts: The payloads to send and their content types, see :meth:`_attachment_parts`
+        :type parts: list of tuple(:class:`tincan.multipart.AttachmentPayload`, unicode)
+        """
+        if not parts:
+            request.headers["Content-Type"] = "application/json"
+            request.content = json_data
+            return
+
+        body = MultipartBody(json_data, parts)
+        request.headers["Content-Type"] = body.content_type
+        # the body is sent chunk by chunk, so its length must be given
+        request.headers["Content-Length"] = str(len(body))
+        request.content = body
+
+    def _statement_batches(self, statements, batch_size, max_batch_bytes):
+        """Splits statements into batches by count and serialized size. Each
+        statement is serialized only once, and only when its batch is about
+        to be sent.
+
+        :return: Generator of (statements, serialized statements) tuples
+        :rtype: generator
+        """
+        batch = StatementList()
+        parts = []
+        size = 0
+
+        for statement in statements:
+            part = statement.to_json(self.version, codec=self._codec)
+            part_size = len(part.encode("utf-8"))
+
+            if batch and (
+                    (batch_size is not None and len(batch) >= batch_size)
+                    or (max_batch_bytes is not None and size + part_size + 2 > max_batch_bytes)):
+                yield batch, parts
+                batch = StatementList()
+                parts = []
+                size = 0
+
+            batch.append(statement)
+            parts.append(part)
+            size += part_size + 2
+
+        if batch:
+            yield batch, parts
+
+    @classmethod
+    def _map_concurrently(cls, fn, items, max_workers):
+        """Calls fn on each of items using up to max_workers threads and
+        returns the results in the order of items. Items are pulled lazily,
+        never more than twice max_workers ahead of the results.
+
+        :param fn: The function to call
+        :type fn: callable
+        :param items: The items to call fn on
+        :type items: iterable
+        :param max_workers: Number of threads. 1 or less calls fn in the current thread.
+        :type max_workers: int
+        :rtype: list
+        """
+        return list(cls._imap_concurrently(fn, items, max_workers, ahead=(max_workers or 0) * 2))
+
+    @staticmethod
+    def _imap_concurrently(fn, items, max_workers, ahead=None):
+        """Generator flavour of :meth:`_map_concurrently`, yielding each result
+        as soon as it and all the ones before it are available
+
+        :param ahead: Maximum number of calls started ahead of the results
+        yielded so far, defaults to max_workers
+        :type ahead: int
+        """
+        if max_workers is None or max_workers <= 1:
+            for item in items:
+                yield fn(item)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(fn, item))
+                if len(pending) >= (ahead or max_workers):
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def retrieve_statement(self, statement_id, attachments=False, response_format=None):
+        """Retrieve a statement from the server from its id
+
+        :param statement_id: The UUID of the desired statement
+        :type statement_id: str | unicode
+        :param attachments: Whether to retrieve the payloads of the statement's
+        attachments too, into the attachments of the LRS Response
+        :type attachments: bool
+        :param response_format: How to hand out the statement, one of
+        :data:`tincan.remote_lrs.RESPONSE_FORMATS`. Defaults to :attr:`response_format`.
+        :type response_format: unicode | None
+        :return: LRS Response object with the retrieved statement as content
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        request = self._retrieve_statement_request("statementId", statement_id, attachments)
+        lrs_response = self._send_request(request, attachments=True)
+        return self._statements_response(lrs_response, self._statement_class, response_format)
 
-    def retrieve_voided_statement(self, statement_id):
+    def retrieve_voided_statement(self, statement_id, attachments=False, response_format=None):
         """Retrieve a voided statement from the server from its id
 
         :param statement_id: The UUID of the desired voided statement
         :type statement_id: str | unicode
+        :param attachments: Whether to retrieve the payloads of the statement's
+        attachments too, into the attachments of the LRS Response
+        :type attachments: bool
+        :param response_format: How to hand out the statement, one of
+        :data:`tincan.remote_lrs.RESPONSE_FORMATS`. Defaults to :attr:`response_format`.
+        :type response_format: unicode | None
         :return: LRS Response object with the retrieved voided statement as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        request = self._retrieve_statement_request("voidedStatementId", statement_id, attachments)
+        lrs_response = self._send_request(request, attachments=True)
+        return self._statements_response(lrs_response, self._statement_class, response_format)
+
+    @staticmethod
+    def _retrieve_statement_request(param, statement_id, attachments):
+        """Builds the request sent by :meth:`retrieve_statement` and
+        :meth:`retrieve_voided_statement`
+
+        :param param: "statementId" or "voidedStatementId"
+        :type param: unicode
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
         request = HTTPRequest(
             method="GET",
             resource="statements"
         )
-        request.query_params["voidedStatementId"] = statement_id
+        request.query_params[param] = statement_id
+        if attachments:
+            request.query_params["attachments"] = "true"
 
-        lrs_response = self._send_request(request)
+        return request
 
+    def _statements_response(self, lrs_response, cls, response_format, projection=None):
+        """Decodes an LRS Response holding statements, see :meth:`_decode_statements`
+
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
         if lrs_response.success:
-            lrs_response.content = Statement.from_json(lrs_response.data)
+            self._decode_statements(lrs_response, cls, response_format, projection)
 
         return lrs_response
 
-    def query_statements(self, query):
+    def query_statements(self, query, response_format=None, projection=None):
         """Query the LRS for statements with specified parameters
 
         :param query: Dictionary of query parameters and their values
         :type query: dict
+        :param response_format: How to hand out the statements, one of
+        :data:`tincan.remote_lrs.RESPONSE_FORMATS`. Defaults to :attr:`response_format`.
+        :type response_format: unicode | None
+        :param projection: The fields of the statements to decode, the others being
+        dropped, see :class:`tincan.projection.Projection`. None (the default) decodes every field.
+        :type projection: :class:`tincan.projection.Projection` | iterable of unicode | None
         :return: LRS Response object with the returned StatementsResult object as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
 
@@ -311,11 +1072,37 @@ class RemoteLRS(Base):
                **format:** (*str* {"ids"|"exact"|"canonical"}) Manipulates how the LRS handles
                importing and returning the statements
                **attachments:** (*bool*) If true, the LRS will use multipart responses and include
-               all attachment data per Statement returned.
-               Otherwise, application/json is used and no attachment information will be returned
+               all attachment data per Statement returned, which ends up in the attachments of the
+               LRS Response. Otherwise, application/json is used and no attachment information will be returned
                **ascending:** (*bool*) If true, the LRS will return results in ascending order of
                stored time (oldest first)
         """
+        lrs_response = self._send_request(self._query_statements_request(query), attachments=True)
+        return self._statements_response(
+            lrs_response, self._statements_result_class, response_format, Projection.of(projection)
+        )
+
+    def _query_statements_request(self, query):
+        """Builds the request sent by :meth:`query_statements`
+
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
+        request = HTTPRequest(
+            method="GET",
+            resource="statements"
+        )
+        request.query_params = self._statements_query_params(query)
+
+        return request
+
+    def _statements_query_params(self, query):
+        """Turns the query passed to :meth:`query_statements` into query parameters
+
+        :param query: Dictionary of query parameters and their values
+        :type query: dict
+        :return: The query parameters to send to the LRS
+        :rtype: dict
+        """
         params = {}
 
         param_keys = [
@@ -333,49 +1120,304 @@ class RemoteLRS(Base):
         for k, v in query.items():
             if v is not None:
                 if k == "agent":
-                    params[k] = v.to_json(self.version)
+                    params[k] = v.to_query_param(self.version, codec=self._codec)
                 elif k == "verb" or k == "activity":
                     params[k] = v.id
+                elif k in param_keys and isinstance(v, bool):
+                    params[k] = "true" if v else "false"
                 elif k in param_keys:
                     params[k] = v
 
-        request = HTTPRequest(
-            method="GET",
-            resource="statements"
-        )
-        request.query_params = params
+        return params
 
-        lrs_response = self._send_request(request)
+    def iter_statements(self, query, prefetch=False, stream=False, projection=None):
+        """Query the LRS for statements and lazily iterate over them, following
+        the "more" links of each page of results until the last one. Only one
+        page (two when prefetching) is held in memory at a time.
 
-        if lrs_response.success:
-            lrs_response.content = StatementsResult.from_json(lrs_response.data)
+        :param query: Dictionary of query parameters and their values,
+        see :meth:`query_statements`
+        :type query: dict
+        :param prefetch: Whether to download the next page in a background thread
+        while the current one is being iterated over
+        :type prefetch: bool
+        :param stream: Whether to parse each page while it is being downloaded,
+        yielding its statements one by one so that only about one statement
+        is held in memory at a time. Can not be combined with prefetch.
+        :type stream: bool
+        :param projection: The fields of the statements to decode, the others being
+        dropped, see :class:`tincan.projection.Projection`. None (the default) decodes every field.
+        :type projection: :class:`tincan.projection.Projection` | iterable of unicode | None
+        :return: Generator of the queried statements, as objects whatever the :attr:`response_format`
+        :rtype: generator of :class:`tincan.statement.Statement`
+        :raises: :class:`tincan.lrs_response.LRSResponseError` if a page can not be retrieved
+        """
+        projection = Projection.of(projection)
+        if stream:
+            if prefetch:
+                raise ValueError("iter_statements can not both prefetch and stream pages")
+
+            request = self._query_statements_request(query)
+            while request is not None:
+                more = yield from self._stream_statements(request, projection)
+                request = self._more_statements_request(more) if more else None
+            return
+
+        if not prefetch:
+            lrs_response = self.query_statements(query, response_format="objects", projection=projection)
+            while True:
+                if not lrs_response.success:
+                    raise LRSResponseError(lrs_response)
+
+                result = lrs_response.content
+                lrs_response = None
+                yield from result.statements
+
+                if not result.more:
+                    return
+                lrs_response = self.more_statements(result.more, response_format="objects", projection=projection)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self.query_statements, query, response_format="objects", projection=projection)
+        try:
+            while future is not None:
+                lrs_response = future.result()
+                if not lrs_response.success:
+                    raise LRSResponseError(lrs_response)
+
+                result = lrs_response.content
+                lrs_response = None
+                if result.more:
+                    future = executor.submit(
+                        self.more_statements, result.more, response_format="objects", projection=projection
+                    )
+                else:
+                    future = None
+
+                yield from result.statements
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def export_statements(self, query, since, until, windows=4, max_workers=None, projection=None):
+        """Export the statements stored in a time range by splitting it into
+        `windows` consecutive windows and fetching them concurrently, each
+        one following its own "more" links. Statements are yielded in
+        ascending stored order, window after window.
+
+        Each window is held in memory from the moment its download starts
+        until it has been iterated over, so no more than `max_workers`
+        windows are in flight ahead of the consumer.
+
+        :param query: Dictionary of query parameters and their values,
+        see :meth:`query_statements`. Its "since", "until" and "ascending"
+        values are replaced by the ones of each window.
+        :type query: dict
+        :param since: Export the statements stored after this time (exclusive)
+        :type since: :class:`datetime.datetime` | str | unicode
+        :param until: Export the statements stored at or before this time (inclusive)
+        :type until: :class:`datetime.datetime` | str | unicode
+        :param windows: Number of time windows to split the range into
+        :type windows: int
+        :param max_workers: Number of windows fetched at the same time,
+        defaults to `windows`
+        :type max_workers: int
+        :param projection: The fields of the statements to decode, the others being
+        dropped, see :class:`tincan.projection.Projection`. None (the default) decodes every field.
+        :type projection: :class:`tincan.projection.Projection` | iterable of unicode | None
+        :return: Generator of the exported statements
+        :rtype: generator of :class:`tincan.statement.Statement`
+        :raises: :class:`tincan.lrs_response.LRSResponseError` if a page can not be retrieved
+        """
+        queries = self._export_window_queries(query, since, until, windows)
+        if max_workers is None:
+            max_workers = len(queries)
 
-        return lrs_response
+        fetch_window = functools.partial(self._fetch_window, projection=projection)
+        for statements in self._imap_concurrently(fetch_window, queries, max_workers):
+            yield from statements
+
+    def _fetch_window(self, query, projection=None):
+        return list(self.iter_statements(query, projection=projection))
+
+    @staticmethod
+    def _export_window_queries(query, since, until, windows):
+        """Splits the (since, until] range into consecutive windows and
+        returns one query per window, in ascending order. The boundary between
+        two windows is the exact same timestamp, so that every statement falls
+        into exactly one of them.
 
-    def more_statements(self, more_url):
+        :rtype: list of dict
+        """
+        since = make_datetime(since).astimezone(utc)
+        until = make_datetime(until).astimezone(utc)
+        if until <= since:
+            raise ValueError(f"'until' must be later than 'since' to export statements, got {since} and {until}")
+        if windows is None or int(windows) < 1:
+            raise ValueError("Number of windows to export statements must be a positive integer")
+
+        windows = int(windows)
+        step = (until - since) / windows
+        bounds = [since + step * i for i in range(windows)] + [until]
+
+        queries = []
+        for start, end in zip(bounds, bounds[1:]):
+            window_query = dict(query)
+            window_query["since"] = start.isoformat()
+            window_query["until"] = end.isoformat()
+            window_query["ascending"] = True
+            queries.append(window_query)
+
+        return queries
+
+    def more_statements(self, more_url, response_format=None, projection=None):
         """Query the LRS for more statements
 
-        :param more_url: URL from a StatementsResult object used to retrieve more statements
-        :type more_url: str | unicode
+        :param more_url: URL from a StatementsResult object used to retrieve more statements,
+        or the StatementsResult itself
+        :type more_url: str | unicode | :class:`tincan.statements_result.StatementsResult` | dict
+        :param response_format: How to hand out the statements, one of
+        :data:`tincan.remote_lrs.RESPONSE_FORMATS`. Defaults to :attr:`response_format`.
+        :type response_format: unicode | None
+        :param projection: The fields of the statements to decode, the others being
+        dropped, see :class:`tincan.projection.Projection`. None (the default) decodes every field.
+        :type projection: :class:`tincan.projection.Projection` | iterable of unicode | None
         :return: LRS Response object with the returned StatementsResult object as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        lrs_response = self._send_request(self._more_statements_request(more_url), attachments=True)
+        return self._statements_response(
+            lrs_response, self._statements_result_class, response_format, Projection.of(projection)
+        )
+
+    def _more_statements_request(self, more_url):
+        """Builds the request sent by :meth:`more_statements`
+
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
         if isinstance(more_url, StatementsResult):
             more_url = more_url.more
+        elif isinstance(more_url, dict):
+            more_url = more_url.get("more")
 
-        more_url = self.get_endpoint_server_root() + more_url
-
-        request = HTTPRequest(
+        return HTTPRequest(
             method="GET",
-            resource=more_url
+            resource=self.get_endpoint_server_root() + more_url
         )
 
-        lrs_response = self._send_request(request)
+    def _stream_statements(self, request, projection=None):
+        """Sends a request for statements and parses the response while it
+        is being read, see :class:`tincan.statements_result_parser.StatementsResultParser`
 
-        if lrs_response.success:
-            lrs_response.content = StatementsResult.from_json(lrs_response.data)
+        :param request: HTTPRequest object
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        :param projection: The fields of the statements to keep, see
+        :class:`tincan.projection.Projection`
+        :type projection: :class:`tincan.projection.Projection` | None
+        :return: Generator of the statements of the response, returning its "more" link
+        :rtype: generator of :class:`tincan.statement.Statement`
+        :raises: :class:`tincan.lrs_response.LRSResponseError` if the request fails
+        """
+        limiter = self._rate_limiter
+        web_req, host, response = self._open_stream(request, limiter)
+        released = False
+        try:
+            read = self._body_reader(response)
+            boundary = multipart_boundary(response.getheader("Content-Type"))
+            if boundary is None:
+                parts = None
+                chunks = iter(lambda: read(self.stream_chunk_size), b"")
+            else:
+                # the statements are the first part, attachment payloads can
+                # not be handed out along with them and are skipped
+                parts = read_multipart(read, boundary, self.stream_chunk_size)
+                _, chunks = next(parts, (None, ()))
+
+            parser = StatementsResultParser(trusted=self._trusted, lazy=self._lazy, projection=projection)
+            for chunk in chunks:
+                yield from parser.feed(chunk)
+            if parts is not None:
+                for _, chunks in parts:
+                    for _ in chunks:
+                        pass
+
+            statements = parser.close()
+            self._release_connection(web_req, host, response)
+            released = True
+
+            yield from statements
+            return parser.more
+        finally:
+            if not released:
+                # the response was not read to its end
+                self.connection_pool.discard(web_req)
+            if limiter is not None:
+                limiter.release()
+
+    def _open_stream(self, request, limiter=None):
+        """Sends request until it gets a successful response, whose body is
+        left unread, or the retry policy gives up
 
-        return lrs_response
+        :param request: HTTPRequest object
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        :param limiter: Rate limiter to acquire before each attempt, which is
+        released on failure, and left for the caller to release on success
+        :type limiter: :class:`tincan.rate_limiter.RateLimiter`
+        :return: The connection, its pool key and the response, see :meth:`_open_request`
+        :rtype: tuple(:class:`http.client.HTTPConnection`, tuple, :class:`http.client.HTTPResponse`)
+        :raises: :class:`tincan.lrs_response.LRSResponseError` if the request fails
+        """
+        attempt = 1
+        while True:
+            timings = {}
+            start = time.perf_counter()
+            self._call_hooks("before_request", request)
+            if limiter is not None:
+                timings["queue"] = limiter.acquire()
+            try:
+                web_req, host, response, _ = self._open_request(request, timings=timings)
+            except Exception as e:
+                if limiter is not None:
+                    limiter.release()
+                self._call_hooks("on_error", request, e)
+                delay = self._retry_delay(request, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                if 200 <= response.status < 300:
+                    # the hooks hear of the response before its body is read
+                    lrs_response = self._make_response(request, response, None)
+                    timings["total"] = time.perf_counter() - start
+                    lrs_response.timings = timings
+                    self._call_hooks("after_response", request, lrs_response)
+                    return web_req, host, response
+
+                try:
+                    read_start = time.perf_counter()
+                    data = self._body_reader(response)()
+                    timings["read"] = time.perf_counter() - read_start
+                except BaseException as e:
+                    self.connection_pool.discard(web_req)
+                    if isinstance(e, Exception):
+                        self._call_hooks("on_error", request, e)
+                    raise
+                finally:
+                    if limiter is not None:
+                        limiter.release()
+                self._release_connection(web_req, host, response)
+
+                lrs_response = self._make_response(request, response, data)
+                timings["total"] = time.perf_counter() - start
+                lrs_response.timings = timings
+                self._call_hooks("after_response", request, lrs_response)
+
+                delay = self._retry_delay(request, attempt, response=response)
+                if delay is None:
+                    raise LRSResponseError(lrs_response)
+
+            attempt += 1
+            time.sleep(delay)
 
     def retrieve_state_ids(self, activity, agent, registration=None, since=None):
         """Retrieve state id's from the LRS with the provided parameters
@@ -391,6 +1433,14 @@ class RemoteLRS(Base):
         :return: LRS Response object with the retrieved state id's as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        lrs_response = self._send_request(self._state_ids_request(activity, agent, registration, since))
+        return self._ids_response(lrs_response)
+
+    def _state_ids_request(self, activity, agent, registration=None, since=None):
+        """Builds the request sent by :meth:`retrieve_state_ids`
+
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
         if not isinstance(activity, Activity):
             activity = Activity(activity)
 
@@ -403,7 +1453,7 @@ class RemoteLRS(Base):
         )
         request.query_params = {
             "activityId": activity.id,
-            "agent": agent.to_json(self.version)
+            "agent": agent.to_query_param(self.version, codec=self._codec)
         }
 
         if registration is not None:
@@ -411,10 +1461,15 @@ class RemoteLRS(Base):
         if since is not None:
             request.query_params["since"] = since
 
-        lrs_response = self._send_request(request)
+        return request
 
+    def _ids_response(self, lrs_response):
+        """Decodes an LRS Response holding a JSON list of ids
+
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
         if lrs_response.success:
-            lrs_response.content = json.loads(lrs_response.data)
+            self._decode_content(lrs_response, get_codec(self._codec).loads)
 
         return lrs_response
 
@@ -432,6 +1487,17 @@ class RemoteLRS(Base):
         :return: LRS Response object with retrieved state document as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        request, doc = self._retrieve_state_request(activity, agent, state_id, registration)
+        key, cached = self._cached_document(request)
+        lrs_response = self._send_request(request)
+        return self._retrieve_document_response(lrs_response, doc, key, cached)
+
+    def _retrieve_state_request(self, activity, agent, state_id, registration=None):
+        """Builds the request sent by :meth:`retrieve_state`
+
+        :return: The request, and the document to fill in from the response
+        :rtype: tuple(:class:`tincan.http_request.HTTPRequest`, :class:`tincan.documents.state_document.StateDocument`)
+        """
         if not isinstance(activity, Activity):
             activity = Activity(activity)
 
@@ -446,32 +1512,40 @@ class RemoteLRS(Base):
 
         request.query_params = {
             "activityId": activity.id,
-            "agent": agent.to_json(self.version),
+            "agent": agent.to_query_param(self.version, codec=self._codec),
             "stateId": state_id
         }
 
         if registration is not None:
             request.query_params["registration"] = registration
 
-        lrs_response = self._send_request(request)
+        doc = StateDocument(
+            id=state_id,
+            activity=activity,
+            agent=agent
+        )
+        if registration is not None:
+            doc.registration = registration
 
-        if lrs_response.success:
-            doc = StateDocument(
-                id=state_id,
-                content=lrs_response.data,
-                activity=activity,
-                agent=agent
-            )
-            if registration is not None:
-                doc.registration = registration
+        return request, doc
 
-            headers = lrs_response.response.getheaders()
-            if "lastModified" in headers and headers["lastModified"] is not None:
-                doc.timestamp = headers["lastModified"]
-            if "contentType" in headers and headers["contentType"] is not None:
-                doc.content_type = headers["contentType"]
-            if "etag" in headers and headers["etag"] is not None:
-                doc.etag = headers["etag"]
+    def _retrieve_document_response(self, lrs_response, doc, key, cached):
+        """Decodes the LRS Response to a document retrieval into doc, or into
+        the cached document when the LRS answered 304 Not Modified
+
+        :param doc: The document built along with the request, without content
+        :type doc: :class:`tincan.documents.document.Document`
+        :param key: The cache key of the request, see :meth:`_cached_document`
+        :param cached: The cached document of the request, if any
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        if self._not_modified(lrs_response, cached):
+            return lrs_response
+
+        if lrs_response.success:
+            doc.content = lrs_response.data
+            self._set_document_headers(doc, lrs_response)
+            self._cache_document(key, doc, lrs_response)
 
             lrs_response.content = doc
 
@@ -485,28 +1559,60 @@ class RemoteLRS(Base):
         :return: LRS Response object with saved state as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        request = self._save_state_request(state)
+        lrs_response = self._send_request(request)
+        return self._save_document_response(lrs_response, request, state)
+
+    def _save_state_request(self, state):
+        """Builds the request sent by :meth:`save_state`
+
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
+        request = self._save_document_request("activities/state", state)
+        request.query_params = {
+            "stateId": state.id,
+            "activityId": state.activity.id,
+            "agent": state.agent.to_query_param(self.version, codec=self._codec)
+        }
+        if state.registration is not None:
+            request.query_params["registration"] = state.registration
+
+        return request
+
+    @staticmethod
+    def _save_document_request(resource, doc):
+        """Builds a request putting doc, its query parameters left to the caller
+
+        :param resource: "activities/state", "activities/profile" or "agents/profile"
+        :type resource: unicode
+        :type doc: :class:`tincan.documents.document.Document`
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
         request = HTTPRequest(
             method="PUT",
-            resource="activities/state",
-            content=state.content,
+            resource=resource,
+            content=doc.content,
         )
-        if state.content_type is not None:
-            request.headers["Content-Type"] = state.content_type
+        if doc.content_type is not None:
+            request.headers["Content-Type"] = doc.content_type
         else:
             request.headers["Content-Type"] = "application/octet-stream"
 
-        if state.etag is not None:
-            request.headers["If-Match"] = state.etag
+        if doc.etag is not None:
+            request.headers["If-Match"] = doc.etag
 
-        request.query_params = {
-            "stateId": state.id,
-            "activityId": state.activity.id,
-            "agent": state.agent.to_json(self.version)
-        }
-        lrs_response = self._send_request(request)
-        lrs_response.content = state
+        return request
 
-        return self._send_request(request)
+    def _save_document_response(self, lrs_response, request, doc):
+        """Finishes a document save, dropping the cached copies the request
+        made stale and handing out doc as content
+
+        :rtype: :class:`tincan.lrs_response.LRSResponse`
+        """
+        self._forget_documents(request)
+        lrs_response.content = doc
+
+        return lrs_response
 
     def _delete_state(self, activity, agent, state_id=None, registration=None, etag=None):
         """Private method to delete a specified state from the LRS
@@ -524,6 +1630,17 @@ class RemoteLRS(Base):
         :return: LRS Response object with deleted state as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        request = self._delete_state_request(activity, agent, state_id, registration, etag)
+        lrs_response = self._send_request(request)
+        self._forget_documents(request)
+
+        return lrs_response
+
+    def _delete_state_request(self, activity, agent, state_id=None, registration=None, etag=None):
+        """Builds the request sent by :meth:`_delete_state`
+
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
         if not isinstance(activity, Activity):
             activity = Activity(activity)
 
@@ -540,7 +1657,7 @@ class RemoteLRS(Base):
 
         request.query_params = {
             "activityId": activity.id,
-            "agent": agent.to_json(self.version)
+            "agent": agent.to_query_param(self.version, codec=self._codec)
         }
         if state_id is not None:
             request.query_params["stateId"] = state_id
@@ -548,9 +1665,7 @@ class RemoteLRS(Base):
         if registration is not None:
             request.query_params["registration"] = registration
 
-        lrs_response = self._send_request(request)
-
-        return lrs_response
+        return request
 
     def delete_state(self, state):
         """Delete a specified state from the LRS
@@ -564,6 +1679,7 @@ class RemoteLRS(Base):
             activity=state.activity,
             agent=state.agent,
             state_id=state.id,
+            registration=state.registration,
             etag=state.etag
         )
 
@@ -585,6 +1701,98 @@ class RemoteLRS(Base):
             registration=registration
         )
 
+    def retrieve_states(self, keys, max_workers=4):
+        """Retrieves many state documents, sending up to `max_workers`
+        requests at a time over the pooled connections
+
+        :param keys: The states to retrieve, each given either as a
+        StateDocument whose activity, agent, id and registration are used, or
+        as a tuple of the arguments of :meth:`retrieve_state`
+        :type keys: list of :class:`tincan.documents.state_document.StateDocument` | list of tuple
+        :param max_workers: Number of requests sent concurrently
+        :type max_workers: int
+        :return: LRS Batch Response object with the LRS Response of each key,
+        in order, and the list of retrieved documents as content, holding None
+        for the states that were not found or could not be retrieved
+        :rtype: :class:`tincan.lrs_batch_response.LRSBatchResponse`
+        """
+        responses = self._map_states(
+            lambda key: self.retrieve_state(*self._state_key(key)), keys, max_workers
+        )
+        return LRSBatchResponse(responses=responses, content=[self._found_state(r) for r in responses])
+
+    def save_states(self, states, max_workers=4):
+        """Saves many state documents, sending up to `max_workers` requests at
+        a time over the pooled connections. Each document is saved as by
+        :meth:`save_state`, only over its current version on the LRS when it
+        has an etag, so the ones changed by someone else since they were
+        retrieved fail with a 412 on their own.
+
+        :param states: State documents to be saved
+        :type states: list of :class:`tincan.documents.state_document.StateDocument`
+        :param max_workers: Number of requests sent concurrently
+        :type max_workers: int
+        :return: LRS Batch Response object with the LRS Response of each
+        document, in order, and the list of documents as content
+        :rtype: :class:`tincan.lrs_batch_response.LRSBatchResponse`
+        """
+        states = list(states)
+        responses = self._map_states(self.save_state, states, max_workers)
+        return LRSBatchResponse(responses=responses, content=states)
+
+    def delete_states(self, states, max_workers=4):
+        """Deletes many state documents, sending up to `max_workers` requests
+        at a time over the pooled connections. As with :meth:`delete_state`,
+        documents with an etag are only deleted if they have not changed
+        since they were retrieved.
+
+        :param states: State documents to be deleted
+        :type states: list of :class:`tincan.documents.state_document.StateDocument`
+        :param max_workers: Number of requests sent concurrently
+        :type max_workers: int
+        :return: LRS Batch Response object with the LRS Response of each document, in order
+        :rtype: :class:`tincan.lrs_batch_response.LRSBatchResponse`
+        """
+        return LRSBatchResponse(responses=self._map_states(self.delete_state, states, max_workers))
+
+    def _map_states(self, call, items, max_workers):
+        """Calls an LRS method on each of items concurrently, see
+        :meth:`_map_concurrently`. An item whose call raises gets an
+        unsuccessful LRS Response holding the exception as content.
+
+        :param call: LRS method taking an item and returning an LRS Response
+        :type call: callable
+        :rtype: list of :class:`tincan.lrs_response.LRSResponse`
+        """
+        def call_item(item):
+            try:
+                return call(item)
+            except Exception as e:
+                return LRSResponse(success=False, content=e)
+
+        return self._map_concurrently(call_item, items, max_workers)
+
+    @staticmethod
+    def _state_key(key):
+        """Turns a key of :meth:`retrieve_states` into the arguments of :meth:`retrieve_state`
+
+        :rtype: tuple
+        """
+        if isinstance(key, StateDocument):
+            return key.activity, key.agent, key.id, key.registration
+        return tuple(key)
+
+    @staticmethod
+    def _found_state(lrs_response):
+        """Returns the document an LRS Response of :meth:`retrieve_state`
+        holds, or None if the state was not found or could not be retrieved
+
+        :rtype: :class:`tincan.documents.state_document.StateDocument` | None
+        """
+        if not lrs_response.success or lrs_response.response.status == 404:
+            return None
+        return lrs_response.content
+
     def retrieve_activity_profile_ids(self, activity, since=None):
         """Retrieve activity profile id(s) with the specified parameters
 
@@ -595,6 +1803,15 @@ class RemoteLRS(Base):
         :return: LRS Response object with list of retrieved activity profile id's as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        lrs_response = self._send_request(self._activity_profile_ids_request(activity, since))
+        return self._ids_response(lrs_response)
+
+    @staticmethod
+    def _activity_profile_ids_request(activity, since=None):
+        """Builds the request sent by :meth:`retrieve_activity_profile_ids`
+
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
         if not isinstance(activity, Activity):
             activity = Activity(activity)
 
@@ -607,12 +1824,7 @@ class RemoteLRS(Base):
         if since is not None:
             request.query_params["since"] = since
 
-        lrs_response = self._send_request(request)
-
-        if lrs_response.success:
-            lrs_response.content = json.loads(lrs_response.data)
-
-        return lrs_response
+        return request
 
     def retrieve_activity_profile(self, activity, profile_id):
         """Retrieve activity profile with the specified parameters
@@ -624,6 +1836,19 @@ class RemoteLRS(Base):
         :return: LRS Response object with an activity profile doc as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        request, doc = self._retrieve_activity_profile_request(activity, profile_id)
+        key, cached = self._cached_document(request)
+        lrs_response = self._send_request(request)
+        return self._retrieve_document_response(lrs_response, doc, key, cached)
+
+    @staticmethod
+    def _retrieve_activity_profile_request(activity, profile_id):
+        """Builds the request sent by :meth:`retrieve_activity_profile`
+
+        :return: The request, and the document to fill in from the response
+        :rtype: tuple(:class:`tincan.http_request.HTTPRequest`,
+        :class:`tincan.documents.activity_profile_document.ActivityProfileDocument`)
+        """
         if not isinstance(activity, Activity):
             activity = Activity(activity)
 
@@ -636,25 +1861,12 @@ class RemoteLRS(Base):
             "profileId": profile_id,
             "activityId": activity.id
         }
-        lrs_response = self._send_request(request)
-
-        if lrs_response.success:
-            doc = ActivityProfileDocument(
-                id=profile_id,
-                content=lrs_response.data,
-                activity=activity
-            )
-            headers = lrs_response.response.getheaders()
-            if "lastModified" in headers and headers["lastModified"] is not None:
-                doc.timestamp = headers["lastModified"]
-            if "contentType" in headers and headers["contentType"] is not None:
-                doc.content_type = headers["contentType"]
-            if "etag" in headers and headers["etag"] is not None:
-                doc.etag = headers["etag"]
-
-            lrs_response.content = doc
+        doc = ActivityProfileDocument(
+            id=profile_id,
+            activity=activity
+        )
 
-        return lrs_response
+        return request, doc
 
     def save_activity_profile(self, profile):
         """Save an activity profile doc to the LRS
@@ -664,27 +1876,22 @@ class RemoteLRS(Base):
         :return: LRS Response object with the saved activity profile doc as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
-        request = HTTPRequest(
-            method="PUT",
-            resource="activities/profile",
-            content=profile.content
-        )
-        if profile.content_type is not None:
-            request.headers["Content-Type"] = profile.content_type
-        else:
-            request.headers["Content-Type"] = "application/octet-stream"
+        request = self._save_activity_profile_request(profile)
+        lrs_response = self._send_request(request)
+        return self._save_document_response(lrs_response, request, profile)
 
-        if profile.etag is not None:
-            request.headers["If-Match"] = profile.etag
+    def _save_activity_profile_request(self, profile):
+        """Builds the request sent by :meth:`save_activity_profile`
 
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
+        request = self._save_document_request("activities/profile", profile)
         request.query_params = {
             "profileId": profile.id,
             "activityId": profile.activity.id
         }
-        lrs_response = self._send_request(request)
-        lrs_response.content = profile
 
-        return lrs_response
+        return request
 
     def delete_activity_profile(self, profile):
         """Delete activity profile doc from LRS
@@ -694,6 +1901,18 @@ class RemoteLRS(Base):
         :return: LRS Response object
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        request = self._delete_activity_profile_request(profile)
+        lrs_response = self._send_request(request)
+        self._forget_documents(request)
+
+        return lrs_response
+
+    @staticmethod
+    def _delete_activity_profile_request(profile):
+        """Builds the request sent by :meth:`delete_activity_profile`
+
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
         request = HTTPRequest(
             method="DELETE",
             resource="activities/profile"
@@ -706,7 +1925,7 @@ class RemoteLRS(Base):
         if profile.etag is not None:
             request.headers["If-Match"] = profile.etag
 
-        return self._send_request(request)
+        return request
 
     def retrieve_agent_profile_ids(self, agent, since=None):
         """Retrieve agent profile id(s) with the specified parameters
@@ -718,6 +1937,14 @@ class RemoteLRS(Base):
         :return: LRS Response object with list of retrieved agent profile id's as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        lrs_response = self._send_request(self._agent_profile_ids_request(agent, since))
+        return self._ids_response(lrs_response)
+
+    def _agent_profile_ids_request(self, agent, since=None):
+        """Builds the request sent by :meth:`retrieve_agent_profile_ids`
+
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
         if not isinstance(agent, Agent):
             agent = Agent(agent)
 
@@ -725,17 +1952,12 @@ class RemoteLRS(Base):
             method="GET",
             resource="agents/profile"
         )
-        request.query_params["agent"] = agent.to_json(self.version)
+        request.query_params["agent"] = agent.to_query_param(self.version, codec=self._codec)
 
         if since is not None:
             request.query_params["since"] = since
 
-        lrs_response = self._send_request(request)
-
-        if lrs_response.success:
-            lrs_response.content = json.loads(lrs_response.data)
-
-        return lrs_response
+        return request
 
     def retrieve_agent_profile(self, agent, profile_id):
         """Retrieve agent profile with the specified parameters
@@ -747,6 +1969,18 @@ class RemoteLRS(Base):
         :return: LRS Response object with an agent profile doc as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        request, doc = self._retrieve_agent_profile_request(agent, profile_id)
+        key, cached = self._cached_document(request)
+        lrs_response = self._send_request(request)
+        return self._retrieve_document_response(lrs_response, doc, key, cached)
+
+    def _retrieve_agent_profile_request(self, agent, profile_id):
+        """Builds the request sent by :meth:`retrieve_agent_profile`
+
+        :return: The request, and the document to fill in from the response
+        :rtype: tuple(:class:`tincan.http_request.HTTPRequest`,
+        :class:`tincan.documents.agent_profile_document.AgentProfileDocument`)
+        """
         if not isinstance(agent, Agent):
             agent = Agent(agent)
 
@@ -757,28 +1991,14 @@ class RemoteLRS(Base):
         )
         request.query_params = {
             "profileId": profile_id,
-            "agent": agent.to_json(self.version)
+            "agent": agent.to_query_param(self.version, codec=self._codec)
         }
+        doc = AgentProfileDocument(
+            id=profile_id,
+            agent=agent
+        )
 
-        lrs_response = self._send_request(request)
-
-        if lrs_response.success:
-            doc = AgentProfileDocument(
-                id=profile_id,
-                content=lrs_response.data,
-                agent=agent
-            )
-            headers = lrs_response.response.getheaders()
-            if "lastModified" in headers and headers["lastModified"] is not None:
-                doc.timestamp = headers["lastModified"]
-            if "contentType" in headers and headers["contentType"] is not None:
-                doc.content_type = headers["contentType"]
-            if "etag" in headers and headers["etag"] is not None:
-                doc.etag = headers["etag"]
-
-            lrs_response.content = doc
-
-        return lrs_response
+        return request, doc
 
     def save_agent_profile(self, profile):
         """Save an agent profile doc to the LRS
@@ -788,27 +2008,22 @@ class RemoteLRS(Base):
         :return: LRS Response object with the saved agent profile doc as content
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
-        request = HTTPRequest(
-            method="PUT",
-            resource="agents/profile",
-            content=profile.content,
-        )
-        if profile.content_type is not None:
-            request.headers["Content-Type"] = profile.content_type
-        else:
-            request.headers["Content-Type"] = "application/octet-stream"
+        request = self._save_agent_profile_request(profile)
+        lrs_response = self._send_request(request)
+        return self._save_document_response(lrs_response, request, profile)
 
-        if profile.etag is not None:
-            request.headers["If-Match"] = profile.etag
+    def _save_agent_profile_request(self, profile):
+        """Builds the request sent by :meth:`save_agent_profile`
 
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
+        request = self._save_document_request("agents/profile", profile)
         request.query_params = {
             "profileId": profile.id,
-            "agent": profile.agent.to_json(self.version)
+            "agent": profile.agent.to_query_param(self.version, codec=self._codec)
         }
-        lrs_response = self._send_request(request)
-        lrs_response.content = profile
 
-        return lrs_response
+        return request
 
     def delete_agent_profile(self, profile):
         """Delete agent profile doc from LRS
@@ -818,19 +2033,124 @@ class RemoteLRS(Base):
         :return: LRS Response object
         :rtype: :class:`tincan.lrs_response.LRSResponse`
         """
+        request = self._delete_agent_profile_request(profile)
+        lrs_response = self._send_request(request)
+        self._forget_documents(request)
+
+        return lrs_response
+
+    def _delete_agent_profile_request(self, profile):
+        """Builds the request sent by :meth:`delete_agent_profile`
+
+        :rtype: :class:`tincan.http_request.HTTPRequest`
+        """
         request = HTTPRequest(
             method="DELETE",
             resource="agents/profile"
         )
         request.query_params = {
             "profileId": profile.id,
-            "agent": profile.agent.to_json(self.version)
+            "agent": profile.agent.to_query_param(self.version, codec=self._codec)
         }
 
         if profile.etag is not None:
             request.headers["If-Match"] = profile.etag
 
-        return self._send_request(request)
+        return request
+
+    @staticmethod
+    def _set_document_headers(doc, lrs_response):
+        """Copies document metadata from the response headers onto a retrieved document
+
+        :param doc: The retrieved document
+        :type doc: :class:`tincan.documents.document.Document`
+        :param lrs_response: LRS Response object the document was retrieved with
+        :type lrs_response: :class:`tincan.lrs_response.LRSResponse`
+        """
+        response = lrs_response.response
+
+        last_modified = response.getheader("Last-Modified")
+        if last_modified is not None:
+            try:
+                doc.timestamp = email.utils.parsedate_to_datetime(last_modified)
+            except (TypeError, ValueError, IndexError):
+                pass
+        content_type = response.getheader("Content-Type")
+        if content_type is not None:
+            doc.content_type = content_type
+        etag = response.getheader("ETag")
+        if etag is not None:
+            doc.etag = etag
+
+    def _cached_document(self, request):
+        """Looks up the document a request retrieves in the document cache,
+        asking the LRS to only send it back if it has changed
+
+        :param request: HTTPRequest object retrieving a document
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        :return: The cache key (None without a cache) and the cached document, if any
+        :rtype: tuple(tuple, :class:`tincan.documents.document.Document`)
+        """
+        if self._document_cache is None:
+            return None, None
+
+        key = DocumentCache.key(request.resource, request.query_params)
+        cached = self._document_cache.get(key)
+        if cached is not None:
+            request.headers["If-None-Match"] = cached.etag
+        return key, cached
+
+    @staticmethod
+    def _not_modified(lrs_response, cached):
+        """Hands out the cached document when the LRS answers that it has not changed
+
+        :param lrs_response: The LRS Response to a request for the document
+        :type lrs_response: :class:`tincan.lrs_response.LRSResponse`
+        :param cached: The document returned by :meth:`_cached_document`
+        :type cached: :class:`tincan.documents.document.Document`
+        :return: Whether the LRS Response is done with
+        :rtype: bool
+        """
+        if cached is None or lrs_response.response.status != 304:
+            return False
+
+        lrs_response.success = True
+        lrs_response.content = cached
+        return True
+
+    def _cache_document(self, key, doc, lrs_response):
+        """Caches a document the LRS sent, or forgets it if it was not found
+
+        :param key: The cache key returned by :meth:`_cached_document`
+        :type key: tuple
+        :param doc: The retrieved document
+        :type doc: :class:`tincan.documents.document.Document`
+        :param lrs_response: LRS Response object the document was retrieved with
+        :type lrs_response: :class:`tincan.lrs_response.LRSResponse`
+        """
+        if key is None or self._document_cache is None:
+            return
+
+        if lrs_response.response.status == 200:
+            self._document_cache.put(key, doc)
+        else:
+            self._document_cache.discard(key)
+
+    def _forget_documents(self, request):
+        """Drops the documents a request saving or deleting documents
+        changes from the document cache
+
+        :param request: HTTPRequest object that was sent
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        """
+        if self._document_cache is None:
+            return
+
+        key = DocumentCache.key(request.resource, request.query_params)
+        if key[-1] is None:
+            self._document_cache.discard_matching(key)
+        else:
+            self._document_cache.discard(key)
 
     @property
     def endpoint(self):
@@ -893,6 +2213,239 @@ class RemoteLRS(Base):
             str(value)
         self._auth = value
 
+    @property
+    def connection_pool(self):
+        """Pool of keep-alive connections used for remote LRS communication
+
+        :setter: Must be a :class:`tincan.connection_pool.ConnectionPool`.
+        Setting to None creates a new pool with the default size.
+        :setter type: :class:`tincan.connection_pool.ConnectionPool`
+        :rtype: :class:`tincan.connection_pool.ConnectionPool`
+        """
+        return self._connection_pool
+
+    @connection_pool.setter
+    def connection_pool(self, value):
+        if value is None:
+            value = ConnectionPool()
+        elif not isinstance(value, ConnectionPool):
+            raise TypeError(
+                f"Property 'connection_pool' in 'tincan.{self.__class__.__name__}' must be set with a "
+                f"tincan.ConnectionPool object"
+            )
+        self._connection_pool = value
+
+    @property
+    def trusted(self):
+        """Whether the statements returned by the LRS are trusted to be valid,
+        in which case they are decoded without most of the validation, which
+        is several times faster for large queries
+
+        :setter: Tries to convert to bool
+        :setter type: bool
+        :rtype: bool
+        """
+        return self._trusted
+
+    @trusted.setter
+    def trusted(self, value):
+        self._trusted = bool(value)
+
+    @property
+    def lazy(self):
+        """Whether the statements returned by the LRS are decoded lazily, as
+        :class:`tincan.lazy_statement.LazyStatement` objects that decode each
+        property the first time it is read
+
+        :setter: Tries to convert to bool
+        :setter type: bool
+        :rtype: bool
+        """
+        return self._lazy
+
+    @lazy.setter
+    def lazy(self, value):
+        self._lazy = bool(value)
+
+    @property
+    def response_format(self):
+        """How the statements returned by :meth:`retrieve_statement`,
+        :meth:`retrieve_voided_statement`, :meth:`query_statements` and
+        :meth:`more_statements` are handed out in the content of their LRS
+        Response: "objects" (the default) decodes them to Statement and
+        StatementsResult objects, "dict" to the dicts and lists of their
+        parsed JSON, and "bytes" hands out their JSON as received, so
+        that it can be forwarded without being decoded and encoded again.
+        Each of these methods can override it with its `response_format`
+        argument.
+
+        :setter: Checks that it is one of :data:`RESPONSE_FORMATS`
+        :setter type: unicode
+        :rtype: unicode
+        :raises: ValueError
+        """
+        return self._response_format
+
+    @response_format.setter
+    def response_format(self, value):
+        self._response_format = self._check_response_format(value)
+
+    @property
+    def _statement_class(self):
+        """The class statements returned by the LRS are decoded to
+
+        :rtype: type
+        """
+        return LazyStatement if self._lazy else Statement
+
+    @property
+    def _statements_result_class(self):
+        """The class statement query results are decoded to
+
+        :rtype: type
+        """
+        return LazyStatementsResult if self._lazy else StatementsResult
+
+    @property
+    def codec(self):
+        """JSON codec used to encode requests and decode responses, or None
+        to use the default codec of :mod:`tincan.json_codec`
+
+        :setter: Tries to get the codec with :func:`tincan.json_codec.get_codec`,
+        for instance from the name of its library
+        :setter type: :class:`tincan.json_codec.JSONCodec` | unicode | None
+        :rtype: :class:`tincan.json_codec.JSONCodec` | None
+        :raises: ValueError, ImportError
+        """
+        return self._codec
+
+    @codec.setter
+    def codec(self, value):
+        self._codec = None if value is None else get_codec(value)
+
+    @property
+    def compress_requests(self):
+        """Size in bytes from which JSON and text request bodies, such as
+        statement batches, are sent gzip compressed with a Content-Encoding
+        header, or None to never compress them. Not every LRS accepts
+        compressed requests, so this is off by default.
+
+        :setter: Tries to convert to int, None disables compression
+        :setter type: int | None
+        :rtype: int | None
+        :raises: ValueError if negative
+        """
+        return self._compress_requests
+
+    @compress_requests.setter
+    def compress_requests(self, value):
+        if value is not None:
+            value = int(value)
+            if value < 0:
+                raise ValueError(f"compress_requests must be None or a size in bytes, got {value}")
+        self._compress_requests = value
+
+    @property
+    def compress_responses(self):
+        """Whether the LRS is asked for gzip or deflate compressed responses.
+        Compressed responses are decompressed either way.
+
+        :setter: Tries to convert to bool
+        :setter type: bool
+        :rtype: bool
+        """
+        return self._compress_responses
+
+    @compress_responses.setter
+    def compress_responses(self, value):
+        self._compress_responses = bool(value)
+
+    @property
+    def retry_policy(self):
+        """When to send failed requests again, see :class:`tincan.retry_policy.RetryPolicy`,
+        or None to send each request once
+
+        :setter type: :class:`tincan.retry_policy.RetryPolicy` | None
+        :rtype: :class:`tincan.retry_policy.RetryPolicy` | None
+        :raises: TypeError
+        """
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, value):
+        if value is not None and not isinstance(value, RetryPolicy):
+            raise TypeError(
+                f"Property 'retry_policy' in 'tincan.{self.__class__.__name__}' must be set with a "
+                f"tincan.RetryPolicy object or None"
+            )
+        self._retry_policy = value
+
+    @property
+    def rate_limiter(self):
+        """Limit on the rate and concurrency of the requests sent to the LRS,
+        see :class:`tincan.rate_limiter.RateLimiter`, or None for no limit.
+        Each attempt of a retried request counts, and a streamed page holds
+        its slot until it has been read.
+
+        :setter type: :class:`tincan.rate_limiter.RateLimiter` | None
+        :rtype: :class:`tincan.rate_limiter.RateLimiter` | None
+        :raises: TypeError
+        """
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value):
+        if value is not None and not isinstance(value, RateLimiter):
+            raise TypeError(
+                f"Property 'rate_limiter' in 'tincan.{self.__class__.__name__}' must be set with a "
+                f"tincan.RateLimiter object or None"
+            )
+        self._rate_limiter = value
+
+    @property
+    def hooks(self):
+        """Objects told about every request sent to the LRS and its outcome,
+        see :class:`tincan.instrumentation.RequestHooks`, called in order
+
+        :setter: Tries to convert to list
+        :setter type: list of :class:`tincan.instrumentation.RequestHooks` | None
+        :rtype: list of :class:`tincan.instrumentation.RequestHooks`
+        :raises: TypeError
+        """
+        return self._hooks
+
+    @hooks.setter
+    def hooks(self, value):
+        value = [] if value is None else list(value)
+        for hook in value:
+            if not isinstance(hook, RequestHooks):
+                raise TypeError(
+                    f"Property 'hooks' in 'tincan.{self.__class__.__name__}' must be set with "
+                    f"tincan.RequestHooks objects"
+                )
+        self._hooks = value
+
+    @property
+    def document_cache(self):
+        """Cache of the state and profile documents retrieved from the LRS,
+        see :class:`tincan.document_cache.DocumentCache`, or None to download
+        them every time
+
+        :setter type: :class:`tincan.document_cache.DocumentCache` | None
+        :rtype: :class:`tincan.document_cache.DocumentCache` | None
+        :raises: TypeError
+        """
+        return self._document_cache
+
+    @document_cache.setter
+    def document_cache(self, value):
+        if value is not None and not isinstance(value, DocumentCache):
+            raise TypeError(
+                f"Property 'document_cache' in 'tincan.{self.__class__.__name__}' must be set with a "
+                f"tincan.DocumentCache object or None"
+            )
+        self._document_cache = value
+
     def get_endpoint_server_root(self):
         """Parses RemoteLRS object's endpoint and returns its root
 
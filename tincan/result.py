@@ -17,7 +17,7 @@ from datetime import timedelta
 from tincan.serializable_base import SerializableBase
 from tincan.score import Score
 from tincan.extensions import Extensions
-from tincan.conversions.iso8601 import make_timedelta
+from tincan.conversions.iso8601 import make_timedelta, make_trusted_timedelta
 
 
 class Result(SerializableBase):
@@ -41,6 +41,8 @@ class Result(SerializableBase):
     :type extensions: :class:`tincan.Extensions`
     """
 
+    __slots__ = ('_score', '_success', '_completion', '_duration', '_response', '_extensions')
+
     _props = [
         'score',
         'success',
@@ -60,6 +62,17 @@ class Result(SerializableBase):
 
         super(Result, self).__init__(*args, **kwargs)
 
+    @classmethod
+    def _trusted_converters(cls):
+        return {
+            'score': Score._from_trusted,
+            'success': bool,
+            'completion': bool,
+            'duration': make_trusted_timedelta,
+            'response': str,
+            'extensions': Extensions._from_trusted,
+        }
+
     @property
     def score(self):
         """Score for Result
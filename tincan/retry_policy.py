@@ -0,0 +1,150 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import datetime
+import email.utils
+import http.client
+import random
+import socket
+
+"""
+.. module:: retry_policy
+   :synopsis: When and how long to wait before sending a failed LRS request again.
+
+"""
+
+
+class RetryPolicy(object):
+    """Decides whether a failed request is sent again, and after how long.
+    Set it as the :attr:`tincan.RemoteLRS.retry_policy` to have every LRS call
+    retried::
+
+        lrs.retry_policy = RetryPolicy(max_attempts=5)
+
+    A request is retried when the LRS could not be reached, or when it
+    answers with one of :attr:`retry_statuses`. The LRS may have processed a
+    request whose connection broke, or which failed with a 500, 502, 504 or
+    408, so those are only retried for idempotent requests, see
+    :attr:`tincan.http_request.HTTPRequest.idempotent`. A refused connection,
+    a 429 and a 503 mean that the request was not processed, so they are
+    retried whatever the request.
+
+    The wait before attempt n + 1 is drawn at random between 0 and
+    `backoff` * 2 ** (n - 1) seconds, capped at `max_backoff` ("full jitter"),
+    so that clients failing together do not all come back at the same time.
+    A Retry-After header is honored by waiting that long plus such a random
+    delay, unless it asks for more than `max_retry_after` seconds, in which
+    case the failure is returned to the caller instead.
+
+    :param max_attempts: Most times a request is sent, the first one included
+    :type max_attempts: int
+    :param backoff: Seconds the first wait is at most
+    :type backoff: float
+    :param max_backoff: Most seconds the random part of a wait can be
+    :type max_backoff: float
+    :param max_retry_after: Most seconds a Retry-After header is honored for
+    :type max_retry_after: float
+    """
+
+    retry_statuses = frozenset((408, 429, 500, 502, 503, 504))
+
+    # Statuses telling that the request was not processed at all
+    unprocessed_statuses = frozenset((429, 503))
+
+    retry_errors = (ConnectionError, TimeoutError, socket.timeout, http.client.HTTPException)
+
+    def __init__(self, max_attempts=3, backoff=0.5, max_backoff=30.0, max_retry_after=60.0):
+        if max_attempts is None or int(max_attempts) < 1:
+            raise ValueError("Property 'max_attempts' in a 'tincan.RetryPolicy' must be a positive integer")
+
+        self.max_attempts = int(max_attempts)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+
+    def retry_delay(self, request, attempt, response=None, error=None):
+        """Decides whether to send a request again after an attempt
+
+        :param request: HTTPRequest object that was sent
+        :type request: :class:`tincan.http_request.HTTPRequest`
+        :param attempt: Number of the attempt, starting at 1
+        :type attempt: int
+        :param response: The response to the attempt, if there was one
+        :type response: :class:`http.client.HTTPResponse`
+        :param error: The exception raised by the attempt, if any
+        :type error: Exception
+        :return: Seconds to wait before the next attempt, or None to not retry
+        :rtype: float | None
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(request, response, error):
+            return None
+
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+        retry_after = self.retry_after(response) if response is not None else None
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            delay += retry_after
+
+        return delay
+
+    def is_retryable(self, request, response=None, error=None):
+        """Tells whether an attempt failed in a way that sending the request
+        again may fix, and that is safe to retry for this request
+
+        :rtype: bool
+        """
+        if error is not None:
+            if isinstance(error, ConnectionRefusedError):
+                return True
+            return isinstance(error, self.retry_errors) and bool(request.idempotent)
+
+        if response is None or response.status not in self.retry_statuses:
+            return False
+        return response.status in self.unprocessed_statuses or bool(request.idempotent)
+
+    @staticmethod
+    def retry_after(response):
+        """Returns the seconds to wait from the Retry-After header of a
+        response, given either as seconds or as an HTTP date
+
+        :param response: The response
+        :type response: :class:`http.client.HTTPResponse`
+        :return: The seconds, or None without a valid header
+        :rtype: float | None
+        """
+        value = response.getheader("Retry-After")
+        if not value:
+            return None
+
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if date is None:
+            return None
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=datetime.timezone.utc)
+        return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} max_attempts={self.max_attempts} backoff={self.backoff} "
+            f"max_backoff={self.max_backoff}>"
+        )
@@ -32,6 +32,8 @@ class Score(SerializableBase):
     :type max: float
     """
 
+    __slots__ = ('_scaled', '_raw', '_min', '_max')
+
     _props = [
         'scaled',
         'raw',
@@ -45,7 +47,31 @@ class Score(SerializableBase):
         self._min = None
         self._max = None
 
-        super(SerializableBase, self).__init__(*args, **kwargs)
+        super(Score, self).__init__(*args, **kwargs)
+
+    def _check_conformance(self):
+        if self.scaled is not None and not -1.0 <= self.scaled <= 1.0:
+            raise ValueError(
+                f"Property 'scaled' in a 'tincan.{self.__class__.__name__}' object must be between -1 and 1"
+            )
+        if self.min is not None and self.max is not None and self.min > self.max:
+            raise ValueError(
+                f"Property 'min' in a 'tincan.{self.__class__.__name__}' object must not be greater than 'max'"
+            )
+        if self.raw is not None and (
+                self.min is not None and self.raw < self.min or self.max is not None and self.raw > self.max):
+            raise ValueError(
+                f"Property 'raw' in a 'tincan.{self.__class__.__name__}' object must be between 'min' and 'max'"
+            )
+
+    @classmethod
+    def _trusted_converters(cls):
+        return {
+            'scaled': float,
+            'raw': float,
+            'min': float,
+            'max': float,
+        }
 
     @property
     def scaled(self):
@@ -12,7 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-import json
+import copy
 import uuid
 import datetime
 import re
@@ -20,6 +20,8 @@ import re
 from tincan.base import Base
 from tincan.version import Version
 from tincan.conversions.iso8601 import jsonify_datetime, jsonify_timedelta
+from tincan.json_codec import get_codec
+from tincan.validation import STANDARD, TRUSTED, get_validation_level, validating
 
 
 """
@@ -30,7 +32,76 @@ from tincan.conversions.iso8601 import jsonify_datetime, jsonify_timedelta
 """
 
 
+_MISSING = object()
+_LIST = object()
+_DICT = object()
+
+# How each class is serialized by SerializableBase.as_version, see
+# SerializableBase._serializer_plan
+_serializer_plans = {}
+
+# What SerializableBase._from_trusted needs for each class, see
+# SerializableBase._make_trusted_plan
+_trusted_plans = {}
+
+# Converters from a value to its JSON representation, cached by the type of
+# the value. None means the value is serialized as is.
+_converters = {}
+
+
+def _as_version(value, version):
+    return value.as_version(version)
+
+
+def _list_as_version(value, version):
+    return [v.as_version(version) if isinstance(v, SerializableBase) else v for v in value]
+
+
+def _uuid_as_version(value, version):
+    return str(value)
+
+
+def _timedelta_as_version(value, version):
+    return jsonify_timedelta(value)
+
+
+def _datetime_as_version(value, version):
+    return jsonify_datetime(value)
+
+
+def _value_converter(value_type):
+    """Returns the converter :meth:`SerializableBase.as_version` applies to
+    values of the given type, computing and caching it on first use
+
+    :param value_type: the type of a value to serialize
+    :type value_type: type
+    :rtype: callable | None
+    """
+    try:
+        return _converters[value_type]
+    except KeyError:
+        pass
+
+    if issubclass(value_type, SerializableBase):
+        convert = _as_version
+    elif issubclass(value_type, list):
+        convert = _list_as_version
+    elif issubclass(value_type, uuid.UUID):
+        convert = _uuid_as_version
+    elif issubclass(value_type, datetime.timedelta):
+        convert = _timedelta_as_version
+    elif issubclass(value_type, datetime.datetime):
+        convert = _datetime_as_version
+    else:
+        convert = None
+
+    _converters[value_type] = convert
+    return convert
+
+
 class SerializableBase(Base):
+    __slots__ = ()
+
     _props_corrected = {
         '_more_info': 'moreInfo',
         '_interaction_type': 'interactionType',
@@ -43,6 +114,8 @@ class SerializableBase(Base):
         '_home_page': 'homePage',
     }
 
+    _trusted_renames = {camel: uscore[1:] for uscore, camel in _props_corrected.items()}
+
     _UUID_REGEX = re.compile(
         r'^[a-f0-9]{8}-'
         r'[a-f0-9]{4}-'
@@ -52,6 +125,17 @@ class SerializableBase(Base):
     )
 
     def __init__(self, *args, **kwargs):
+        """Initializes an object from dicts or objects of its properties,
+        and keyword arguments, as :class:`tincan.Base` does. Under the
+        "trusted" validation level, an object built from a single dict skips
+        most conversions and checks, see
+        :func:`tincan.validation.get_validation_level`
+
+        """
+        level = get_validation_level()
+        if level == TRUSTED and len(args) == 1 and not kwargs and type(args[0]) is dict:
+            self._set_trusted(args[0])
+            return
 
         new_kwargs = {}
         for obj in args:
@@ -66,8 +150,44 @@ class SerializableBase(Base):
 
         super(SerializableBase, self).__init__(**new_kwargs)
 
+    def validate(self):
+        """Checks that the object, and the objects it holds, conform to the
+        xAPI specification beyond what the setters of their properties check,
+        for instance that an agent has exactly one identifier or that a
+        scaled score is between -1 and 1. Objects decoded by :meth:`from_json`
+        are checked this way under the "strict" validation level.
+
+        :raises: ValueError
+        """
+        self._validate()
+
+    def _validate(self):
+        """Checks the object and the objects it holds, see :meth:`validate`"""
+        self._check_conformance()
+        for value in vars(self).values():
+            if isinstance(value, SerializableBase):
+                value._validate()
+
+    def _check_conformance(self):
+        """Checks the xAPI conformance rules that the setters of the
+        properties of the object can not check on their own, such as
+        required properties, see :meth:`validate`
+
+        :raises: ValueError
+        """
+        pass
+
+    def _check_required(self, *props):
+        """Checks that properties of the object are set, see :meth:`_check_conformance`
+
+        :raises: ValueError
+        """
+        for prop in props:
+            if getattr(self, prop) is None:
+                raise ValueError(f"Property '{prop}' in a 'tincan.{self.__class__.__name__}' object is required")
+
     @classmethod
-    def from_json(cls, json_data):
+    def from_json(cls, json_data, trusted=False, codec=None):
         """Tries to convert a JSON representation to an object of the same
         type as self
 
@@ -79,17 +199,143 @@ class SerializableBase(Base):
 
         :param json_data: The JSON string to convert
         :type json_data: str | unicode
+        :param trusted: Whether the JSON comes from a trusted source, such as
+        an LRS, in which case most of the validation is skipped (see
+        :meth:`_from_trusted`). The "strict" and "trusted" validation levels
+        override it, the "strict" one also checking the object with
+        :meth:`validate`, see :func:`tincan.validation.get_validation_level`.
+        :type trusted: bool
+        :param codec: The JSON codec to decode with, see
+        :func:`tincan.json_codec.get_codec`. Defaults to the default codec.
+        :type codec: :class:`tincan.json_codec.JSONCodec` | unicode | None
 
         :raises: TypeError, ValueError, LanguageMapInitError
         """
 
-        data = json.loads(json_data)
-        result = cls(data)
+        result = cls._from_data(get_codec(codec).loads(json_data), trusted)
         if hasattr(result, "_from_json"):
             result._from_json()
         return result
 
-    def to_json(self, version=Version.latest):
+    @classmethod
+    def _from_data(cls, data, trusted=False, validate=True):
+        """Builds an object from parsed JSON, as :meth:`from_json` does
+
+        :param data: The parsed JSON of the object
+        :type data: dict
+        :param trusted: Whether the JSON comes from a trusted source, see :meth:`from_json`
+        :type trusted: bool
+        :param validate: Whether the object is complete, and checked with
+        :meth:`validate` under the "strict" validation level. Objects
+        keeping only some of their properties, such as projected statements,
+        are not.
+        :type validate: bool
+        :raises: TypeError, ValueError
+        """
+        level = get_validation_level()
+        if level == STANDARD:
+            return cls._from_trusted(data) if trusted else cls(data)
+        if level == TRUSTED:
+            return cls._from_trusted(data)
+
+        result = cls(data)
+        if validate:
+            result._validate()
+        return result
+
+    @classmethod
+    def _from_trusted(cls, data):
+        """Builds an object from data parsed from a trusted source, which is
+        expected to be valid xAPI, without going through the constructor and
+        :meth:`tincan.Base.__setattr__`
+
+        Properties with a converter in :meth:`_trusted_converters` are
+        converted and stored directly, the others go through their regular
+        setter, so that the result is the same as the one of ``cls(data)``.
+
+        :param data: The parsed JSON of the object
+        :type data: dict
+        """
+        result = cls.__new__(cls)
+        result._set_trusted(data)
+        return result
+
+    def _set_trusted(self, data):
+        """Sets the properties of the object from data parsed from a trusted
+        source, see :meth:`_from_trusted`
+
+        :param data: The parsed JSON of the object
+        :type data: dict
+        """
+        cls = type(self)
+        plan = _trusted_plans.get(cls)
+        if plan is None:
+            plan = cls._make_trusted_plan()
+        defaults, mutable_defaults, converters, setters = plan
+
+        values = defaults.copy()
+        for k in mutable_defaults:
+            values[k] = copy.copy(values[k])
+
+        others = []
+        for k, v in data.items():
+            converter = converters.get(k)
+            if converter is None or v is None:
+                others.append((SerializableBase._trusted_renames.get(k, k), v))
+            else:
+                values[converter[0]] = converter[1](v)
+
+        for k, v in values.items():
+            setters[k](self, v)
+        for k, v in others:
+            setattr(self, k, v)
+
+    @classmethod
+    def _trusted_converters(cls):
+        """Maps the properties that :meth:`_from_trusted` can store without
+        going through their setter to a function converting a (not None)
+        parsed JSON value to the stored value
+
+        :rtype: dict
+        """
+        return {}
+
+    @classmethod
+    def _make_trusted_plan(cls):
+        """Computes and caches what :meth:`_from_trusted` needs for cls: the
+        attributes of a new object, which of them must be copied, the
+        converters keyed by JSON property name and the attribute setters
+
+        :rtype: tuple
+        """
+        with validating(STANDARD):
+            defaults = vars(cls())
+        mutable_defaults = tuple(k for k, v in defaults.items() if isinstance(v, (list, dict)))
+        setters = {k: cls._attribute_setter(k) for k in defaults}
+
+        converters = {}
+        for prop, converter in cls._trusted_converters().items():
+            converters[prop] = ('_' + prop, converter)
+            camel = cls._props_corrected.get('_' + prop)
+            if camel is not None:
+                converters[camel] = converters[prop]
+
+        plan = _trusted_plans[cls] = (defaults, mutable_defaults, converters, setters)
+        return plan
+
+    @classmethod
+    def _attribute_setter(cls, name):
+        """Returns a function storing the given attribute of an object of cls
+        directly, either in its slot or in its instance dict
+
+        :rtype: callable
+        """
+        slot = getattr(cls, name, None)
+        if slot is not None and hasattr(slot, '__set__'):
+            return slot.__set__
+        return lambda obj, value: object.__setattr__(obj, name, value)
+
+    def to_json(self, version=Version.latest, codec=None):
         """Tries to convert an object into a JSON representation and return
         the resulting string
 
@@ -101,9 +347,12 @@ class SerializableBase(Base):
         :param version: The version to which the object must be serialized to.
         This will default to the latest version supported by the library.
         :type version: str | unicode
+        :param codec: The JSON codec to encode with, see
+        :func:`tincan.json_codec.get_codec`. Defaults to the default codec.
+        :type codec: :class:`tincan.json_codec.JSONCodec` | unicode | None
 
         """
-        return json.dumps(self.as_version(version))
+        return get_codec(codec).dumps(self.as_version(version))
 
     def as_version(self, version=Version.latest):
         """Returns a dict that has been modified based on versioning
@@ -117,37 +366,70 @@ class SerializableBase(Base):
         :type version: str | unicode
 
         """
-        if not isinstance(self, list):
+        plan = _serializer_plans.get(type(self))
+        if plan is None:
+            plan = self._serializer_plan()
+
+        if plan is _LIST:
+            return [v.as_version(version) if isinstance(v, SerializableBase) else v for v in self]
+
+        if plan is _DICT:
             result = {}
-            for k, v in iter(self.items()) if isinstance(self, dict) else iter(vars(self).items()):
+            for k, v in self.items():
                 k = self._props_corrected.get(k, k)
-                if isinstance(v, SerializableBase):
-                    result[k] = v.as_version(version)
-                elif isinstance(v, list):
-                    result[k] = []
-                    for val in v:
-                        if isinstance(val, SerializableBase):
-                            result[k].append(val.as_version(version))
-                        else:
-                            result[k].append(val)
-                elif isinstance(v, uuid.UUID):
-                    result[k] = str(v)
-                elif isinstance(v, datetime.timedelta):
-                    result[k] = jsonify_timedelta(v)
-                elif isinstance(v, datetime.datetime):
-                    result[k] = jsonify_datetime(v)
-                else:
-                    result[k] = v
-            result = self._filter_none(result)
-        else:
-            result = []
-            for v in self:
-                if isinstance(v, SerializableBase):
-                    result.append(v.as_version(version))
-                else:
-                    result.append(v)
+                convert = _value_converter(type(v))
+                result[k] = v if convert is None else convert(v, version)
+            return self._filter_none(result)
+
+        result = {}
+        converters_get = _converters.get
+        for k, v in vars(self).items():
+            if v is None:
+                continue
+            key = plan.get(k)
+            if key is None:
+                key = plan[k] = self._serializer_key(k)
+            convert = converters_get(type(v), _MISSING)
+            if convert is None:
+                result[key] = v
+            elif convert is _as_version:
+                result[key] = v.as_version(version)
+            else:
+                if convert is _MISSING:
+                    convert = _value_converter(type(v))
+                result[key] = v if convert is None else convert(v, version)
         return result
 
+    @classmethod
+    def _serializer_plan(cls):
+        """Computes and caches how :meth:`as_version` serializes objects of
+        cls: as a list, as a dict, or attribute by attribute, in which case the
+        plan maps each attribute to its JSON property name. Attributes that are
+        not properties are added to the plan the first time they are seen.
+
+        :rtype: dict
+        """
+        if issubclass(cls, list):
+            plan = _LIST
+        elif issubclass(cls, dict):
+            plan = _DICT
+        else:
+            plan = {'_' + k: cls._serializer_key('_' + k) for k in cls._props}
+        _serializer_plans[cls] = plan
+        return plan
+
+    @classmethod
+    def _serializer_key(cls, attr):
+        """Returns the JSON property name an attribute is serialized to, as
+        :meth:`as_version` and :meth:`_filter_none` compute it
+
+        :param attr: the attribute name
+        :type attr: str
+        :rtype: str
+        """
+        key = cls._props_corrected.get(attr, attr)
+        return key[1:] if key.startswith('_') else key
+
     @staticmethod
     def _filter_none(obj):
         """Filters out attributes set to None prior to serialization, and
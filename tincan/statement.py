@@ -23,7 +23,8 @@ from tincan.result import Result
 from tincan.substatement import SubStatement
 from tincan.statement_ref import StatementRef
 from tincan.activity import Activity
-from tincan.conversions.iso8601 import make_datetime
+from tincan.interner import interned
+from tincan.conversions.iso8601 import make_datetime, make_trusted_datetime
 from tincan.version import Version
 
 
@@ -34,6 +35,8 @@ from tincan.version import Version
 
 
 class Statement(StatementBase):
+    __slots__ = ("_id", "_stored", "_authority", "_result", "_version")
+
     _UUID_REGEX = re.compile(
         r'^[a-f0-9]{8}-'
         r'[a-f0-9]{4}-'
@@ -65,6 +68,39 @@ class Statement(StatementBase):
 
         super(Statement, self).__init__(*args, **kwargs)
 
+    def _check_conformance(self):
+        super(Statement, self)._check_conformance()
+        if self.version is not None and not self.version.startswith('1.0.'):
+            raise ValueError(
+                f"Property 'version' in a 'tincan.{self.__class__.__name__}' object must be a 1.0.x version"
+            )
+
+    @classmethod
+    def _trusted_converters(cls):
+        converters = super(Statement, cls)._trusted_converters()
+        converters.update({
+            'id': uuid.UUID,
+            'object': cls._trusted_object,
+            'stored': make_trusted_datetime,
+            'authority': Agent._from_trusted,
+            'result': Result._from_trusted,
+            'version': str,
+        })
+        return converters
+
+    @staticmethod
+    def _trusted_object(value):
+        object_type = value.get('objectType', value.get('object_type'))
+        if object_type == 'Agent':
+            return Agent._from_trusted(value)
+        elif object_type == 'Group':
+            return Group._from_trusted(value)
+        elif object_type == 'SubStatement':
+            return SubStatement._from_trusted(value)
+        elif object_type == 'StatementRef':
+            return StatementRef._from_trusted(value)
+        return interned(Activity._from_trusted, value)
+
     @property
     def id(self):
         """Id for Statement
@@ -121,13 +157,13 @@ class Statement(StatementBase):
                         elif value['object_type'] == 'StatementRef':
                             value = StatementRef(value)
                         elif value['object_type'] == 'Activity':
-                            value = Activity(value)
+                            value = interned(Activity, value)
                         elif value['object_type'] == 'Group':
                             value = Group(value)
                         else:
-                            value = Activity(value)
+                            value = interned(Activity, value)
                     else:
-                        value = Activity(value)
+                        value = interned(Activity, value)
         self._object = value
 
     @object.deleter
@@ -18,10 +18,12 @@ from tincan.serializable_base import SerializableBase
 from tincan.agent import Agent
 from tincan.group import Group
 from tincan.verb import Verb
+from tincan.activity import Activity
 from tincan.context import Context
 from tincan.attachment import Attachment
 from tincan.attachment_list import AttachmentList
-from tincan.conversions.iso8601 import make_datetime
+from tincan.interner import interned
+from tincan.conversions.iso8601 import make_datetime, make_trusted_datetime
 
 
 """
@@ -33,6 +35,8 @@ from tincan.conversions.iso8601 import make_datetime
 
 
 class StatementBase(SerializableBase):
+    __slots__ = ('_actor', '_verb', '_object', '_timestamp', '_context', '_attachments')
+
     _props_req = [
         'actor',
         'verb',
@@ -57,6 +61,35 @@ class StatementBase(SerializableBase):
 
         super(StatementBase, self).__init__(*args, **kwargs)
 
+    def _check_conformance(self):
+        self._check_required('actor', 'verb', 'object')
+        context = self.context
+        if context is not None and (context.revision is not None or context.platform is not None):
+            if not isinstance(self.object, Activity):
+                raise ValueError(
+                    f"The context of a 'tincan.{self.__class__.__name__}' object can only have a revision "
+                    f"or a platform if its object is an activity"
+                )
+
+    @classmethod
+    def _trusted_converters(cls):
+        return {
+            'actor': cls._trusted_actor,
+            'verb': cls._trusted_verb,
+            'timestamp': make_trusted_datetime,
+            'context': Context._from_trusted,
+        }
+
+    @staticmethod
+    def _trusted_verb(value):
+        return interned(Verb._from_trusted, value)
+
+    @staticmethod
+    def _trusted_actor(value):
+        if value.get('objectType', value.get('object_type')) == 'Group':
+            return Group._from_trusted(value)
+        return Agent._from_trusted(value)
+
     @property
     def actor(self):
         """Actor for StatementBase
@@ -104,7 +137,7 @@ class StatementBase(SerializableBase):
     @verb.setter
     def verb(self, value):
         if value is not None and not isinstance(value, Verb):
-            value = Verb(value)
+            value = interned(Verb, value)
         self._verb = value
 
     @verb.deleter
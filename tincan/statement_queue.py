@@ -0,0 +1,378 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import random
+import sqlite3
+import threading
+import time
+import uuid
+
+from tincan.statement import Statement
+from tincan.statement_list import StatementList
+
+"""
+.. module:: statement_queue
+   :synopsis: Store-and-forward queue persisting statements to a local SQLite
+   journal and sending them to an LRS in the background.
+
+"""
+
+# Journal entry states
+PENDING = 0
+ACKNOWLEDGED = 1
+REJECTED = 2
+
+# Most seconds flush() waits before checking that the background thread is still alive
+_FLUSH_POLL_INTERVAL = 0.5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS statements (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    json TEXT NOT NULL,
+    state INTEGER NOT NULL DEFAULT 0,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS statements_state ON statements (state, seq);
+"""
+
+
+class StatementQueue(object):
+    """Saves statements to a local SQLite journal and returns at once, while
+    a background thread sends them to the LRS in batches of up to
+    `batch_size`, oldest first. Producers are never slowed down or failed by
+    a slow or unreachable LRS::
+
+        queue = StatementQueue(lrs, "statements.db")
+        queue.put(statement)
+        ...
+        queue.close()
+
+    or as a context manager, which stops the background thread on exit
+    without waiting for the pending statements to be sent::
+
+        with StatementQueue(lrs, "statements.db") as queue:
+            queue.put(statement)
+
+    Statements without an id are given one when they are put, so that
+    sending a batch again after a failure can not store them twice. An
+    entry is acknowledged once the LRS has confirmed its id. When the LRS
+    can not be reached or fails with a 5xx, 408 or 429 status, the batch is
+    retried after an exponential backoff. A batch the LRS refuses with
+    another 4xx status is sent again one statement at a time, and the
+    statements still refused are set aside as rejected, see :meth:`rejected`,
+    so that they do not hold the queue up.
+
+    Entries not acknowledged when the process stops are sent by the next
+    queue opened on the same journal. Only one queue at a time may use a
+    given journal. Commits survive the process crashing, but the last ones
+    may be lost if the machine itself goes down.
+
+    :param lrs: The LRS to send statements to, which can not be a :class:`tincan.AsyncRemoteLRS`
+    :type lrs: :class:`tincan.RemoteLRS`
+    :param path: Path of the SQLite journal, created if missing
+    :type path: str | unicode
+    :param batch_size: Maximum number of statements sent per request
+    :type batch_size: int
+    :param retry_delay: Seconds waited before the first retry, doubled on
+    each consecutive failure
+    :type retry_delay: float
+    :param max_retry_delay: Most seconds waited between retries
+    :type max_retry_delay: float
+    :param start: Whether to start the background thread right away, see :meth:`start`
+    :type start: bool
+    """
+
+    def __init__(self, lrs, path, batch_size=100, retry_delay=1.0, max_retry_delay=60.0, start=True):
+        if batch_size is None or int(batch_size) < 1:
+            raise ValueError("Property 'batch_size' in a 'tincan.StatementQueue' must be a positive integer")
+
+        self.lrs = lrs
+        self.path = path
+        self.batch_size = int(batch_size)
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+
+        # a single connection, shared by the producers and the flusher
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db_lock = threading.Lock()
+
+        self._changed = threading.Condition()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._running = False
+        self._closed = False
+        self._failures = 0
+        self.last_error = None
+
+        if start:
+            self.start()
+
+    def put(self, statement):
+        """Saves a statement to the journal, to be sent in the background
+
+        :param statement: The statement to send
+        :type statement: :class:`tincan.Statement`
+        :return: The id of the statement, given to it if it had none
+        :rtype: unicode
+        """
+        return self.put_many([statement])[0]
+
+    def put_many(self, statements):
+        """Saves statements to the journal in a single transaction, to be
+        sent in the background
+
+        :param statements: The statements to send
+        :type statements: :class:`tincan.StatementList` | list of :class:`tincan.Statement`
+        :return: The ids of the statements, given to those that had none
+        :rtype: list of unicode
+        """
+        if not isinstance(statements, StatementList):
+            statements = StatementList(statements)
+
+        rows = []
+        for statement in statements:
+            if statement.id is None:
+                statement.id = uuid.uuid4()
+            rows.append((str(statement.id), statement.to_json(self.lrs.version, codec=self.lrs.codec)))
+
+        with self._db_lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany("INSERT INTO statements (id, json) VALUES (?, ?)", rows)
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+        self._wake.set()
+        return [row[0] for row in rows]
+
+    def pending_count(self):
+        """Number of statements not sent to the LRS yet
+
+        :rtype: int
+        """
+        return self._count(PENDING)
+
+    def acknowledged_count(self):
+        """Number of statements sent and acknowledged, still in the journal
+        until :meth:`purge` is called
+
+        :rtype: int
+        """
+        return self._count(ACKNOWLEDGED)
+
+    def rejected(self):
+        """Returns the statements the LRS refused, along with its response
+
+        :return: The statements and the status and body of the response refusing each one
+        :rtype: list of tuple(:class:`tincan.Statement`, unicode)
+        """
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT json, error FROM statements WHERE state = ? ORDER BY seq", (REJECTED,)
+            ).fetchall()
+        return [(Statement.from_json(json_data, codec=self.lrs.codec), error) for json_data, error in rows]
+
+    def purge(self, rejected=False):
+        """Deletes the acknowledged statements from the journal
+
+        :param rejected: Whether to delete the rejected statements too
+        :type rejected: bool
+        :return: Number of statements deleted
+        :rtype: int
+        """
+        states = (ACKNOWLEDGED, REJECTED) if rejected else (ACKNOWLEDGED,)
+        with self._db_lock:
+            cursor = self._db.execute(
+                f"DELETE FROM statements WHERE state IN ({', '.join('?' * len(states))})", states
+            )
+        return cursor.rowcount
+
+    def start(self):
+        """Starts the background thread sending the statements, if it is not
+        running already"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stopping.clear()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="tincan-statement-queue", daemon=True)
+        self._thread.start()
+
+    def flush(self, timeout=None):
+        """Waits until every statement put so far has been acknowledged or
+        rejected
+
+        :param timeout: Most seconds to wait, None to wait for as long as it takes
+        :type timeout: float
+        :return: Whether no statement is pending anymore, which without a
+        running background thread is only the case if none was pending. If
+        the thread dies while waiting, :attr:`last_error` holds the cause.
+        :rtype: bool
+        """
+        thread = self._thread
+        if thread is None:
+            return not self.pending_count()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._wake.set()
+        with self._changed:
+            while self.pending_count():
+                if not thread.is_alive():
+                    return False
+                remaining = _FLUSH_POLL_INTERVAL
+                if deadline is not None:
+                    remaining = min(remaining, deadline - time.monotonic())
+                    if remaining <= 0:
+                        return False
+                self._changed.wait(remaining)
+        return True
+
+    def stop(self, timeout=None):
+        """Stops the background thread once the request being sent, if any,
+        has completed. Pending statements stay in the journal.
+
+        :param timeout: Most seconds to wait for the thread to stop, None to
+        wait for as long as it takes
+        :type timeout: float
+        :return: Whether the thread has stopped
+        :rtype: bool
+        """
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                return False
+            self._thread = None
+        return True
+
+    def close(self, timeout=10.0):
+        """Sends the pending statements, for up to timeout seconds, then
+        stops the background thread and closes the journal. Statements still
+        pending stay in the journal. If a request is still being sent, the
+        thread closes the journal once it has completed.
+
+        :param timeout: Most seconds to wait for the pending statements to be
+        sent, then for the thread to stop, None to wait for as long as it takes
+        :type timeout: float
+        :return: Whether no statement was left pending
+        :rtype: bool
+        """
+        flushed = self.flush(timeout)
+        self.stop(timeout)
+        with self._db_lock:
+            self._closed = True
+            if not self._running:
+                self._db.close()
+        return flushed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close(timeout=0)
+
+    def _count(self, state):
+        with self._db_lock:
+            return self._db.execute("SELECT COUNT(*) FROM statements WHERE state = ?", (state,)).fetchone()[0]
+
+    def _run(self):
+        try:
+            self._send_pending()
+        except Exception as e:
+            self.last_error = e
+            raise
+        finally:
+            with self._db_lock:
+                self._running = False
+                if self._closed:
+                    self._db.close()
+            with self._changed:
+                self._changed.notify_all()
+
+    def _send_pending(self):
+        while not self._stopping.is_set():
+            with self._db_lock:
+                rows = self._db.execute(
+                    "SELECT seq, id, json FROM statements WHERE state = ? ORDER BY seq LIMIT ?",
+                    (PENDING, self.batch_size),
+                ).fetchall()
+
+            if not rows:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+
+            if self._send(rows):
+                self._failures = 0
+            else:
+                self._failures += 1
+                # jitter keeps clients that failed together from retrying together
+                delay = min(self.max_retry_delay, self.retry_delay * 2 ** (self._failures - 1))
+                self._stopping.wait(delay * random.uniform(0.5, 1.0))
+
+    def _send(self, rows):
+        """Sends a batch of journal entries and records the outcome
+
+        :return: False if the batch should be retried later
+        :rtype: bool
+        """
+        try:
+            # every statement has an id
+            lrs_response = self.lrs.save_statements_json(
+                "[" + ", ".join(row[2] for row in rows) + "]",
+                idempotent=True,
+            )
+        except Exception as e:
+            self.last_error = e
+            return False
+
+        if lrs_response.success:
+            confirmed = set(lrs_response.content)
+            self._set_state([row[0] for row in rows if row[1] in confirmed], ACKNOWLEDGED)
+            if len(confirmed) < len(rows):
+                self.last_error = f"The LRS only confirmed {len(confirmed)} of {len(rows)} statements"
+                return False
+            return True
+
+        status = lrs_response.response.status
+        self.last_error = f"{status} {lrs_response.data}"
+        if status >= 500 or status in (408, 429):
+            return False
+
+        if len(rows) == 1:
+            self._set_state([rows[0][0]], REJECTED, self.last_error)
+            return True
+
+        # find out which statements the LRS refuses
+        for row in rows:
+            if not self._send([row]):
+                return False
+        return True
+
+    def _set_state(self, seqs, state, error=None):
+        with self._db_lock:
+            self._db.executemany(
+                "UPDATE statements SET state = ?, error = ? WHERE seq = ?",
+                [(state, error, seq) for seq in seqs],
+            )
+        with self._changed:
+            self._changed.notify_all()
@@ -24,6 +24,8 @@ from tincan.serializable_base import SerializableBase
 
 
 class StatementRef(SerializableBase):
+    __slots__ = ('_object_type', '_id')
+
     _props_req = [
         'object_type'
     ]
@@ -40,6 +42,15 @@ class StatementRef(SerializableBase):
 
         super(StatementRef, self).__init__(*args, **kwargs)
 
+    def _check_conformance(self):
+        self._check_required('id')
+
+    @classmethod
+    def _trusted_converters(cls):
+        return {
+            'id': uuid.UUID,
+        }
+
     @property
     def object_type(self):
         """Object type for Statement Ref. Will always be "StatementRef"
@@ -23,6 +23,8 @@
 
 
 class StatementTargetable(object):
+    __slots__ = ()
+
     def __init__(self):
         self.object_type = None
 
@@ -14,6 +14,8 @@
 
 from tincan.serializable_base import SerializableBase
 from tincan.statement_list import StatementList
+from tincan.projection import Projection
+from tincan.json_codec import get_codec
 
 """
 .. module:: statements_result
@@ -23,6 +25,8 @@ from tincan.statement_list import StatementList
 
 
 class StatementsResult(SerializableBase):
+    __slots__ = ('_statements', '_more')
+
     _props_req = [
         'statements',
         'more',
@@ -31,12 +35,41 @@ class StatementsResult(SerializableBase):
     _props = []
     _props.extend(_props_req)
 
+    _statement_list = StatementList
+
     def __init__(self, *args, **kwargs):
         self._statements = None
         self._more = None
 
         super(StatementsResult, self).__init__(*args, **kwargs)
 
+    @classmethod
+    def from_json(cls, json_data, trusted=False, codec=None, projection=None):
+        """Converts the JSON of a page of statements, see
+        :meth:`tincan.SerializableBase.from_json`
+
+        :param projection: The fields of the statements to decode, the
+        others being dropped, see :class:`tincan.projection.Projection`.
+        None (the default) decodes every field.
+        :type projection: :class:`tincan.projection.Projection` | iterable of unicode | None
+        """
+        projection = Projection.of(projection)
+        if projection is None:
+            return super(StatementsResult, cls).from_json(json_data, trusted=trusted, codec=codec)
+
+        data = get_codec(codec).loads(json_data)
+        if isinstance(data, dict) and isinstance(data.get("statements"), list):
+            data["statements"] = projection.apply_all(data["statements"])
+        # projected statements are incomplete, so they are not checked for conformance
+        return cls._from_data(data, trusted, validate=False)
+
+    @classmethod
+    def _trusted_converters(cls):
+        return {
+            'statements': cls._statement_list._from_trusted,
+            'more': str,
+        }
+
     @property
     def statements(self):
         """Statements for StatementsResult
@@ -51,10 +84,10 @@ class StatementsResult(SerializableBase):
     @statements.setter
     def statements(self, value):
         if value is None:
-            self._statements = StatementList()
+            self._statements = self._statement_list()
             return
         try:
-            self._statements = StatementList(value)
+            self._statements = self._statement_list(value)
         except Exception:
             raise TypeError(f"Property 'statements' in a 'tincan.{self.__class__.__name__}' object must be set with a "
                             f"list or None."
@@ -0,0 +1,270 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import codecs
+import json
+import re
+from json.decoder import WHITESPACE
+
+from tincan.statement import Statement
+from tincan.lazy_statement import LazyStatement
+from tincan.projection import Projection
+
+"""
+.. module:: statements_result_parser
+   :synopsis: Incremental parser turning the JSON of a statements result, as
+   it arrives from an LRS, into statements one at a time.
+
+"""
+
+# Parser states, named after what is expected next
+_OPEN_RESULT = "'{'"
+_FIRST_KEY = "a property name or '}'"
+_KEY = "a property name"
+_COLON = "':'"
+_VALUE = "a value"
+_AFTER_VALUE = "',' or '}'"
+_FIRST_STATEMENT = "a statement or ']'"
+_STATEMENT = "a statement"
+_AFTER_STATEMENT = "',' or ']'"
+_END = "the end of the document"
+
+_INCOMPLETE = object()
+
+# What the scan of an object or array stops at, outside and inside strings
+_STRUCTURE = re.compile(r'[][{}"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class StatementsResultParser(object):
+    """Parses the JSON of a :class:`tincan.StatementsResult` incrementally:
+    bytes are passed to :meth:`feed` as they are read, and each statement is
+    returned as soon as its closing brace has been seen. Only the statement
+    being parsed is kept in memory, instead of the whole page.
+
+    The "more" link is available in :attr:`more` once the document has been
+    parsed. Properties other than "statements" and "more" are ignored.
+
+    :param trusted: Whether statements are decoded without validation, see
+    :meth:`tincan.SerializableBase.from_json`
+    :type trusted: bool
+    :param lazy: Whether statements are decoded lazily, as
+    :class:`tincan.LazyStatement` objects
+    :type lazy: bool
+    :param projection: The fields of the statements to decode, see
+    :class:`tincan.projection.Projection`. None (the default) decodes every field.
+    :type projection: :class:`tincan.projection.Projection` | iterable of unicode | None
+    """
+
+    def __init__(self, trusted=False, lazy=False, projection=None):
+        self.trusted = trusted
+        self.lazy = lazy
+        self.projection = Projection.of(projection)
+        self.more = None
+
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._scanner = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._consumed = 0
+        self._wait_for = 0
+        self._scan_state = (0, 0, False)
+        self._state = _OPEN_RESULT
+        self._key = None
+
+    def feed(self, data):
+        """Parses the next part of the document
+
+        :param data: The next bytes of the document
+        :type data: bytes
+        :return: The statements completed by data
+        :rtype: list of :class:`tincan.Statement`
+        :raises: ValueError for invalid JSON
+        """
+        text = self._decoder.decode(data)
+        self._consumed += self._pos
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        if len(self._buffer) < self._wait_for:
+            return []
+        return self._parse(final=False)
+
+    def close(self):
+        """Parses the end of the document
+
+        :return: The statements completed by the end of the document
+        :rtype: list of :class:`tincan.Statement`
+        :raises: ValueError if the document is invalid or incomplete
+        """
+        self._consumed += self._pos
+        self._buffer = self._buffer[self._pos:] + self._decoder.decode(b"", final=True)
+        self._pos = 0
+        statements = self._parse(final=True)
+        if self._state is not _END:
+            self._error(f"Expecting {self._state}, got the end of the document")
+        return statements
+
+    def _parse(self, final):
+        """Consumes as much of the buffer as possible. Unless final is set,
+        stops before a value reaching the end of the buffer, which may
+        continue in the next part of the document.
+
+        :rtype: list of :class:`tincan.Statement`
+        """
+        statements = []
+        buffer = self._buffer
+
+        while True:
+            pos = WHITESPACE.match(buffer, self._pos).end()
+            self._pos = pos
+            if pos == len(buffer):
+                return statements
+
+            state = self._state
+            char = buffer[pos]
+
+            if state is _FIRST_STATEMENT and char == "]" or state is _AFTER_STATEMENT and char == "]":
+                self._state, self._pos = _AFTER_VALUE, pos + 1
+            elif state is _FIRST_KEY and char == "}" or state is _AFTER_VALUE and char == "}":
+                self._state, self._pos = _END, pos + 1
+            elif state is _FIRST_STATEMENT or state is _STATEMENT:
+                value = self._decode(final)
+                if value is _INCOMPLETE:
+                    return statements
+                if self.projection is not None:
+                    value = self.projection.apply(value)
+                if self.lazy:
+                    statements.append(LazyStatement(value))
+                else:
+                    statements.append(Statement._from_data(value, self.trusted, validate=self.projection is None))
+                self._state = _AFTER_STATEMENT
+            elif state is _AFTER_STATEMENT:
+                self._expect(char, ",")
+                self._state, self._pos = _STATEMENT, pos + 1
+            elif state is _OPEN_RESULT:
+                self._expect(char, "{")
+                self._state, self._pos = _FIRST_KEY, pos + 1
+            elif state is _FIRST_KEY or state is _KEY:
+                self._expect(char, '"')
+                key = self._decode(final)
+                if key is _INCOMPLETE:
+                    return statements
+                self._key, self._state = key, _COLON
+            elif state is _COLON:
+                self._expect(char, ":")
+                self._state, self._pos = _VALUE, pos + 1
+            elif state is _VALUE and self._key == "statements" and char == "[":
+                self._state, self._pos = _FIRST_STATEMENT, pos + 1
+            elif state is _VALUE:
+                value = self._decode(final)
+                if value is _INCOMPLETE:
+                    return statements
+                if self._key == "statements" and value is not None:
+                    raise TypeError(
+                        f"Property 'statements' in a statements result must be a list or None, "
+                        f"got a '{value.__class__.__name__}' object: {repr(value)}"
+                    )
+                if self._key == "more":
+                    self.more = None if value is None else str(value)
+                self._state = _AFTER_VALUE
+            elif state is _AFTER_VALUE:
+                self._expect(char, ",")
+                self._state, self._pos = _KEY, pos + 1
+            else:
+                self._error(f"Expecting {state}")
+
+    def _decode(self, final):
+        """Decodes the JSON value starting at the current position and moves
+        past it, or returns _INCOMPLETE if it may continue past the end of
+        the buffer. Objects and arrays are only decoded once :meth:`_scan`
+        has found their end, so each is decoded exactly once however many
+        parts it spans.
+
+        :raises: ValueError
+        """
+        buffer, pos = self._buffer, self._pos
+        closed = buffer[pos] in "{[" and self._scan() is not None
+        if buffer[pos] in "{[" and not closed and not final:
+            return _INCOMPLETE
+        try:
+            value, end = self._scanner.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if final or closed:
+                raise
+            end = None
+
+        if end is None or end == len(buffer) and not final and not closed:
+            # the value may be cut short (a number may even have more digits
+            # to come), so try again once the buffer has doubled, which
+            # bounds the work spent on values spanning many parts
+            self._wait_for = 2 * (len(buffer) - pos)
+            return _INCOMPLETE
+
+        self._wait_for = 0
+        self._pos = end
+        return value
+
+    def _scan(self):
+        """Scans the object or array starting at the current position for its
+        closing bracket, carrying on from where the scan of the previous
+        parts stopped. The scan only stops at brackets and quotes outside
+        strings, and at quotes and backslashes inside them.
+
+        :return: The position past the closing bracket, or None if it has
+        not been read yet
+        :rtype: int | None
+        """
+        buffer, start = self._buffer, self._pos
+        offset, depth, in_string = self._scan_state
+        i, length = start + offset, len(buffer)
+
+        while True:
+            if in_string:
+                match = _STRING_SPECIAL.search(buffer, i)
+                if match is None:
+                    i = length
+                    break
+                i = match.start()
+                if buffer[i] == "\\":
+                    if i + 1 == length:
+                        # the escaped character is still to come
+                        break
+                    i += 2
+                else:
+                    in_string, i = False, i + 1
+            else:
+                match = _STRUCTURE.search(buffer, i)
+                if match is None:
+                    i = length
+                    break
+                char, i = match.group(), match.end()
+                if char == '"':
+                    in_string = True
+                elif char in "{[":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        self._scan_state = (0, 0, False)
+                        return i
+
+        self._scan_state = (i - start, depth, in_string)
+        return None
+
+    def _expect(self, char, expected):
+        if char != expected:
+            self._error(f"Expecting {self._state}")
+
+    def _error(self, msg):
+        raise ValueError(f"Invalid statements result: {msg} at character {self._consumed + self._pos}")
@@ -16,9 +16,12 @@ from tincan.statement_base import StatementBase
 from tincan.agent import Agent
 from tincan.group import Group
 from tincan.activity import Activity
+from tincan.interner import interned
 
 
 class SubStatement(StatementBase):
+    __slots__ = ('_object_type',)
+
     _props_req = [
         'object_type'
     ]
@@ -33,6 +36,21 @@ class SubStatement(StatementBase):
 
         super(SubStatement, self).__init__(*args, **kwargs)
 
+    @classmethod
+    def _trusted_converters(cls):
+        converters = super(SubStatement, cls)._trusted_converters()
+        converters['object'] = cls._trusted_object
+        return converters
+
+    @staticmethod
+    def _trusted_object(value):
+        object_type = value.get('objectType', value.get('object_type'))
+        if object_type == 'Agent':
+            return Agent._from_trusted(value)
+        elif object_type == 'Group':
+            return Group._from_trusted(value)
+        return interned(Activity._from_trusted, value)
+
     @property
     def object(self):
         """Object for SubStatement
@@ -58,13 +76,13 @@ class SubStatement(StatementBase):
                     if value['object_type'] == 'Agent':
                         value = Agent(value)
                     elif value['object_type'] == 'Activity':
-                        value = Activity(value)
+                        value = interned(Activity, value)
                     elif value['object_type'] == 'Group':
                         value = Group(value)
                     else:
-                        value = Activity(value)
+                        value = interned(Activity, value)
                 else:
-                    value = Activity(value)
+                    value = interned(Activity, value)
         self._object = value
 
     @object.deleter
@@ -22,6 +22,8 @@ from tincan.serializable_base import SerializableBase
 
 
 class TypedList(list, SerializableBase):
+    __slots__ = ()
+
     _cls = None
 
     def __init__(self, *args, **kwargs):
@@ -34,6 +36,23 @@ class TypedList(list, SerializableBase):
         value = self._make_cls(value)
         super(TypedList, self).__setitem__(ind, value)
 
+    @classmethod
+    def _from_trusted(cls, data):
+        """Builds a list from data parsed from a trusted source, converting
+        each element with :meth:`tincan.SerializableBase._from_trusted`
+
+        :param data: The parsed JSON of the list
+        :type data: list
+        """
+        result = cls.__new__(cls)
+        list.extend(result, [cls._cls._from_trusted(v) for v in data])
+        return result
+
+    def _validate(self):
+        """Checks each element, see :meth:`tincan.SerializableBase.validate`"""
+        for value in self:
+            value._validate()
+
     def _check_cls(self):
         """If self._cls is not set, raises ValueError.
 
@@ -0,0 +1,93 @@
+# Copyright 2014 Rustici Software
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import contextlib
+import contextvars
+
+"""
+.. module:: validation
+   :synopsis: How thoroughly model objects are checked when they are built.
+
+"""
+
+STRICT = "strict"
+STANDARD = "standard"
+TRUSTED = "trusted"
+
+# From the most to the least thorough
+LEVELS = (STRICT, STANDARD, TRUSTED)
+
+_active = contextvars.ContextVar("tincan_validation_level", default=None)
+_default = STANDARD
+
+
+def get_validation_level():
+    """Returns the validation level model objects are built with in the
+    current context:
+
+    - "strict" also checks that objects decoded from JSON conform to the
+      xAPI specification, with :meth:`tincan.SerializableBase.validate`,
+      for instance that an agent has exactly one identifier or that a
+      scaled score is between -1 and 1, raising a ValueError otherwise.
+      JSON is always decoded with validation. Objects built with their
+      constructor are only checked when validate is called, so that they
+      may be built empty and completed property by property.
+    - "standard", the default, converts and checks each property as it is
+      set, as it always has.
+    - "trusted" builds objects from dicts the way JSON from a trusted
+      source is decoded (see :meth:`tincan.SerializableBase.from_json`),
+      skipping most conversions and checks, for data already validated,
+      such as statements returned by an LRS.
+
+    :rtype: unicode
+    """
+    level = _active.get()
+    return _default if level is None else level
+
+
+def set_validation_level(level):
+    """Sets the validation level of every context that has not set its own,
+    see :func:`get_validation_level`
+
+    :param level: One of :data:`LEVELS`
+    :type level: unicode
+    :raises: ValueError
+    """
+    global _default
+    _default = _check_level(level)
+
+
+@contextlib.contextmanager
+def validating(level):
+    """Sets the validation level of the block, for the current thread or
+    asyncio task and the tasks it starts, see :func:`get_validation_level`::
+
+        with validating("strict"):
+            statement = Statement.from_json(json_data)
+
+    :param level: One of :data:`LEVELS`
+    :type level: unicode
+    :raises: ValueError
+    """
+    token = _active.set(_check_level(level))
+    try:
+        yield
+    finally:
+        _active.reset(token)
+
+
+def _check_level(level):
+    if level not in LEVELS:
+        raise ValueError(f"Validation level must be one of {', '.join(LEVELS)}, not {level!r}")
+    return level
@@ -23,6 +23,8 @@ from tincan.language_map import LanguageMap
 
 
 class Verb(SerializableBase):
+    __slots__ = ('_id', '_display')
+
     _props_req = [
         'id',
     ]
@@ -39,6 +41,16 @@ class Verb(SerializableBase):
 
         super(Verb, self).__init__(*args, **kwargs)
 
+    def _check_conformance(self):
+        self._check_required('id')
+
+    @classmethod
+    def _trusted_converters(cls):
+        return {
+            'id': str,
+            'display': LanguageMap._from_trusted,
+        }
+
     def __repr__(self):
         return f'Verb: {self.__dict__}'
 